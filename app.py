@@ -2,7 +2,9 @@ import os
 import sys
 import json
 import re
+import heapq
 import logging
+import importlib.util
 from datetime import datetime, timedelta, date, time
 from functools import wraps
 
@@ -23,22 +25,17 @@ def _json_serialize_extracted_event(data):
         return [_json_serialize_extracted_event(v) for v in data]
     return data
 
-# Google OAuth imports
-try:
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import Flow
-    from googleapiclient.discovery import build
-    
+# Google OAuth libraries are imported on first use (auth routes); only check they are installed
+GOOGLE_OAUTH_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ('google.auth', 'google_auth_oauthlib', 'googleapiclient')
+)
+if GOOGLE_OAUTH_AVAILABLE:
     # Configure OAuth for Railway's proxy environment
-    import os
     if 'RAILWAY_ENVIRONMENT' in os.environ:
         os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
-    
-    GOOGLE_OAUTH_AVAILABLE = True
-except ImportError:
+else:
     print("⚠️  Warning: Google OAuth libraries not found. Admin authentication will be disabled.")
-    GOOGLE_OAUTH_AVAILABLE = False
 
 # Try to import dotenv with fallback
 try:
@@ -61,10 +58,11 @@ except ImportError:
 
 # Import Flask components
 try:
-    from flask import Flask, render_template, request, jsonify, session, redirect, Response, stream_with_context
+    from flask import Flask, render_template, request, jsonify, session, redirect, Response, stream_with_context, g
     from flask_cors import CORS
     from flask_sqlalchemy import SQLAlchemy
     from flask_wtf.csrf import CSRFProtect
+    from werkzeug.http import http_date
     import pytz
 except ImportError as e:
     print(f"❌ Error importing Flask components: {e}")
@@ -83,6 +81,69 @@ from scripts.utils import (
     clean_integer_field
 )
 from scripts.env_config import ensure_env_loaded, get_app_config
+from scripts.event_pagination import (
+    PAGING_PARAMS,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+    keyset_after,
+    keyset_order,
+    keyset_page,
+    parse_fields,
+    parse_limit,
+    project,
+    sort_key,
+)
+from scripts.event_serializer import (
+    FULL_PROFILE_FIELDS,
+    LIST_PROFILE_FIELDS,
+    EventSerializer,
+    dumps_events,
+    event_image_url,
+    event_maps_link,
+    venue_image_url,
+)
+from scripts.image_proxy_cache import create_image_proxy_cache
+from scripts.response_cache import create_response_cache, register_invalidation_hooks
+from scripts.job_queue import FAILED, CANCELLED, create_job_queue, create_job_worker, jobs_enabled
+from scripts.progress_bus import progress
+from scripts.visit_recorder import NO_CITY, visits as visit_recorder
+from scripts.schema_version import record_schema_version, should_migrate_on_boot
+from scripts.bulk_loader import BulkLoader
+from scripts import title_rules
+from scripts.event_visibility import (
+    refresh_effective_visibility,
+    register_visibility_hooks,
+)
+from scripts.event_query_planner import (
+    EVENT_INDEXES,
+    GENERIC_TOUR_TITLES,
+    build_date_filter,
+    build_events_filter,
+    build_series_filter,
+    event_type_position,
+    events_order_by,
+    resolve_time_range,
+)
+from scripts.event_series import RecurrenceRule, expand_occurrences
+from scripts.ical_feed import feed_etag, iter_calendar, not_modified
+from scripts.event_search import (
+    create_search_index,
+    query_terms,
+    refresh_search_index,
+    register_search_hooks,
+    search_hits,
+)
+from scripts.event_geo import (
+    covering_prefixes,
+    distance_km,
+    geohash_filter,
+    parse_point,
+    parse_radius,
+    refresh_event_geohash,
+    register_geo_hooks,
+)
 
 # Ensure environment is loaded
 ensure_env_loaded()
@@ -357,6 +418,9 @@ def migrate_events_schema():
                 ('related_exhibitions', 'TEXT'),
                 ('visibility', 'VARCHAR(20)'),
                 ('source_id', 'INTEGER'),
+                ('effective_visibility', 'VARCHAR(20)'),
+                ('series_id', 'INTEGER'),
+                ('geohash', 'VARCHAR(12)'),
             ]
             
             # Add missing columns with appropriate defaults
@@ -419,6 +483,9 @@ def migrate_events_schema():
             ('is_permanent', 'INTEGER', 0),
             ('visibility', 'VARCHAR(20)', None),
             ('source_id', 'INTEGER', None),
+            ('effective_visibility', 'VARCHAR(20)', None),
+            ('series_id', 'INTEGER', None),
+            ('geohash', 'VARCHAR(12)', None),
         ]
         
         added_columns = []
@@ -589,35 +656,103 @@ def migrate_sources_schema():
     except Exception as e:
         return False, f"Sources migration error: {str(e)}", []
 
+def migrate_events_indexes():
+    """Create the composite indexes used by the /api/events query planner if missing.
+    Returns: (success: bool, message: str, created_indexes: list)
+    """
+    try:
+        import sqlalchemy
+        inspector = sqlalchemy.inspect(db.engine)
+        if not inspector.has_table('events'):
+            return True, "Events table not created yet", []
+        existing_indexes = {index['name'] for index in inspector.get_indexes('events')}
+        
+        created_indexes = []
+        errors = []
+        for index_name, columns in EVENT_INDEXES:
+            if index_name in existing_indexes:
+                continue
+            try:
+                with db.engine.connect() as conn:
+                    conn.execute(sqlalchemy.text(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} ON events ({', '.join(columns)})"
+                    ))
+                    conn.commit()
+                created_indexes.append(index_name)
+            except Exception as e:
+                errors.append(f"Failed to create {index_name}: {str(e)}")
+                print(f"⚠️  Index creation failed for {index_name}: {e}")
+        
+        if created_indexes:
+            message = f"Created {len(created_indexes)} indexes: {', '.join(created_indexes)}"
+            if errors:
+                message += f". Errors: {'; '.join(errors)}"
+            return True, message, created_indexes
+        elif errors:
+            return False, f"Index migration failed: {'; '.join(errors)}", []
+        else:
+            return True, "Indexes are already up to date", []
+    except Exception as e:
+        return False, f"Events index migration error: {str(e)}", []
+
+def migrate_event_series_schema():
+    """Create the event_series table (recurring event rules) if missing, or add match_key.
+    Returns: (success: bool, message: str, created_tables: list)
+    """
+    try:
+        import sqlalchemy
+        inspector = sqlalchemy.inspect(db.engine)
+        if inspector.has_table('event_series'):
+            if 'match_key' in [col['name'] for col in inspector.get_columns('event_series')]:
+                return True, "event_series table already exists", []
+            with db.engine.begin() as conn:
+                conn.execute(sqlalchemy.text("ALTER TABLE event_series ADD COLUMN match_key VARCHAR(40)"))
+            return True, "Added event_series column: match_key", []
+        EventSeries.__table__.create(db.engine, checkfirst=True)
+        return True, "Created event_series table", ['event_series']
+    except Exception as e:
+        return False, f"Event series migration error: {str(e)}", []
+
+def migrate_event_search_index():
+    """Create and fill the full-text event_search index (scripts/event_search.py) if missing.
+    Returns: (success: bool, message: str, created_tables: list)
+    """
+    try:
+        import sqlalchemy
+        if not sqlalchemy.inspect(db.engine).has_table('events'):
+            return True, "Events table not created yet", []
+        with db.engine.begin() as conn:
+            if not create_search_index(conn):
+                return True, "event_search index already exists", []
+            refresh_search_index(conn, Event, Venue)
+        return True, "Created and filled event_search index", ['event_search']
+    except Exception as e:
+        return False, f"Event search index migration error: {str(e)}", []
+
 def auto_migrate_schema():
-    """Automatically migrate schema on startup (Railway PostgreSQL or local SQLite)."""
+    """Migrate schema (Railway PostgreSQL or local SQLite). Returns True when every step succeeded."""
+    all_succeeded = True
     try:
         with app.app_context():
-            # Migrate events table
-            success, message, _ = migrate_events_schema()
-            if success:
-                print(f"✅ Events schema migration: {message}")
-            else:
-                print(f"⚠️  Events schema migration: {message}")
-            
-            # Migrate venues table
-            success, message, _ = migrate_venues_schema()
-            if success:
-                print(f"✅ Venues schema migration: {message}")
-            else:
-                print(f"⚠️  Venues schema migration: {message}")
-
-            success, message, _ = migrate_sources_schema()
-            if success:
-                print(f"✅ Sources schema migration: {message}")
-            else:
-                print(f"⚠️  Sources schema migration: {message}")
+            for label, migrate in (
+                ('Event series migration', migrate_event_series_schema),
+                ('Events schema migration', migrate_events_schema),
+                ('Venues schema migration', migrate_venues_schema),
+                ('Sources schema migration', migrate_sources_schema),
+                ('Events index migration', migrate_events_indexes),
+                ('Event search index migration', migrate_event_search_index),
+            ):
+                success, message, _ = migrate()
+                if success:
+                    print(f"✅ {label}: {message}")
+                else:
+                    print(f"⚠️  {label}: {message}")
+                    all_succeeded = False
     except Exception as e:
         # Migration can fail on startup if database isn't ready yet - that's okay
         print(f"⚠️  Schema migration: {str(e)}")
-
-# Run auto-migration on startup
-auto_migrate_schema()
+        return False
+    return all_succeeded
 
 # Define models directly in app.py for simplicity
 class City(db.Model):
@@ -691,39 +826,7 @@ class Venue(db.Model):
 
     def to_dict(self):
         # Handle image_url - use secure image proxy endpoint
-        image_url = self.image_url
-        if image_url:
-            # First check if it's a dict with photo_reference
-            if isinstance(image_url, dict) and 'photo_reference' in image_url:
-                photo_ref = image_url['photo_reference']
-                image_url = f"/api/image/{photo_ref}"
-            elif isinstance(image_url, str) and image_url.startswith('{'):
-                # Try to parse as JSON if it's a string starting with {
-                try:
-                    import json
-                    photo_data = json.loads(image_url)
-                    if isinstance(photo_data, dict) and 'photo_reference' in photo_data:
-                        photo_ref = photo_data['photo_reference']
-                        image_url = f"/api/image/{photo_ref}"
-                except (json.JSONDecodeError, TypeError):
-                    # If it's not valid JSON, treat as raw photo reference
-                    if len(image_url) > 50 and not image_url.startswith('http'):
-                        image_url = f"/api/image/{image_url}"
-            elif isinstance(image_url, str) and 'maps.googleapis.com' in image_url:
-                # Extract photo reference from existing Google Maps URL
-                import re
-                pattern = r'photoreference=([^&]+)'
-                match = re.search(pattern, image_url)
-                if match:
-                    photo_ref = match.group(1)
-                    image_url = f"/api/image/{photo_ref}"
-            elif isinstance(image_url, str) and len(image_url) > 50 and not image_url.startswith('http'):
-                # Raw photo reference string
-                image_url = f"/api/image/{image_url}"
-            elif isinstance(image_url, str) and image_url.startswith('http'):
-                # External URL - route through proxy to keep at loadable size
-                from scripts.utils import ensure_loadable_image_url, IMAGE_PROXY_MAX_WIDTH_VENUE
-                image_url = ensure_loadable_image_url(image_url, IMAGE_PROXY_MAX_WIDTH_VENUE)
+        image_url = venue_image_url(self.image_url)
         
         # Generate Google Maps link for navigation
         maps_link = ""
@@ -778,9 +881,48 @@ class Venue(db.Model):
                 return city.timezone
         return None
 
+class EventSeries(db.Model):
+    """Recurrence rule for repeating events (walk-in tours); display fields live on the template Event"""
+    __tablename__ = 'event_series'
+    __table_args__ = (db.Index('ix_event_series_city_window', 'city_id', 'start_date', 'end_date'),)
+    
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    event_type = db.Column(db.String(50), nullable=False)
+    venue_id = db.Column(db.Integer, db.ForeignKey('venues.id', ondelete='CASCADE'))
+    city_id = db.Column(db.Integer, db.ForeignKey('cities.id', ondelete='CASCADE'))
+    match_key = db.Column(db.String(40))  # URL base/location hash separating same-titled series
+    days_of_week = db.Column(db.String(20), nullable=False)  # '0,1,2,3,4,5' (Monday=0)
+    times = db.Column(db.Text, nullable=False)  # JSON list of 'HH:MM' start times
+    duration_minutes = db.Column(db.Integer, default=60)
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date)  # NULL = open-ended
+    exceptions = db.Column(db.Text)  # JSON list of ISO dates without occurrences
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def rule(self):
+        return RecurrenceRule.from_row(self)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'event_type': self.event_type,
+            'venue_id': self.venue_id,
+            'city_id': self.city_id,
+            'days_of_week': [int(day) for day in self.days_of_week.split(',') if day],
+            'times': json.loads(self.times or '[]'),
+            'duration_minutes': self.duration_minutes,
+            'start_date': self.start_date.isoformat() if self.start_date else None,
+            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'exceptions': json.loads(self.exceptions or '[]'),
+        }
+
 class Event(db.Model):
     """Unified event class for all event types"""
     __tablename__ = 'events'
+    __table_args__ = tuple(db.Index(index_name, *columns) for index_name, columns in EVENT_INDEXES)
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -797,6 +939,7 @@ class Event(db.Model):
     is_admin_only = db.Column(db.Boolean, default=False, nullable=False)  # Legacy; use visibility when set
     visibility = db.Column(db.String(20))  # NULL = inherit; public | admin_only = explicit override
     source_id = db.Column(db.Integer, db.ForeignKey('sources.id', ondelete='SET NULL'))
+    effective_visibility = db.Column(db.String(20))  # Maintained by scripts/event_visibility.py; do not set directly
     event_type = db.Column(db.String(50), nullable=False)  # 'tour', 'exhibition', 'festival', 'photowalk'
     
     # Registration fields
@@ -808,6 +951,8 @@ class Event(db.Model):
     source = db.Column(db.String(50))  # 'instagram', 'facebook', 'website', etc.
     source_url = db.Column(db.String(1000))  # URL of the source (e.g., Instagram post URL) - increased for long URLs
     linked_source = db.relationship('Source', foreign_keys=[source_id], lazy=True)
+    series_id = db.Column(db.Integer, db.ForeignKey('event_series.id', ondelete='CASCADE'))  # Set on a series' template row only
+    series = db.relationship('EventSeries', backref=db.backref('template_events', passive_deletes=True), lazy=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -822,6 +967,7 @@ class Event(db.Model):
     start_longitude = db.Column(db.Float)
     end_latitude = db.Column(db.Float)
     end_longitude = db.Column(db.Float)
+    geohash = db.Column(db.String(12))  # Venue or start coordinates; maintained by scripts/event_geo.py
     
     # Tour-specific fields
     tour_type = db.Column(db.String(50))        # 'Guided', 'Self-guided', 'Audio tour'
@@ -860,73 +1006,19 @@ class Event(db.Model):
     
     def to_dict(self):
         """Convert event to dictionary with all relevant fields"""
-        from urllib.parse import quote
-        
         # Handle image_url - use venue image as fallback when event has no image
-        image_url = self.image_url
-        if (not image_url or (isinstance(image_url, str) and not image_url.strip())) and self.venue and self.venue.image_url:
-            image_url = self.venue.to_dict()['image_url']
-        if image_url and isinstance(image_url, dict) and 'photo_reference' in image_url:
-            # Generate public Google Maps URL using event location
-            if self.start_location and self.start_location.strip():
-                location_name = self.start_location.replace(' ', '+')
-                if self.start_latitude and self.start_longitude:
-                    image_url = f"https://placehold.co/400x300/667eea/ffffff?text={location_name.replace('+', '+')}"
-                else:
-                    image_url = f"https://placehold.co/400x300/667eea/ffffff?text={location_name.replace('+', '+')}"
-            elif self.venue and self.venue.name and self.venue.name.strip():
-                venue_name = self.venue.name.replace(' ', '+')
-                if self.venue.latitude and self.venue.longitude:
-                    image_url = f"https://placehold.co/400x300/667eea/ffffff?text={venue_name.replace('+', '+')}"
-                else:
-                    image_url = f"https://placehold.co/400x300/667eea/ffffff?text={venue_name.replace('+', '+')}"
-            elif self.title and self.title.strip():
-                # Fallback to a generic search
-                title_name = self.title.replace(' ', '+')
-                image_url = f"https://placehold.co/400x300/667eea/ffffff?text={title_name.replace('+', '+')}"
-            else:
-                # Ultimate fallback
-                image_url = "https://placehold.co/400x300/667eea/ffffff?text=Event"
-        
-        # Route external URLs through proxy - all images resized where possible
-        # Decode stored npg.si.edu proxy URLs to raw (proxy blocked from cloud IPs)
-        if image_url and isinstance(image_url, str):
-            if '/api/image-proxy?' in image_url and 'npg.si.edu' in image_url:
-                from urllib.parse import unquote, parse_qs
-                try:
-                    parsed = parse_qs(image_url.split('?', 1)[1])
-                    raw_url = parsed.get('url', [None])[0]
-                    if raw_url:
-                        image_url = unquote(raw_url)
-                except (IndexError, KeyError):
-                    pass
-            if image_url.startswith(('http://', 'https://')):
-                from scripts.utils import ensure_loadable_image_url, IMAGE_PROXY_MAX_WIDTH_EVENT
-                image_url = ensure_loadable_image_url(image_url, IMAGE_PROXY_MAX_WIDTH_EVENT)
+        image_url = event_image_url(self.image_url, self.venue.image_url if self.venue else None)
         
         # Generate Google Maps link for navigation
-        # Priority: explicit multi-location events > venue coordinates/name > event coordinates > event location
-        # This keeps venue-based events stable, but respects events that move around.
-        maps_link = ""
-        if self.multiple_locations and self.start_location and self.start_location.strip():
-            location_name = self.start_location.replace(' ', '+')
-            maps_link = f"https://www.google.com/maps/search/{location_name}"
-        elif self.venue and self.venue.latitude and self.venue.longitude:
-            # Use venue coordinates if available (most accurate)
-            maps_link = f"https://www.google.com/maps/@{self.venue.latitude},{self.venue.longitude},17z"
-        elif self.venue and self.venue.name and self.venue.name.strip():
-            # Use venue name for search (e.g., "National Gallery of Art")
-            venue_name = self.venue.name.replace(' ', '+')
-            maps_link = f"https://www.google.com/maps/search/{venue_name}"
-        elif self.start_latitude and self.start_longitude:
-            # Fall back to event coordinates if no venue
-            maps_link = f"https://www.google.com/maps/@{self.start_latitude},{self.start_longitude},17z"
-        elif self.start_location and self.start_location.strip():
-            # Last resort: use meeting point location if no venue
-            location_name = self.start_location.replace(' ', '+')
-            maps_link = f"https://www.google.com/maps/search/{location_name}"
-        else:
-            maps_link = "https://www.google.com/maps"
+        maps_link = event_maps_link(
+            self.multiple_locations,
+            self.start_location,
+            self.venue.name if self.venue else None,
+            self.venue.latitude if self.venue else None,
+            self.venue.longitude if self.venue else None,
+            self.start_latitude,
+            self.start_longitude,
+        )
         
         return {
             'id': self.id,
@@ -1019,6 +1111,7 @@ class Event(db.Model):
                     else VISIBILITY_PUBLIC
                 ),
             }),
+            'series_id': self.series_id,
         }
     
     def _get_city_timezone(self):
@@ -1126,7 +1219,7 @@ class Visit(db.Model):
     user_agent = db.Column(db.String(500))
     referrer = db.Column(db.String(500))
     page_path = db.Column(db.String(200))
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     # Relationships
     city = db.relationship('City', backref='visits')
@@ -1204,53 +1297,9 @@ def _effective_event_visibility(event):
     return VISIBILITY_PUBLIC
 
 
-def _match_source_for_event_dict(event_dict, sources_by_id, sources_list):
-    """Resolve a Source row for an event dict (FK first, then handle/URL heuristics)."""
-    source_id = event_dict.get('source_id')
-    if source_id and source_id in sources_by_id:
-        return sources_by_id[source_id]
-    handle = (event_dict.get('social_media_handle') or '').lstrip('@').lower()
-    if handle:
-        for source in sources_list:
-            source_handle = (source.handle or '').lstrip('@').lower()
-            if source_handle and handle == source_handle:
-                return source
-    event_url = event_dict.get('source_url') or event_dict.get('url') or ''
-    if event_url:
-        normalized_event_url = event_url.rstrip('/').lower()
-        for source in sources_list:
-            if not source.url:
-                continue
-            source_url = source.url.rstrip('/').lower()
-            if source_url and source_url in normalized_event_url:
-                return source
-    return None
-
-
-def _enrich_event_dict_visibility(event_dict, sources_by_id, sources_list):
-    """Attach source_visibility and effective_visibility for API/admin consumers."""
-    matched_source = _match_source_for_event_dict(event_dict, sources_by_id, sources_list)
-    if matched_source:
-        if not event_dict.get('source_id'):
-            event_dict['source_id'] = matched_source.id
-        if matched_source.visibility in (VISIBILITY_PUBLIC, VISIBILITY_ADMIN_ONLY):
-            event_dict['source_visibility'] = matched_source.visibility
-        else:
-            event_dict['source_visibility'] = None
-    else:
-        event_dict.setdefault('source_visibility', None)
-    event_dict['effective_visibility'] = _effective_event_visibility(event_dict)
-    return event_dict
-
-
-def _enrich_event_dicts_visibility(events, sources_list):
-    sources_by_id = {source.id: source for source in sources_list}
-    return [_enrich_event_dict_visibility(event, sources_by_id, sources_list) for event in events]
-
-
 def _event_is_public_for_api(event):
-    """True when an event may appear in public /api/events."""
-    return _effective_event_visibility(event) != VISIBILITY_ADMIN_ONLY
+    """True when an event may appear in public /api/events (stored effective_visibility when present)."""
+    return (event.get('effective_visibility') or _effective_event_visibility(event)) != VISIBILITY_ADMIN_ONLY
 
 
 def _filter_public_event_dicts(events):
@@ -1260,6 +1309,241 @@ def _filter_public_event_dicts(events):
     return [event for event in events if _event_is_public_for_api(event)]
 
 
+# Column-projected serializer for /api/events ('list') and /api/admin/events ('full')
+event_serializer = EventSerializer(db, Event, Venue, City, Source, _effective_event_visibility)
+
+
+def _events_json_response(events):
+    """JSON response for a list of serialized event dicts."""
+    return Response(dumps_events(events), mimetype='application/json')
+
+
+def _events_page_response(page, fields, total=None, extra_count=0):
+    """JSON page envelope (scripts/event_pagination.py); ``total`` is (count, is_estimate) on the first page only."""
+    body = {'events': project(page.items, fields), 'next_cursor': page.next_cursor}
+    if total is not None:
+        body['total_estimate'] = total[0] + extra_count
+        body['total_is_estimate'] = total[1]
+    return Response(dumps_events(body), mimetype='application/json')
+
+
+def _public_event_predicate():
+    """Python-side filters of /api/events: English only, and public visibility for non-admins."""
+    from scripts.utils import is_spanish_language_event
+    public_only = not _is_admin_authenticated()
+    
+    def listed(event):
+        # Exclude non-English events (e.g. "Spanish-Language Walk-In Tours")
+        if (event.get('language') or 'English').lower() != 'english' or is_spanish_language_event(event.get('title', '')):
+            return False
+        # effective_visibility is materialized at write time (scripts/event_visibility.py)
+        return not public_only or _event_is_public_for_api(event)
+    return listed
+
+
+# Keep events.effective_visibility current; registered first so it runs before cache invalidation
+register_visibility_hooks(Event, Venue, Source, _effective_event_visibility)
+# Keep the full-text event_search index current (scripts/event_search.py), also before cache invalidation
+register_search_hooks(Event, Venue)
+# Keep events.geohash current for /api/events/nearby (scripts/event_geo.py)
+register_geo_hooks(Event, Venue)
+
+
+def backfill_effective_visibility():
+    """Fill events.effective_visibility for rows written before the column existed."""
+    try:
+        with app.app_context():
+            import sqlalchemy
+            if not sqlalchemy.inspect(db.engine).has_table('events'):
+                return True
+            with db.engine.begin() as conn:
+                updated = refresh_effective_visibility(
+                    conn, Event, Venue, Source, _effective_event_visibility, only_missing=True
+                )
+        if updated:
+            print(f"✅ Backfilled effective_visibility for {updated} events")
+        return True
+    except Exception as e:
+        print(f"⚠️  effective_visibility backfill: {str(e).splitlines()[0]}")
+        return False
+
+def backfill_event_geohash():
+    """Fill events.geohash (venue or own coordinates) for rows written before the column existed."""
+    try:
+        with app.app_context():
+            import sqlalchemy
+            if not sqlalchemy.inspect(db.engine).has_table('events'):
+                return True
+            with db.engine.begin() as conn:
+                updated = refresh_event_geohash(conn, Event, Venue, only_missing=True)
+        if updated:
+            print(f"✅ Backfilled geohash for {updated} events")
+        return True
+    except Exception as e:
+        print(f"⚠️  geohash backfill: {str(e).splitlines()[0]}")
+        return False
+
+# Public read endpoints are served from here; any commit writing these models invalidates it.
+# The generation lives in the database so the job worker and cron containers invalidate it too.
+with app.app_context():
+    response_cache = create_response_cache(db.engine)
+register_invalidation_hooks(response_cache, (City, Venue, Event, Source))
+
+
+def cached_public_response(view):
+    """Serve a GET endpoint from response_cache, keyed on path + query args + admin/public role,
+    with an ETag so clients revalidate (If-None-Match → 304)."""
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        role = 'admin' if _is_admin_authenticated() else 'public'
+        key = response_cache.key(request.path, request.args.items(multi=True), role)
+        cached = response_cache.get(key)
+        if cached is None:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            cached = response_cache.put(key, response.get_data(), response.mimetype)
+        response = Response(cached.body, mimetype=cached.mimetype)
+        response.headers['ETag'] = cached.etag
+        # Revalidate every time (cheap 304s); role depends on the session cookie
+        response.headers['Cache-Control'] = 'private, no-cache' if role == 'admin' else 'public, no-cache'
+        response.vary.add('Cookie')
+        return response.make_conditional(request)
+    return decorated_function
+
+
+# Admin scrapes run on the job worker (scripts/scrape_job_worker.py), not in gunicorn requests
+with app.app_context():
+    scrape_job_queue = create_job_queue(db.engine)
+    # Scrape progress snapshots (/api/scrape-progress) are shared through the database too
+    progress.configure(db.engine)
+    # /api/log-visit buffers visits and writes them (plus visit_daily_stats) in batches
+    visit_recorder.configure(db.engine, Visit.__table__)
+
+
+def backfill_visit_rollup():
+    """Build visit_daily_stats from existing visits when the rollup is empty."""
+    try:
+        with app.app_context():
+            if db.inspect(db.engine).has_table('visits'):
+                visit_recorder.ensure_rollup()
+        return True
+    except Exception as e:
+        print(f"⚠️  visit_daily_stats backfill: {str(e).splitlines()[0]}")
+        return False
+
+
+def run_schema_migrations():
+    """Schema migrations and backfills. The release step (scripts/migrate_app_schema.py) runs them
+    once per SCHEMA_VERSION; boot only runs them when the stored version is behind
+    (see scripts/schema_version.py). Returns True when every step succeeded."""
+    results = [auto_migrate_schema(), backfill_effective_visibility(), backfill_event_geohash(), backfill_visit_rollup()]
+    if not all(results):
+        return False
+    try:
+        with app.app_context():
+            record_schema_version(db.engine)
+    except Exception as e:
+        print(f"⚠️  Could not record schema version: {str(e).splitlines()[0]}")
+        return False
+    return True
+
+
+with app.app_context():
+    migrate_on_boot = should_migrate_on_boot(db.engine)
+if migrate_on_boot:
+    run_schema_migrations()
+
+
+def scrape_job(view=None, stream=False):
+    """Enqueue a scrape endpoint as a background job and return 202 with its job id.
+    ``stream=True`` endpoints (SSE) respond with the job's event stream instead.
+    The worker replays the request with the job context set, which runs the view itself;
+    SCRAPE_JOBS=inline (or a queue error) runs it in the request as before."""
+    if view is None:
+        return lambda view: scrape_job(view, stream=stream)
+
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        if not jobs_enabled() or getattr(g, 'scrape_job_context', None) is not None:
+            return view(*args, **kwargs)
+        try:
+            job_id = scrape_job_queue.enqueue(request.endpoint, {
+                'path': request.path,
+                'query_string': request.query_string.decode('utf-8', 'replace'),
+                'json': request.get_json(silent=True),
+                'view_args': kwargs,
+            })
+        except Exception as e:
+            app_logger.error(f"Could not enqueue {request.endpoint}, running in request: {e}")
+            return view(*args, **kwargs)
+        app_logger.info(f"Queued {request.endpoint} as job {job_id}")
+        if stream:
+            return _job_event_stream(job_id)
+        return jsonify({
+            'success': True,
+            'queued': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': f'/api/admin/jobs/{job_id}',
+            'message': f'Scrape queued as job {job_id}',
+        }), 202
+    return decorated_function
+
+
+def _job_event_stream(job_id, after_id=0):
+    """SSE response tailing a job's events (ids allow resuming with Last-Event-ID)."""
+    def generate():
+        for item in scrape_job_queue.tail(job_id, after_id):
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            event_id, data = item
+            yield f"id: {event_id}\ndata: {json.dumps(data)}\n\n"
+            if data.get('type') == 'job' and data.get('status') in (FAILED, CANCELLED):
+                message = data.get('error') or f"Scrape job {data['status']}"
+                yield f"data: {json.dumps({'type': 'error', 'message': message})}\n\n"
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+        'X-Job-Id': str(job_id),
+    })
+
+
+def run_scrape_job(job, context):
+    """Job handler: replay the queued request against its view, forwarding SSE events to the job log."""
+    payload = job.payload
+    request_kwargs = {'method': 'POST', 'query_string': payload.get('query_string') or None,
+                      'base_url': 'http://localhost'}
+    if payload.get('json') is not None:
+        request_kwargs['json'] = payload['json']
+    with app.test_request_context(payload.get('path', '/'), **request_kwargs), progress.use_channel(f'job:{job.id}'):
+        g.scrape_job_context = context
+        try:
+            response = app.make_response(app.view_functions[job.kind](**(payload.get('view_args') or {})))
+            if response.is_streamed:
+                for chunk in response.response:
+                    if isinstance(chunk, bytes):
+                        chunk = chunk.decode('utf-8', 'replace')
+                    for block in chunk.split('\n\n'):
+                        if block.startswith('data: '):
+                            context.emit(json.loads(block[len('data: '):]))
+                return {'status_code': response.status_code}
+            body = response.get_json(silent=True)
+            context.emit({'type': 'result', 'status_code': response.status_code, 'body': body})
+            return {'status_code': response.status_code, 'body': body}
+        finally:
+            progress.flush()
+
+
+def start_embedded_scrape_worker():
+    """Run a job worker thread inside this process (local `python app.py`, no separate worker)."""
+    import threading
+    worker = create_job_worker(scrape_job_queue, run_scrape_job, isolate=False)
+    threading.Thread(target=worker.run_forever, name='scrape-job-worker', daemon=True).start()
+    return worker
+
+
 def login_required(f):
     """Decorator to require Google OAuth login for admin routes"""
     @wraps(f)
@@ -1448,6 +1732,7 @@ def favicon():
     return redirect(url_for('static', filename='icons/planner-icon-32.png') + '?v=4', code=302)
 
 @app.route('/api/cities')
+@cached_public_response
 def get_cities():
     """Get list of available cities"""
     cities = City.query.all()
@@ -1463,6 +1748,7 @@ def get_venue_types():
     })
 
 @app.route('/api/stats')
+@cached_public_response
 def get_public_stats():
     """Get public statistics for the main page"""
     try:
@@ -1491,7 +1777,11 @@ def add_header(response):
     """
     Disable caching for all routes to ensure the latest UI is always loaded
     during active development and deployment updates.
+    Responses that set their own Cache-Control (image proxies, streams, and the
+    ETag-revalidated public read APIs) keep it.
     """
+    if 'Cache-Control' in response.headers:
+        return response
     response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, post-check=0, pre-check=0, max-age=0'
     response.headers['Pragma'] = 'no-cache'
     response.headers['Expires'] = '-1'
@@ -1515,18 +1805,15 @@ def log_visit():
         user_agent = request.headers.get('User-Agent')
         referrer = request.headers.get('Referer')
         
-        # Create visit record
-        visit = Visit(
-            city_id=city_id if city_id and str(city_id).isdigit() else None,
+        # Buffered; written to the database in batches off the request path
+        visit_recorder.record(
+            city_id=int(city_id) if city_id and str(city_id).isdigit() else None,
             ip_address=ip_address,
             user_agent=user_agent,
             referrer=referrer,
             page_path=page_path
         )
         
-        db.session.add(visit)
-        db.session.commit()
-        
         return jsonify({'success': True})
     except Exception as e:
         app_logger.error(f"Error logging visit: {e}")
@@ -1538,19 +1825,25 @@ def get_visit_stats():
     try:
         from sqlalchemy import func
         
-        # Total visits
-        total_visits = Visit.query.count()
-        
-        # Visits in the last 24 hours
+        # Write this worker's buffered visits so the admin sees their own page views
+        visit_recorder.flush()
+        
+        # Totals and visits by city come from the visit_daily_stats rollup
+        with db.engine.connect() as conn:
+            totals = visit_recorder.totals_by_city(conn)
+        total_visits = sum(totals.values())
+        city_names = dict(
+            db.session.query(City.id, City.name).filter(City.id.in_([c for c in totals if c != NO_CITY])).all()
+        ) if totals else {}
+        by_name = {}
+        for city_id, count in totals.items():
+            name = city_names.get(city_id) or 'Main Page'
+            by_name[name] = by_name.get(name, 0) + count
+        city_data = [{'city': name, 'count': count} for name, count in by_name.items()]
+        
+        # Visits in the last 24 hours (range scan on the timestamp index)
         yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_visits = Visit.query.filter(Visit.timestamp >= yesterday).count()
-        
-        # Visits by city
-        city_stats = db.session.query(
-            City.name, func.count(Visit.id)
-        ).join(City, Visit.city_id == City.id, isouter=True).group_by(City.name).all()
-        
-        city_data = [{'city': name or 'Main Page', 'count': count} for name, count in city_stats]
+        recent_visits = db.session.query(func.count(Visit.id)).filter(Visit.timestamp >= yesterday).scalar()
         
         # Recent visits list
         latest_visits = Visit.query.order_by(Visit.timestamp.desc()).limit(20).all()
@@ -1572,6 +1865,7 @@ def clear_visits():
         # Delete all records from the visits table
         num_deleted = db.session.query(Visit).delete()
         db.session.commit()
+        visit_recorder.clear()
         
         app_logger.info(f"Admin cleared {num_deleted} visit records")
         return jsonify({
@@ -1584,6 +1878,7 @@ def clear_visits():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/sources')
+@cached_public_response
 def get_sources():
     """
     Get sources for a specific city. Reads from the database (not sources.json) so that
@@ -1627,279 +1922,230 @@ def get_sources():
         })
     return jsonify(result)
 
-@app.route('/api/events')
-def get_events():
-    """Get events for a specific city and time range"""
+def _series_occurrences(city_id, start_date, end_date, event_type, today, profile='list', template_filter=None):
+    """Serialized occurrences of the city's event series inside [start_date, end_date] (None = open).
+    With ``city_id=None``, series of any city whose template matches ``template_filter``."""
+    series_filter = build_series_filter(db, EventSeries, start_date, end_date)
+    if city_id is not None:
+        series_filter = db.and_(EventSeries.city_id == city_id, series_filter)
+        template_filter = build_events_filter(db, Event, Venue, city_id, None, None, event_type)
+    rules = {series.id: series.rule() for series in EventSeries.query.filter(series_filter).all()}
+    if not rules:
+        return []
+    templates = event_serializer.fetch(
+        db.and_(template_filter, Event.series_id.in_(list(rules))),
+        order_by=(Event.id,),
+        profile=profile,
+    )
+    return expand_occurrences(templates, rules, start_date, end_date, today)
+
+def _events_request_scope(default_time_range):
+    """
+    (city, city-local now, start_date, end_date) from the ``city_id`` / ``time_range`` /
+    ``custom_*_date`` args shared by /api/events and the calendar feed.
+    Returns (scope, None), or (None, error response) for a missing/unknown city or bad range.
+    """
     city_id = request.args.get('city_id')
-    time_range = request.args.get('time_range', 'this_week')
-    event_type = request.args.get('event_type')
-    include_unselected = request.args.get('include_unselected', 'false').lower() == 'true'
-    
     if not city_id:
-        return jsonify({'error': 'City ID is required'}), 400
+        return None, (jsonify({'error': 'City ID is required'}), 400)
     
     try:
         city_id_int = int(city_id)
     except (ValueError, TypeError):
-        return jsonify({'error': 'Invalid City ID format'}), 400
+        return None, (jsonify({'error': 'Invalid City ID format'}), 400)
         
     city = db.session.get(City, city_id_int)
     if not city:
-        return jsonify({'error': 'City not found'}), 404
+        return None, (jsonify({'error': 'City not found'}), 404)
     
     # Calculate date range based on time_range
     now = datetime.now(pytz.timezone(city.timezone))
+    try:
+        start_date, end_date = resolve_time_range(
+            request.args.get('time_range', default_time_range),
+            now.date(),
+            request.args.get('custom_start_date'),
+            request.args.get('custom_end_date'),
+        )
+    except ValueError as e:
+        return None, (jsonify({'error': str(e)}), 400)
+    return (city, now, start_date, end_date), None
+
+@app.route('/api/events')
+@cached_public_response
+def get_events():
+    """Get events for a specific city and time range.
+
+    Without ``limit``/``cursor`` returns every match as one array (index.html). With them,
+    returns a keyset page ordered by (start_date, id); see scripts/event_pagination.py.
+    ``fields=a,b`` limits the keys of each event.
+    """
+    event_type = request.args.get('event_type')
+    scope, error = _events_request_scope('this_week')
+    if error:
+        return error
+    city, now, start_date, end_date = scope
+    city_id_int = city.id
     
-    if time_range == 'today':
-        start_date = now.date()
-        end_date = now.date()
-    elif time_range == 'tomorrow':
-        start_date = (now + timedelta(days=1)).date()
-        end_date = (now + timedelta(days=1)).date()
-    elif time_range == 'this_week':
-        start_date = now.date()
-        end_date = (now + timedelta(days=6)).date()  # 7 days total including today
-    elif time_range == 'next_week':
-        start_date = (now + timedelta(days=7)).date()
-        end_date = (now + timedelta(days=13)).date()  # 7 days starting next week
-    elif time_range == 'this_month':
-        start_date = now.date()
-        end_date = (now + timedelta(days=29)).date()  # 30 days total including today
-    elif time_range == 'next_month':
-        start_date = (now + timedelta(days=30)).date()
-        end_date = (now + timedelta(days=59)).date()  # 30 days starting next month
-    elif time_range == 'custom':
-        # Handle custom date range from request parameters
-        custom_start = request.args.get('custom_start_date')
-        custom_end = request.args.get('custom_end_date')
-        
-        if not custom_start or not custom_end:
-            return jsonify({'error': 'Custom start and end dates required for custom range'}), 400
-        
-        try:
-            start_date = datetime.strptime(custom_start, '%Y-%m-%d').date()
-            end_date = datetime.strptime(custom_end, '%Y-%m-%d').date()
-        except ValueError:
-            return jsonify({'error': 'Invalid custom date format. Use YYYY-MM-DD'}), 400
-    elif time_range == 'all':
-        # For "all", don't filter by date - return all events
-        # Set a very wide date range (past and far future)
-        start_date = None
-        end_date = None
-    else:
-        return jsonify({'error': 'Invalid time range'}), 400
-    
-    # Query events based on type
-    events = []
-    
-    # Get venues for this city once (used by events)
-    city_venues = Venue.query.filter_by(city_id=city_id).all()
-    venue_ids = [v.id for v in city_venues]
-    
-    # Import for OR condition
-    from sqlalchemy import or_
-    
-    if not event_type or event_type == 'tour':
-        tour_filter = Event.event_type == 'tour'
-        if venue_ids:
-            tour_filter = tour_filter & or_(Event.city_id == city_id, Event.venue_id.in_(venue_ids))
-        else:
-            tour_filter = tour_filter & (Event.city_id == city_id)
-        
-        tour_query = Event.query.filter(tour_filter)
-        # Show all events by default (both selected and unselected)
-        # Users can filter by is_selected on the frontend if needed
-        
-        # Only filter by date if not "all"
-        if time_range != 'all':
-            tour_query = tour_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        
-        tour_events = tour_query.options(db.joinedload(Event.city), db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in tour_events])
+    try:
+        fields = parse_fields(request.args.get('fields'), LIST_PROFILE_FIELDS)
+        paged = any(request.args.get(param) for param in PAGING_PARAMS)
+        limit = parse_limit(request.args.get('limit'))
+        after = decode_cursor(request.args.get('cursor'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    if not event_type or event_type == 'exhibition':
-        exhibition_filter = Event.event_type == 'exhibition'
-        if venue_ids:
-            exhibition_filter = exhibition_filter & or_(Event.city_id == city_id, Event.venue_id.in_(venue_ids))
-        else:
-            exhibition_filter = exhibition_filter & (Event.city_id == city_id)
-        
-        exhibition_query = Event.query.filter(exhibition_filter)
-        # Show all events by default (both selected and unselected)
-        
-        # Only filter by date if not "all"
-        if time_range == 'all':
-            # For "all", show all exhibitions (no date filtering)
-            pass
-        elif time_range == 'today':
-            # For today, only show exhibitions that are currently running
-            exhibition_query = exhibition_query.filter(
-                Event.start_date <= start_date,
-                Event.end_date >= start_date
-            )
-        else:
-            # For other time ranges, show exhibitions that overlap with the range
-            exhibition_query = exhibition_query.filter(
-                Event.start_date <= end_date,
-                Event.end_date >= start_date
-            )
-        
-        exhibition_events = exhibition_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in exhibition_events])
+    # One statement for all event types; per-type scope and date rules live in the planner
+    events_filter = db.and_(
+        build_events_filter(db, Event, Venue, city_id_int, start_date, end_date, event_type),
+        Event.series_id.is_(None),
+    )
+    # Recurring series are stored once and expanded for the requested window only
+    series_occurrences = _series_occurrences(city_id_int, start_date, end_date, event_type, now.date())
+    listed = _public_event_predicate()
     
-    if not event_type or event_type == 'festival':
-        festival_query = Event.query.filter(
-            Event.event_type == 'festival',
-            Event.city_id == city_id
-        )
-        # Show all events by default (both selected and unselected)
-        
-        # Only filter by date if not "all"
-        if time_range != 'all':
-            festival_query = festival_query.filter(
-                Event.start_date <= end_date,
-                Event.end_date >= start_date
-            )
-        
-        festival_events = festival_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in festival_events])
+    if paged:
+        def fetch_batch(cursor, size):
+            criteria = events_filter if cursor is None else db.and_(
+                events_filter, keyset_after(db, Event.start_date, Event.id, cursor))
+            return event_serializer.fetch(criteria, order_by=keyset_order(Event.start_date, Event.id),
+                                          profile='list', limit=size)
+        
+        page = keyset_page(fetch_batch, limit, 'start_date', after=after, extra=series_occurrences, keep=listed)
+        total = None
+        if after is None:
+            total = estimate_count(db, db.select(Event.id).where(events_filter))
+        return _events_page_response(page, fields, total, len(series_occurrences))
     
-    if not event_type or event_type == 'photowalk':
-        photowalk_query = Event.query.filter(
-            Event.event_type == 'photowalk',
-            Event.city_id == city_id
-        )
-        # Show all events by default (both selected and unselected)
-        
-        # Only filter by date if not "all"
-        if time_range != 'all':
-            photowalk_query = photowalk_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        
-        photowalk_events = photowalk_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in photowalk_events])
+    events = event_serializer.fetch(
+        events_filter,
+        order_by=(events_order_by(db, Event), Event.id),
+        profile='list',
+    )
+    if series_occurrences:
+        events = sorted(events + series_occurrences, key=lambda e: event_type_position(e.get('event_type')))
+    events = [event for event in events if listed(event)]
     
-    if not event_type or event_type == 'music':
-        music_query = Event.query.filter(
-            Event.event_type == 'music',
-            Event.city_id == city_id
-        )
-        if time_range != 'all':
-            music_query = music_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        music_events = music_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in music_events])
+    return _events_json_response(project(events, fields))
 
-    if not event_type or event_type == 'film':
-        film_query = Event.query.filter(
-            Event.event_type == 'film',
-            Event.city_id == city_id
-        )
-        if time_range != 'all':
-            film_query = film_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        film_events = film_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in film_events])
-
-    if not event_type or event_type == 'workshop':
-        workshop_query = Event.query.filter(
-            Event.event_type == 'workshop',
-            Event.city_id == city_id
-        )
-        if time_range != 'all':
-            workshop_query = workshop_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        workshop_events = workshop_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in workshop_events])
+@app.route('/api/events/search')
+@cached_public_response
+def search_events():
+    """Full-text search over title, description, artists, curator, organizer and venue name.
 
-    if not event_type or event_type == 'talk':
-        talk_query = Event.query.filter(
-            Event.event_type == 'talk',
-            Event.city_id == city_id
-        )
-        if time_range != 'all':
-            talk_query = talk_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        talk_events = talk_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in talk_events])
+    ``q`` terms all have to match, each as a prefix; results are ranked best first
+    (scripts/event_search.py). Optional ``city_id``, ``event_type``, ``limit`` (default 20)
+    and ``fields``. Searches every date; a recurring series appears once (its template event).
+    """
+    try:
+        terms = query_terms(request.args.get('q'))
+        fields = parse_fields(request.args.get('fields'), LIST_PROFILE_FIELDS)
+        limit = parse_limit(request.args.get('limit'), default=20)
+        city_id = int(request.args['city_id']) if request.args.get('city_id') else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    if not event_type or event_type == 'improv':
-        improv_query = Event.query.filter(
-            Event.event_type == 'improv',
-            Event.city_id == city_id
-        )
-        if time_range != 'all':
-            improv_query = improv_query.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        improv_events = improv_query.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in improv_events])
-
-    # Handle other event types (event, food, community_event, performance, etc.)
-    # These should be included when event_type is empty or matches
-    known_types = ['tour', 'exhibition', 'festival', 'photowalk', 'film', 'workshop', 'talk', 'music', 'improv']
-    if not event_type or event_type not in known_types:
-        if venue_ids:
-            other_filter = or_(Event.city_id == city_id, Event.venue_id.in_(venue_ids))
-        else:
-            other_filter = Event.city_id == city_id
-        
-        other_events = Event.query.filter(other_filter)
-        # Show all events by default (both selected and unselected)
-        
-        # Only filter by date if not "all"
-        if time_range != 'all':
-            other_events = other_events.filter(
-                Event.start_date >= start_date,
-                Event.start_date <= end_date
-            )
-        
-        # If a specific event_type was provided, filter by it
-        if event_type == 'other':
-            # "Other" = event types not in the main categories
-            other_events = other_events.filter(
-                ~Event.event_type.in_(['tour', 'exhibition', 'festival', 'photowalk', 'film', 'workshop', 'talk', 'music', 'event'])
-            )
-        elif event_type:
-            other_events = other_events.filter(Event.event_type == event_type)
+    hits = search_hits(db.engine, terms)
+    criteria = [Event.id == hits.c.event_id]
+    if city_id is not None:
+        criteria.append(Event.city_id == city_id)
+    if request.args.get('event_type'):
+        criteria.append(Event.event_type == request.args['event_type'])
+    if not _is_admin_authenticated():
+        criteria.append(db.or_(Event.effective_visibility.is_(None), Event.effective_visibility != VISIBILITY_ADMIN_ONLY))
+    listed = _public_event_predicate()
+    
+    # Rank order; refill past rows dropped by the Python-side language/visibility filter
+    events, offset, batch_size = [], 0, limit + 10
+    while len(events) < limit:
+        batch = event_serializer.fetch(db.and_(*criteria), order_by=(hits.c.score, Event.id),
+                                       profile='list', limit=batch_size, offset=offset)
+        events += [event for event in batch if listed(event)]
+        if len(batch) < batch_size:
+            break
+        offset += batch_size
+    return _events_json_response(project(events[:limit], fields))
+
+@app.route('/api/events/nearby')
+def nearby_events():
+    """Events within ``radius`` km (default 2, max 50) of ``lat``/``lng``, nearest first.
+
+    Uses the /api/events time ranges and per-type date rules (``time_range`` defaults to
+    ``today``); "today" is in the timezone of ``city_id`` when given, else ``tz`` (default UTC).
+    Optional ``event_type``, ``limit`` (default 100) and ``fields``; each event carries
+    ``distance_km``. Not response-cached: every client location is a different key.
+    """
+    event_type = request.args.get('event_type')
+    try:
+        latitude, longitude = parse_point(request.args.get('lat'), request.args.get('lng'))
+        radius = parse_radius(request.args.get('radius'))
+        fields = parse_fields(request.args.get('fields'), LIST_PROFILE_FIELDS + ('distance_km',))
+        limit = parse_limit(request.args.get('limit'))
+        if request.args.get('city_id'):
+            city = db.session.get(City, int(request.args['city_id']))
+            if not city:
+                return jsonify({'error': 'City not found'}), 404
+            timezone = pytz.timezone(city.timezone)
         else:
-            # Exclude the types we already handled above
-            other_events = other_events.filter(
-                ~Event.event_type.in_(known_types)
-            )
-        
-        other_events = other_events.options(db.joinedload(Event.venue)).all()
-        events.extend([event.to_dict() for event in other_events])
+            timezone = pytz.timezone(request.args.get('tz') or 'UTC')
+        today = datetime.now(timezone).date()
+        start_date, end_date = resolve_time_range(
+            request.args.get('time_range', 'today'), today,
+            request.args.get('custom_start_date'), request.args.get('custom_end_date'),
+        )
+    except pytz.UnknownTimeZoneError:
+        return jsonify({'error': 'Unknown timezone'}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    # Exclude non-English events (e.g. "Spanish-Language Walk-In Tours")
-    from scripts.utils import is_spanish_language_event
-    events = [
-        e for e in events
-        if (e.get('language') or 'English').lower() == 'english'
-        and not is_spanish_language_event(e.get('title', ''))
+    # Geohash prefix ranges cover the radius' bounding box; exact distances trim the corners
+    near = geohash_filter(db, Event.geohash, covering_prefixes(latitude, longitude, radius))
+    def within(criteria):
+        columns = (Event.id, Event.geohash, Event.series_id, Event.start_date, Event.start_time)
+        for row in db.session.execute(db.select(*columns).where(near, criteria)):
+            distance = distance_km(latitude, longitude, row.geohash)
+            if distance <= radius:
+                yield row, round(distance, 3)
+    
+    # (distance, start, id, serialized event): stored events are serialized per batch below
+    ranked = [
+        (distance, f"{row.start_date.isoformat()} {row.start_time.strftime('%H:%M') if row.start_time else ''}",
+         row.id, None)
+        for row, distance in within(db.and_(build_date_filter(db, Event, start_date, end_date, event_type),
+                                            Event.series_id.is_(None)))
     ]
-
-    city_sources = Source.query.filter_by(city_id=city_id_int).all()
-    events = _enrich_event_dicts_visibility(events, city_sources)
-    events = _filter_public_event_dicts(events)
+    # Recurring series: templates within the radius, expanded for the window
+    template_distance = {
+        row.series_id: distance
+        for row, distance in within(db.and_(build_date_filter(db, Event, None, None, event_type),
+                                            Event.series_id.isnot(None)))
+    }
+    if template_distance:
+        occurrences = _series_occurrences(None, start_date, end_date, event_type, today,
+                                          template_filter=Event.series_id.in_(list(template_distance)))
+        ranked += [
+            (template_distance[event['series_id']], f"{event['start_date']} {event.get('start_time') or ''}",
+             event['id'], event)
+            for event in occurrences
+        ]
+    ranked.sort(key=lambda item: item[:3])
     
-    return jsonify(events)
+    listed = _public_event_predicate()
+    events, batch_size = [], limit + 10
+    for start in range(0, len(ranked), batch_size):
+        batch = ranked[start:start + batch_size]
+        ids = [event_id for _, _, event_id, event in batch if event is None]
+        fetched = {event['id']: event for event in event_serializer.fetch(Event.id.in_(ids), profile='list')} if ids else {}
+        for distance, _, event_id, event in batch:
+            event = event or fetched.get(event_id)
+            if event is not None and listed(event):
+                events.append(dict(event, distance_km=distance))
+        if len(events) >= limit:
+            break
+    return _events_json_response(project(events[:limit], fields))
 
 @app.route('/api/venues')
+@cached_public_response
 def get_venues():
     """Get venues for a specific city and venue types"""
     city_id = request.args.get('city_id')
@@ -2007,6 +2253,8 @@ def get_venue_image(photo_reference):
 
 # Default max width for proxied images - keeps all images at loadable size (avoids 2MB+ Wharf images etc)
 IMAGE_PROXY_DEFAULT_MAX_WIDTH = 800
+image_proxy_cache = create_image_proxy_cache()
+
 def _image_unavailable_response():
     """Return 404 so img onerror fires and the card hides the image slot (no grey box)."""
     from flask import Response
@@ -2101,75 +2349,36 @@ def proxy_external_image():
         if 'evbuc.com' in image_url.lower():
             return redirect(image_url, code=302)
         
-        # Disable SSL verification warnings (verify=False avoids SSLContext being passed to stat() in some urllib3 versions)
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # Hosts/URLs that recently answered 403/404 - skip the upstream fetch
+        if image_proxy_cache.is_negative(image_url):
+            return redirect(image_url, code=302)
         
-        # Set Referer/Origin based on image domain - Smithsonian sites block hotlinking and require matching referer
-        parsed = urlparse(image_url)
-        origin_base = f"{parsed.scheme}://{parsed.netloc}" if parsed.netloc else 'https://hirshhorn.si.edu'
-        referer = origin_base + '/' if not origin_base.endswith('/') else origin_base
+        cache_key = image_proxy_cache.key(image_url, max_width)
+        cached = image_proxy_cache.get(cache_key)
+        if cached is None:
+            # One upstream fetch per variant, even when a page requests it many times at once
+            with image_proxy_cache.single_flight(cache_key):
+                cached = image_proxy_cache.get(cache_key)
+                if cached is None:
+                    fetched = _fetch_and_resize_proxy_image(image_url, max_width, domain)
+                    if not isinstance(fetched, tuple):
+                        return fetched
+                    content, content_type = fetched
+                    cached = image_proxy_cache.put(cache_key, content, content_type, image_url, max_width)
+        else:
+            app_logger.debug(f"[image-proxy] Cache hit: {domain}")
         
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': referer,
-            'Origin': origin_base.rstrip('/'),
+            'Cache-Control': 'public, max-age=86400',  # Cache for 24 hours
+            'ETag': cached.etag,
+            'Access-Control-Allow-Origin': '*'  # Allow cross-origin requests
         }
-        
-        # Try regular requests first (works well with proper headers)
-        try:
-            response = requests.get(image_url, headers=headers, timeout=15, allow_redirects=True, verify=False)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            # 403/404 = hotlinking blocked (Eventbrite, etc.) - redirect so browser tries directly
-            if hasattr(e, 'response') and e.response is not None and e.response.status_code in (403, 404):
-                app_logger.debug(f"[image-proxy] Blocked {e.response.status_code} from {domain}, redirecting to direct URL")
-                return redirect(image_url, code=302)
-            # Network unreachable/timeout - skip cloudscraper (it will fail the same way)
-            if _is_network_unreachable_error(e):
-                app_logger.debug(f"Network unreachable for image, skipping cloudscraper: {image_url[:60]}...")
-                raise e
-            # Try cloudscraper for other failures (Cloudflare, etc.)
-            try:
-                import cloudscraper
-                scraper = cloudscraper.create_scraper()
-                app_logger.debug(f"Regular request failed, trying cloudscraper for {image_url[:80]}...")
-                response = scraper.get(image_url, headers=headers, timeout=15, allow_redirects=True, verify=False)
-                response.raise_for_status()
-            except ImportError:
-                raise e
-            except requests.exceptions.RequestException as e2:
-                if hasattr(e2, 'response') and e2.response is not None and e2.response.status_code in (403, 404):
-                    return redirect(image_url, code=302)
-                if _is_network_unreachable_error(e2):
-                    app_logger.debug(f"Network unreachable (cloudscraper): {image_url[:60]}...")
-                else:
-                    app_logger.error(f"Both regular requests and cloudscraper failed for {image_url[:80]}...: {e}, {e2}")
-                raise e2
-        
-        content = response.content
-        content_type = response.headers.get('Content-Type', 'image/jpeg')
-        if not content_type.startswith('image/'):
-            content_type = 'image/jpeg'
-        
-        # Resize if requested (reduces large images like Wharf's 2MB+ to ~50KB for thumbnails)
-        if max_width > 0:
-            content, content_type = _resize_image_if_needed(content, content_type, max_width)
-        
-        app_logger.debug(f"[image-proxy] OK: {domain} ({len(content)} bytes)")
+        if cached.etag and request.if_none_match.contains(cached.etag.strip('"')):
+            return Response(status=304, headers=headers)
         
         # Return the image with proper headers
-        return Response(
-            content,
-            mimetype=content_type,
-            headers={
-                'Cache-Control': 'public, max-age=86400',  # Cache for 24 hours
-                'Content-Type': content_type,
-                'Access-Control-Allow-Origin': '*'  # Allow cross-origin requests
-            }
-        )
+        headers['Content-Type'] = cached.content_type
+        return Response(cached.read(), mimetype=cached.content_type, headers=headers)
         
     except requests.exceptions.RequestException as e:
         # Network errors are expected when offline - log at DEBUG to reduce noise
@@ -2186,27 +2395,173 @@ def proxy_external_image():
         app_logger.error(f"Unexpected error proxying image: {e}")
         return _image_unavailable_response()
 
+
+def _fetch_and_resize_proxy_image(image_url, max_width, domain):
+    """Fetch an image upstream (requests, then cloudscraper) and resize it.
+    Returns (content, content_type), or a redirect response when the host blocks us.
+    """
+    from flask import redirect
+    from urllib.parse import urlparse
+    import requests
+    
+    # Disable SSL verification warnings (verify=False avoids SSLContext being passed to stat() in some urllib3 versions)
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    
+    # Set Referer/Origin based on image domain - Smithsonian sites block hotlinking and require matching referer
+    parsed = urlparse(image_url)
+    origin_base = f"{parsed.scheme}://{parsed.netloc}" if parsed.netloc else 'https://hirshhorn.si.edu'
+    referer = origin_base + '/' if not origin_base.endswith('/') else origin_base
+    
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Referer': referer,
+        'Origin': origin_base.rstrip('/'),
+    }
+    
+    # Try regular requests first (works well with proper headers)
+    try:
+        response = requests.get(image_url, headers=headers, timeout=15, allow_redirects=True, verify=False)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        # 403/404 = hotlinking blocked (Eventbrite, etc.) - redirect so browser tries directly
+        if hasattr(e, 'response') and e.response is not None and e.response.status_code in (403, 404):
+            app_logger.debug(f"[image-proxy] Blocked {e.response.status_code} from {domain}, redirecting to direct URL")
+            image_proxy_cache.mark_negative(image_url, e.response.status_code)
+            return redirect(image_url, code=302)
+        # Network unreachable/timeout - skip cloudscraper (it will fail the same way)
+        if _is_network_unreachable_error(e):
+            app_logger.debug(f"Network unreachable for image, skipping cloudscraper: {image_url[:60]}...")
+            raise e
+        # Try cloudscraper for other failures (Cloudflare, etc.)
+        try:
+            import cloudscraper
+            scraper = cloudscraper.create_scraper()
+            app_logger.debug(f"Regular request failed, trying cloudscraper for {image_url[:80]}...")
+            response = scraper.get(image_url, headers=headers, timeout=15, allow_redirects=True, verify=False)
+            response.raise_for_status()
+        except ImportError:
+            raise e
+        except requests.exceptions.RequestException as e2:
+            if hasattr(e2, 'response') and e2.response is not None and e2.response.status_code in (403, 404):
+                image_proxy_cache.mark_negative(image_url, e2.response.status_code)
+                return redirect(image_url, code=302)
+            if _is_network_unreachable_error(e2):
+                app_logger.debug(f"Network unreachable (cloudscraper): {image_url[:60]}...")
+            else:
+                app_logger.error(f"Both regular requests and cloudscraper failed for {image_url[:80]}...: {e}, {e2}")
+            raise e2
+    
+    content = response.content
+    content_type = response.headers.get('Content-Type', 'image/jpeg')
+    if not content_type.startswith('image/'):
+        content_type = 'image/jpeg'
+    
+    # Resize if requested (reduces large images like Wharf's 2MB+ to ~50KB for thumbnails)
+    if max_width > 0:
+        content, content_type = _resize_image_if_needed(content, content_type, max_width)
+    
+    app_logger.debug(f"[image-proxy] OK: {domain} ({len(content)} bytes)")
+    
+    return content, content_type
+
+def _progress_channel_from_request():
+    """?channel=... or ?job_id=N (a scrape job's channel); None = most recently updated channel"""
+    job_id = request.args.get('job_id', type=int)
+    if job_id:
+        return f'job:{job_id}'
+    return request.args.get('channel') or None
+
 @app.route('/api/scrape-progress')
 def get_scraping_progress():
-    """Get real-time scraping progress"""
-    try:
-        # Read the current scraping progress from a temporary file
-        progress_file = 'scraping_progress.json'
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r') as f:
-                progress_data = json.load(f)
-            return jsonify(progress_data)
+    """Get real-time scraping progress; ?since=<version>&wait=<seconds> long-polls for the next update"""
+    try:
+        channel = _progress_channel_from_request()
+        since = request.args.get('since', type=int)
+        if since is not None:
+            wait = min(max(request.args.get('wait', 20, type=float), 0), 25)
+            version, progress_data = progress.wait(channel, since, timeout=wait)
+        else:
+            version, progress_data = progress.read(channel)
+        if progress_data is not None:
+            return jsonify(dict(progress_data, version=version))
         else:
             return jsonify({
                 'status': 'not_started',
                 'current_step': '',
                 'progress': 0,
                 'events_found': 0,
-                'log_entries': []
+                'log_entries': [],
+                'version': 0
             })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/scrape-progress/stream')
+def stream_scraping_progress():
+    """Server-Sent Events: one progress snapshot per update until the scrape completes or fails"""
+    channel = _progress_channel_from_request()
+    
+    def generate():
+        version = request.args.get('since', 0, type=int)
+        while True:
+            new_version, progress_data = progress.wait(channel, version, timeout=15)
+            if new_version <= version or progress_data is None:
+                yield ": keep-alive\n\n"
+                continue
+            version = new_version
+            yield f"id: {version}\ndata: {json.dumps(dict(progress_data, version=version))}\n\n"
+            if progress_data.get('percentage', 0) >= 100 or progress_data.get('error'):
+                return
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/admin/jobs')
+def list_scrape_jobs():
+    """Recent scrape jobs (optionally ?status=queued|running|succeeded|failed|cancelled)"""
+    limit = min(request.args.get('limit', 50, type=int) or 50, 500)
+    jobs = scrape_job_queue.list(status=request.args.get('status') or None, limit=limit)
+    return jsonify({'jobs': [job.to_dict() for job in jobs]})
+
+@app.route('/api/admin/jobs/<int:job_id>')
+def get_scrape_job(job_id):
+    """Status and result of one scrape job"""
+    job = scrape_job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/admin/jobs/<int:job_id>/events')
+def stream_scrape_job_events(job_id):
+    """Server-Sent Events for a job; reconnects resume from Last-Event-ID (or ?after=)"""
+    if scrape_job_queue.get(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+    after_id = request.headers.get('Last-Event-ID', type=int) or request.args.get('after', 0, type=int)
+    return _job_event_stream(job_id, after_id)
+
+@app.route('/api/admin/jobs/<int:job_id>/cancel', methods=['POST'])
+def cancel_scrape_job(job_id):
+    """Cancel a queued job, or stop a running one"""
+    job = scrape_job_queue.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/admin/jobs/<int:job_id>/retry', methods=['POST'])
+def retry_scrape_job(job_id):
+    """Queue a finished (failed, cancelled or succeeded) job again"""
+    job = scrape_job_queue.retry(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if job.status != 'queued':
+        return jsonify({'error': f'Job is {job.status}; only finished jobs can be retried'}), 409
+    return jsonify(job.to_dict())
+
 def save_event_to_database(event_data, city_id, venue_exhibition_counts, venue_event_counts, max_exhibitions_per_venue, max_events_per_venue):
     """
     Helper function to save a single event to the database with all validation logic.
@@ -2257,24 +2612,8 @@ def save_event_to_database(event_data, city_id, venue_exhibition_counts, venue_e
                 return None, False
         
         # Detect if event is baby-friendly
-        is_baby_friendly = False
-        title_lower = title.lower()
-        description_lower = (event_data.get('description', '') or '').lower()
-        combined_text = f"{title_lower} {description_lower}"
-        
-        baby_keywords = [
-            'baby', 'babies', 'toddler', 'toddlers', 'infant', 'infants',
-            'ages 0-2', 'ages 0–2', 'ages 0 to 2', '0-2 years', '0–2 years',
-            'ages 0-3', 'ages 0–3', 'ages 0 to 3', '0-3 years', '0–3 years',
-            'bring your own baby', 'byob', 'baby-friendly', 'baby friendly',
-            'stroller', 'strollers', 'nursing', 'breastfeeding',
-            'family program', 'family-friendly', 'family friendly',
-            'art & play', 'art and play', 'play time', 'playtime',
-            'children', 'kids', 'little ones', 'young families'
-        ]
-        
-        if any(keyword in combined_text for keyword in baby_keywords):
-            is_baby_friendly = True
+        is_baby_friendly = title_rules.is_baby_friendly(title, event_data.get('description', ''))
+        if is_baby_friendly:
             app_logger.info(f"   👶 Detected baby-friendly event: '{title}'")
         
         # Parse start date
@@ -2496,6 +2835,7 @@ def save_event_to_database(event_data, city_id, venue_exhibition_counts, venue_e
         return None, False
 
 @app.route('/api/scrape-stream', methods=['POST'])
+@scrape_job(stream=True)
 def trigger_scraping_stream():
     """Trigger scraping with Server-Sent Events (SSE) streaming for real-time event updates"""
     def generate():
@@ -2817,248 +3157,60 @@ def trigger_scraping_stream():
         'Cache-Control': 'no-cache',
         'X-Accel-Buffering': 'no'  # Disable buffering in nginx
     })
-
-@app.route('/api/clear-database', methods=['POST'])
-def clear_database():
-    """Clear all data from database"""
-    try:
-        app_logger.info("Starting database clear...")
-        
-        # Clear in order to respect foreign key constraints
-        Event.query.delete()
-        Venue.query.delete()
-        Source.query.delete()
-        City.query.delete()
-        
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Database cleared successfully!'
-        })
-        
-    except Exception as e:
-        app_logger.error(f"Database clear error: {e}")
-        db.session.rollback()
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
-
-@app.route('/api/load-data', methods=['POST'])
-def load_data():
-    """Load data from JSON files into database"""
-    try:
-        import json
-        import os
-        
-        app_logger.info("Starting data loading...")
-        
-        # Clear existing data first
-        app_logger.info("Clearing existing data...")
-        Event.query.delete()
-        Venue.query.delete()
-        Source.query.delete()
-        City.query.delete()
-        db.session.commit()
-        app_logger.info("Existing data cleared")
-        
-        # Load cities
-        cities_loaded = 0
-        try:
-            with open('data/cities.json', 'r') as f:
-                cities_data = json.load(f)
-            
-            if "cities" in cities_data:
-                cities_section = cities_data["cities"]
-                for city_id, city_data in cities_section.items():
-                    city = City(
-                        name=city_data['name'],
-                        state=city_data.get('state'),
-                        country=city_data['country'],
-                        timezone=city_data.get('timezone', 'America/New_York')
-                    )
-                    db.session.add(city)
-                    cities_loaded += 1
-            
-            db.session.commit()
-            app_logger.info(f"Loaded {cities_loaded} cities")
-        except Exception as e:
-            app_logger.error(f"Error loading cities: {e}")
-            return jsonify({
-                'success': False,
-                'error': f'Failed to load cities: {str(e)}'
-            }), 500
-        
-        # Load venues
-        venues_loaded = 0
-        try:
-            app_logger.info("Starting venues loading...")
-            with open('data/venues.json', 'r') as f:
-                venues_data = json.load(f)
-            
-            app_logger.info(f"Venues JSON loaded, keys: {list(venues_data.keys())}")
-            
-            if "venues" in venues_data:
-                venues_section = venues_data["venues"]
-                app_logger.info(f"Found venues section with {len(venues_section)} cities")
-                
-                for city_id, city_data in venues_section.items():
-                    if city_id == "metadata":
-                        continue
-                        
-                    city_name = city_data.get('name', 'Unknown')
-                    city_venues = city_data.get('venues', [])
-                    
-                    app_logger.info(f"Processing city: {city_name} with {len(city_venues)} venues")
-                    
-                    # Find the city
-                    city = City.query.filter_by(name=city_name.split(',')[0].strip()).first()
-                    if not city:
-                        app_logger.warning(f"City not found: {city_name}")
-                        continue
-                    
-                    for venue_data in city_venues:
-                        try:
-                            # Truncate fields to fit database limits
-                            def truncate_field(value, max_length):
-                                if value and len(str(value)) > max_length:
-                                    return str(value)[:max_length]
-                                return value
-                            
-                            venue = Venue(
-                                name=truncate_field(venue_data['name'], 200),
-                                venue_type=truncate_field(venue_data['venue_type'], 50),
-                                address=venue_data.get('address'),  # TEXT field, no limit
-                                latitude=venue_data.get('latitude'),
-                                longitude=venue_data.get('longitude'),
-                                image_url=truncate_field(venue_data.get('image_url'), 500),
-                                instagram_url=truncate_field(venue_data.get('instagram_url'), 200),
-                                facebook_url=truncate_field(venue_data.get('facebook_url'), 200),
-                                twitter_url=truncate_field(venue_data.get('twitter_url'), 200),
-                                youtube_url=truncate_field(venue_data.get('youtube_url'), 200),
-                                tiktok_url=truncate_field(venue_data.get('tiktok_url'), 200),
-                                website_url=truncate_field(venue_data.get('website_url'), 200),
-                                description=venue_data.get('description'),  # TEXT field, no limit
-                                opening_hours=venue_data.get('opening_hours'),  # TEXT field, no limit
-                                holiday_hours=venue_data.get('holiday_hours'),  # TEXT field, no limit
-                                phone_number=truncate_field(venue_data.get('phone_number'), 50),
-                                email=truncate_field(venue_data.get('email'), 200),
-                                tour_info=venue_data.get('tour_info'),  # TEXT field, no limit
-                                admission_fee=venue_data.get('admission_fee'),  # TEXT field, no limit
-                                additional_info=venue_data.get('additional_info'),  # TEXT field, no limit
-                                city_id=city.id
-                            )
-                            db.session.add(venue)
-                            venues_loaded += 1
-                        except Exception as venue_error:
-                            app_logger.error(f"Error creating venue {venue_data.get('name', 'Unknown')}: {venue_error}")
-                            continue
-            
-            db.session.commit()
-            app_logger.info(f"Loaded {venues_loaded} venues")
-        except Exception as e:
-            app_logger.error(f"Error loading venues: {e}")
-            return jsonify({
-                'success': False,
-                'error': f'Failed to load venues: {str(e)}'
-            }), 500
-        
-        # Load sources
-        sources_loaded = 0
-        try:
-            app_logger.info("Starting sources loading...")
-            with open('data/sources.json', 'r') as f:
-                sources_data = json.load(f)
-            
-            app_logger.info(f"Sources JSON loaded, keys: {list(sources_data.keys())}")
-            
-            if "sources" in sources_data:
-                sources_section = sources_data["sources"]
-                app_logger.info(f"Found sources section with {len(sources_section)} sources")
-                
-                for source_id, source_data in sources_section.items():
-                    try:
-                        # Find the city by city_id
-                        city_id = source_data.get('city_id')
-                        if city_id:
-                            # Try multiple lookup methods
-                            city = db.session.get(City, city_id)
-                            if not city:
-                                # Try by name as fallback
-                                city_name = source_data.get('city_name', 'Washington')
-                                city = City.query.filter_by(name=city_name).first()
-                                if not city:
-                                    app_logger.warning(f"City not found for city_id: {city_id}, city_name: {city_name}")
-                                    continue
-                                else:
-                                    app_logger.info(f"Found city by name: {city_name} (ID: {city.id})")
-                            else:
-                                app_logger.info(f"Found city by ID: {city_id} ({city.name})")
-                        else:
-                            app_logger.warning(f"No city_id for source: {source_data.get('name', 'Unknown')}")
-                            continue
-                        
-                        # Handle list fields (convert to JSON string for database)
-                        event_types = source_data.get('event_types', '')
-                        if isinstance(event_types, list):
-                            event_types = json.dumps(event_types)
-                        
-                        covered_cities = source_data.get('covered_cities', '')
-                        if isinstance(covered_cities, list):
-                            covered_cities = json.dumps(covered_cities)
-                        
-                        source = Source(
-                            name=source_data['name'],
-                            handle=source_data.get('handle', ''),
-                            source_type=source_data['source_type'],
-                            url=source_data.get('url'),
-                            description=source_data.get('description'),
-                            city_id=city.id,
-                            covers_multiple_cities=source_data.get('covers_multiple_cities', False),
-                            covered_cities=covered_cities,
-                            event_types=event_types,
-                            is_active=source_data.get('is_active', True),
-                            last_checked=source_data.get('last_checked'),
-                            last_event_found=source_data.get('last_event_found'),
-                            events_found_count=source_data.get('events_found_count', 0),
-                            reliability_score=source_data.get('reliability_score', 5.0),
-                            posting_frequency=source_data.get('posting_frequency'),
-                            notes=source_data.get('notes'),
-                            scraping_pattern=source_data.get('scraping_pattern')
-                        )
-                        db.session.add(source)
-                        sources_loaded += 1
-                    except Exception as source_error:
-                        app_logger.error(f"Error creating source {source_data.get('name', 'Unknown')}: {source_error}")
-                        continue
-            
-            db.session.commit()
-            app_logger.info(f"Loaded {sources_loaded} sources")
-        except Exception as e:
-            app_logger.error(f"Error loading sources: {e}")
-            return jsonify({
-                'success': False,
-                'error': f'Failed to load sources: {str(e)}'
-            }), 500
+
+@app.route('/api/clear-database', methods=['POST'])
+def clear_database():
+    """Clear all data from database"""
+    try:
+        app_logger.info("Starting database clear...")
         
-        # Get final counts
-        cities_count = City.query.count()
-        venues_count = Venue.query.count()
-        sources_count = Source.query.count()
-        events_count = Event.query.count()
+        # Clear in order to respect foreign key constraints
+        Event.query.delete()
+        EventSeries.query.delete()
+        Venue.query.delete()
+        Source.query.delete()
+        City.query.delete()
+        
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'message': 'Database cleared successfully!'
+        })
         
+    except Exception as e:
+        app_logger.error(f"Database clear error: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/load-data', methods=['POST'])
+def load_data():
+    """Replace cities, venues and sources (and clear events) with the contents of data/*.json"""
+    try:
+        app_logger.info("Starting data loading (replacing existing data)...")
+        result = _bulk_load_json_data(replace=True)
+        cities_loaded = result['cities'].loaded
+        venues_loaded = result['venues'].loaded
+        sources_loaded = result['sources'].loaded
+
         return jsonify({
             'success': True,
             'message': f'Data loaded successfully! Cities: {cities_loaded}, Venues: {venues_loaded}, Sources: {sources_loaded}',
             'counts': {
-                'cities': cities_count,
-                'venues': venues_count,
-                'sources': sources_count,
-                'events': events_count
-            }
+                'cities': City.query.count(),
+                'venues': Venue.query.count(),
+                'sources': Source.query.count(),
+                'events': Event.query.count()
+            },
+            'throughput': result.throughput()
         })
-        
+
+    except FileNotFoundError as e:
+        app_logger.error(f"Data loading error: {e}")
+        return jsonify({'success': False, 'error': f'{os.path.basename(e.filename)} not found'}), 404
     except Exception as e:
         app_logger.error(f"Data loading error: {e}")
         return jsonify({
@@ -3067,6 +3219,7 @@ def load_data():
         }), 500
 
 @app.route('/api/scrape', methods=['POST'])
+@scrape_job
 def trigger_scraping():
     """Trigger the scraping process to refresh event data"""
     import signal
@@ -3132,8 +3285,7 @@ def trigger_scraping():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Step 1: Scrape from venues and sources
         all_events = []
@@ -3147,8 +3299,7 @@ def trigger_scraping():
                 'message': f'Scraping events from {len(venue_ids)} venues...'
             })
             
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             
             try:
                 venue_scraper = VenueEventScraper()
@@ -3166,8 +3317,7 @@ def trigger_scraping():
                     'events_found': 0,
                     'venues_processed': 0
                 })
-                with open('scraping_progress.json', 'w') as f:
-                    json.dump(progress_data, f)
+                progress.replace(progress_data)
                 
                 venue_events = venue_scraper.scrape_venue_events(
                     city_id=city_id,
@@ -3189,8 +3339,7 @@ def trigger_scraping():
                     'percentage': 50,
                     'message': f'Found {len(venue_events)} events from {len(venue_ids)} venues. Saving to database...'
                 })
-                with open('scraping_progress.json', 'w') as f:
-                    json.dump(progress_data, f)
+                progress.replace(progress_data)
                 
                 app_logger.info(f"Scraped {len(venue_events)} events from venues")
             except (ConnectionError, Timeout, Exception) as e:
@@ -3213,8 +3362,7 @@ def trigger_scraping():
                 'message': f'Scraping events from {len(source_ids)} sources...'
             })
             
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             
             source_scraper = SourceEventScraper()
             source_events = source_scraper.scrape_source_events(
@@ -3235,8 +3383,7 @@ def trigger_scraping():
                 'percentage': 50,
                 'message': f'Found {len(all_events)} total events. Processing...'
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         
         # Final deduplication across all scraped events
         # For exhibitions, use URL + title to deduplicate across venues with same website
@@ -3280,8 +3427,7 @@ def trigger_scraping():
             'percentage': 60,
             'message': f'Found {len(events_scraped)} unique events after deduplication. Preparing to save...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Save scraped events to file for loading
         scraped_data = {
@@ -3310,8 +3456,7 @@ def trigger_scraping():
             'events_saved': 0  # Reset saved count, will update during saving
         })
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import shared handler
         from scripts.event_database_handler import create_events_in_database as shared_create_events
@@ -3381,8 +3526,7 @@ def trigger_scraping():
                     'percentage': min(70 + int((events_loaded / max(len(events_scraped), 1)) * 20), 90),
                     'message': f'Saving events to database... ({events_loaded}/{len(events_scraped)})'
                 })
-                with open('scraping_progress.json', 'w') as f:
-                    json.dump(progress_data, f)
+                progress.replace(progress_data)
                 
             except Exception as e:
                 app_logger.error(f"❌ Error processing events for venue_id {venue_id}: {e}")
@@ -3404,8 +3548,7 @@ def trigger_scraping():
             'events_saved': events_loaded
         })
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"Scraping completed: {events_loaded} events added")
         
@@ -3461,6 +3604,7 @@ def auth_login():
         return redirect('/admin')
     
     try:
+        from google_auth_oauthlib.flow import Flow
         # Create flow with proper configuration
         flow = Flow.from_client_config(CLIENT_CONFIG, SCOPES)
         
@@ -3500,6 +3644,8 @@ def auth_callback():
         return redirect('/admin')
     
     try:
+        from google_auth_oauthlib.flow import Flow
+        from googleapiclient.discovery import build
         # Create flow without state validation to avoid CSRF issues on Railway
         flow = Flow.from_client_config(CLIENT_CONFIG, SCOPES)
         
@@ -3776,6 +3922,7 @@ def test_oauth():
         return "OAuth not available"
     
     try:
+        from google_auth_oauthlib.flow import Flow
         # Create flow
         flow = Flow.from_client_config(CLIENT_CONFIG, SCOPES)
         flow.redirect_uri = 'https://planner.ozayn.com/auth/callback'
@@ -3959,45 +4106,69 @@ def migrate_schema():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Sort columns the admin grid may request (keyset-paginated with events.id as tie-breaker)
+ADMIN_EVENT_SORTS = ('updated_at', 'created_at', 'start_date', 'title', 'id')
+
+
+def _admin_events_criteria(args):
+    """
+    SQL filters for the admin grid: ``q`` (title/type/description substring), ``event_type``,
+    ``city_id``, ``venue_id``, ``venue_name``, ``visibility``, ``hide_recurring_tours`` and
+    ``has_times``. Raises ValueError for malformed ids.
+    """
+    criteria = []
+    search = (args.get('q') or '').strip()
+    if search:
+        pattern = f"%{search}%"
+        criteria.append(db.or_(Event.title.ilike(pattern), Event.event_type.ilike(pattern),
+                               Event.description.ilike(pattern)))
+    if args.get('event_type'):
+        criteria.append(Event.event_type == args['event_type'])
+    for name, column in (('city_id', Event.city_id), ('venue_id', Event.venue_id)):
+        if args.get(name):
+            try:
+                criteria.append(column == int(args[name]))
+            except ValueError:
+                raise ValueError(f"Invalid {name}")
+    if args.get('venue_name'):
+        criteria.append(Venue.name == args['venue_name'])
+    if args.get('visibility'):
+        criteria.append(Event.effective_visibility == args['visibility'])
+    if args.get('hide_recurring_tours', '').lower() == 'true':
+        generic_tour = db.and_(Event.event_type == 'tour', db.func.lower(db.func.trim(Event.title)).in_(GENERIC_TOUR_TITLES))
+        criteria.append(db.and_(Event.series_id.is_(None), db.not_(generic_tour)))
+    if args.get('has_times', '').lower() == 'true':
+        criteria.append(db.and_(Event.start_time.isnot(None), Event.end_time.isnot(None)))
+    return criteria
+
+
 @app.route('/api/admin/events')
 def admin_events():
-    """Get all events for admin, sorted by most recently updated (most recent first)"""
-    try:
-        events = Event.query.order_by(Event.updated_at.desc()).all()
-        all_sources = Source.query.all()
-        events_data = []
-        
-        for event in events:
-            event_dict = event.to_dict()
-            event_dict.update({
-                'venue_name': event.venue.name if event.venue else None,
-                'city_name': event.city.name if event.city else 'Unknown',
-                'city_timezone': event.city.timezone if event.city else 'UTC'
-            })
-            events_data.append(event_dict)
+    """Get all events for admin, sorted by most recently updated (most recent first).
 
-        events_data = _enrich_event_dicts_visibility(events_data, all_sources)
+    With ``limit``/``cursor`` returns a keyset page instead of the whole table, filtered and
+    sorted server-side (``sort`` in ADMIN_EVENT_SORTS, ``order=asc|desc``, filters in
+    _admin_events_criteria). ``fields=a,b`` limits the keys of each event.
+    """
+    try:
+        try:
+            fields = parse_fields(request.args.get('fields'), FULL_PROFILE_FIELDS)
+            if any(request.args.get(param) for param in PAGING_PARAMS):
+                return _admin_events_page(request.args, fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        return jsonify(events_data)
+        return _events_json_response(project(_admin_event_dicts(), fields))
     except Exception as e:
         error_str = str(e)
         # If error is due to missing columns, try to migrate and retry
         if 'does not exist' in error_str or 'UndefinedColumn' in error_str:
             try:
+                db.session.rollback()
                 success, message, _ = migrate_events_schema()
                 if success:
                     # Retry the query after migration
-                    events = Event.query.order_by(Event.updated_at.desc()).all()
-                    events_data = []
-                    for event in events:
-                        event_dict = event.to_dict()
-                        event_dict.update({
-                            'venue_name': event.venue.name if event.venue else None,
-                            'city_name': event.city.name if event.city else 'Unknown',
-                            'city_timezone': event.city.timezone if event.city else 'UTC'
-                        })
-                        events_data.append(event_dict)
-                    return jsonify(events_data)
+                    return _events_json_response(_admin_event_dicts())
             except Exception as migration_error:
                 return jsonify({
                     'error': f'Query failed and migration failed: {error_str}. Migration error: {str(migration_error)}'
@@ -4005,6 +4176,46 @@ def admin_events():
         
         return jsonify({'error': error_str}), 500
 
+def _admin_events_page(args, fields):
+    """One keyset page of the admin grid (see admin_events)."""
+    sort = args.get('sort', 'updated_at')
+    if sort not in ADMIN_EVENT_SORTS:
+        raise ValueError(f"Invalid sort: {sort}")
+    descending = args.get('order', 'desc' if sort == 'updated_at' else 'asc').lower() == 'desc'
+    limit = parse_limit(args.get('limit'))
+    after = decode_cursor(args.get('cursor'))
+    column = getattr(Event, sort)
+    
+    filters = _admin_events_criteria(args)
+    total = None
+    if after is None:
+        total = estimate_count(db, event_serializer.select('full').where(db.and_(True, *filters)))
+    else:
+        filters.append(keyset_after(db, column, Event.id, after, descending))
+    rows = _admin_event_dicts(db.and_(True, *filters), order_by=keyset_order(column, Event.id, descending),
+                              limit=limit + 1)
+    more = len(rows) > limit
+    rows = rows[:limit]
+    
+    next_cursor = encode_cursor(rows[-1][sort], rows[-1]['id']) if more else None
+    return _events_page_response(Page(rows, next_cursor), fields, total)
+
+
+def _admin_event_dicts(criteria=None, order_by=None, limit=None):
+    """Events as 'full' profile dicts, most recently updated first unless ``order_by`` is given."""
+    events_data = event_serializer.fetch(
+        criteria,
+        order_by=order_by or (Event.updated_at.desc(),),
+        profile='full',
+        limit=limit,
+    )
+    for event_dict in events_data:
+        if event_dict['city_name'] is None:
+            event_dict['city_name'] = 'Unknown'
+        if event_dict['city_timezone'] is None:
+            event_dict['city_timezone'] = 'UTC'
+    return events_data
+
 @app.route('/api/admin/lookup-city', methods=['POST'])
 def lookup_city():
     """Lookup city information with geocoding"""
@@ -4915,14 +5126,39 @@ def fix_column_sizes():
         app_logger.error(f"Error fixing column sizes: {e}")
         return jsonify({'error': str(e)}), 500
 
+def _bulk_load_json_data(replace=False):
+    """
+    Load data/cities.json, venues.json and sources.json in one transaction (scripts/bulk_loader.py).
+    ``replace`` empties events, event series, venues, sources and cities first; otherwise rows
+    are matched by natural key and updated in place so events stay linked.
+    """
+    loader = BulkLoader(City.__table__, Venue.__table__, Source.__table__, data_dir='data')
+    # Release the session's connection so the load can take the write lock (SQLite)
+    db.session.close()
+    with db.engine.begin() as conn:
+        result = loader.load(
+            conn, replace=replace,
+            clear=(Event.__table__, EventSeries.__table__, Venue.__table__, Source.__table__, City.__table__),
+        )
+        if not replace and (result['venues'].updated or result['sources'].updated):
+            # Venue/source visibility may have changed under existing events
+            refresh_effective_visibility(conn, Event, Venue, Source, _effective_event_visibility)
+        if replace or result['venues'].updated:
+            # Cleared events or renamed venues (FTS5 rows do not cascade)
+            refresh_search_index(conn, Event, Venue)
+        if not replace and result['venues'].updated:
+            # Venue coordinates locate the events that inherit them
+            refresh_event_geohash(conn, Event, Venue)
+    # Core writes bypass the session hooks, so invalidate explicitly
+    response_cache.invalidate()
+    app_logger.info(f"✅ Bulk load in {result.seconds:.2f}s: {result.summary()}")
+    return result
+
+
 @app.route('/api/admin/load-all-data', methods=['POST'])
 def load_all_data_to_database():
     """Load all data (cities, venues, sources) from JSON files into database"""
     try:
-        import json
-        from pathlib import Path
-        from datetime import datetime
-        
         app_logger.info("🚀 Loading all data from JSON files...")
         
         # Step 1: Create tables if they don't exist
@@ -4930,7 +5166,6 @@ def load_all_data_to_database():
             db.create_all()
             # Explicitly create visits table if it doesn't exist (for SQLite)
             if 'sqlite' in app.config['SQLALCHEMY_DATABASE_URI']:
-                from sqlalchemy import inspect
                 inspector = db.inspect(db.engine)
                 if 'visits' not in inspector.get_table_names():
                     Visit.__table__.create(db.engine)
@@ -4939,313 +5174,26 @@ def load_all_data_to_database():
             app_logger.error(f"Error creating tables: {e}")
             return jsonify({'error': f'Table creation failed: {str(e)}'}), 500
         
-        # Step 2: Load cities
-        cities_file = Path("data/cities.json")
-        if not cities_file.exists():
-            return jsonify({'error': 'cities.json not found'}), 404
-        
-        with open(cities_file, 'r') as f:
-            cities_data = json.load(f)
-        
-        cities_json = cities_data.get('cities', {})
-        app_logger.info(f"📊 Found {len(cities_json)} cities in JSON")
-        
-        # Get existing cities by name (case-insensitive) to preserve IDs and avoid breaking events/venues/sources
-        existing_cities = {}
-        for city in City.query.all():
-            # Use lowercase name as key for case-insensitive matching
-            key = f"{city.name.lower()}|{city.state or ''}|{city.country or ''}"
-            existing_cities[key] = city
-        
-        app_logger.info(f"📍 Found {len(existing_cities)} existing cities in database")
-        
-        # Process cities from JSON (update existing, add new)
-        cities_updated = 0
-        cities_added = 0
-        cities_skipped = 0
-        
-        for city_id, city_info in cities_json.items():
-            try:
-                city_name = city_info.get('name', '').strip()
-                city_state = city_info.get('state', '').strip()
-                city_country = city_info.get('country', '').strip()
-                city_timezone = city_info.get('timezone', 'UTC')
-                
-                if not city_name:
-                    app_logger.warning(f"Skipping city with no name: {city_info}")
-                    cities_skipped += 1
-                    continue
-                
-                # Create key for matching (case-insensitive)
-                key = f"{city_name.lower()}|{city_state}|{city_country}"
-                
-                # Check if city already exists
-                existing_city = existing_cities.get(key)
-                
-                if existing_city:
-                    # Update existing city (preserve ID to keep events/venues/sources linked)
-                    existing_city.name = city_name
-                    existing_city.state = city_state
-                    existing_city.country = city_country
-                    existing_city.timezone = city_timezone
-                    cities_updated += 1
-                else:
-                    # Add new city
-                    new_city = City(
-                        name=city_name,
-                        country=city_country,
-                        state=city_state,
-                        timezone=city_timezone
-                    )
-                    db.session.add(new_city)
-                    cities_added += 1
-                    
-            except Exception as e:
-                app_logger.error(f"Error processing city {city_info.get('name')}: {e}")
-                cities_skipped += 1
-                continue
-        
-        db.session.commit()
-        cities_loaded = cities_updated + cities_added
-        app_logger.info(f"✅ Processed cities: {cities_updated} updated, {cities_added} added, {cities_skipped} skipped (total: {cities_loaded})")
-        
-        # Step 3: Load venues
-        venues_file = Path("data/venues.json")
-        if not venues_file.exists():
-            return jsonify({'error': 'venues.json not found'}), 404
-        
-        with open(venues_file, 'r') as f:
-            venues_data = json.load(f)
-        
-        venues_json = venues_data.get('venues', {})
-        app_logger.info(f"📊 Found {len(venues_json)} venues in JSON")
-        
-        # Get existing venues by name to preserve IDs and avoid breaking events
-        existing_venues = {}
-        for venue in Venue.query.all():
-            key = venue.name.lower().strip()
-            existing_venues[key] = venue
-        
-        app_logger.info(f"📍 Found {len(existing_venues)} existing venues in database")
-        
-        # Create city name mapping for faster lookups
-        cities_by_name = {city.name: city for city in City.query.all()}
-        
-        venues_updated = 0
-        venues_added = 0
-        venues_skipped = 0
-        
-        for venue_id, venue_data in venues_json.items():
-            # Skip metadata entries
-            if venue_id == 'metadata' or not isinstance(venue_data, dict):
-                continue
-            
-            try:
-                venue_name = venue_data.get('name', '').strip()
-                if not venue_name:
-                    venues_skipped += 1
-                    continue
-                
-                # Get city name from venue data
-                city_name = venue_data.get('city_name', '').strip()
-                if not city_name:
-                    app_logger.warning(f"Venue {venue_name} has no city_name, skipping")
-                    venues_skipped += 1
-                    continue
-                
-                # Find city in database (handle "Washington" or "Washington, DC" format)
-                # Try exact match first, then try without comma
-                city = cities_by_name.get(city_name) or cities_by_name.get(city_name.split(',')[0].strip())
-                
-                # If still not found, try case-insensitive match
-                if not city:
-                    city_name_clean = city_name.split(',')[0].strip()
-                    for db_city_name, db_city in cities_by_name.items():
-                        if db_city_name.lower() == city_name_clean.lower():
-                            city = db_city
-                            break
-                
-                if not city:
-                    app_logger.warning(f"City not found for venue {venue_name}: {city_name} (available cities: {list(cities_by_name.keys())[:5]})")
-                    venues_skipped += 1
-                    continue
-                
-                # Check if venue already exists
-                key = venue_name.lower()
-                existing_venue = existing_venues.get(key)
-                
-                if existing_venue:
-                    # Update existing venue (preserve ID to keep events linked)
-                    existing_venue.venue_type = venue_data.get('venue_type', existing_venue.venue_type or 'museum')
-                    existing_venue.address = venue_data.get('address', existing_venue.address)
-                    existing_venue.latitude = venue_data.get('latitude', existing_venue.latitude)
-                    existing_venue.longitude = venue_data.get('longitude', existing_venue.longitude)
-                    existing_venue.image_url = venue_data.get('image_url', existing_venue.image_url)
-                    existing_venue.instagram_url = venue_data.get('instagram_url', existing_venue.instagram_url)
-                    existing_venue.facebook_url = venue_data.get('facebook_url', existing_venue.facebook_url)
-                    existing_venue.twitter_url = venue_data.get('twitter_url', existing_venue.twitter_url)
-                    existing_venue.youtube_url = venue_data.get('youtube_url', existing_venue.youtube_url)
-                    existing_venue.tiktok_url = venue_data.get('tiktok_url', existing_venue.tiktok_url)
-                    existing_venue.website_url = venue_data.get('website_url', existing_venue.website_url)
-                    existing_venue.description = venue_data.get('description', existing_venue.description)
-                    existing_venue.city_id = city.id
-                    existing_venue.opening_hours = venue_data.get('opening_hours', existing_venue.opening_hours)
-                    existing_venue.holiday_hours = venue_data.get('holiday_hours', existing_venue.holiday_hours)
-                    existing_venue.phone_number = venue_data.get('phone_number', existing_venue.phone_number)
-                    existing_venue.email = venue_data.get('email', existing_venue.email)
-                    existing_venue.tour_info = venue_data.get('tour_info', existing_venue.tour_info)
-                    existing_venue.admission_fee = venue_data.get('admission_fee', existing_venue.admission_fee)
-                    existing_venue.additional_info = venue_data.get('additional_info', existing_venue.additional_info)
-                    venues_updated += 1
-                else:
-                    # Create new venue
-                    venue = Venue(
-                        name=venue_name,
-                        venue_type=venue_data.get('venue_type', 'museum'),
-                        address=venue_data.get('address', ''),
-                        latitude=venue_data.get('latitude'),
-                        longitude=venue_data.get('longitude'),
-                        image_url=venue_data.get('image_url', ''),
-                        instagram_url=venue_data.get('instagram_url', ''),
-                        facebook_url=venue_data.get('facebook_url', ''),
-                        twitter_url=venue_data.get('twitter_url', ''),
-                        youtube_url=venue_data.get('youtube_url', ''),
-                        tiktok_url=venue_data.get('tiktok_url', ''),
-                        website_url=venue_data.get('website_url', ''),
-                        description=venue_data.get('description', ''),
-                        city_id=city.id,
-                        opening_hours=venue_data.get('opening_hours', ''),
-                        holiday_hours=venue_data.get('holiday_hours', ''),
-                        phone_number=venue_data.get('phone_number', ''),
-                        email=venue_data.get('email', ''),
-                        tour_info=venue_data.get('tour_info', ''),
-                        admission_fee=venue_data.get('admission_fee', ''),
-                        additional_info=venue_data.get('additional_info')
-                    )
-                    db.session.add(venue)
-                    venues_added += 1
-            except Exception as e:
-                app_logger.error(f"Error processing venue {venue_data.get('name', 'Unknown')}: {e}")
-                venues_skipped += 1
-                continue
-        
-        db.session.commit()
-        venues_loaded = venues_updated + venues_added
-        app_logger.info(f"✅ Processed venues: {venues_updated} updated, {venues_added} added, {venues_skipped} skipped (total: {venues_loaded})")
-        if venues_skipped > 0:
-            app_logger.warning(f"⚠️  Skipped {venues_skipped} venues (missing city or invalid data)")
-        
-        # Step 4: Load sources
-        sources_file = Path("data/sources.json")
-        if not sources_file.exists():
-            return jsonify({'error': 'sources.json not found'}), 404
-        
-        with open(sources_file, 'r') as f:
-            sources_data = json.load(f)
-        
-        sources_json = sources_data.get('sources', {})
-        app_logger.info(f"📊 Found {len(sources_json)} sources in JSON")
-        
-        # Get existing sources by name to preserve IDs and avoid breaking events
-        existing_sources = {}
-        for source in Source.query.all():
-            key = source.name.lower().strip()
-            existing_sources[key] = source
-        
-        app_logger.info(f"📍 Found {len(existing_sources)} existing sources in database")
-        
-        # Create a mapping of JSON city IDs to actual database city IDs
-        city_id_mapping = {}
-        for json_city_id, city_info in cities_json.items():
-            city = City.query.filter_by(name=city_info.get('name')).first()
-            if city:
-                city_id_mapping[int(json_city_id)] = city.id
-        
-        app_logger.info(f"📍 City ID mapping created: {len(city_id_mapping)} cities mapped")
-        
-        sources_updated = 0
-        sources_added = 0
-        sources_skipped = 0
-        for source_id, source_info in sources_json.items():
-            try:
-                # Map JSON city_id to actual database city_id
-                json_city_id = source_info.get('city_id')
-                actual_city_id = city_id_mapping.get(json_city_id)
-                
-                if not actual_city_id:
-                    app_logger.warning(f"Skipping source {source_info.get('name')} - city_id {json_city_id} not found")
-                    sources_skipped += 1
-                    continue
-                
-                source_name = source_info.get('name', '').strip()
-                if not source_name:
-                    sources_skipped += 1
-                    continue
-                
-                # Check if source already exists
-                key = source_name.lower()
-                existing_source = existing_sources.get(key)
-                
-                if existing_source:
-                    # Update existing source (preserve ID to keep events linked)
-                    existing_source.name = source_name
-                    existing_source.handle = source_info.get('handle', existing_source.handle)
-                    existing_source.source_type = source_info.get('source_type', existing_source.source_type)
-                    existing_source.url = source_info.get('url', existing_source.url)
-                    existing_source.description = source_info.get('description', existing_source.description)
-                    existing_source.city_id = actual_city_id
-                    existing_source.covers_multiple_cities = source_info.get('covers_multiple_cities', False)
-                    existing_source.covered_cities = source_info.get('covered_cities', '')
-                    existing_source.event_types = source_info.get('event_types', '[]')
-                    existing_source.is_active = source_info.get('is_active', True)
-                    existing_source.reliability_score = source_info.get('reliability_score', 3.0)
-                    existing_source.posting_frequency = source_info.get('posting_frequency', '')
-                    existing_source.notes = source_info.get('notes', '')
-                    existing_source.scraping_pattern = source_info.get('scraping_pattern', '')
-                    if 'visibility' in source_info:
-                        existing_source.visibility = _parse_visibility_setting(
-                            source_info.get('visibility'), allow_inherit=True
-                        )
-                    sources_updated += 1
-                else:
-                    # Add new source
-                    source = Source(
-                        name=source_name,
-                        handle=source_info.get('handle'),
-                        source_type=source_info.get('source_type'),
-                        url=source_info.get('url'),
-                        description=source_info.get('description'),
-                        city_id=actual_city_id,  # Use actual database city_id
-                        covers_multiple_cities=source_info.get('covers_multiple_cities', False),
-                        covered_cities=source_info.get('covered_cities', ''),
-                        event_types=source_info.get('event_types', '[]'),
-                        is_active=source_info.get('is_active', True),
-                        reliability_score=source_info.get('reliability_score', 3.0),
-                        posting_frequency=source_info.get('posting_frequency', ''),
-                        notes=source_info.get('notes', ''),
-                        scraping_pattern=source_info.get('scraping_pattern', ''),
-                        visibility=_parse_visibility_setting(
-                            source_info.get('visibility'), allow_inherit=True
-                        ),
-                    )
-                    db.session.add(source)
-                    sources_added += 1
-            except Exception as e:
-                app_logger.error(f"Error processing source {source_info.get('name')}: {e}")
-                sources_skipped += 1
-                continue
+        # Step 2: Upsert cities, venues and sources (existing rows keep their ids)
+        try:
+            result = _bulk_load_json_data(replace=False)
+        except FileNotFoundError as e:
+            return jsonify({'error': f'{os.path.basename(e.filename)} not found'}), 404
         
-        db.session.commit()
-        sources_loaded = sources_updated + sources_added
-        app_logger.info(f"✅ Processed sources: {sources_updated} updated, {sources_added} added, {sources_skipped} skipped (total: {sources_loaded})")
+        cities_loaded = result['cities'].loaded
+        venues_loaded = result['venues'].loaded
+        sources_loaded = result['sources'].loaded
+        if result['venues'].skipped > 0:
+            app_logger.warning(f"⚠️  Skipped {result['venues'].skipped} venues (missing city or invalid data)")
         
         return jsonify({
             'message': f'Successfully loaded all data',
             'cities_loaded': cities_loaded,
             'venues_loaded': venues_loaded,
-            'venues_skipped': venues_skipped,
+            'venues_skipped': result['venues'].skipped,
             'sources_loaded': sources_loaded,
-            'total_items': cities_loaded + venues_loaded + sources_loaded
+            'total_items': cities_loaded + venues_loaded + sources_loaded,
+            'throughput': result.throughput()
         })
         
     except Exception as e:
@@ -5910,8 +5858,9 @@ def clear_events():
         # Count events before deletion
         events_count = Event.query.count()
         
-        # Delete all events
+        # Delete all events (and the recurrence rules of series)
         Event.query.delete()
+        EventSeries.query.delete()
         db.session.commit()
         
         return jsonify({
@@ -7331,6 +7280,7 @@ def extract_event_from_url():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/admin/scrape-event-from-url', methods=['POST'])
+@scrape_job
 def scrape_event_from_url():
     """Scrape event data from a URL and create events based on schedule"""
     try:
@@ -7519,6 +7469,84 @@ def add_event_to_calendar():
         app_logger.error(f"Error adding event to calendar: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Subscribed calendars (webcal://) show this window unless the URL sets time_range
+CALENDAR_FEED_DEFAULT_RANGE = 'this_month'
+
+
+@app.route('/api/calendar/feed.ics')
+def calendar_feed():
+    """
+    Subscribable iCalendar feed for the same filters as /api/events (city_id, time_range,
+    event_type, custom dates); see scripts/ical_feed.py.
+
+    Calendar clients poll it every few minutes. The ETag is built from the data, not just the
+    response cache key: row counts and the latest updated_at of the listed events, their venues,
+    the series and their templates (two aggregate queries), plus the key (query args, role,
+    city-local date, cache generation). A write the cache generation never saw (another
+    container, cache backend down) still changes the ETag, and deletes change the counts.
+    Rendered feeds are cached under key + ETag; a miss is streamed from a server-side cursor.
+    """
+    event_type = request.args.get('event_type')
+    scope, error = _events_request_scope(CALENDAR_FEED_DEFAULT_RANGE)
+    if error:
+        return error
+    city, now, start_date, end_date = scope
+    
+    role = 'admin' if _is_admin_authenticated() else 'public'
+    key = response_cache.key(request.path, [*request.args.items(multi=True), ('_day', now.date().isoformat())], role)
+    events_filter = db.and_(
+        build_events_filter(db, Event, Venue, city.id, start_date, end_date, event_type),
+        Event.series_id.is_(None),
+    )
+    event_count, events_updated, venues_updated = db.session.query(
+        db.func.count(Event.id), db.func.max(Event.updated_at), db.func.max(Venue.updated_at),
+    ).outerjoin(Venue, Event.venue_id == Venue.id).filter(events_filter).one()
+    series_count, series_updated, templates_updated = db.session.query(
+        db.func.count(EventSeries.id), db.func.max(EventSeries.updated_at), db.func.max(Event.updated_at),
+    ).outerjoin(Event, Event.series_id == EventSeries.id).filter(
+        EventSeries.city_id == city.id, build_series_filter(db, EventSeries, start_date, end_date)).one()
+    last_modified = max(filter(None, (events_updated, venues_updated, series_updated, templates_updated)),
+                        default=None)
+    etag = feed_etag(key, city.name, city.timezone, event_count, series_count, last_modified)
+    headers = {
+        'ETag': f'"{etag}"',
+        'Cache-Control': 'private, no-cache' if role == 'admin' else 'public, no-cache',
+        'Vary': 'Cookie',
+    }
+    if last_modified is not None:
+        last_modified = last_modified.replace(tzinfo=pytz.UTC, microsecond=0)
+        headers['Last-Modified'] = http_date(last_modified)
+    if not_modified(request.if_none_match, etag, request.if_modified_since, last_modified):
+        return Response(status=304, headers=headers)
+    
+    headers['Content-Disposition'] = f'inline; filename="planner-{city.id}.ics"'
+    # Keyed on the validator too, so a cached render never outlives the data behind its ETag
+    render_key = f"{key}:{etag}"
+    cached = response_cache.get(render_key)
+    if cached is not None:
+        return Response(cached.body, mimetype='text/calendar', headers=headers)
+    
+    name = f"Planner - {city.name}" + (f" ({event_type})" if event_type else '')
+    first_day = start_date or now.date() - timedelta(days=365)
+    last_day = end_date or now.date() + timedelta(days=365)
+    occurrences = sorted(_series_occurrences(city.id, start_date, end_date, event_type, now.date()),
+                         key=sort_key('start_date'))
+    listed = _public_event_predicate()
+    
+    def generate():
+        rows = event_serializer.stream(events_filter, order_by=keyset_order(Event.start_date, Event.id),
+                                       profile='list')
+        events = (event for event in heapq.merge(rows, occurrences, key=sort_key('start_date')) if listed(event))
+        chunks = []
+        for chunk in iter_calendar(events, city.timezone or 'UTC', name, (first_day.year, last_day.year),
+                                   now=datetime.utcnow()):
+            chunk = chunk.encode('utf-8')
+            chunks.append(chunk)
+            yield chunk
+        response_cache.put(render_key, b''.join(chunks), 'text/calendar')
+    
+    return Response(stream_with_context(generate()), mimetype='text/calendar', headers=headers)
+
 def detect_venue_type(venue_name=None, title=None, url=None, start_location=None):
     """Detect special venue types (NGA, Hirshhorn, Webster's)"""
     venue_name_lower = (venue_name or '').lower()
@@ -7956,6 +7984,7 @@ def create_event_from_venue():
 
 # Event Scraping API Endpoints
 @app.route('/api/admin/scrape-smithsonian', methods=['POST'])
+@scrape_job
 def scrape_smithsonian():
     """Scrape events from Smithsonian museums."""
     try:
@@ -7996,6 +8025,7 @@ def scrape_smithsonian():
         }), 500
 
 @app.route('/api/admin/scrape-museums', methods=['POST'])
+@scrape_job
 def scrape_museums():
     """Scrape events from museums only."""
     try:
@@ -8029,6 +8059,7 @@ def scrape_museums():
         }), 500
 
 @app.route('/api/admin/scrape-all-venues', methods=['POST'])
+@scrape_job
 def scrape_all_venues():
     """Scrape events from all venues."""
     try:
@@ -8062,6 +8093,7 @@ def scrape_all_venues():
         }), 500
 
 @app.route('/api/admin/scrape-finding-awe', methods=['POST'])
+@scrape_job
 def scrape_finding_awe():
     """Scrape all Finding Awe events from NGA."""
     try:
@@ -8083,8 +8115,7 @@ def scrape_finding_awe():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the Finding Awe scraper
         from scripts.nga_finding_awe_scraper import scrape_all_finding_awe_events, create_events_in_database
@@ -8096,8 +8127,7 @@ def scrape_finding_awe():
             'percentage': 20,
             'message': 'Scraping Finding Awe events...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all Finding Awe events (with incremental saving)
         try:
@@ -8126,8 +8156,7 @@ def scrape_finding_awe():
                 'message': '❌ No Finding Awe events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -8147,8 +8176,7 @@ def scrape_finding_awe():
             'events_saved': created_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"Finding Awe scraping completed: found {len(events)} events, created {created_count} new events, skipped {skipped_count} duplicates")
         
@@ -8179,8 +8207,7 @@ def scrape_finding_awe():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -8190,6 +8217,7 @@ def scrape_finding_awe():
         }), 500
 
 @app.route('/api/admin/scrape-nga', methods=['POST'])
+@scrape_job
 def scrape_nga():
     """Scrape all NGA events: Finding Awe, tours, exhibitions, talks, and other events."""
     try:
@@ -8211,8 +8239,7 @@ def scrape_nga():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the comprehensive NGA scraper
         from scripts.nga_comprehensive_scraper import scrape_all_nga_events, create_events_in_database
@@ -8224,8 +8251,7 @@ def scrape_nga():
             'percentage': 10,
             'message': 'Scraping Finding Awe events...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all NGA events
         scrape_error_msg = None
@@ -8247,8 +8273,7 @@ def scrape_nga():
                 'message': f'❌ {err}',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': err,
@@ -8265,8 +8290,7 @@ def scrape_nga():
             'message': f'Saving {len(events)} events to database...',
             'events_found': len(events)
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Create/update events in database
         created_count, updated_count = create_events_in_database(events)
@@ -8281,8 +8305,7 @@ def scrape_nga():
             'events_updated': updated_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"NGA scraping completed: found {len(events)} events, created {created_count} new events, updated {updated_count} existing events")
         
@@ -8313,8 +8336,7 @@ def scrape_nga():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -8324,6 +8346,7 @@ def scrape_nga():
         }), 500
 
 @app.route('/api/admin/scrape-saam', methods=['POST'])
+@scrape_job
 def scrape_saam():
     """Scrape all SAAM events: exhibitions, tours, talks, and other events."""
     try:
@@ -8345,8 +8368,7 @@ def scrape_saam():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the comprehensive SAAM scraper
         from scripts.saam_scraper import scrape_all_saam_events, create_events_in_database
@@ -8358,8 +8380,7 @@ def scrape_saam():
             'percentage': 20,
             'message': 'Scraping SAAM events (exhibitions, tours, talks)...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all SAAM events
         try:
@@ -8379,8 +8400,7 @@ def scrape_saam():
                 'message': '❌ No SAAM events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -8396,8 +8416,7 @@ def scrape_saam():
             'message': f'Saving {len(events)} events to database...',
             'events_found': len(events)
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Create/update events in database
         created_count, updated_count = create_events_in_database(events)
@@ -8412,8 +8431,7 @@ def scrape_saam():
             'events_updated': updated_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"SAAM scraping completed: found {len(events)} events, created {created_count} new events, updated {updated_count} existing events")
         
@@ -8444,8 +8462,7 @@ def scrape_saam():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -8624,6 +8641,7 @@ def search_eventbrite_organizer():
         }), 500
 
 @app.route('/api/admin/scrape-eventbrite', methods=['POST'])
+@scrape_job
 def scrape_eventbrite():
     """Scrape Eventbrite for venue_id or all venues in city_id with eventbrite on ticketing_url (shared scraper; embassies use the same fields as cron)."""
     try:
@@ -8764,6 +8782,7 @@ def scrape_eventbrite():
         }), 500
 
 @app.route('/api/admin/scrape-dc-embassy-eventbrite', methods=['POST'])
+@scrape_job
 def scrape_dc_embassy_eventbrite():
     """Scrape Eventbrite for all Washington DC venues with venue_type embassy and an Eventbrite organizer URL on ticketing_url (shared scripts/eventbrite_scraper.py path; no per-embassy code)."""
     try:
@@ -8946,6 +8965,7 @@ def scrape_dc_embassy_eventbrite():
         }), 500
 
 @app.route('/api/admin/scrape-npg', methods=['POST'])
+@scrape_job
 def scrape_npg():
     """Scrape all NPG events: exhibitions, tours, talks, and other events."""
     try:
@@ -8967,8 +8987,7 @@ def scrape_npg():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the comprehensive NPG scraper
         from scripts.npg_scraper import scrape_all_npg_events, create_events_in_database
@@ -8980,8 +8999,7 @@ def scrape_npg():
             'percentage': 20,
             'message': 'Scraping NPG events (exhibitions, tours, talks, programs)...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all NPG events
         try:
@@ -8999,8 +9017,7 @@ def scrape_npg():
                 'message': '❌ No NPG events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -9016,8 +9033,7 @@ def scrape_npg():
             'message': f'Saving {len(events)} events to database...',
             'events_found': len(events)
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Create/update events in database
         created_count, updated_count = create_events_in_database(events)
@@ -9032,8 +9048,7 @@ def scrape_npg():
             'events_updated': updated_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"NPG scraping completed: found {len(events)} events, created {created_count} new events, updated {updated_count} existing events")
         
@@ -9064,8 +9079,7 @@ def scrape_npg():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -9078,6 +9092,7 @@ def scrape_npg():
         }), 500
 
 @app.route('/api/admin/scrape-suns-cinema', methods=['POST'])
+@scrape_job
 def scrape_suns_cinema_endpoint():
     """Scrape all Suns Cinema movie showtimes and upcoming screenings."""
     try:
@@ -9099,8 +9114,7 @@ def scrape_suns_cinema_endpoint():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the Suns Cinema scraper
         from scripts.suns_cinema_scraper import scrape_all_suns_cinema_events
@@ -9112,8 +9126,7 @@ def scrape_suns_cinema_endpoint():
             'percentage': 30,
             'message': 'Scraping movie showtimes from Suns Cinema...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape events
         events = scrape_all_suns_cinema_events()
@@ -9127,8 +9140,7 @@ def scrape_suns_cinema_endpoint():
             'events_found': len(events),
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         return jsonify({
             'success': True,
@@ -9146,6 +9158,7 @@ def scrape_suns_cinema_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-culture-dc', methods=['POST'])
+@scrape_job
 def scrape_culture_dc_endpoint():
     """Scrape all Culture DC events: music, DJ sets, and upcoming performances."""
     try:
@@ -9167,8 +9180,7 @@ def scrape_culture_dc_endpoint():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the Culture DC scraper
         from scripts.culture_dc_scraper import scrape_all_culture_dc_events
@@ -9177,8 +9189,7 @@ def scrape_culture_dc_endpoint():
         progress_data.update({
             'message': 'Scraping music events from Culture DC...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape events
         events = scrape_all_culture_dc_events()
@@ -9190,8 +9201,7 @@ def scrape_culture_dc_endpoint():
             'events_found': len(events),
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         return jsonify({
             'success': True,
@@ -9209,6 +9219,7 @@ def scrape_culture_dc_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-wharf-dc', methods=['POST'])
+@scrape_job
 def scrape_wharf_dc_endpoint():
     """Scrape all Wharf DC events from the upcoming-events listing page."""
     try:
@@ -9230,14 +9241,12 @@ def scrape_wharf_dc_endpoint():
             'recent_events': []
         }
 
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         from scripts.wharf_dc_scraper import scrape_wharf_dc_events, create_events_in_database_wrapper
 
         progress_data.update({'message': 'Scraping events from Wharf DC...'})
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         events = scrape_wharf_dc_events()
         created, updated, skipped = 0, 0, 0
@@ -9252,8 +9261,7 @@ def scrape_wharf_dc_endpoint():
             'events_updated': updated,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         return jsonify({
             'success': True,
@@ -9274,6 +9282,7 @@ def scrape_wharf_dc_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-shoot-nyc', methods=['POST'])
+@scrape_job
 def scrape_shoot_nyc_endpoint():
     """Scrape Shoot New York City workshops (street photography, walking tours)."""
     try:
@@ -9308,6 +9317,7 @@ def scrape_shoot_nyc_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-metmuseum', methods=['POST'])
+@scrape_job
 def scrape_metmuseum_endpoint():
     """Scrape The Metropolitan Museum of Art tours & programs (met-tours listing)."""
     try:
@@ -9344,6 +9354,7 @@ def scrape_metmuseum_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-tenement-museum', methods=['POST'])
+@scrape_job
 def scrape_tenement_museum_endpoint():
     """Scrape Tenement Museum tours & programs (tenement.org/tours/ listing)."""
     try:
@@ -9384,6 +9395,7 @@ def scrape_tenement_museum_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-dc-urban-walkers', methods=['POST'])
+@scrape_job
 def scrape_dc_urban_walkers_endpoint():
     """Scrape DC Urban Walkers upcoming walks from Meetup."""
     try:
@@ -9424,6 +9436,7 @@ def scrape_dc_urban_walkers_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-big-onion', methods=['POST'])
+@scrape_job
 def scrape_big_onion_endpoint():
     """Scrape Big Onion Walking Tours (bigonion.com listing)."""
     try:
@@ -9464,6 +9477,7 @@ def scrape_big_onion_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-dcparade', methods=['POST'])
+@scrape_job
 def scrape_dcparade_endpoint():
     """Scrape DC Chinese New Year Parade from dcparade.com."""
     try:
@@ -9480,8 +9494,7 @@ def scrape_dcparade_endpoint():
             'events_updated': 0,
             'recent_events': []
         }
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         from scripts.dcparade_scraper import scrape_dcparade_events, create_events_in_database_wrapper
 
@@ -9498,8 +9511,7 @@ def scrape_dcparade_endpoint():
             'events_updated': updated,
             'recent_events': [{'title': e.get('title'), 'date': str(e.get('start_date')), 'time': str(e.get('start_time'))} for e in events[:5]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         return jsonify({
             'success': True,
@@ -9516,6 +9528,7 @@ def scrape_dcparade_endpoint():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/admin/scrape-tulipday', methods=['POST'])
+@scrape_job
 def scrape_tulipday_endpoint():
     """Scrape Tulip Day Washington from tulipday.eu."""
     try:
@@ -9532,8 +9545,7 @@ def scrape_tulipday_endpoint():
             'events_updated': 0,
             'recent_events': []
         }
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         from scripts.tulipday_scraper import scrape_all_tulipday_events
         from scripts.event_database_handler import create_events_in_database as shared_create_events
@@ -9546,8 +9558,7 @@ def scrape_tulipday_endpoint():
                 'message': '❌ No Tulip Day events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -9589,8 +9600,7 @@ def scrape_tulipday_endpoint():
             'events_updated': updated,
             'recent_events': [{'title': e.get('title'), 'date': str(e.get('start_date')), 'time': str(e.get('start_time'))} for e in events[:5]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         return jsonify({
             'success': True,
@@ -9607,6 +9617,7 @@ def scrape_tulipday_endpoint():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/admin/scrape-hammer', methods=['POST'])
+@scrape_job
 def scrape_hammer_endpoint():
     """Scrape Hammer Museum (UCLA) programs and events from hammer.ucla.edu/programs-events."""
     try:
@@ -9678,6 +9689,7 @@ def scrape_hammer_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-deyoung', methods=['POST'])
+@scrape_job
 def scrape_deyoung_endpoint():
     """Scrape de Young Museum (FAMSF) exhibitions from famsf.org."""
     try:
@@ -9751,6 +9763,7 @@ def scrape_deyoung_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-ocma', methods=['POST'])
+@scrape_job
 def scrape_ocma_endpoint():
     """Scrape Orange County Museum of Art (OCMA) via built-in venue scraper path."""
     try:
@@ -9830,6 +9843,7 @@ def scrape_ocma_endpoint():
 
 
 @app.route('/api/admin/scrape-acfdc-dc', methods=['POST'])
+@scrape_job
 def scrape_acfdc_dc_endpoint():
     """Scrape Austrian Cultural Forum Washington (acfdc.org) via shared VenueEventScraper and saved /events path."""
     try:
@@ -9913,6 +9927,7 @@ def scrape_acfdc_dc_endpoint():
 
 
 @app.route('/api/admin/scrape-university-park-library', methods=['POST'])
+@scrape_job
 def scrape_university_park_library_endpoint():
     """Scrape University Park Library (Irvine) from PDF program guide."""
     try:
@@ -9980,6 +9995,7 @@ def scrape_university_park_library_endpoint():
         }), 500
 
 @app.route('/api/admin/scrape-wit-eventbrite', methods=['POST'])
+@scrape_job
 def scrape_wit_eventbrite_endpoint():
     """Scrape Washington Improv Theater events from Eventbrite organizer page."""
     try:
@@ -9996,8 +10012,7 @@ def scrape_wit_eventbrite_endpoint():
             'events_updated': 0,
             'recent_events': []
         }
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         venue = Venue.query.filter(
             (Venue.name.ilike('%washington improv%')) |
@@ -10021,8 +10036,7 @@ def scrape_wit_eventbrite_endpoint():
                 'message': '❌ No WIT Eventbrite events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -10057,8 +10071,7 @@ def scrape_wit_eventbrite_endpoint():
             'events_updated': updated,
             'recent_events': [{'title': e.get('title'), 'date': str(e.get('start_date')), 'time': str(e.get('start_time'))} for e in events[:5]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
 
         return jsonify({
             'success': True,
@@ -10075,6 +10088,7 @@ def scrape_wit_eventbrite_endpoint():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/admin/scrape-asian-art', methods=['POST'])
+@scrape_job
 def scrape_asian_art():
     """Scrape all Asian Art Museum events: exhibitions, tours, talks, and other events."""
     try:
@@ -10096,8 +10110,7 @@ def scrape_asian_art():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the comprehensive Asian Art scraper
         from scripts.asian_art_scraper import scrape_all_asian_art_events, create_events_in_database
@@ -10109,8 +10122,7 @@ def scrape_asian_art():
             'percentage': 10,
             'message': 'Scraping exhibitions, events, and films...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all Asian Art Museum events
         try:
@@ -10130,8 +10142,7 @@ def scrape_asian_art():
                 'message': '❌ No Asian Art Museum events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -10148,8 +10159,7 @@ def scrape_asian_art():
             'message': f'Saving {len(events)} events to database...',
             'events_found': len(events)
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Create/update events in database
         created_count, updated_count = create_events_in_database(events)
@@ -10164,8 +10174,7 @@ def scrape_asian_art():
             'events_updated': updated_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')), 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"Asian Art Museum scraping completed: found {len(events)} events, created {created_count} new events, updated {updated_count} existing events")
         
@@ -10196,8 +10205,7 @@ def scrape_asian_art():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -10211,6 +10219,7 @@ def scrape_asian_art():
 
 
 @app.route('/api/admin/scrape-african-art', methods=['POST'])
+@scrape_job
 def scrape_african_art():
     """Scrape all African Art Museum events: exhibitions, tours, talks, and other events."""
     try:
@@ -10232,8 +10241,7 @@ def scrape_african_art():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the comprehensive African Art scraper
         from scripts.african_art_scraper import scrape_all_african_art_events, create_events_in_database
@@ -10245,8 +10253,7 @@ def scrape_african_art():
             'percentage': 20,
             'message': 'Scraping exhibitions, events, and tours...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all African Art Museum events
         try:
@@ -10266,8 +10273,7 @@ def scrape_african_art():
                 'message': '❌ No African Art Museum events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -10283,8 +10289,7 @@ def scrape_african_art():
             'message': f'Saving {len(events)} events to database...',
             'events_found': len(events)
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Create/update events in database
         created_count, updated_count = create_events_in_database(events)
@@ -10299,8 +10304,7 @@ def scrape_african_art():
             'events_updated': updated_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"African Art Museum scraping completed: found {len(events)} events, created {created_count} new events, updated {updated_count} existing events")
         
@@ -10331,8 +10335,7 @@ def scrape_african_art():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -10345,6 +10348,7 @@ def scrape_african_art():
         }), 500
 
 @app.route('/api/admin/scrape-hirshhorn', methods=['POST'])
+@scrape_job
 def scrape_hirshhorn():
     """Scrape Hirshhorn tours/programs via Tribe Events REST API (exhibitions deferred)."""
     try:
@@ -10365,8 +10369,7 @@ def scrape_hirshhorn():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Find Hirshhorn venue
         hirshhorn = Venue.query.filter(
@@ -10379,8 +10382,7 @@ def scrape_hirshhorn():
                 'message': '❌ Hirshhorn Museum venue not found in database',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'Hirshhorn Museum venue not found in database',
@@ -10397,8 +10399,7 @@ def scrape_hirshhorn():
             'message': f'Scraping tours/programs from Tribe Events API ({hirshhorn.name}); exhibitions skipped...',
             'current_venue': hirshhorn.name
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         from scripts.hirshhorn_scraper import (
             scrape_all_hirshhorn_events,
@@ -10428,8 +10429,7 @@ def scrape_hirshhorn():
             'events_found': len(scraped_events),
             'venues_processed': 1
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         if not scraped_events:
             failure = get_last_scrape_failure() or {}
@@ -10450,8 +10450,7 @@ def scrape_hirshhorn():
                 'message': f'❌ {error_message}',
                 'error': True,
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'message': error_message,
@@ -10475,8 +10474,7 @@ def scrape_hirshhorn():
             'events_found': len(scraped_events),
             'venues_processed': 1
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         created_count, updated_count, skipped_count = create_events_in_database(scraped_events)
         events_saved = created_count
@@ -10526,8 +10524,7 @@ def scrape_hirshhorn():
             'events_saved': events_saved,
             'recent_events': recent_events_list,
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         return jsonify({
             'success': True,
@@ -10553,6 +10550,7 @@ def scrape_hirshhorn():
         }), 500
 
 @app.route('/api/admin/scrape-websters', methods=['POST'])
+@scrape_job
 def scrape_websters():
     """Scrape all events from Webster's Bookstore Cafe."""
     try:
@@ -10574,8 +10572,7 @@ def scrape_websters():
             'recent_events': []
         }
         
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Import the Webster's scraper
         from scripts.websters_scraper import scrape_websters_events, create_events_in_database
@@ -10587,8 +10584,7 @@ def scrape_websters():
             'percentage': 20,
             'message': 'Scraping Webster\'s events...'
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Scrape all Webster's events
         try:
@@ -10608,8 +10604,7 @@ def scrape_websters():
                 'message': '❌ No Webster\'s events found or scraping failed',
                 'error': True
             })
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
             return jsonify({
                 'success': False,
                 'error': 'No events found or scraping failed',
@@ -10624,8 +10619,7 @@ def scrape_websters():
             'message': f'Saving {len(events)} events to database...',
             'events_found': len(events)
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         # Create events in database
         created_count = create_events_in_database(events)
@@ -10640,8 +10634,7 @@ def scrape_websters():
             'events_saved': created_count,
             'recent_events': [{'title': e.get('title', 'Unknown'), 'type': e.get('event_type', 'unknown'), 'date': str(e.get('start_date')) if e.get('start_date') else None, 'time': str(e.get('start_time')) if e.get('start_time') else None, 'location': e.get('location')} for e in events[:10]]
         })
-        with open('scraping_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        progress.replace(progress_data)
         
         app_logger.info(f"Webster's scraping completed: found {len(events)} events, created {created_count} new events, skipped {skipped_count} duplicates")
         
@@ -10672,8 +10665,7 @@ def scrape_websters():
                 'error': True,
                 'timestamp': datetime.utcnow().isoformat() + 'Z'
             }
-            with open('scraping_progress.json', 'w') as f:
-                json.dump(progress_data, f)
+            progress.replace(progress_data)
         except:
             pass
         
@@ -10723,4 +10715,9 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', 5001))
     debug = os.getenv('FLASK_ENV') != 'production'
     
+    # No separate worker process locally: run queued scrapes in this one (reloader child only)
+    if jobs_enabled() and os.getenv('SCRAPE_JOB_EMBEDDED_WORKER', '1') != '0' and (
+            not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+        start_embedded_scrape_worker()
+    
     app.run(debug=debug, port=port, host='0.0.0.0')
\ No newline at end of file
@@ -0,0 +1,390 @@
+"""
+Bulk import of cities, venues and sources from ``data/*.json`` (``/api/load-data`` and
+``/api/admin/load-all-data``).
+
+The ORM loaders added one object at a time and looked each venue's city up with its own query.
+Here every table is read once, natural keys are resolved in memory, and rows are written with
+executemany ``UPDATE`` / ``INSERT`` statements in batches, all inside one transaction:
+
+- **cities** are keyed by ``(lower(name), state, country)``,
+- **venues** by ``lower(name)``; the city comes from ``city_name`` (case-insensitive, then the
+  part before a comma) or the ``cities.json`` id in ``city_id``,
+- **sources** by ``lower(name)``; the city comes from the ``cities.json`` id, then ``city_name``.
+
+Existing rows keep their ids (events stay linked) and fields missing from the JSON keep their
+current value. ``replace=True`` first deletes the given tables (``/api/load-data`` semantics).
+String values are truncated to their column length. ``venues.json`` may be flat
+(``{id: venue}``) or grouped by city (``{id: {"name": city, "venues": [...]}}``).
+
+The tables carry no unique constraints on these keys, so ``ON CONFLICT`` is not available;
+the key lookup happens in Python against one ``SELECT`` per table instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_TIMEZONE = 'UTC'
+VISIBILITY_VALUES = ('public', 'admin_only')
+
+CITY_FIELDS = ('name', 'state', 'country', 'timezone')
+VENUE_FIELDS = (
+    'name', 'venue_type', 'address', 'latitude', 'longitude', 'image_url', 'instagram_url',
+    'facebook_url', 'twitter_url', 'youtube_url', 'tiktok_url', 'website_url', 'ticketing_url',
+    'description', 'opening_hours', 'holiday_hours', 'phone_number', 'email', 'tour_info',
+    'admission_fee', 'additional_info', 'city_id',
+)
+SOURCE_FIELDS = (
+    'name', 'handle', 'source_type', 'url', 'description', 'city_id', 'covers_multiple_cities',
+    'covered_cities', 'event_types', 'is_active', 'last_checked', 'last_event_found',
+    'events_found_count', 'reliability_score', 'posting_frequency', 'notes', 'scraping_pattern',
+    'visibility',
+)
+# Values for new rows when the JSON leaves a field out (None otherwise)
+VENUE_DEFAULTS = {'venue_type': 'museum'}
+SOURCE_DEFAULTS = {
+    'handle': '', 'source_type': 'website', 'covers_multiple_cities': False, 'covered_cities': '',
+    'event_types': '[]', 'is_active': True, 'events_found_count': 0, 'reliability_score': 5.0,
+}
+DATETIME_FIELDS = ('last_checked', 'last_event_found')
+
+
+@dataclass
+class TableStats:
+    """Rows written to one table and how long it took."""
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def loaded(self) -> int:
+        return self.inserted + self.updated
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.loaded / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'skipped': self.skipped,
+            'seconds': round(self.seconds, 4),
+            'rows_per_second': round(self.rows_per_second, 1),
+        }
+
+
+@dataclass
+class LoadResult:
+    """Per-table stats of one bulk load, in load order."""
+    tables: Dict[str, TableStats] = field(default_factory=dict)
+    cleared: bool = False
+
+    def __getitem__(self, table: str) -> TableStats:
+        return self.tables[table]
+
+    @property
+    def seconds(self) -> float:
+        return sum(stats.seconds for stats in self.tables.values())
+
+    def throughput(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self.tables.items()}
+
+    def summary(self) -> str:
+        return ', '.join(
+            f"{name}: {stats.inserted} added, {stats.updated} updated, {stats.skipped} skipped "
+            f"({stats.rows_per_second:.0f} rows/s)"
+            for name, stats in self.tables.items()
+        )
+
+
+def _text(value: Any) -> str:
+    return str(value).strip() if value is not None else ''
+
+
+def _city_key(name: Any, state: Any, country: Any) -> Tuple[str, str, str]:
+    return (_text(name).lower(), _text(state), _text(country))
+
+
+def _json_list(value: Any) -> Any:
+    return json.dumps(value) if isinstance(value, (list, dict)) else value
+
+
+def _datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _visibility(value: Any) -> Optional[str]:
+    vis = _text(value).lower()
+    return vis if vis in VISIBILITY_VALUES else None
+
+
+def _batches(rows: Sequence[Dict[str, Any]], size: int) -> Iterator[Sequence[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def read_section(path: Path, section: str) -> Iterator[Tuple[str, Any]]:
+    """(key, entry) pairs of ``section`` in a data file, skipping the metadata entry."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    entries = data.get(section, {}) if isinstance(data, dict) else {}
+    for key, entry in entries.items():
+        if key != 'metadata' and isinstance(entry, dict):
+            yield key, entry
+
+
+def iter_venues(entries: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """Venue dicts from a flat or city-grouped ``venues.json`` section."""
+    for key, entry in entries:
+        if isinstance(entry.get('venues'), list):
+            for venue in entry['venues']:
+                if isinstance(venue, dict):
+                    yield {'city_name': entry.get('name', ''), 'city_id': key, **venue}
+        else:
+            yield entry
+
+
+class BulkLoader:
+    """
+    Loads cities, venues and sources into the given SQLAlchemy Core tables on one connection.
+
+    The caller owns the transaction (``with engine.begin() as conn: loader.load(conn)``), so a
+    failure anywhere leaves the database untouched.
+    """
+
+    def __init__(self, cities, venues, sources, data_dir='data', batch_size: int = DEFAULT_BATCH_SIZE):
+        self.cities = cities
+        self.venues = venues
+        self.sources = sources
+        self.data_dir = Path(data_dir)
+        self.batch_size = max(1, batch_size)
+
+    # -- entry point ---------------------------------------------------------------------------
+
+    def load(self, conn, replace: bool = False, clear: Sequence = ()) -> LoadResult:
+        """
+        Upsert everything from ``cities.json``, ``venues.json`` and ``sources.json``.
+        With ``replace``, the ``clear`` tables (children first) are emptied beforehand.
+        """
+        result = LoadResult(cleared=replace)
+        if replace:
+            for table in clear:
+                conn.execute(table.delete())
+
+        city_entries = list(read_section(self.data_dir / 'cities.json', 'cities'))
+        result.tables['cities'] = self._load_cities(conn, city_entries)
+
+        city_ids = self._city_ids(conn)
+        json_city_ids = self._json_city_ids(city_entries, city_ids)
+        result.tables['venues'] = self._load_venues(
+            conn, iter_venues(read_section(self.data_dir / 'venues.json', 'venues')), city_ids, json_city_ids,
+        )
+        result.tables['sources'] = self._load_sources(
+            conn, read_section(self.data_dir / 'sources.json', 'sources'), city_ids, json_city_ids,
+        )
+        logger.debug(f"Bulk load: {result.summary()}")
+        return result
+
+    # -- tables --------------------------------------------------------------------------------
+
+    def _load_cities(self, conn, entries) -> TableStats:
+        stats = TableStats('cities')
+        started = time.perf_counter()
+        existing = {
+            _city_key(row.name, row.state, row.country): row.id
+            for row in conn.execute(self.cities.select().with_only_columns(
+                self.cities.c.id, self.cities.c.name, self.cities.c.state, self.cities.c.country))
+        }
+        inserts, updates, seen = [], [], set()
+        for _, entry in entries:
+            name = _text(entry.get('name'))
+            if not name:
+                stats.skipped += 1
+                continue
+            row = {
+                'name': name,
+                'state': _text(entry.get('state')),
+                'country': _text(entry.get('country')),
+                'timezone': _text(entry.get('timezone')) or DEFAULT_TIMEZONE,
+            }
+            key = _city_key(name, row['state'], row['country'])
+            if key in seen:
+                stats.skipped += 1
+                continue
+            seen.add(key)
+            if key in existing:
+                updates.append({'_id': existing[key], **row})
+            else:
+                inserts.append(row)
+        self._write(conn, self.cities, CITY_FIELDS, inserts, updates, stats)
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def _load_venues(self, conn, entries, city_ids, json_city_ids) -> TableStats:
+        stats = TableStats('venues')
+        started = time.perf_counter()
+        existing = self._existing_by_name(conn, self.venues, VENUE_FIELDS)
+        cities_by_name = self._cities_by_name(city_ids)
+        inserts, updates = [], []
+        for entry in entries:
+            name = _text(entry.get('name'))
+            city_id = self._resolve_city(entry.get('city_name'), cities_by_name) \
+                or json_city_ids.get(_text(entry.get('city_id')))
+            if not name or not city_id:
+                if name:
+                    logger.warning(f"City not found for venue {name}: {entry.get('city_name')}")
+                stats.skipped += 1
+                continue
+            values = {f: entry[f] for f in VENUE_FIELDS if f in entry}
+            values.update(name=name, city_id=city_id)
+            self._stage(self.venues, VENUE_FIELDS, VENUE_DEFAULTS, values, existing, inserts, updates)
+        self._write(conn, self.venues, VENUE_FIELDS, inserts, updates, stats)
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def _load_sources(self, conn, entries, city_ids, json_city_ids) -> TableStats:
+        stats = TableStats('sources')
+        started = time.perf_counter()
+        existing = self._existing_by_name(conn, self.sources, SOURCE_FIELDS)
+        cities_by_name = self._cities_by_name(city_ids)
+        inserts, updates = [], []
+        for _, entry in entries:
+            name = _text(entry.get('name'))
+            city_id = json_city_ids.get(_text(entry.get('city_id'))) \
+                or self._resolve_city(entry.get('city_name'), cities_by_name)
+            if not name or not city_id:
+                if name:
+                    logger.warning(f"Skipping source {name} - city_id {entry.get('city_id')} not found")
+                stats.skipped += 1
+                continue
+            values = {f: entry[f] for f in SOURCE_FIELDS if f in entry}
+            values.update(name=name, city_id=city_id)
+            for list_field in ('covered_cities', 'event_types'):
+                if list_field in values:
+                    values[list_field] = _json_list(values[list_field])
+            for date_field in DATETIME_FIELDS:
+                if date_field in values:
+                    values[date_field] = _datetime(values[date_field])
+            if 'visibility' in values:
+                values['visibility'] = _visibility(values['visibility'])
+            self._stage(self.sources, SOURCE_FIELDS, SOURCE_DEFAULTS, values, existing, inserts, updates)
+        self._write(conn, self.sources, SOURCE_FIELDS, inserts, updates, stats)
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    # -- helpers -------------------------------------------------------------------------------
+
+    def _city_ids(self, conn) -> Dict[Tuple[str, str, str], int]:
+        table = self.cities
+        rows = conn.execute(table.select().with_only_columns(
+            table.c.id, table.c.name, table.c.state, table.c.country).order_by(table.c.id))
+        city_ids = {}
+        for row in rows:
+            city_ids.setdefault(_city_key(row.name, row.state, row.country), row.id)
+        return city_ids
+
+    @staticmethod
+    def _json_city_ids(entries, city_ids) -> Dict[str, int]:
+        """``cities.json`` id -> database id, via the natural key."""
+        mapping = {}
+        for json_id, entry in entries:
+            city_id = city_ids.get(_city_key(entry.get('name'), entry.get('state'), entry.get('country')))
+            if city_id:
+                mapping[_text(json_id)] = city_id
+        return mapping
+
+    @staticmethod
+    def _cities_by_name(city_ids) -> Dict[str, int]:
+        by_name = {}
+        for (name, _, _), city_id in city_ids.items():
+            by_name.setdefault(name, city_id)
+        return by_name
+
+    @staticmethod
+    def _resolve_city(city_name: Any, cities_by_name: Dict[str, int]) -> Optional[int]:
+        """City id for "Washington" or "Washington, DC" (case-insensitive)."""
+        name = _text(city_name).lower()
+        if not name:
+            return None
+        return cities_by_name.get(name) or cities_by_name.get(name.split(',')[0].strip())
+
+    @staticmethod
+    def _existing_by_name(conn, table, fields) -> Dict[str, Dict[str, Any]]:
+        """Current rows keyed by lower(name); the first (lowest id) row wins on duplicates."""
+        columns = [table.c.id] + [table.c[f] for f in fields]
+        existing = {}
+        for row in conn.execute(table.select().with_only_columns(*columns).order_by(table.c.id)):
+            existing.setdefault(_text(row.name).lower(), dict(row._mapping))
+        return existing
+
+    @staticmethod
+    def _stage(table, fields, defaults, values, existing, inserts, updates) -> None:
+        """
+        Queue ``values`` as an update of the existing row with the same name (fields absent from
+        the JSON keep their value) or as a new row. A name repeated in the JSON merges into the
+        row already queued for it.
+        """
+        key = values['name'].lower()
+        current = existing.get(key)
+        if current is None:
+            row = {f: values.get(f, defaults.get(f)) for f in fields}
+        else:
+            row = {f: values.get(f, current[f]) for f in fields}
+        for f in fields:
+            if row[f] is None and not table.c[f].nullable and f in defaults:
+                row[f] = defaults[f]
+
+        queued = current.get('_queued') if current else None
+        if queued:
+            target, index = queued
+            row['_id'] = current.get('id')
+            target[index] = row
+        elif current is not None:
+            row['_id'] = current['id']
+            updates.append(row)
+            queued = (updates, len(updates) - 1)
+        else:
+            row['_id'] = None
+            inserts.append(row)
+            queued = (inserts, len(inserts) - 1)
+        existing[key] = {**row, 'id': row['_id'], '_queued': queued}
+
+    def _write(self, conn, table, fields, inserts, updates, stats) -> None:
+        from sqlalchemy import bindparam
+
+        limits = {f: table.c[f].type.length for f in fields
+                  if getattr(table.c[f].type, 'length', None)}
+
+        def fit(row):
+            for f, limit in limits.items():
+                value = row.get(f)
+                if isinstance(value, str) and len(value) > limit:
+                    row[f] = value[:limit]
+            return row
+
+        if updates:
+            stmt = table.update().where(table.c.id == bindparam('_id')).values(
+                {f: bindparam(f) for f in fields})
+            for batch in _batches([fit(row) for row in updates], self.batch_size):
+                conn.execute(stmt, list(batch))
+        for batch in _batches([fit({f: row[f] for f in fields}) for row in inserts], self.batch_size):
+            conn.execute(table.insert(), list(batch))
+        stats.updated += len(updates)
+        stats.inserted += len(inserts)
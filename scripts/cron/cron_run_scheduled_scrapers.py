@@ -7,6 +7,9 @@ Operational buckets (see scripts/cron_bucket_config.py):
 - protected: troublesome direct website scrapers only (Asian Art, NPG, Hirshhorn, …)
 
 Per-scraper run rules (always vs seasonal) are in scripts/cron_scheduler_config.py.
+Scrapers run concurrently with per-domain limits via scripts/cron/cron_scrape_pool.py.
+A scraper whose events match its last reconciled run skips the database upsert
+(scripts/scraper_utils/fingerprints.py); pass --full-rescan to reconcile everything.
 
 Usage:
     source venv/bin/activate && python scripts/cron_run_scheduled_scrapers.py
@@ -14,13 +17,16 @@ Usage:
 
 Cronjob examples:
     python scripts/cron_run_scheduled_scrapers.py --bucket stable
+    python scripts/cron_run_scheduled_scrapers.py --bucket stable --full-rescan
     python scripts/cron_run_protected_scrapers.py
 """
 
 import argparse
+import importlib
 import os
 import sys
 import logging
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -46,6 +52,13 @@ from scripts.cron_scheduler_config import (
     get_standalone_schedule_rule,
 )
 from scripts.cron.cron_env_validation import validate_cron_env
+from scripts.cron.cron_scrape_pool import (
+    ScrapeJob,
+    ScrapeResult,
+    create_scrape_scheduler,
+    politeness_domain,
+)
+from scripts.scraper_utils.fingerprints import events_fingerprint, get_fingerprint_store
 
 
 def configure_logging(bucket: str) -> None:
@@ -122,8 +135,377 @@ def get_eventbrite_extra_venues(all_venues):
     return extra
 
 
-def run_scheduled_scrapers(bucket: str = BUCKET_STABLE) -> int:
-    """Run scheduled scrapers for the given operational bucket."""
+# Scraper clients hold a requests.Session, so each worker thread gets its own instance
+_thread_clients = threading.local()
+
+
+def _thread_client(name, factory):
+    client = getattr(_thread_clients, name, None)
+    if client is None:
+        client = factory()
+        setattr(_thread_clients, name, client)
+    return client
+
+
+def _eventbrite_scraper():
+    from scripts.eventbrite_scraper import EventbriteScraper
+    return _thread_client('eventbrite', EventbriteScraper)
+
+
+def _venue_scraper():
+    from scripts.venue_event_scraper import VenueEventScraper
+    return _thread_client('venue', VenueEventScraper)
+
+
+# Scraping settings for the weekly run: 'this_month' gives a good range of upcoming events
+TIME_RANGE = 'this_month'
+MAX_EVENTS_PER_VENUE = 50
+MAX_EXHIBITIONS_PER_VENUE = 20
+
+# Museum scrapers called directly (same as admin buttons) so venue_id comes from event content:
+# (url fragment, label, module, scrape function). Each module's create_events_in_database(events)
+# returns (created, updated) or (created, updated, skipped).
+MUSEUM_MODULE_SCRAPERS = [
+    ('nga.gov', 'NGA', 'scripts.nga_comprehensive_scraper', 'scrape_all_nga_events'),
+    ('americanart.si.edu', 'SAAM', 'scripts.saam_scraper', 'scrape_all_saam_events'),
+    ('npg.si.edu', 'NPG', 'scripts.npg_scraper', 'scrape_all_npg_events'),
+    ('asia.si.edu', 'Asian Art', 'scripts.asian_art_scraper', 'scrape_all_asian_art_events'),
+    ('africa.si.edu', 'African Art', 'scripts.african_art_scraper', 'scrape_all_african_art_events'),
+    ('hirshhorn.si.edu', 'Hirshhorn', 'scripts.hirshhorn_scraper', 'scrape_all_hirshhorn_events'),
+]
+
+# Extra text for a museum's result line
+MUSEUM_RESULT_NOTES = {
+    'Hirshhorn': '(Tribe Events API; exhibitions deferred)',
+}
+
+# Museum scrapers that save while scraping; every returned event counts as saved
+SELF_SAVING_MUSEUM_SCRAPERS = [
+    ('sunscinema.com', 'Suns Cinema', 'scripts.suns_cinema_scraper', 'scrape_all_suns_cinema_events'),
+    ('culturedc.com', 'Culture DC', 'scripts.culture_dc_scraper', 'scrape_all_culture_dc_events'),
+]
+
+# Standalone scrapers with a module-level save function:
+# (scraper id, icon, label, module, scrape function, save function, politeness domain)
+STANDALONE_MODULE_SCRAPERS = [
+    ('websters', '🏛️', "Webster's | Webster's Bookstore Cafe", 'scripts.websters_scraper',
+     'scrape_websters_events', 'create_events_in_database', 'webstersbooksandcafe.com'),
+    ('wharf_dc', '🏛️', 'Wharf DC | The Wharf DC', 'scripts.wharf_dc_scraper',
+     'scrape_wharf_dc_events', 'create_events_in_database_wrapper', 'wharfdc.com'),
+    ('dc_urban_walkers', '🚶', 'DC Urban Walkers | Meetup', 'scripts.dc_urban_walkers_scraper',
+     'scrape_dc_urban_walkers_events', 'create_events_in_database_wrapper', 'meetup.com'),
+    ('shoot_nyc', '📷', 'Shoot NYC | Shoot New York City', 'scripts.shoot_nyc_scraper',
+     'scrape_shoot_nyc_events', 'create_events_in_database_wrapper', 'shootnyc.com'),
+    ('metmuseum', '🏛️', 'The Met | The Metropolitan Museum of Art', 'scripts.metmuseum_scraper',
+     'scrape_metmuseum_events', 'create_events_in_database_wrapper', 'metmuseum.org'),
+    ('tenement_museum', '🏠', 'Tenement Museum | Tenement Museum', 'scripts.tenement_museum_scraper',
+     'scrape_tenement_museum_events', 'create_events_in_database_wrapper', 'tenement.org'),
+    ('big_onion', '🧅', 'Big Onion | Big Onion Walking Tours', 'scripts.big_onion_scraper',
+     'scrape_big_onion_events', 'create_events_in_database_wrapper', 'bigonion.com'),
+    ('dcparade', '🏮', 'DC Parade | DC Chinese New Year Parade', 'scripts.dcparade_scraper',
+     'scrape_dcparade_events', 'create_events_in_database_wrapper', 'dcparade.com'),
+]
+
+# Standalone scrapers for one venue saved through the shared handler:
+# (scraper id, label, venue name/url filters, module + scrape function or None for VenueEventScraper,
+#  source url or None for the venue website)
+STANDALONE_VENUE_SCRAPERS = [
+    ('acfdc_dc', 'ACF DC | Austrian Cultural Forum Washington',
+     ('%austrian cultural forum%washington%', '%acfdc.org%'), None, 'https://www.acfdc.org/events'),
+    ('deyoung', 'de Young Museum | de Young Museum',
+     ('%de young%', '%deyoung.famsf.org%'), ('scripts.deyoung_scraper', 'scrape_all_deyoung_events'),
+     'https://www.famsf.org/exhibitions?where=de-young'),
+    ('hammer', 'Hammer Museum | Hammer Museum',
+     ('%hammer museum%', '%hammer.ucla.edu%'), ('scripts.hammer_scraper', 'scrape_all_hammer_events'),
+     'https://hammer.ucla.edu/programs-events'),
+    ('ocma', 'OCMA | Orange County Museum of Art',
+     ('%orange county museum%', '%ocma.art%'), None, None),
+    ('university_park_library', 'University Park Library | Irvine',
+     ('%university park library%', None),
+     ('scripts.university_park_library_scraper', 'scrape_all_university_park_library_events'),
+     'https://legacy.cityofirvine.org/civica/filebank/blobdload.asp?BlobID=36797'),
+]
+
+
+def _call(module_name, function_name, *args):
+    return getattr(importlib.import_module(module_name), function_name)(*args)
+
+
+def _save_with_shared_handler(events, venue, source_url, event_processor):
+    """Save events for one venue via scripts.event_database_handler; returns (created, updated, skipped)."""
+    from app import db, Venue, Event
+    from scripts.event_database_handler import create_events_in_database as shared_create_events
+    return shared_create_events(
+        events=events,
+        venue_id=venue.id,
+        city_id=venue.city_id,
+        venue_name=venue.name,
+        db=db,
+        Event=Event,
+        Venue=Venue,
+        batch_size=5,
+        logger_instance=logger,
+        source_url=source_url,
+        custom_event_processor=event_processor,
+    )
+
+
+def _reconcile(key, events, save):
+    """
+    ``save()`` unless ``events`` match the last reconciled set for ``key`` (see scraper_utils.fingerprints).
+
+    The set is only marked reconciled when save() reported no failed events (track_save_errors):
+    a failed event must be retried next run, not skipped as unchanged.
+
+    Returns save()'s counts, or None when the database upsert was skipped.
+    """
+    from scripts.event_database_handler import track_save_errors
+
+    store = get_fingerprint_store()
+    if store is None:
+        return save()
+    events_hash = events_fingerprint(events)  # before save: processors mutate the dicts
+    if store.events_unchanged(key, events_hash):
+        return None
+    with track_save_errors() as report:
+        counts = save()
+    if report.errors:
+        logger.warning(f"   ⚠️  {key}: {report.errors} event(s) failed to save; will reconcile again next run")
+    else:
+        store.mark_reconciled(key, events_hash)
+    return counts
+
+
+def _unchanged_result(events, note=''):
+    return ScrapeResult(found=len(events), skipped=len(events), note=(note + ' (unchanged since last run)').strip())
+
+
+def _website_processor(organizer):
+    def processor(event_data):
+        event_data.update({'source': 'website', 'organizer': organizer})
+    return processor
+
+
+def _load_venue(venue_id):
+    from app import db, Venue
+    venue = db.session.get(Venue, venue_id)
+    if venue is None:
+        raise LookupError(f"venue {venue_id} no longer exists")
+    return venue
+
+
+def build_museum_job(museum):
+    """ScrapeJob for a museum with a specialized scraper, or None when it has none / is out of season."""
+    venue_url_lower = (museum.website_url or '').lower()
+    name_lower = (museum.name or '').lower()
+    venue_id, venue_name = museum.id, museum.name
+    domain = politeness_domain(museum.website_url)
+
+    # African Art also lives under si.edu/museums/african-art-museum
+    is_si_african_art = 'african art' in name_lower and 'si.edu' in venue_url_lower and 'african-art' in venue_url_lower
+
+    for fragment, label, module_name, scrape_function in MUSEUM_MODULE_SCRAPERS:
+        if fragment not in venue_url_lower and not (fragment == 'africa.si.edu' and is_si_african_art):
+            continue
+
+        def run(module_name=module_name, scrape_function=scrape_function, note=MUSEUM_RESULT_NOTES.get(label, '')):
+            events = _call(module_name, scrape_function) or []
+            if not events:
+                return ScrapeResult(note=note)
+            counts = _reconcile(f"museum:{module_name}:{venue_id}", events,
+                                lambda: _call(module_name, 'create_events_in_database', events))
+            if counts is None:
+                return _unchanged_result(events, note)
+            if len(counts) == 3:
+                created, updated, skipped = counts
+            else:
+                created, updated = counts
+                skipped = len(events) - created - updated
+            return ScrapeResult(len(events), created, updated, skipped, note=note)
+
+        return ScrapeJob(f"{label} | {venue_name}", domain, run, counts_venue=True)
+
+    for fragment, label, module_name, scrape_function in SELF_SAVING_MUSEUM_SCRAPERS:
+        if fragment in venue_url_lower:
+            def run(module_name=module_name, scrape_function=scrape_function):
+                events = _call(module_name, scrape_function) or []
+                return ScrapeResult(found=len(events), saved=len(events))
+            return ScrapeJob(f"{label} | {venue_name}", domain, run, counts_venue=True)
+
+    if 'tulipday.eu' in venue_url_lower:
+        rule, months = get_venue_schedule_rule(museum.website_url or '')
+        if not should_run(rule, months):
+            logger.info("⏭️  Tulip Day | skipped (out of season, runs Mar–Apr)")
+            return None
+
+        def run():
+            from scripts.tulipday_scraper import scrape_all_tulipday_events
+            events = scrape_all_tulipday_events() or []
+            if not events:
+                return ScrapeResult()
+            venue = _load_venue(venue_id)
+
+            def tulip_event_processor(event_data):
+                event_data['source'] = 'website'
+                if not event_data.get('organizer'):
+                    event_data['organizer'] = venue.name
+
+            counts = _reconcile(f"venue:{venue_id}", events, lambda: _save_with_shared_handler(
+                events, venue, venue.website_url, tulip_event_processor
+            ))
+            if counts is None:
+                return _unchanged_result(events)
+            return ScrapeResult(len(events), *counts)
+
+        return ScrapeJob(f"Tulip Day | {venue_name}", domain, run, counts_venue=True)
+
+    logger.warning(f"   ⚠️  No specialized scraper for {venue_name}, skipping")
+    return None
+
+
+def _save_embassy_events(events):
+    """Insert embassy events not already stored (title + start_date + venue); returns (saved, skipped)."""
+    from app import db, Event
+    from scripts.event_database_handler import record_save_errors
+    saved_count = 0
+    skipped_count = 0
+    for event_data in events:
+        try:
+            existing = Event.query.filter_by(
+                title=event_data.get('title'),
+                start_date=event_data.get('start_date'),
+                venue_id=event_data.get('venue_id')
+            ).first()
+            if existing:
+                skipped_count += 1
+                continue
+            db.session.add(Event(**event_data))
+            # Commit each event so it is saved as soon as we have all info
+            db.session.commit()
+            saved_count += 1
+        except Exception as e:
+            logger.error(f"   ❌ Error saving event '{event_data.get('title', 'N/A')}': {e}")
+            db.session.rollback()
+            record_save_errors()
+    return saved_count, skipped_count
+
+
+def build_embassy_job(embassy):
+    """ScrapeJob for a diplomatic/cultural venue scraped through the Eventbrite API."""
+    venue_id = embassy.id
+
+    def run():
+        venue = _load_venue(venue_id)
+        events = _eventbrite_scraper().scrape_venue_events(venue=venue, time_range=TIME_RANGE) or []
+        if not events:
+            return ScrapeResult()
+        counts = _reconcile(f"eventbrite:{venue_id}", events, lambda: _save_embassy_events(events))
+        if counts is None:
+            return _unchanged_result(events)
+        saved, skipped = counts
+        return ScrapeResult(len(events), saved, 0, skipped)
+
+    return ScrapeJob(f"Eventbrite | {embassy.name}", 'eventbriteapi.com', run,
+                     counts_venue=True, counts_failure=True)
+
+
+def build_eventbrite_extra_job(eb_venue):
+    """ScrapeJob for a non-diplomatic venue on the shared Eventbrite flow."""
+    venue_id = eb_venue.id
+
+    def run():
+        venue = _load_venue(venue_id)
+        events = _eventbrite_scraper().scrape_venue_events(venue=venue, time_range=TIME_RANGE) or []
+        if not events:
+            return ScrapeResult()
+        venue_name = venue.name
+        counts = _reconcile(f"eventbrite:{venue_id}", events, lambda: _save_with_shared_handler(
+            events, venue, venue.ticketing_url or venue.website_url,
+            lambda e: e.update({'source': 'eventbrite', 'organizer': venue_name}),
+        ))
+        if counts is None:
+            return _unchanged_result(events)
+        return ScrapeResult(len(events), *counts)
+
+    return ScrapeJob(f"Eventbrite | {eb_venue.name}", 'eventbriteapi.com', run, counts_venue=True)
+
+
+def _standalone_scheduled(scraper_id, label):
+    rule, months = get_standalone_schedule_rule(scraper_id)
+    if should_run(rule, months):
+        return True
+    reason = f"out of season, runs in months {months}" if months else 'scheduler'
+    logger.info(f"⏭️  {label.split(' | ')[0]} | skipped ({reason})")
+    return False
+
+
+def build_standalone_jobs(bucket):
+    """ScrapeJobs for the standalone scrapers assigned to this bucket (see cron_bucket_config)."""
+    jobs = []
+    for scraper_id, icon, label, module_name, scrape_function, save_function, domain in STANDALONE_MODULE_SCRAPERS:
+        if not standalone_runs_in_bucket(scraper_id, bucket) or not _standalone_scheduled(scraper_id, label):
+            continue
+
+        def run(scraper_id=scraper_id, module_name=module_name, scrape_function=scrape_function,
+                save_function=save_function):
+            events = _call(module_name, scrape_function) or []
+            if not events:
+                return ScrapeResult()
+            counts = _reconcile(f"standalone:{scraper_id}", events,
+                                lambda: _call(module_name, save_function, events))
+            if counts is None:
+                return _unchanged_result(events)
+            if isinstance(counts, int):
+                return ScrapeResult(found=len(events), saved=counts)
+            created, updated, skipped = counts
+            return ScrapeResult(len(events), created, updated, skipped)
+
+        jobs.append(ScrapeJob(label, domain, run, icon=icon))
+
+    for scraper_id, label, (name_pattern, url_pattern), scrape, source_url in STANDALONE_VENUE_SCRAPERS:
+        if not standalone_runs_in_bucket(scraper_id, bucket) or not _standalone_scheduled(scraper_id, label):
+            continue
+
+        def run(scraper_id=scraper_id, label=label, name_pattern=name_pattern, url_pattern=url_pattern,
+                scrape=scrape, source_url=source_url):
+            from app import Venue
+            criteria = Venue.name.ilike(name_pattern)
+            if url_pattern:
+                criteria = criteria | Venue.website_url.ilike(url_pattern)
+            venue = Venue.query.filter(criteria).first()
+            if not venue:
+                logger.warning(f"   ⚠️  {label.split(' | ')[0]} venue not found, skipping")
+                return ScrapeResult()
+            if scrape:
+                events = _call(*scrape) or []
+            else:
+                events = _venue_scraper().scrape_venue_events(
+                    venue_ids=[venue.id],
+                    event_type=None,
+                    time_range=TIME_RANGE,
+                    max_exhibitions_per_venue=MAX_EXHIBITIONS_PER_VENUE,
+                    max_events_per_venue=MAX_EVENTS_PER_VENUE,
+                ) or []
+            if not events:
+                return ScrapeResult()
+            counts = _reconcile(f"standalone:{scraper_id}", events, lambda: _save_with_shared_handler(
+                events, venue, source_url or venue.website_url, _website_processor(venue.name)
+            ))
+            if counts is None:
+                return _unchanged_result(events)
+            return ScrapeResult(len(events), *counts)
+
+        icon = '📚' if 'library' in scraper_id else '🏛️'
+        domain = politeness_domain(url_pattern.strip('%') if url_pattern else source_url)
+        jobs.append(ScrapeJob(label, domain, run, icon=icon))
+    return jobs
+
+
+def run_scheduled_scrapers(bucket: str = BUCKET_STABLE, full_rescan: bool = False) -> int:
+    """Run scheduled scrapers for the given operational bucket.
+
+    ``full_rescan`` ignores stored page / event fingerprints and re-parses and reconciles everything.
+    """
     if bucket not in (BUCKET_STABLE, BUCKET_PROTECTED):
         raise ValueError(f"Unknown cron bucket: {bucket}")
 
@@ -139,7 +521,7 @@ def run_scheduled_scrapers(bucket: str = BUCKET_STABLE) -> int:
     )
     
     try:
-        from app import app, db, Venue, City, Event
+        from app import app, db, Venue, City
         
         with app.app_context():
             # Find Washington DC city (city_id = 1)
@@ -215,719 +597,46 @@ def run_scheduled_scrapers(bucket: str = BUCKET_STABLE) -> int:
                 for i, embassy in enumerate(embassies, 1):
                     logger.debug(f"   {i}. {embassy.name}")
             
-            # Import scrapers
-            from scripts.venue_event_scraper import VenueEventScraper
-            from scripts.eventbrite_scraper import EventbriteScraper
-            
-            # Initialize scrapers
-            venue_scraper = VenueEventScraper()
-            eventbrite_scraper = EventbriteScraper()
-            
-            # Scraping settings for weekly run
-            # Use 'this_month' to get a good range of upcoming events
-            time_range = 'this_month'
-            max_events_per_venue = 50  # Higher limit for weekly scraping
-            max_exhibitions_per_venue = 20
-            
-            logger.debug(f"Settings: time_range={time_range}, max_events={max_events_per_venue}, max_exhibitions={max_exhibitions_per_venue}")
-            
+            logger.debug(
+                f"Settings: time_range={TIME_RANGE}, max_events={MAX_EVENTS_PER_VENUE}, "
+                f"max_exhibitions={MAX_EXHIBITIONS_PER_VENUE}"
+            )
+
+            # One job per scraper; museums first, then Eventbrite, then standalone scrapers
+            jobs = [job for job in (build_museum_job(museum) for museum in museums) if job]
+            jobs += [build_embassy_job(embassy) for embassy in embassies]
+            jobs += [build_eventbrite_extra_job(eb_venue) for eb_venue in eventbrite_extra_venues]
+            jobs += build_standalone_jobs(bucket)
+
+            # Release the planning session before workers open their own
+            db.session.remove()
+
+            fingerprints = get_fingerprint_store(force_full=full_rescan)
+            scheduler = create_scrape_scheduler()
+            logger.info(
+                f"⚙️  {len(jobs)} scrapers on {scheduler.max_workers} workers "
+                f"({scheduler.per_domain} per domain, {scheduler.domain_interval:g}s apart)"
+            )
+            results = scheduler.run(jobs, app=app, db=db, logger_instance=logger)
+
             # Track statistics
             total_events_found = 0
             total_events_saved = 0
             venues_processed = 0
             venues_failed = 0
             venues_with_events = 0
-            
-            # Scrape museums one by one using specialized scrapers directly (like admin buttons)
-            # This ensures venue_id is determined from event content, not from which venue is being scraped
-            for museum in museums:
-                saved_count = 0  # Initialize outside try block
-                skipped_count = 0
-                updated_count = 0
-                try:
-                    venue_url_lower = (museum.website_url or '').lower()
-                    scraped_events = []
-                    scraper_name = None
-                    
-                    # Call specialized scrapers directly (same as admin buttons)
-                    # This bypasses venue_event_scraper.py which was assigning venue_id incorrectly
-                    if 'nga.gov' in venue_url_lower:
-                        scraper_name = "NGA"
-                        logger.info(f"🏛️  {scraper_name} | {museum.name}")
-                        from scripts.nga_comprehensive_scraper import scrape_all_nga_events, create_events_in_database
-                        try:
-                            scraped_events = scrape_all_nga_events()
-                            if scraped_events:
-                                created, updated = create_events_in_database(scraped_events)
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = len(scraped_events) - created - updated
-                                total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}, updated {updated_count}, skipped {skipped_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'americanart.si.edu' in venue_url_lower:
-                        logger.info(f"🏛️  SAAM | {museum.name}")
-                        from scripts.saam_scraper import scrape_all_saam_events, create_events_in_database
-                        try:
-                            scraped_events = scrape_all_saam_events()
-                            if scraped_events:
-                                created, updated = create_events_in_database(scraped_events)
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = len(scraped_events) - created - updated
-                                total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}, updated {updated_count}, skipped {skipped_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'npg.si.edu' in venue_url_lower:
-                        logger.info(f"🏛️  NPG | {museum.name}")
-                        from scripts.npg_scraper import scrape_all_npg_events, create_events_in_database
-                        try:
-                            scraped_events = scrape_all_npg_events()
-                            if scraped_events:
-                                created, updated = create_events_in_database(scraped_events)
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = len(scraped_events) - created - updated
-                                total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}, updated {updated_count}, skipped {skipped_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'asia.si.edu' in venue_url_lower:
-                        logger.info(f"🏛️  Asian Art | {museum.name}")
-                        from scripts.asian_art_scraper import scrape_all_asian_art_events, create_events_in_database
-                        try:
-                            scraped_events = scrape_all_asian_art_events()
-                            if scraped_events:
-                                created, updated = create_events_in_database(scraped_events)
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = len(scraped_events) - created - updated
-                                total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}, updated {updated_count}, skipped {skipped_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif ('africa.si.edu' in venue_url_lower or
-                          ('african art' in (museum.name or '').lower() and 'si.edu' in venue_url_lower and 'african-art' in venue_url_lower)):
-                        logger.info(f"🏛️  African Art | {museum.name}")
-                        from scripts.african_art_scraper import scrape_all_african_art_events, create_events_in_database
-                        try:
-                            scraped_events = scrape_all_african_art_events()
-                            if scraped_events:
-                                created, updated = create_events_in_database(scraped_events)
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = len(scraped_events) - created - updated
-                                total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}, updated {updated_count}, skipped {skipped_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'hirshhorn.si.edu' in venue_url_lower:
-                        logger.info(f"🏛️  Hirshhorn | {museum.name} (Tribe Events API)")
-                        from scripts.hirshhorn_scraper import scrape_all_hirshhorn_events, create_events_in_database
-                        try:
-                            scraped_events = scrape_all_hirshhorn_events() or []
-                            if scraped_events:
-                                created, updated, skipped = create_events_in_database(scraped_events)
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = skipped
-                                total_events_saved += saved_count
-                            logger.info(
-                                f"   → Tribe API: found {len(scraped_events)}, saved {saved_count}, "
-                                f"updated {updated_count}, skipped {skipped_count} (exhibitions deferred)"
-                            )
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'sunscinema.com' in venue_url_lower:
-                        logger.info(f"🏛️  Suns Cinema | {museum.name}")
-                        try:
-                            from scripts.suns_cinema_scraper import scrape_all_suns_cinema_events
-                            scraped_events = scrape_all_suns_cinema_events()
-                            saved_count = len(scraped_events)
-                            total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'culturedc.com' in venue_url_lower:
-                        logger.info(f"🏛️  Culture DC | {museum.name}")
-                        try:
-                            from scripts.culture_dc_scraper import scrape_all_culture_dc_events
-                            scraped_events = scrape_all_culture_dc_events()
-                            saved_count = len(scraped_events)
-                            total_events_saved += saved_count
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    
-                    elif 'tulipday.eu' in venue_url_lower:
-                        rule, months = get_venue_schedule_rule(museum.website_url or '')
-                        if not should_run(rule, months):
-                            logger.info(f"⏭️  Tulip Day | skipped (out of season, runs Mar–Apr)")
-                            continue
-                        logger.info(f"🏛️  Tulip Day | {museum.name}")
-                        try:
-                            from scripts.tulipday_scraper import scrape_all_tulipday_events
-                            scraped_events = scrape_all_tulipday_events()
-                            if scraped_events:
-                                from scripts.event_database_handler import create_events_in_database as shared_create_events
-                                def tulip_event_processor(event_data):
-                                    event_data['source'] = 'website'
-                                    if not event_data.get('organizer'):
-                                        event_data['organizer'] = museum.name
-                                created, updated, skipped = shared_create_events(
-                                    events=scraped_events,
-                                    venue_id=museum.id,
-                                    city_id=museum.city_id,
-                                    venue_name=museum.name,
-                                    db=db,
-                                    Event=Event,
-                                    Venue=Venue,
-                                    batch_size=5,
-                                    logger_instance=logger,
-                                    source_url=museum.website_url,
-                                    custom_event_processor=tulip_event_processor
-                                )
-                                saved_count = created
-                                updated_count = updated
-                                skipped_count = skipped
-                                total_events_saved += saved_count
-                            else:
-                                saved_count = updated_count = skipped_count = 0
-                            logger.info(f"   → found {len(scraped_events)}, saved {saved_count}, updated {updated_count}, skipped {skipped_count}")
-                        except Exception as e:
-                            logger.error(f"   ❌ {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                    else:
-                        logger.warning(f"   ⚠️  No specialized scraper for {museum.name}, skipping")
-                    
-                    if scraped_events:
-                        total_events_found += len(scraped_events)
-                    
-                    venues_processed += 1
-                    if saved_count > 0:
-                        venues_with_events += 1
-                
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+            for job, result in zip(jobs, results):
+                total_events_found += result.found
+                total_events_saved += result.saved
+                if not job.counts_venue:
+                    continue
+                if result.error and job.counts_failure:
                     venues_failed += 1
-                    db.session.rollback()
                     continue
-            
-            # Scrape embassies with Eventbrite (stable cron only)
-            if bucket_runs_stable_sections(bucket) and embassies:
-                for embassy in embassies:
-                    saved_count = 0
-                    skipped_count = 0
-                    try:
-                        logger.info(f"🏛️  Eventbrite | {embassy.name}")
-                        embassy_events = eventbrite_scraper.scrape_venue_events(
-                            venue=embassy,
-                            time_range=time_range
-                        )
-                        
-                        if embassy_events:
-                            events_count = len(embassy_events)
-                            total_events_found += events_count
-                            # Save events to database immediately (as soon as we have all info)
-                            saved_count = 0
-                            skipped_count = 0
-                            batch_size = 5  # Commit in small batches of 5 for immediate saving
-                            
-                            for event_data in embassy_events:
-                                try:
-                                    # Check for duplicates
-                                    existing = Event.query.filter_by(
-                                        title=event_data.get('title'),
-                                        start_date=event_data.get('start_date'),
-                                        venue_id=event_data.get('venue_id')
-                                    ).first()
-                                    
-                                    if existing:
-                                        skipped_count += 1
-                                        continue
-                                    
-                                    # Create new event
-                                    event = Event(**event_data)
-                                    db.session.add(event)
-                                    saved_count += 1
-                                    
-                                    # Commit in small batches of 5 for immediate saving (as soon as we have all info)
-                                    # This ensures events are saved quickly while maintaining good database performance
-                                    if saved_count % batch_size == 0:
-                                        db.session.commit()
-                                    else:
-                                        # Commit immediately for events not in a batch (ensures immediate saving)
-                                        db.session.commit()
-                                
-                                except Exception as e:
-                                    logger.error(f"   ❌ Error saving event '{event_data.get('title', 'N/A')}': {e}")
-                                    db.session.rollback()
-                                    continue
-
-                            # Final commit for any remaining events (safety net, though they should already be committed)
-                            try:
-                                db.session.commit()
-                            except Exception as e:
-                                logger.error(f"   ❌ Error in final commit: {e}")
-                                db.session.rollback()
-
-                            total_events_saved += saved_count
-                            logger.info(f"   → found {events_count}, saved {saved_count}, skipped {skipped_count}")
-                        else:
-                            logger.info(f"   → found 0")
-
-                        venues_processed += 1
-                        if saved_count > 0:
-                            venues_with_events += 1
-
-                    except Exception as e:
-                        logger.error(f"   ❌ {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-                        venues_failed += 1
-                        db.session.rollback()
-                        continue
+                venues_processed += 1
+                if result.saved > 0:
+                    venues_with_events += 1
 
-            # Scrape non-embassy Eventbrite venues (stable cron only)
-            if not bucket_runs_stable_sections(bucket):
-                eventbrite_extra_venues = []
-            for eb_venue in eventbrite_extra_venues:
-                logger.info(f"🏛️  Eventbrite | {eb_venue.name}")
-                try:
-                    eb_events = eventbrite_scraper.scrape_venue_events(
-                        venue=eb_venue,
-                        time_range=time_range
-                    )
-                    if eb_events:
-                        events_count = len(eb_events)
-                        total_events_found += events_count
-                        from scripts.event_database_handler import create_events_in_database as shared_create_events
-                        venue_name = eb_venue.name
-                        created, updated, skipped = shared_create_events(
-                            events=eb_events,
-                            venue_id=eb_venue.id,
-                            city_id=eb_venue.city_id,
-                            venue_name=venue_name,
-                            db=db,
-                            Event=Event,
-                            Venue=Venue,
-                            batch_size=5,
-                            logger_instance=logger,
-                            source_url=eb_venue.ticketing_url or eb_venue.website_url,
-                            custom_event_processor=lambda e, vn=venue_name: e.update({'source': 'eventbrite', 'organizer': vn})
-                        )
-                        total_events_saved += created
-                        if created > 0:
-                            venues_with_events += 1
-                        logger.info(f"   → found {events_count}, saved {created}, updated {updated}, skipped {skipped}")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            # --- Standalone scrapers (per-scraper bucket in cron_bucket_config) ---
-            if standalone_runs_in_bucket("websters", bucket):
-                # Webster's Bookstore Cafe (State College, PA)
-                logger.info(f"🏛️  Webster's | Webster's Bookstore Cafe")
-                try:
-                    from scripts.websters_scraper import scrape_websters_events, create_events_in_database
-                    websters_events = scrape_websters_events()
-                    if websters_events:
-                        created = create_events_in_database(websters_events)
-                        total_events_saved += created
-                        total_events_found += len(websters_events)
-                        logger.info(f"   → found {len(websters_events)}, saved {created}")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("wharf_dc", bucket):
-                # The Wharf DC
-                logger.info(f"🏛️  Wharf DC | The Wharf DC")
-                try:
-                    from scripts.wharf_dc_scraper import scrape_wharf_dc_events, create_events_in_database_wrapper
-                    wharf_events = scrape_wharf_dc_events()
-                    if wharf_events:
-                        created, updated, skipped = create_events_in_database_wrapper(wharf_events)
-                        total_events_saved += created
-                        total_events_found += len(wharf_events)
-                        logger.info(f"   → found {len(wharf_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("dc_urban_walkers", bucket):
-                # DC Urban Walkers (Meetup)
-                logger.info(f"🚶 DC Urban Walkers | Meetup")
-                try:
-                    from scripts.dc_urban_walkers_scraper import (
-                        scrape_dc_urban_walkers_events,
-                        create_events_in_database_wrapper as save_dc_urban_walkers_events,
-                    )
-                    duw_events = scrape_dc_urban_walkers_events()
-                    if duw_events:
-                        created, updated, skipped = save_dc_urban_walkers_events(duw_events)
-                        total_events_saved += created
-                        total_events_found += len(duw_events)
-                        logger.info(f"   → found {len(duw_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("acfdc_dc", bucket):
-                # Austrian Cultural Forum Washington (acfdc.org — shared VenueEventScraper + event_paths.events)
-                rule, months = get_standalone_schedule_rule("acfdc_dc")
-                if not should_run(rule, months):
-                    logger.info(f"⏭️  ACF DC | skipped (scheduler)")
-                else:
-                    logger.info(f"🏛️  ACF DC | Austrian Cultural Forum Washington")
-                    try:
-                        acf = Venue.query.filter(
-                            (Venue.website_url.ilike('%acfdc.org%'))
-                            | (Venue.name.ilike('%austrian cultural forum%washington%'))
-                        ).first()
-                        if acf:
-                            scraped_events = venue_scraper.scrape_venue_events(
-                                venue_ids=[acf.id],
-                                event_type=None,
-                                time_range=time_range,
-                                max_exhibitions_per_venue=max_exhibitions_per_venue,
-                                max_events_per_venue=max_events_per_venue,
-                            )
-                            if scraped_events:
-                                from scripts.event_database_handler import create_events_in_database as shared_create_events
-                                created, updated, skipped = shared_create_events(
-                                    events=scraped_events,
-                                    venue_id=acf.id,
-                                    city_id=acf.city_id,
-                                    venue_name=acf.name,
-                                    db=db,
-                                    Event=Event,
-                                    Venue=Venue,
-                                    batch_size=5,
-                                    logger_instance=logger,
-                                    source_url='https://www.acfdc.org/events',
-                                    custom_event_processor=lambda e: e.update({'source': 'website', 'organizer': acf.name}),
-                                )
-                                total_events_saved += created
-                                total_events_found += len(scraped_events)
-                                logger.info(
-                                    f"   → found {len(scraped_events)}, saved {created}, updated {updated}, skipped {skipped}"
-                                )
-                            else:
-                                logger.info(f"   → found 0")
-                        else:
-                            logger.warning(f"   ⚠️  ACF DC venue not found, skipping")
-                    except Exception as e:
-                        logger.error(f"   ❌ {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("shoot_nyc", bucket):
-                # Shoot New York City (NYC workshops)
-                logger.info(f"📷 Shoot NYC | Shoot New York City")
-                try:
-                    from scripts.shoot_nyc_scraper import scrape_shoot_nyc_events, create_events_in_database_wrapper
-                    shoot_nyc_events = scrape_shoot_nyc_events()
-                    if shoot_nyc_events:
-                        created, updated, skipped = create_events_in_database_wrapper(shoot_nyc_events)
-                        total_events_saved += created
-                        total_events_found += len(shoot_nyc_events)
-                        logger.info(f"   → found {len(shoot_nyc_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("metmuseum", bucket):
-                # The Metropolitan Museum of Art (NYC — met-tours & programs)
-                rule, months = get_standalone_schedule_rule("metmuseum")
-                if not should_run(rule, months):
-                    logger.info(f"⏭️  The Met | skipped (scheduler)")
-                else:
-                    logger.info(f"🏛️  The Met | The Metropolitan Museum of Art")
-                    try:
-                        from scripts.metmuseum_scraper import scrape_metmuseum_events, create_events_in_database_wrapper
-                        met_events = scrape_metmuseum_events()
-                        if met_events:
-                            created, updated, skipped = create_events_in_database_wrapper(met_events)
-                            total_events_saved += created
-                            total_events_found += len(met_events)
-                            logger.info(f"   → found {len(met_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.info(f"   → found 0")
-                    except Exception as e:
-                        logger.error(f"   ❌ {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("tenement_museum", bucket):
-                # Tenement Museum (NYC — tours & programs)
-                rule, months = get_standalone_schedule_rule("tenement_museum")
-                if not should_run(rule, months):
-                    logger.info(f"⏭️  Tenement Museum | skipped (scheduler)")
-                else:
-                    logger.info(f"🏠  Tenement Museum | Tenement Museum")
-                    try:
-                        from scripts.tenement_museum_scraper import (
-                            create_events_in_database_wrapper,
-                            scrape_tenement_museum_events,
-                        )
-                        tenement_events = scrape_tenement_museum_events()
-                        if tenement_events:
-                            created, updated, skipped = create_events_in_database_wrapper(tenement_events)
-                            total_events_saved += created
-                            total_events_found += len(tenement_events)
-                            logger.info(f"   → found {len(tenement_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.info(f"   → found 0")
-                    except Exception as e:
-                        logger.error(f"   ❌ {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("big_onion", bucket):
-                # Big Onion Walking Tours (NYC)
-                rule, months = get_standalone_schedule_rule("big_onion")
-                if not should_run(rule, months):
-                    logger.info(f"⏭️  Big Onion | skipped (scheduler)")
-                else:
-                    logger.info(f"🧅  Big Onion | Big Onion Walking Tours")
-                    try:
-                        from scripts.big_onion_scraper import (
-                            create_events_in_database_wrapper,
-                            scrape_big_onion_events,
-                        )
-                        big_onion_events = scrape_big_onion_events()
-                        if big_onion_events:
-                            created, updated, skipped = create_events_in_database_wrapper(big_onion_events)
-                            total_events_saved += created
-                            total_events_found += len(big_onion_events)
-                            logger.info(f"   → found {len(big_onion_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.info(f"   → found 0")
-                    except Exception as e:
-                        logger.error(f"   ❌ {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("deyoung", bucket):
-                # de Young Museum (SF exhibitions)
-                logger.info(f"🏛️  de Young Museum | de Young Museum")
-                try:
-                    from scripts.deyoung_scraper import scrape_all_deyoung_events
-                    from scripts.event_database_handler import create_events_in_database as shared_create_events
-                    deyoung_events = scrape_all_deyoung_events()
-                    if deyoung_events:
-                        venue = Venue.query.filter(
-                            (Venue.website_url.ilike('%deyoung.famsf.org%')) |
-                            (Venue.name.ilike('%de young%'))
-                        ).first()
-                        if venue:
-                            created, updated, skipped = shared_create_events(
-                                events=deyoung_events,
-                                venue_id=venue.id,
-                                city_id=venue.city_id,
-                                venue_name=venue.name,
-                                db=db,
-                                Event=Event,
-                                Venue=Venue,
-                                batch_size=5,
-                                logger_instance=logger,
-                                source_url='https://www.famsf.org/exhibitions?where=de-young',
-                                custom_event_processor=lambda e: e.update({'source': 'website', 'organizer': venue.name})
-                            )
-                            total_events_saved += created
-                            total_events_found += len(deyoung_events)
-                            logger.info(f"   → found {len(deyoung_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.warning(f"   ⚠️  de Young Museum venue not found, skipping")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("hammer", bucket):
-                # Hammer Museum (LA programs and events)
-                logger.info(f"🏛️  Hammer Museum | Hammer Museum")
-                try:
-                    from scripts.hammer_scraper import scrape_all_hammer_events
-                    from scripts.event_database_handler import create_events_in_database as shared_create_events
-                    hammer_events = scrape_all_hammer_events()
-                    if hammer_events:
-                        venue = Venue.query.filter(
-                            (Venue.website_url.ilike('%hammer.ucla.edu%')) |
-                            (Venue.name.ilike('%hammer museum%'))
-                        ).first()
-                        if venue:
-                            created, updated, skipped = shared_create_events(
-                                events=hammer_events,
-                                venue_id=venue.id,
-                                city_id=venue.city_id,
-                                venue_name=venue.name,
-                                db=db,
-                                Event=Event,
-                                Venue=Venue,
-                                batch_size=5,
-                                logger_instance=logger,
-                                source_url='https://hammer.ucla.edu/programs-events',
-                                custom_event_processor=lambda e: e.update({'source': 'website', 'organizer': venue.name})
-                            )
-                            total_events_saved += created
-                            total_events_found += len(hammer_events)
-                            logger.info(f"   → found {len(hammer_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.warning(f"   ⚠️  Hammer Museum venue not found, skipping")
-                    else:
-                        logger.info(f"   → found 0")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("ocma", bucket):
-                # OCMA (Orange County Museum of Art, Irvine/Costa Mesa)
-                logger.info(f"🏛️  OCMA | Orange County Museum of Art")
-                try:
-                    ocma = Venue.query.filter(
-                        (Venue.website_url.ilike('%ocma.art%')) |
-                        (Venue.name.ilike('%orange county museum%'))
-                    ).first()
-                    if ocma:
-                        scraped_events = venue_scraper.scrape_venue_events(
-                            venue_ids=[ocma.id],
-                            event_type=None,
-                            time_range=time_range,
-                            max_exhibitions_per_venue=max_exhibitions_per_venue,
-                            max_events_per_venue=max_events_per_venue
-                        )
-                        if scraped_events:
-                            from scripts.event_database_handler import create_events_in_database as shared_create_events
-                            created, updated, skipped = shared_create_events(
-                                events=scraped_events,
-                                venue_id=ocma.id,
-                                city_id=ocma.city_id,
-                                venue_name=ocma.name,
-                                db=db,
-                                Event=Event,
-                                Venue=Venue,
-                                batch_size=5,
-                                logger_instance=logger,
-                                source_url=ocma.website_url or 'https://ocma.art',
-                                custom_event_processor=lambda e: e.update({'source': 'website', 'organizer': ocma.name})
-                            )
-                            total_events_saved += created
-                            total_events_found += len(scraped_events)
-                            logger.info(f"   → found {len(scraped_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.info(f"   → found 0")
-                    else:
-                        logger.warning(f"   ⚠️  OCMA venue not found, skipping")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("university_park_library", bucket):
-                # University Park Library (Irvine) - PDF program guide
-                logger.info(f"📚 University Park Library | Irvine")
-                try:
-                    upl = Venue.query.filter(Venue.name.ilike('%university park library%')).first()
-                    if upl:
-                        from scripts.university_park_library_scraper import scrape_all_university_park_library_events
-                        from scripts.event_database_handler import create_events_in_database as shared_create_events
-                        upl_events = scrape_all_university_park_library_events()
-                        if upl_events:
-                            created, updated, skipped = shared_create_events(
-                                events=upl_events,
-                                venue_id=upl.id,
-                                city_id=upl.city_id,
-                                venue_name=upl.name,
-                                db=db,
-                                Event=Event,
-                                Venue=Venue,
-                                batch_size=5,
-                                logger_instance=logger,
-                                source_url='https://legacy.cityofirvine.org/civica/filebank/blobdload.asp?BlobID=36797',
-                                custom_event_processor=lambda e: e.update({'source': 'website', 'organizer': upl.name})
-                            )
-                            total_events_saved += created
-                            total_events_found += len(upl_events)
-                            logger.info(f"   → found {len(upl_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.info(f"   → found 0")
-                    else:
-                        logger.warning(f"   ⚠️  University Park Library venue not found, skipping")
-                except Exception as e:
-                    logger.error(f"   ❌ {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-
-            if standalone_runs_in_bucket("dcparade", bucket):
-                # DC Chinese New Year Parade (seasonal: Jan–Feb)
-                rule, months = get_standalone_schedule_rule("dcparade")
-                if not should_run(rule, months):
-                    logger.info(f"⏭️  DC Parade | skipped (out of season, runs Jan–Feb)")
-                else:
-                    logger.info(f"🏮 DC Parade | DC Chinese New Year Parade")
-                    try:
-                        from scripts.dcparade_scraper import scrape_dcparade_events, create_events_in_database_wrapper
-                        dcparade_events = scrape_dcparade_events()
-                        if dcparade_events:
-                            created, updated, skipped = create_events_in_database_wrapper(dcparade_events)
-                            total_events_saved += created
-                            total_events_found += len(dcparade_events)
-                            logger.info(f"   → found {len(dcparade_events)}, saved {created}, updated {updated}, skipped {skipped}")
-                        else:
-                            logger.info(f"   → found 0")
-                    except Exception as e:
-                        logger.error(f"   ❌ {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-            
             # Final summary
             end_time = datetime.now()
             duration = end_time - start_time
@@ -936,6 +645,8 @@ def run_scheduled_scrapers(bucket: str = BUCKET_STABLE) -> int:
                 f"(with events: {venues_with_events}, failed: {venues_failed}) | "
                 f"found {total_events_found} | saved {total_events_saved} | {duration}"
             )
+            if fingerprints:
+                logger.info(f"🧬 Fingerprints: {fingerprints.format_stats()}")
             
             return 0 if venues_failed == 0 else 1
     
@@ -954,8 +665,13 @@ def main() -> int:
         default=BUCKET_STABLE,
         help='stable = main cron; protected = Cloudflare/403-sensitive scrapers',
     )
+    parser.add_argument(
+        '--full-rescan',
+        action='store_true',
+        help='ignore page/event fingerprints: re-parse every page and reconcile every scraper',
+    )
     args = parser.parse_args()
-    return run_scheduled_scrapers(args.bucket)
+    return run_scheduled_scrapers(args.bucket, full_rescan=args.full_rescan)
 
 
 if __name__ == '__main__':
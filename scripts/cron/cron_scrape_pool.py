@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Bounded worker pool for cron scrapers (used by cron_run_scheduled_scrapers.py).
+
+Each venue or standalone scraper is a ``ScrapeJob``. ``ScrapeScheduler.run()`` starts jobs on a
+thread pool while honouring per-domain politeness:
+
+- **Concurrency:** at most ``per_domain`` jobs run against one registered domain at a time
+  (``npg.si.edu`` and ``asia.si.edu`` share the ``si.edu`` slot).
+- **Rate budget:** job starts on one domain are spaced at least ``domain_interval`` seconds apart.
+- **Isolation:** every job runs in its own app context, so Flask-SQLAlchemy gives it its own
+  session; the session is rolled back on error and removed when the job finishes.
+
+Jobs waiting on a busy domain never occupy a worker; the scheduler only submits runnable jobs.
+
+Configuration (env): ``CRON_SCRAPE_WORKERS`` (default 4; 1 runs jobs serially),
+``CRON_SCRAPE_PER_DOMAIN`` (default 1), ``CRON_SCRAPE_DOMAIN_INTERVAL`` seconds (default 2).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_PER_DOMAIN = 1
+DEFAULT_DOMAIN_INTERVAL = 2.0
+
+# (max concurrent jobs, seconds between job starts) for domains that differ from the defaults
+DOMAIN_POLICIES: Dict[str, Tuple[int, float]] = {
+    'eventbriteapi.com': (2, 1.0),  # Authenticated API, not page scraping
+}
+
+
+@dataclass
+class ScrapeResult:
+    """Counts reported by one scraper run."""
+    found: int = 0
+    saved: int = 0
+    updated: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+    note: str = ''
+    seconds: float = 0.0
+
+
+@dataclass
+class ScrapeJob:
+    """One scraper to run. ``run`` is called inside the worker's app context."""
+    label: str
+    domain: str
+    run: Callable[[], Optional[ScrapeResult]]
+    icon: str = '🏛️'
+    counts_venue: bool = False    # include in venues processed / with events
+    counts_failure: bool = False  # an error counts as a failed venue (non-zero exit)
+
+
+def politeness_domain(url: str) -> str:
+    """Registered domain used as the politeness key (``https://www.npg.si.edu/x`` → ``si.edu``)."""
+    host = (urlparse(url if '//' in (url or '') else f'//{url or ""}').hostname or '').lower()
+    labels = [label for label in host.split('.') if label]
+    return '.'.join(labels[-2:]) if labels else ''
+
+
+def format_result(result: ScrapeResult) -> str:
+    """``found X, saved Y, updated Z, skipped W`` as logged per scraper."""
+    if result.error:
+        return f"❌ {result.error}"
+    line = f"found {result.found}, saved {result.saved}, updated {result.updated}, skipped {result.skipped}"
+    if result.note:
+        line += f" {result.note}"
+    return line
+
+
+class ScrapeScheduler:
+    """Runs ScrapeJobs concurrently with per-domain concurrency limits and start spacing."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        per_domain: int = DEFAULT_PER_DOMAIN,
+        domain_interval: float = DEFAULT_DOMAIN_INTERVAL,
+        domain_policies: Optional[Dict[str, Tuple[int, float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.per_domain = max(1, per_domain)
+        self.domain_interval = max(0.0, domain_interval)
+        self.domain_policies = DOMAIN_POLICIES if domain_policies is None else domain_policies
+        self._clock = clock
+        self._sleep = sleep
+
+    def _policy(self, domain: str) -> Tuple[int, float]:
+        return self.domain_policies.get(domain, (self.per_domain, self.domain_interval))
+
+    def run(self, jobs: List[ScrapeJob], app=None, db=None, logger_instance=None) -> List[ScrapeResult]:
+        """Run all jobs; returns one ScrapeResult per job, in job order."""
+        log = logger_instance or logger
+        results: List[Optional[ScrapeResult]] = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        running = {}
+        active: Dict[str, int] = defaultdict(int)
+        next_start: Dict[str, float] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scrape') as pool:
+            while pending or running:
+                now = self._clock()
+                wake_at = None
+                for index in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    job = jobs[index]
+                    limit, interval = self._policy(job.domain)
+                    if active[job.domain] >= limit:
+                        continue
+                    ready_at = next_start.get(job.domain, now)
+                    if ready_at > now:
+                        wake_at = ready_at if wake_at is None else min(wake_at, ready_at)
+                        continue
+                    pending.remove(index)
+                    active[job.domain] += 1
+                    next_start[job.domain] = now + interval
+                    log.info(f"{job.icon}  {job.label}")
+                    running[pool.submit(_run_job, job, app, db, log)] = index
+
+                if not running:
+                    self._sleep(max(0.0, wake_at - now) if wake_at is not None else 0.0)
+                    continue
+                timeout = None if wake_at is None else max(0.0, wake_at - now)
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    job = jobs[index]
+                    active[job.domain] -= 1
+                    results[index] = future.result()
+                    log.info(f"   → {job.label}: {format_result(results[index])} ({results[index].seconds:.1f}s)")
+        return results
+
+
+def _run_job(job: ScrapeJob, app, db, log) -> ScrapeResult:
+    started = time.monotonic()
+    with (app.app_context() if app is not None else nullcontext()):
+        try:
+            result = job.run() or ScrapeResult()
+        except Exception as e:
+            log.error(f"   ❌ {job.label}: {e}")
+            log.error(traceback.format_exc())
+            if db is not None:
+                db.session.rollback()
+            result = ScrapeResult(error=str(e) or e.__class__.__name__)
+        finally:
+            if db is not None:
+                db.session.remove()
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def create_scrape_scheduler() -> ScrapeScheduler:
+    """Build the scheduler from environment settings."""
+    try:
+        workers = int(os.getenv('CRON_SCRAPE_WORKERS', DEFAULT_WORKERS))
+    except ValueError:
+        workers = DEFAULT_WORKERS
+    try:
+        per_domain = int(os.getenv('CRON_SCRAPE_PER_DOMAIN', DEFAULT_PER_DOMAIN))
+    except ValueError:
+        per_domain = DEFAULT_PER_DOMAIN
+    try:
+        interval = float(os.getenv('CRON_SCRAPE_DOMAIN_INTERVAL', DEFAULT_DOMAIN_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_DOMAIN_INTERVAL
+    return ScrapeScheduler(workers, per_domain, interval)
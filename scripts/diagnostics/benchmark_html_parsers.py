@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark lxml against html.parser on stored scraper pages.
+
+Pages come from the scraper HTTP cache (bodies of pages served with ETag/Last-Modified,
+see scripts/scraper_utils/http_cache.py) or from a folder of saved .html files. For each
+page it times both parsers and compares the visible text and link count; pages where the
+two trees differ are candidates for SCRAPER_HTML_PARSER_FALLBACK_HOSTS.
+
+Usage:
+    python scripts/diagnostics/benchmark_html_parsers.py
+    python scripts/diagnostics/benchmark_html_parsers.py --pages-dir ~/saved_pages --repeat 5
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup
+
+from scripts.scraper_utils.html_parser import HTML_PARSER, LXML_AVAILABLE, LXML_PARSER
+from scripts.scraper_utils.http_cache import DEFAULT_CACHE_PATH
+
+
+def load_cached_pages(path):
+    """(url, body) pairs with a stored HTML body from the HTTP cache database."""
+    if not os.path.exists(path):
+        print(f"❌ HTTP cache not found: {path}")
+        return []
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute('SELECT url, body, headers FROM http_cache WHERE body IS NOT NULL').fetchall()
+    finally:
+        conn.close()
+    return [(url, body) for url, body, headers in rows if 'html' in (headers or '').lower() or b'<html' in body[:2048].lower()]
+
+
+def load_dir_pages(directory):
+    """(file name, body) pairs for every .html / .htm file under ``directory``."""
+    pages = []
+    for path in sorted(Path(directory).expanduser().rglob('*')):
+        if path.suffix.lower() in ('.html', '.htm'):
+            pages.append((path.name, path.read_bytes()))
+    return pages
+
+
+def time_parse(body, parser, repeat):
+    """Best-of-``repeat`` seconds to parse ``body``, and the last tree."""
+    best = None
+    soup = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = BeautifulSoup(body, parser)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, soup
+
+
+def tree_signature(soup):
+    text = ' '.join(soup.get_text(' ', strip=True).split())
+    return text, len(soup.find_all('a', href=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare lxml and html.parser on stored pages')
+    parser.add_argument('--cache', default=os.getenv('SCRAPER_HTTP_CACHE_PATH') or DEFAULT_CACHE_PATH,
+                        help='scraper HTTP cache database')
+    parser.add_argument('--pages-dir', help='folder of saved .html files (instead of the HTTP cache)')
+    parser.add_argument('--repeat', type=int, default=3, help='parses per page and parser (best time is kept)')
+    args = parser.parse_args()
+
+    if not LXML_AVAILABLE:
+        print("❌ lxml is not installed (pip install lxml)")
+        return 1
+
+    pages = load_dir_pages(args.pages_dir) if args.pages_dir else load_cached_pages(args.cache)
+    if not pages:
+        print("No pages to benchmark")
+        return 1
+
+    totals = {LXML_PARSER: 0.0, HTML_PARSER: 0.0}
+    by_host = defaultdict(lambda: {LXML_PARSER: 0.0, HTML_PARSER: 0.0, 'pages': 0})
+    mismatches = []
+
+    for name, body in pages:
+        host = urlparse(name).hostname or name
+        lxml_time, lxml_soup = time_parse(body, LXML_PARSER, args.repeat)
+        stdlib_time, stdlib_soup = time_parse(body, HTML_PARSER, args.repeat)
+        totals[LXML_PARSER] += lxml_time
+        totals[HTML_PARSER] += stdlib_time
+        stats = by_host[host]
+        stats[LXML_PARSER] += lxml_time
+        stats[HTML_PARSER] += stdlib_time
+        stats['pages'] += 1
+
+        lxml_text, lxml_links = tree_signature(lxml_soup)
+        stdlib_text, stdlib_links = tree_signature(stdlib_soup)
+        if lxml_links != stdlib_links or lxml_text != stdlib_text:
+            mismatches.append((name, len(lxml_text) - len(stdlib_text), lxml_links - stdlib_links))
+
+    print("=" * 80)
+    print(f"HTML PARSER BENCHMARK ({len(pages)} pages, best of {args.repeat})")
+    print("=" * 80)
+    print(f"{'host':<40} {'pages':>5} {'lxml ms':>10} {'html.parser ms':>15} {'speedup':>8}")
+    for host, stats in sorted(by_host.items(), key=lambda item: -item[1][HTML_PARSER]):
+        speedup = stats[HTML_PARSER] / stats[LXML_PARSER] if stats[LXML_PARSER] else 0
+        print(f"{host[:40]:<40} {stats['pages']:>5} {stats[LXML_PARSER] * 1000:>10.1f} "
+              f"{stats[HTML_PARSER] * 1000:>15.1f} {speedup:>7.1f}x")
+    speedup = totals[HTML_PARSER] / totals[LXML_PARSER] if totals[LXML_PARSER] else 0
+    print("-" * 80)
+    print(f"{'total':<40} {len(pages):>5} {totals[LXML_PARSER] * 1000:>10.1f} "
+          f"{totals[HTML_PARSER] * 1000:>15.1f} {speedup:>7.1f}x")
+
+    if mismatches:
+        print(f"\n⚠️  {len(mismatches)} pages parse differently (text chars / links, lxml minus html.parser):")
+        for name, text_delta, link_delta in mismatches:
+            print(f"  {name}  text {text_delta:+d}  links {link_delta:+d}")
+        print("\nCheck the scrapers for these hosts; add hosts that break to SCRAPER_HTML_PARSER_FALLBACK_HOSTS.")
+    else:
+        print("\n✅ Both parsers produce the same text and links on every page")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
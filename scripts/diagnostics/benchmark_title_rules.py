@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled title rules (scripts/title_rules.py) against the per-check loops they replaced.
+
+For every event in data/events.json (or --events-file) it evaluates all flags twice: with the
+old style (one ``in`` / ``re.match`` per keyword or pattern, one function per flag) and with
+``title_rules``' predicates, uncached and through the memoized ``classify()``. It prints
+per-event timings and lists any event where the two disagree.
+
+Usage:
+    python scripts/diagnostics/benchmark_title_rules.py
+    python scripts/diagnostics/benchmark_title_rules.py --repeat 20 --events-file nga_events_local.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts import title_rules
+from scripts.title_rules import (
+    BABY_FRIENDLY_KEYWORDS,
+    CATEGORY_HEADING_PATTERNS,
+    LISTING_TITLE_PATTERNS,
+    LISTING_TITLES,
+    NAVIGATION_ARROWS,
+    NAVIGATION_KEYWORDS,
+    NON_ENGLISH_STARTERS,
+    NON_ENGLISH_WORD_PATTERNS,
+    PAGE_ELEMENT_PATTERNS,
+    PAGE_ELEMENT_PREFIXES,
+    PAGE_ELEMENT_TITLES,
+    SECTION_HEADERS,
+    SHOPPING_KEYWORDS,
+)
+
+FLAGS = ('heading', 'navigation', 'non_english', 'spanish_language', 'baby_friendly', 'shopping',
+         'listing_title', 'page_element')
+
+
+def load_events(path):
+    with open(path) as f:
+        data = json.load(f)
+    events = data.get('events', data) if isinstance(data, dict) else data
+    if isinstance(events, dict):
+        events = list(events.values())
+    return [(e.get('title') or '', e.get('description') or '', e.get('url') or '') for e in events]
+
+
+# -- the previous per-check style -----------------------------------------------------------------
+
+def loop_navigation(title):
+    if not title:
+        return False
+    title = title.strip()
+    if len(title) > 200:
+        return True
+    title_lower = title.lower().strip()
+    keyword_count = sum(1 for keyword in NAVIGATION_KEYWORDS if keyword in title_lower)
+    if keyword_count >= 3:
+        return True
+    words = title_lower.split()
+    if len(words) > 5:
+        word_counts = {}
+        for word in words:
+            word_counts[word] = word_counts.get(word, 0) + 1
+        if max(word_counts.values()) >= 2 and keyword_count >= 2:
+            return True
+    if len(words) >= 5:
+        if sum(1 for word in words if word in NAVIGATION_KEYWORDS) >= len(words) * 0.6:
+            return True
+    return False
+
+
+def loop_heading(title):
+    title_lower = title.lower().strip()
+    return any(re.match(f'^{pattern}$', title_lower) for pattern in CATEGORY_HEADING_PATTERNS)
+
+
+def loop_english(text):
+    if not text:
+        return True
+    text_lower = text.lower()
+    count = sum(len(re.findall(rf'\b({words})\b', text_lower)) for words in NON_ENGLISH_WORD_PATTERNS)
+    accented = sum(1 for char in text if char in 'áéíóúñüàèìòùâêîôûäëïöçãõåæø')
+    if count > 2 or accented > 3:
+        return False
+    return not any(word in NON_ENGLISH_STARTERS for word in text_lower.split()[:3])
+
+
+def loop_listing_title(title):
+    title = title.lower().strip()
+    if title in LISTING_TITLES or title.endswith(NAVIGATION_ARROWS):
+        return True
+    for header in SECTION_HEADERS:
+        if title == header or title.startswith(header + ' ') or title.startswith(header + '→'):
+            return True
+    return any(re.match(pattern, title, re.IGNORECASE) for pattern in LISTING_TITLE_PATTERNS)
+
+
+def loop_page_element(title):
+    title_lower = title.lower().strip()
+    if any(re.match(pattern, title_lower, re.IGNORECASE) for pattern in PAGE_ELEMENT_PATTERNS):
+        return True
+    if title_lower in PAGE_ELEMENT_TITLES or title_lower.endswith(NAVIGATION_ARROWS):
+        return True
+    return any(title_lower.startswith(prefix + ' ') or title_lower == prefix for prefix in PAGE_ELEMENT_PREFIXES)
+
+
+def loop_flags(title, description, url):
+    combined = f"{title.lower()} {description.lower()}"
+    return {
+        'heading': bool(title) and loop_heading(title),
+        'navigation': loop_navigation(title),
+        'non_english': not loop_english(title) or (len(description) > 50 and not loop_english(description)),
+        'spanish_language': bool(re.search(r'\bspanish[\s-]language\b', title.lower())),
+        'baby_friendly': any(keyword in combined for keyword in BABY_FRIENDLY_KEYWORDS),
+        'shopping': any(keyword in f"{combined} {url.lower()}" for keyword in SHOPPING_KEYWORDS),
+        'listing_title': bool(title) and loop_listing_title(title),
+        'page_element': bool(title) and loop_page_element(title),
+    }
+
+
+def compiled_flags(title, description, url):
+    return title_rules._classify.__wrapped__(title, description, url)
+
+
+def classify_flags(title, description, url):
+    return title_rules.classify(title, description, url)
+
+
+def time_per_event(function, events, repeat):
+    best = None
+    for _ in range(repeat):
+        title_rules.clear_cache()
+        started = time.perf_counter()
+        for event in events:
+            function(*event)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best / max(1, len(events))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compiled title rules')
+    parser.add_argument('--events-file', default=str(project_root / 'data' / 'events.json'))
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    events = load_events(args.events_file)
+    print(f"📊 {len(events)} events from {args.events_file}")
+
+    mismatches = []
+    for event in events:
+        expected = loop_flags(*event)
+        actual = compiled_flags(*event)
+        differing = [flag for flag in FLAGS if expected[flag] != getattr(actual, flag)]
+        if differing:
+            mismatches.append((event[0], differing))
+
+    loops = time_per_event(loop_flags, events, args.repeat)
+    compiled = time_per_event(compiled_flags, events, args.repeat)
+    print(f"   per-check loops:   {loops * 1e6:8.1f} µs/event")
+    print(f"   compiled rules:    {compiled * 1e6:8.1f} µs/event  ({loops / compiled:.1f}x)")
+
+    # A listing page is parsed several times per run (pagination, detail pages, retries)
+    title_rules.clear_cache()
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for event in events:
+            classify_flags(*event)
+    memoized = (time.perf_counter() - started) / max(1, len(events) * args.repeat)
+    print(f"   classify() x{args.repeat}:     {memoized * 1e6:8.1f} µs/event  ({loops / memoized:.1f}x)")
+
+    counts = {flag: sum(1 for event in events if getattr(compiled_flags(*event), flag)) for flag in FLAGS}
+    print("\n🏷️  Flagged events: " + ', '.join(f"{flag}={count}" for flag, count in counts.items()))
+
+    if mismatches:
+        print(f"\n❌ {len(mismatches)} events classified differently:")
+        for title, differing in mismatches[:20]:
+            print(f"   {title[:70]!r}: {', '.join(differing)}")
+        return 1
+    print("\n✅ Compiled rules agree with the per-check loops on every event")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
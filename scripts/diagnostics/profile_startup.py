@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of app.py (what a gunicorn worker pays on boot or recycle).
+
+Imports the app in a fresh interpreter with ``python -X importtime`` and reports the total
+import time, the slowest top-level imports (cumulative) and the slowest modules by their own
+time. Boot migrations are skipped (SCHEMA_MIGRATIONS=skip) unless --with-migrations is given,
+so the numbers match a worker starting after the release step.
+
+Usage:
+    python scripts/diagnostics/profile_startup.py
+    python scripts/diagnostics/profile_startup.py --top 40 --with-migrations
+    python scripts/diagnostics/profile_startup.py --module scripts.utils
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+
+
+def run_importtime(module, with_migrations):
+    """(wall seconds, [(self_us, cumulative_us, depth, name)]) for importing ``module``."""
+    env = dict(os.environ)
+    env.setdefault('SCRAPE_JOB_EMBEDDED_WORKER', '0')
+    if not with_migrations:
+        env['SCHEMA_MIGRATIONS'] = 'skip'
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=project_root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit(f"❌ import {module} failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return wall, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time profile of the web app')
+    parser.add_argument('--module', default='app', help='module to import (default: app)')
+    parser.add_argument('--top', type=int, default=25, help='rows per table')
+    parser.add_argument('--with-migrations', action='store_true', help='let boot migrations run')
+    args = parser.parse_args()
+
+    wall, rows = run_importtime(args.module, args.with_migrations)
+    root = next((row for row in rows if row[3] == args.module and row[2] == 0), None)
+
+    print(f"📊 import {args.module}: {wall * 1000:.0f} ms wall (interpreter start included)")
+    if root:
+        print(f"   module body: {root[0] / 1000:.0f} ms, imports + body: {root[1] / 1000:.0f} ms")
+
+    direct = sorted((row for row in rows if row[2] == 1), key=lambda row: -row[1])
+    print(f"\n🐢 Slowest imports made by {args.module} (cumulative ms)")
+    for self_us, cumulative_us, _, name in direct[:args.top]:
+        print(f"   {cumulative_us / 1000:8.1f}  {name}")
+
+    own = sorted((row for row in rows if row[3] != args.module), key=lambda row: -row[0])
+    print("\n🔥 Slowest modules by own time (ms)")
+    for self_us, _, _, name in own[:args.top]:
+        print(f"   {self_us / 1000:8.1f}  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,16 @@
 """
 Enhanced LLM Fallback System for Venue Discovery
 Integrates multiple AI models with automatic fallback
+
+- Successful answers are cached by prompt hash (scripts/llm_cache.py), so identical
+  prompts from repeat scrapes are answered without calling a provider.
+- Concurrent identical prompts in one process share a single provider call.
+- A model that returns 429 (or fails several times in a row) is skipped for a cool-down
+  window instead of being retried on every request.
+
+Configuration (env): LLM_PROVIDER_COOLDOWN_SECONDS (default 300; a Retry-After header
+wins when the provider sends one), LLM_PROVIDER_FAILURE_THRESHOLD (consecutive failures
+that open the breaker, default 3); cache settings in scripts/llm_cache.py.
 """
 
 import os
@@ -10,11 +20,13 @@ import requests
 import json
 import time
 import logging
+import threading
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
 from enum import Enum
 # Import centralized environment configuration
 from scripts.env_config import ensure_env_loaded, get_api_keys
+from scripts.llm_cache import get_llm_cache, prompt_key
 
 # Ensure environment is loaded
 ensure_env_loaded()
@@ -41,6 +53,101 @@ llm_logger = setup_llm_logging()
 # Per-run fallback usage count (incremented when fallback is used)
 _fallback_used_count = 0
 
+DEFAULT_PROVIDER_COOLDOWN_SECONDS = 300
+DEFAULT_PROVIDER_FAILURE_THRESHOLD = 3
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class ProviderCircuitBreaker:
+    """Skip a model for a cool-down window after a 429 or repeated failures (shared by all instances)."""
+
+    def __init__(self, cooldown_seconds: float, failure_threshold: int):
+        self.cooldown_seconds = cooldown_seconds
+        self.failure_threshold = failure_threshold
+        self._open_until: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, name: str) -> bool:
+        with self._lock:
+            return self._open_until.get(name, 0) > time.monotonic()
+
+    def record_success(self, name: str) -> None:
+        with self._lock:
+            self._failures.pop(name, None)
+            self._open_until.pop(name, None)
+
+    def record_failure(self, name: str, status_code: Optional[int] = None,
+                       retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            failures = self._failures.get(name, 0) + 1
+            self._failures[name] = failures
+            if status_code == 429 or failures >= self.failure_threshold:
+                cooldown = retry_after if retry_after else self.cooldown_seconds
+                self._open_until[name] = time.monotonic() + cooldown
+                self._failures[name] = 0
+                llm_logger.info("Skipping %s for %ds (%s)", name, cooldown,
+                                'rate limited' if status_code == 429 else f'{failures} failures')
+
+    def reset(self) -> None:
+        with self._lock:
+            self._open_until.clear()
+            self._failures.clear()
+
+
+provider_breaker = ProviderCircuitBreaker(
+    _env_number('LLM_PROVIDER_COOLDOWN_SECONDS', DEFAULT_PROVIDER_COOLDOWN_SECONDS),
+    int(_env_number('LLM_PROVIDER_FAILURE_THRESHOLD', DEFAULT_PROVIDER_FAILURE_THRESHOLD)),
+)
+
+
+class _InflightQueries:
+    """Let concurrent callers with the same prompt wait for one provider call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Dict[str, Any]] = {}
+
+    def run(self, key: str, query):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': threading.Event(), 'result': None}
+        if not leader:
+            call['done'].wait()
+            if call['result'] is not None:
+                return dict(call['result'], coalesced=True)
+            return query()  # the leading call raised; query on our own
+        try:
+            call['result'] = query()
+            return call['result']
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call['done'].set()
+
+
+_inflight_queries = _InflightQueries()
+
+
+def _http_error(response, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Failure result for a non-200 provider response (keeps the status and Retry-After)."""
+    text = response.text
+    if limit is not None and len(text) > limit:
+        text = text[:limit] + '...'
+    error = {'success': False, 'error': f'HTTP {response.status_code}: {text}', 'status_code': response.status_code}
+    retry_after = (response.headers.get('Retry-After') or '').strip()
+    if retry_after.isdigit():
+        error['retry_after'] = int(retry_after)
+    return error
+
 class ModelProvider(Enum):
     GROQ = "groq"
     OPENAI = "openai"
@@ -235,8 +342,42 @@ class EnhancedLLMFallback:
         print(f"Total models available: {len([m for m in self.models if m.provider != ModelProvider.MOCK])}")
         print()
     
-    def query_with_fallback(self, prompt: str, context: str = "") -> Dict[str, Any]:
-        """Query LLM with automatic fallback through multiple models"""
+    def query_with_fallback(self, prompt: str, context: str = "", use_cache: bool = True) -> Dict[str, Any]:
+        """Query LLM with automatic fallback through multiple models (cached by prompt)"""
+        if not use_cache:
+            return self._query_models(prompt, context)
+
+        key = prompt_key(prompt, context)
+        cache = get_llm_cache()
+        if cache is not None:
+            try:
+                cached = cache.get(key)
+            except Exception as e:
+                llm_logger.debug("LLM cache read failed: %s", e)
+                cached = None
+            if cached is not None:
+                llm_logger.debug("LLM cache hit (%s)", cached.get('provider'))
+                return dict(cached, cached=True)
+
+        def query():
+            response = self._query_models(prompt, context)
+            if cache is not None and response.get('success') and response.get('provider') != 'mock':
+                try:
+                    cache.put(key, response)
+                except Exception as e:
+                    llm_logger.debug("LLM cache write failed: %s", e)
+            return response
+
+        return _inflight_queries.run(key, query)
+
+    def extract_batch(self, instructions: str, items: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """Run one extraction prompt over many items ({'id', 'content'}) in a few batched
+        queries; returns {id: parsed JSON result or None}. See scripts/llm_batch.py."""
+        from scripts.llm_batch import extract_batch
+        return extract_batch(self, instructions, items, **kwargs)
+
+    def _query_models(self, prompt: str, context: str) -> Dict[str, Any]:
+        """Walk the model chain, skipping models whose circuit breaker is open"""
         global _fallback_used_count
 
         llm_logger.debug("Starting LLM query with fallback. Prompt length: %d", len(prompt))
@@ -252,9 +393,17 @@ class EnhancedLLMFallback:
                     llm_logger.warning("Using mock response as fallback")
                     return self._get_mock_response(prompt, context)
 
+                breaker_name = f"{model.provider.value}:{model.model_name}"
+                if provider_breaker.is_open(breaker_name):
+                    llm_logger.debug("Skipping %s (cooling down)", breaker_name)
+                    if not self.silent:
+                        print(f"⏭️  Skipping {model.provider.value} ({model.model_name}): cooling down")
+                    continue
+
                 response = self._query_model(model, prompt, context)
 
                 if response.get('success'):
+                    provider_breaker.record_success(breaker_name)
                     llm_logger.debug("Success with %s (%s)", model.provider.value, model.model_name)
                     if not self.silent:
                         print(f"✅ Success with {model.provider.value} ({model.model_name})")
@@ -280,6 +429,7 @@ class EnhancedLLMFallback:
 
                     # Update error stats
                     self.usage_stats[model.provider.value]['errors'] += 1
+                    provider_breaker.record_failure(breaker_name, response.get('status_code'), response.get('retry_after'))
 
             except Exception as e:
                 llm_logger.debug("Exception with %s: %s", model.provider.value, str(e), exc_info=True)
@@ -289,6 +439,7 @@ class EnhancedLLMFallback:
 
                 # Update error stats
                 self.usage_stats[model.provider.value]['errors'] += 1
+                provider_breaker.record_failure(f"{model.provider.value}:{model.model_name}")
                 continue
 
         # If all models fail, return mock response
@@ -342,7 +493,7 @@ class EnhancedLLMFallback:
             tokens_used = result.get('usage', {}).get('total_tokens', 0)
             return {'success': True, 'content': content, 'provider': 'groq', 'tokens_used': tokens_used}
         else:
-            return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+            return _http_error(response)
     
     def _query_openai(self, model: ModelConfig, prompt: str) -> Dict[str, Any]:
         """Query OpenAI API"""
@@ -369,7 +520,7 @@ class EnhancedLLMFallback:
             tokens_used = result.get('usage', {}).get('total_tokens', 0)
             return {'success': True, 'content': content, 'provider': 'openai', 'tokens_used': tokens_used}
         else:
-            return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+            return _http_error(response)
     
     def _query_anthropic(self, model: ModelConfig, prompt: str) -> Dict[str, Any]:
         """Query Anthropic Claude API"""
@@ -396,7 +547,7 @@ class EnhancedLLMFallback:
             tokens_used = result.get('usage', {}).get('total_tokens', 0)
             return {'success': True, 'content': content, 'provider': 'anthropic', 'tokens_used': tokens_used}
         else:
-            return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+            return _http_error(response)
     
     def _query_cohere(self, model: ModelConfig, prompt: str) -> Dict[str, Any]:
         """Query Cohere API"""
@@ -420,7 +571,7 @@ class EnhancedLLMFallback:
             tokens_used = result.get('meta', {}).get('tokens', {}).get('total_tokens', 0)
             return {'success': True, 'content': content, 'provider': 'cohere', 'tokens_used': tokens_used}
         else:
-            return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+            return _http_error(response)
     
     def _query_google(self, model: ModelConfig, prompt: str) -> Dict[str, Any]:
         """Query Google Gemini API"""
@@ -447,10 +598,9 @@ class EnhancedLLMFallback:
             tokens_used = result.get('usageMetadata', {}).get('totalTokenCount', 0)
             return {'success': True, 'content': content, 'provider': 'google', 'tokens_used': tokens_used}
         elif response.status_code == 429:
-            return {'success': False, 'error': 'Resource exhausted (429)', 'status_code': 429}
+            return dict(_http_error(response), error='Resource exhausted (429)')
         else:
-            err = response.text[:200] + ('...' if len(response.text) > 200 else '')
-            return {'success': False, 'error': f'HTTP {response.status_code}: {err}'}
+            return _http_error(response, limit=200)
     
     def _query_mistral(self, model: ModelConfig, prompt: str) -> Dict[str, Any]:
         """Query Mistral API"""
@@ -476,7 +626,7 @@ class EnhancedLLMFallback:
             tokens_used = result.get('usage', {}).get('total_tokens', 0)
             return {'success': True, 'content': content, 'provider': 'mistral', 'tokens_used': tokens_used}
         else:
-            return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+            return _http_error(response)
     
     def _query_huggingface(self, model: ModelConfig, prompt: str) -> Dict[str, Any]:
         """Query Hugging Face API"""
@@ -504,7 +654,7 @@ class EnhancedLLMFallback:
                 content = str(result)
             return {'success': True, 'content': content, 'provider': 'huggingface', 'tokens_used': len(prompt) + len(content)}
         else:
-            return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+            return _http_error(response)
     
     def _get_mock_response(self, prompt: str, context: str) -> Dict[str, Any]:
         """Return mock response when all models fail"""
@@ -6,12 +6,49 @@ venue validation, and immediate commits. All scrapers should use this
 instead of duplicating the same logic.
 """
 
+import contextvars
 import logging
+from contextlib import contextmanager
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, date
 
+from scripts.event_series import RecurrenceRule, series_match_key, split_series, with_series_dates
+
 logger = logging.getLogger(__name__)
 
+
+class SaveReport:
+    """Events the shared handler failed to save while a ``track_save_errors()`` block was open."""
+    
+    def __init__(self):
+        self.errors = 0
+
+
+_save_report: contextvars.ContextVar[Optional[SaveReport]] = contextvars.ContextVar('save_report', default=None)
+
+
+@contextmanager
+def track_save_errors():
+    """
+    Count save failures inside the block, in this thread. The handler catches and logs them
+    per event, and scraper wrappers only return created/updated counts, so callers that must
+    know whether everything was written (cron reconciliation) read ``report.errors`` instead.
+    """
+    report = SaveReport()
+    token = _save_report.set(report)
+    try:
+        yield report
+    finally:
+        _save_report.reset(token)
+
+
+def record_save_errors(count: int = 1) -> None:
+    """Add ``count`` failed events to the open ``track_save_errors()`` report, if any."""
+    report = _save_report.get()
+    if report is not None and count:
+        report.errors += count
+
+
 # Specialized museum URL domains - used for venue validation
 SPECIALIZED_MUSEUM_DOMAINS = {
     'npg.si.edu': 'National Portrait Gallery',
@@ -92,6 +129,17 @@ def should_skip_event_for_venue(event_url: str, current_venue_name: str) -> bool
     return False
 
 
+def _instance_criteria(Event) -> list:
+    """Filters that keep series template rows (events.series_id) out of instance matching."""
+    return [Event.series_id.is_(None)] if hasattr(Event, 'series_id') else []
+
+
+def _series_model(Event):
+    """The EventSeries model mapped on Event.series, or None when the app has no series support."""
+    relationship = Event.__mapper__.relationships.get('series')
+    return relationship.mapper.class_ if relationship is not None else None
+
+
 def find_existing_event(event_data: Dict, venue_id: int, city_id: int, db, Event, Venue) -> Optional:
     """
     Find an existing event in the database using multiple strategies.
@@ -156,7 +204,8 @@ def find_existing_event(event_data: Dict, venue_id: int, city_id: int, db, Event
              (Event.source_url == event_url) | (Event.source_url == normalized_url)),
             Event.venue_id == venue_id,  # CRITICAL: Match by venue to prevent cross-venue duplicates
             Event.city_id == city_id,
-            Event.start_date == start_date
+            Event.start_date == start_date,
+            *_instance_criteria(Event)
         )
         
         # CRITICAL: For recurring events (like walk-in tours), include start_time in matching
@@ -184,7 +233,8 @@ def find_existing_event(event_data: Dict, venue_id: int, city_id: int, db, Event
                 Event.event_type == 'exhibition',
                 Venue.website_url == venue.website_url,
                 Event.city_id == city_id,
-                Event.start_date == start_date
+                Event.start_date == start_date,
+                *_instance_criteria(Event)
             ).first()
             
             if existing:
@@ -213,7 +263,7 @@ def find_existing_event(event_data: Dict, venue_id: int, city_id: int, db, Event
         venue_id=venue_id,  # CRITICAL: Must match venue_id
         city_id=city_id,
         start_date=start_date
-    )
+    ).filter(*_instance_criteria(Event))
     
     # Include start_time in matching for recurring events (prevents duplicates)
     if start_time:
@@ -480,6 +530,456 @@ def handle_ongoing_exhibition_dates(event_data: Dict, logger_instance: Optional[
         return False
 
 
+# Event model fields set when creating an event from scraped data
+NEW_EVENT_FIELDS = [
+    'title', 'description', 'event_type', 'url', 'image_url',
+    'start_date', 'end_date', 'start_time', 'end_time',
+    'start_location', 'end_location', 'meeting_point',
+    'venue_id', 'city_id', 'source', 'source_url', 'organizer',
+    'price', 'is_online', 'is_registration_required', 'registration_url',
+    'registration_info', 'social_media_platform', 'social_media_handle', 
+    'social_media_url', 'is_baby_friendly', 'is_admin_only', 'visibility', 'source_id',
+    'is_selected'
+]
+
+
+def _parse_time_safe(value):
+    """Parse 'HH:MM[:SS]' strings to time objects; time objects pass through, anything else is None."""
+    from datetime import time as dt_time
+    if isinstance(value, dt_time):
+        return value
+    if not isinstance(value, str):
+        return None
+    parts = value.strip().split(':')
+    if len(parts) < 2:
+        return None
+    try:
+        second = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+        return dt_time(int(parts[0]), int(parts[1]), second)
+    except (ValueError, TypeError):
+        return None
+
+
+def _prepare_event_for_venue(
+    event_data: Dict,
+    venue_id: int,
+    city_id: int,
+    venue_name: str,
+    source_url: Optional[str],
+    custom_event_processor: Optional[callable],
+    logger_instance: logging.Logger,
+) -> bool:
+    """
+    Validate and normalize one scraped event in place before matching/saving.
+    
+    Returns False when the event should be skipped (other museum's URL, missing title,
+    category heading, non-English, or missing dates that cannot be inferred).
+    """
+    from scripts.utils import is_category_heading, is_spanish_language_event, ensure_loadable_image_url, IMAGE_PROXY_MAX_WIDTH_EVENT
+    
+    title = event_data.get('title', '').strip()
+    event_type = event_data.get('event_type', 'unknown')
+    
+    # CRITICAL: Check URL domain to ensure event belongs to this venue
+    event_url = event_data.get('url') or event_data.get('source_url') or ''
+    if should_skip_event_for_venue(event_url, venue_name):
+        logger_instance.debug(f"   ⏭️ Skipping event from different specialized museum: {title} (URL: {event_url})")
+        return False
+    
+    # Validate required fields
+    if not title:
+        logger_instance.warning(f"   ⚠️  Skipping event: missing title")
+        return False
+    
+    # Skip category headings
+    if is_category_heading(title):
+        logger_instance.debug(f"   ⏭️ Skipping category heading: '{title}'")
+        return False
+    
+    # Treat title-based Spanish events (e.g. "Spanish-Language Walk-In Tours") as Spanish
+    if is_spanish_language_event(title):
+        event_data['language'] = 'Spanish'
+    
+    # Skip non-English events
+    language = event_data.get('language', 'English')
+    if language and language.lower() != 'english':
+        logger_instance.debug(f"   ⚠️  Skipping non-English event: '{title}' (language: {language})")
+        return False
+    
+    # Handle ongoing exhibitions (set dates if missing)
+    if not event_data.get('start_date'):
+        if event_type == 'tour':
+            logger_instance.warning(f"   ⚠️  Skipping tour '{title}': missing start_date")
+        if not handle_ongoing_exhibition_dates(event_data, logger_instance):
+            return False
+    
+    # Detect baby-friendly events
+    if detect_baby_friendly(event_data):
+        event_data['is_baby_friendly'] = True
+        logger_instance.info(f"   👶 Detected baby-friendly event: '{title}'")
+    
+    # Allow custom event processing (e.g., for venue-specific fields)
+    if custom_event_processor:
+        custom_event_processor(event_data)
+    
+    # Ensure image URLs are loadable (all scrapers - current and future)
+    if event_data.get('image_url'):
+        event_data['image_url'] = ensure_loadable_image_url(
+            event_data['image_url'], max_width=IMAGE_PROXY_MAX_WIDTH_EVENT
+        )
+    
+    # Ensure venue_id and city_id are set
+    event_data['venue_id'] = venue_id
+    event_data['city_id'] = city_id
+    
+    # Default end_time for music/performance events to 11:59 PM if missing
+    if event_data.get('event_type') in ['music', 'performance'] and not event_data.get('end_time'):
+        from datetime import time as dt_time
+        event_data['end_time'] = dt_time(23, 59)
+        logger_instance.debug(f"   🕒 Set default midnight end_time for {event_data.get('event_type')} event: '{title}'")
+    
+    # Set source_url if provided
+    if source_url and not event_data.get('source_url'):
+        event_data['source_url'] = source_url
+    
+    return True
+
+
+def _apply_new_event_fields(event, event_data: Dict) -> None:
+    """Copy NEW_EVENT_FIELDS from event_data onto a new Event, parsing date/time strings (unparseable values are left unset)."""
+    for field in NEW_EVENT_FIELDS:
+        if field in event_data and event_data[field] is not None:
+            # Handle date conversion if needed
+            if field in ['start_date', 'end_date'] and isinstance(event_data[field], str):
+                parsed = _parse_date_safe(event_data[field])
+                if parsed is None:
+                    continue  # Skip if can't parse
+                event_data[field] = parsed
+            # Handle time conversion if needed
+            elif field in ['start_time', 'end_time'] and isinstance(event_data[field], str):
+                parsed = _parse_time_safe(event_data[field])
+                if parsed is None:
+                    continue  # Skip if can't parse
+                event_data[field] = parsed
+            
+            setattr(event, field, event_data[field])
+
+
+def _parse_match_time(value):
+    """start_time as find_existing_event compares it: 'HH:MM' strings to time (seconds ignored)."""
+    if isinstance(value, str):
+        try:
+            if ':' in value:
+                from datetime import time as dt_time
+                parts = value.split(':')
+                return dt_time(int(parts[0]), int(parts[1]))
+        except (ValueError, IndexError):
+            pass
+        return None
+    return value
+
+
+class _ExistingEventIndex:
+    """
+    In-memory lookup over prefetched events mirroring find_existing_event() strategies.
+    
+    Keys are recomputed when an event is updated (update_existing_event can move an event to
+    this venue or change its date/time), so later lookups see what a fresh query would.
+    Candidates are ranked so DB rows win over events created earlier in the same batch, and
+    lower ids win among DB rows.
+    """
+    
+    def __init__(self, venue_id: int, city_id: int):
+        self.venue_id = venue_id
+        self.city_id = city_id
+        self.by_url = {}         # (url, start_date, start_time) -> [(rank, event)]
+        self.by_exhibition = {}  # (title, start_date) -> [(rank, event)], same-website venues
+        self.by_title = {}       # (title, start_date) -> [(rank, event)]
+        self._entries = {}       # id(event) -> (rank, same_website, [(bucket, key)])
+        self._pending_rank = 0
+    
+    def add(self, event, same_website: bool, pending: bool = False) -> None:
+        if id(event) in self._entries:
+            return
+        if pending:
+            self._pending_rank += 1
+            rank = (1, self._pending_rank)
+        else:
+            rank = (0, event.id)
+        self._entries[id(event)] = (rank, same_website, [])
+        self._index(event)
+    
+    def refresh(self, event) -> None:
+        rank, _, keys = self._entries[id(event)]
+        for bucket, key in keys:
+            bucket[key].remove((rank, event))
+        keys.clear()
+        self._index(event)
+    
+    def _index(self, event) -> None:
+        rank, same_website, keys = self._entries[id(event)]
+        entries = []
+        if event.city_id == self.city_id and event.venue_id == self.venue_id:
+            for url in {event.url, event.source_url}:
+                if url:
+                    entries.append((self.by_url, (url, event.start_date, event.start_time)))
+            entries.append((self.by_title, (event.title, event.start_date)))
+        if same_website and event.city_id == self.city_id and event.event_type == 'exhibition':
+            entries.append((self.by_exhibition, (event.title, event.start_date)))
+        for bucket, key in entries:
+            bucket.setdefault(key, []).append((rank, event))
+            keys.append((bucket, key))
+    
+    @staticmethod
+    def _first(candidates):
+        return min(candidates, key=lambda item: item[0])[1] if candidates else None
+    
+    def find(self, title: str, event_url: str, event_type: str, start_date: date, start_time):
+        if event_url:
+            candidates = []
+            for url in {event_url, event_url.rstrip('/')}:
+                candidates += self.by_url.get((url, start_date, start_time or None), [])
+            existing = self._first(candidates)
+            if existing is not None:
+                return existing
+        if event_type == 'exhibition':
+            existing = self._first(self.by_exhibition.get((title, start_date), []))
+            if existing is not None:
+                return existing
+        candidates = self.by_title.get((title, start_date), [])
+        if start_time:
+            candidates = [item for item in candidates if item[1].start_time == start_time]
+        return self._first(candidates)
+
+
+def save_event_series(
+    series: List[Tuple[Dict, RecurrenceRule]],
+    venue_id: int,
+    city_id: int,
+    venue_name: str,
+    db,
+    Event,
+    logger_instance: logging.Logger,
+    source_url: Optional[str] = None,
+    custom_event_processor: Optional[callable] = None,
+) -> Tuple[int, int, int]:
+    """
+    Save recurring series (see scripts/event_series.py): one event_series row per
+    (venue, title, event_type, match_key) plus its template Event, in one transaction.
+    ``match_key`` carries the URL base and location that split_series() groups by, so two
+    same-titled series at a venue (e.g. tours from different meeting points) stay separate.
+    
+    A re-scraped rule is merged with the stored one (the window only grows), the template is
+    updated like any existing event, and single-occurrence rows the series now covers (the
+    instances older scrapes stored one per date/time) are deleted.
+    
+    Returns:
+        Tuple of (created_count, updated_count, skipped_count)
+    """
+    EventSeries = _series_model(Event)
+    created_count = updated_count = skipped_count = retired_count = 0
+    today = date.today()
+    for template, rule in series:
+        title = (template.get('title') or '').strip()
+        event_type = template.get('event_type') or 'event'
+        match_key = series_match_key(template)  # before the venue defaults fill in fields
+        if not _prepare_event_for_venue(template, venue_id, city_id, venue_name, source_url,
+                                        custom_event_processor, logger_instance):
+            skipped_count += 1
+            continue
+        
+        stored = EventSeries.query.filter(
+            EventSeries.venue_id == venue_id,
+            EventSeries.city_id == city_id,
+            EventSeries.event_type == event_type,
+            db.func.lower(EventSeries.title) == title.lower(),
+            db.or_(EventSeries.match_key == match_key, EventSeries.match_key.is_(None)),
+        ).order_by(EventSeries.match_key.is_(None), EventSeries.id).first()
+        if stored is None and rule.end_date is not None and rule.end_date < today:
+            skipped_count += 1
+            continue
+        
+        changed = False
+        if stored is None:
+            stored = EventSeries(title=title, event_type=event_type, venue_id=venue_id, city_id=city_id,
+                                 match_key=match_key, **rule.to_columns())
+            db.session.add(stored)
+            db.session.flush()
+        else:
+            if stored.match_key is None:  # stored before match_key existed: the first group adopts it
+                stored.match_key = match_key
+            rule = rule.merged_with(stored.rule())
+            for column, value in rule.to_columns().items():
+                if getattr(stored, column) != value:
+                    setattr(stored, column, value)
+                    changed = True
+        
+        template_data = with_series_dates(template, rule)
+        existing = Event.query.filter(Event.series_id == stored.id).order_by(Event.id).first()
+        if existing is None:
+            event = Event()
+            _apply_new_event_fields(event, template_data)
+            event.series_id = stored.id
+            db.session.add(event)
+            created_count += 1
+        else:
+            changed = update_existing_event(existing, template_data, venue_id, logger_instance) or changed
+            if existing.end_date != rule.end_date:  # open-ended series: None is not copied by the update
+                existing.end_date = rule.end_date
+                changed = True
+            if changed:
+                updated_count += 1
+            else:
+                skipped_count += 1
+        
+        # Occurrence rows stored before this series existed (or by older scrapes)
+        covered = Event.query.filter(
+            Event.series_id.is_(None),
+            Event.venue_id == venue_id,
+            Event.city_id == city_id,
+            Event.event_type == event_type,
+            db.func.lower(Event.title) == title.lower(),
+            Event.start_date >= rule.start_date,
+            Event.start_time.in_(rule.times),
+        )
+        if rule.end_date is not None:
+            covered = covered.filter(Event.start_date <= rule.end_date)
+        retired_count += covered.delete(synchronize_session=False)
+        logger_instance.info(f"   🔁 Series: {title} ({len(rule.times)} time(s), {rule.start_date} → {rule.end_date or 'open'})")
+    
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger_instance.error(f"❌ Saving event series failed: {e}")
+        record_save_errors(max(1, created_count + updated_count))
+        return (0, 0, skipped_count + created_count + updated_count)
+    if retired_count:
+        logger_instance.info(f"   🧹 Removed {retired_count} single-occurrence rows now covered by series")
+    return (created_count, updated_count, skipped_count)
+
+
+def _create_events_in_database_bulk(
+    events: List[Dict],
+    venue_id: int,
+    city_id: int,
+    venue_name: str,
+    db,
+    Event,
+    Venue,
+    logger_instance: logging.Logger,
+    source_url: Optional[str],
+    custom_event_processor: Optional[callable],
+    skip_past_events: bool,
+) -> Tuple[int, int, int]:
+    """
+    Bulk reconciliation for create_events_in_database(bulk=True).
+    
+    Prefetches every candidate match for the venue and date window (plus same-website
+    exhibitions) in at most two queries, decides create/update/skip in memory, and writes
+    everything in one transaction. Falls back to the per-event path if the commit fails.
+    """
+    originals = [dict(event_data) for event_data in events]
+    created_count = 0
+    updated_count = 0
+    skipped_count = 0
+    
+    # 1. Validate/normalize, and parse the match keys once
+    prepared = []
+    for event_data in events:
+        try:
+            if not _prepare_event_for_venue(event_data, venue_id, city_id, venue_name, source_url,
+                                            custom_event_processor, logger_instance):
+                skipped_count += 1
+                continue
+        except Exception as e:
+            logger_instance.error(f"   ❌ Error processing event '{event_data.get('title', 'Unknown')}': {e}")
+            record_save_errors()
+            continue
+        title = event_data.get('title', '').strip()
+        start_date = _parse_date_safe(event_data.get('start_date'))
+        prepared.append((event_data, title, start_date))
+    
+    # 2. Prefetch candidate matches: venue + city + date window, and same-website exhibitions
+    exhibitions = [(title, start_date) for event_data, title, start_date in prepared
+                   if title and start_date and event_data.get('event_type', 'event') == 'exhibition']
+    venue = db.session.get(Venue, venue_id) if exhibitions else None
+    match_exhibitions = bool(venue and venue.website_url)
+    index = _ExistingEventIndex(venue_id, city_id)
+    dates = [start_date for _, title, start_date in prepared if title and start_date]
+    if dates:
+        for existing in Event.query.filter(
+            Event.venue_id == venue_id,
+            Event.city_id == city_id,
+            Event.start_date >= min(dates),
+            Event.start_date <= max(dates),
+            *_instance_criteria(Event),
+        ).order_by(Event.id).all():
+            index.add(existing, same_website=match_exhibitions)
+    if match_exhibitions:
+        for existing in db.session.query(Event).join(Venue, Event.venue_id == Venue.id).filter(
+            Event.event_type == 'exhibition',
+            Venue.website_url == venue.website_url,
+            Event.city_id == city_id,
+            Event.title.in_({title for title, _ in exhibitions}),
+            Event.start_date.in_({start_date for _, start_date in exhibitions}),
+            *_instance_criteria(Event),
+        ).order_by(Event.id).all():
+            index.add(existing, same_website=True)
+    
+    # 3. Decide create / update / skip in memory
+    new_events = []
+    for event_data, title, start_date in prepared:
+        try:
+            existing = None
+            if title and start_date:
+                event_url = event_data.get('url') or event_data.get('source_url') or ''
+                existing = index.find(title, event_url, event_data.get('event_type', 'event'),
+                                      start_date, _parse_match_time(event_data.get('start_time')))
+            
+            if existing:
+                if update_existing_event(existing, event_data, venue_id, logger_instance):
+                    index.refresh(existing)
+                    updated_count += 1
+                    logger_instance.debug(f"   ✅ Updated: {title}")
+                else:
+                    skipped_count += 1
+                continue
+            
+            if skip_past_events and is_event_past(event_data):
+                skipped_count += 1
+                logger_instance.debug(f"   ⏭️ Skipping past event: '{title}' (start: {event_data.get('start_date')}, end: {event_data.get('end_date')})")
+                continue
+            
+            event = Event()
+            _apply_new_event_fields(event, event_data)
+            new_events.append(event)
+            created_count += 1
+            # Later duplicates in the same scrape match this event, as they would after a commit
+            index.add(event, same_website=match_exhibitions, pending=True)
+        except Exception as e:
+            logger_instance.error(f"   ❌ Error processing event '{event_data.get('title', 'Unknown')}': {e}")
+            record_save_errors()
+            import traceback
+            logger_instance.debug(traceback.format_exc())
+    
+    # 4. One transaction: batched INSERT for new events, UPDATEs for changed rows
+    try:
+        db.session.add_all(new_events)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger_instance.error(f"❌ Bulk save failed ({e}); retrying event by event")
+        return create_events_in_database(
+            originals, venue_id, city_id, venue_name, db, Event, Venue,
+            logger_instance=logger_instance, source_url=source_url,
+            custom_event_processor=custom_event_processor, skip_past_events=skip_past_events,
+        )
+    
+    logger_instance.info(f"✅ Created {created_count} new events, updated {updated_count} existing events, skipped {skipped_count} duplicates")
+    return (created_count, updated_count, skipped_count)
+
+
 def create_events_in_database(
     events: List[Dict],
     venue_id: int,
@@ -492,13 +992,24 @@ def create_events_in_database(
     logger_instance: Optional[logging.Logger] = None,
     source_url: Optional[str] = None,
     custom_event_processor: Optional[callable] = None,
-    skip_past_events: bool = True
+    skip_past_events: bool = True,
+    bulk: bool = False,
+    collapse_series: bool = False
 ) -> Tuple[int, int, int]:
     """
     Save events to database with deduplication, venue validation, and immediate commits.
     
     This is the shared handler that all scrapers should use instead of duplicating logic.
     
+    With bulk=True the whole scrape result is reconciled at once: candidate matches are
+    prefetched in one or two queries, create/update/skip is decided in memory and written in
+    a single transaction (batch_size is ignored). Use it for large scrapes (NGA, SAAM) where
+    per-event lookups and commits dominate; matching rules are the same as find_existing_event().
+    
+    Recurring events are stored as series (scripts/event_series.py): event dicts carrying a
+    ``recurrence`` dict always, and with collapse_series=True also runs of single-day instances
+    that repeat on at least three dates (walk-in tours expanded per date/time by a scraper).
+    
     When skip_past_events=True (default), new past events are not created. Existing events
     are still updated. Multi-day events with end_date >= today are kept. Ongoing exhibitions
     get dates from handle_ongoing_exhibition_dates() before this check. Pass skip_past_events=False
@@ -515,6 +1026,8 @@ def create_events_in_database(
         batch_size: Number of events to commit in a batch (default: 5 for immediate saving)
         logger_instance: Optional logger instance (uses module logger if not provided)
         skip_past_events: If True, skip creating new past events (default). Set False for backfill.
+        bulk: If True, use the prefetch + single-transaction reconciliation path.
+        collapse_series: If True, fold repeating instances into event series.
         
     Returns:
         Tuple of (created_count, updated_count, skipped_count)
@@ -522,86 +1035,33 @@ def create_events_in_database(
     if logger_instance is None:
         logger_instance = logger
     
-    created_count = 0
-    updated_count = 0
-    skipped_count = 0
-    error_count = 0
+    series_counts = (0, 0, 0)
+    if _series_model(Event) is not None:
+        events, series = split_series(events, collapse=collapse_series)
+        if series:
+            series_counts = save_event_series(
+                series, venue_id, city_id, venue_name, db, Event, logger_instance,
+                source_url=source_url, custom_event_processor=custom_event_processor,
+            )
     
-    # Import utilities
-    from scripts.utils import is_category_heading, is_spanish_language_event, ensure_loadable_image_url, IMAGE_PROXY_MAX_WIDTH_EVENT
+    if bulk:
+        counts = _create_events_in_database_bulk(
+            events, venue_id, city_id, venue_name, db, Event, Venue, logger_instance,
+            source_url, custom_event_processor, skip_past_events,
+        )
+        return tuple(count + series_count for count, series_count in zip(counts, series_counts))
+    
+    created_count, updated_count, skipped_count = series_counts
+    error_count = 0
     
     for event_data in events:
         try:
             title = event_data.get('title', '').strip()
-            event_type = event_data.get('event_type', 'unknown')
-            
-            # CRITICAL: Check URL domain to ensure event belongs to this venue
-            event_url = event_data.get('url') or event_data.get('source_url') or ''
-            if should_skip_event_for_venue(event_url, venue_name):
-                skipped_count += 1
-                logger_instance.debug(f"   ⏭️ Skipping event from different specialized museum: {title} (URL: {event_url})")
-                continue
-            
-            # Validate required fields
-            if not title:
-                logger_instance.warning(f"   ⚠️  Skipping event: missing title")
-                skipped_count += 1
-                continue
-            
-            # Skip category headings
-            if is_category_heading(title):
-                logger_instance.debug(f"   ⏭️ Skipping category heading: '{title}'")
-                skipped_count += 1
-                continue
-            
-            # Treat title-based Spanish events (e.g. "Spanish-Language Walk-In Tours") as Spanish
-            if is_spanish_language_event(title):
-                event_data['language'] = 'Spanish'
-            
-            # Skip non-English events
-            language = event_data.get('language', 'English')
-            if language and language.lower() != 'english':
-                logger_instance.debug(f"   ⚠️  Skipping non-English event: '{title}' (language: {language})")
+            if not _prepare_event_for_venue(event_data, venue_id, city_id, venue_name, source_url,
+                                            custom_event_processor, logger_instance):
                 skipped_count += 1
                 continue
             
-            # Handle ongoing exhibitions (set dates if missing)
-            if not event_data.get('start_date'):
-                if event_type == 'tour':
-                    logger_instance.warning(f"   ⚠️  Skipping tour '{title}': missing start_date")
-                if not handle_ongoing_exhibition_dates(event_data, logger_instance):
-                    skipped_count += 1
-                    continue
-            
-            # Detect baby-friendly events
-            if detect_baby_friendly(event_data):
-                event_data['is_baby_friendly'] = True
-                logger_instance.info(f"   👶 Detected baby-friendly event: '{title}'")
-            
-            # Allow custom event processing (e.g., for venue-specific fields)
-            if custom_event_processor:
-                custom_event_processor(event_data)
-            
-            # Ensure image URLs are loadable (all scrapers - current and future)
-            if event_data.get('image_url'):
-                event_data['image_url'] = ensure_loadable_image_url(
-                    event_data['image_url'], max_width=IMAGE_PROXY_MAX_WIDTH_EVENT
-                )
-            
-            # Ensure venue_id and city_id are set
-            event_data['venue_id'] = venue_id
-            event_data['city_id'] = city_id
-            
-            # Default end_time for music/performance events to 11:59 PM if missing
-            if event_data.get('event_type') in ['music', 'performance'] and not event_data.get('end_time'):
-                from datetime import time as dt_time
-                event_data['end_time'] = dt_time(23, 59)
-                logger_instance.debug(f"   🕒 Set default midnight end_time for {event_data.get('event_type')} event: '{title}'")
-            
-            # Set source_url if provided
-            if source_url and not event_data.get('source_url'):
-                event_data['source_url'] = source_url
-            
             # Find existing event
             existing = find_existing_event(event_data, venue_id, city_id, db, Event, Venue)
             
@@ -631,51 +1091,7 @@ def create_events_in_database(
                     continue
                 # Create new event
                 event = Event()
-                
-                # Set all valid Event model fields
-                valid_fields = [
-                    'title', 'description', 'event_type', 'url', 'image_url',
-                    'start_date', 'end_date', 'start_time', 'end_time',
-                    'start_location', 'end_location', 'meeting_point',
-                    'venue_id', 'city_id', 'source', 'source_url', 'organizer',
-                    'price', 'is_online', 'is_registration_required', 'registration_url',
-                    'registration_info', 'social_media_platform', 'social_media_handle', 
-                    'social_media_url', 'is_baby_friendly', 'is_admin_only', 'visibility', 'source_id',
-                    'is_selected'
-                ]
-                
-                for field in valid_fields:
-                    if field in event_data and event_data[field] is not None:
-                        # Handle date conversion if needed
-                        if field in ['start_date', 'end_date'] and isinstance(event_data[field], str):
-                            try:
-                                from datetime import datetime
-                                event_data[field] = datetime.fromisoformat(event_data[field].replace('Z', '+00:00')).date()
-                            except (ValueError, AttributeError):
-                                try:
-                                    event_data[field] = datetime.strptime(event_data[field], '%Y-%m-%d').date()
-                                except ValueError:
-                                    continue  # Skip if can't parse
-                        # Handle time conversion if needed
-                        elif field in ['start_time', 'end_time'] and isinstance(event_data[field], str):
-                            try:
-                                from datetime import time as dt_time
-                                time_str = event_data[field].strip()
-                                if ':' in time_str:
-                                    parts = time_str.split(':')
-                                    if len(parts) >= 2:
-                                        hour = int(parts[0])
-                                        minute = int(parts[1])
-                                        second = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
-                                        event_data[field] = dt_time(hour, minute, second)
-                                    else:
-                                        continue  # Skip if can't parse
-                                else:
-                                    continue  # Skip if no colon
-                            except (ValueError, IndexError, TypeError):
-                                continue  # Skip if can't parse
-                        
-                        setattr(event, field, event_data[field])
+                _apply_new_event_fields(event, event_data)
                 
                 db.session.add(event)
                 created_count += 1
@@ -692,6 +1108,7 @@ def create_events_in_database(
         
         except Exception as e:
             error_count += 1
+            record_save_errors()
             logger_instance.error(f"   ❌ Error processing event '{event_data.get('title', 'Unknown')}': {e}")
             db.session.rollback()
             import traceback
@@ -704,6 +1121,7 @@ def create_events_in_database(
     except Exception as e:
         logger_instance.error(f"❌ Error in final commit: {e}")
         db.session.rollback()
+        record_save_errors()
     
     logger_instance.info(f"✅ Created {created_count} new events, updated {updated_count} existing events, skipped {skipped_count} duplicates")
     
@@ -0,0 +1,292 @@
+"""
+Geohash index and distances for the nearby-events query (``/api/events/nearby``).
+
+``events.geohash`` stores a geohash of each event's effective location: the venue's
+coordinates when it has them, else the event's own ``start_latitude``/``start_longitude``
+(the same priority as the Google Maps link). Most events only inherit a location from their
+venue, so the column is materialized rather than computed per request, and it has a plain
+btree index (``ix_events_geohash`` in scripts/event_query_planner.py) on both SQLite and
+PostgreSQL.
+
+A radius query becomes a handful of prefix ranges:
+
+- ``covering_prefixes(lat, lng, radius_km)``: the geohash cells (at most ``MAX_CELLS``, as fine
+  as possible) that cover the circle's bounding box;
+- ``geohash_filter(db, column, prefixes)``: ``column >= prefix AND column < next prefix`` for
+  each, which the index answers with range scans;
+- ``distance_km(lat, lng, geohash)``: exact great-circle distance from the cell centre (within a
+  few metres at the stored precision), applied in Python to drop the box corners.
+
+``refresh_event_geohash()`` recomputes the column for a scope of events and
+``register_geo_hooks()`` runs it after each commit that moves an event or a venue (ORM flushes
+and the rows of bulk updates).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from scripts.orm_bulk import bulk_target_rows
+
+logger = logging.getLogger(__name__)
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9  # ~4.8 m cells
+EARTH_RADIUS_KM = 6371.0088
+MAX_CELLS = 9
+
+DEFAULT_RADIUS_KM = 2.0
+MAX_RADIUS_KM = 50.0
+
+# Event attributes that feed the geohash; other column changes do not trigger a refresh
+EVENT_GEO_INPUTS = ('start_latitude', 'start_longitude', 'venue_id')
+VENUE_GEO_INPUTS = ('latitude', 'longitude')
+
+_UPDATE_CHUNK = 500
+
+
+def encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Geohash of a point."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        interval, coordinate = (lng_range, longitude) if even else (lat_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits, value = 0, 0
+    return ''.join(chars)
+
+
+def decode(geohash: str) -> Tuple[float, float]:
+    """Centre ``(latitude, longitude)`` of a geohash cell."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = BASE32.index(char)
+        for shift in range(4, -1, -1):
+            interval = lng_range if even else lat_range
+            middle = (interval[0] + interval[1]) / 2
+            if value >> shift & 1:
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+    return (lat_range[0] + lat_range[1]) / 2, (lng_range[0] + lng_range[1]) / 2
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """``(latitude, longitude)`` extent in degrees of a cell at ``precision``."""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** (bits - bits // 2)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi, d_lambda = phi2 - phi1, math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance_km(latitude: float, longitude: float, geohash: str) -> float:
+    """Distance from a point to the centre of a stored geohash."""
+    return haversine_km(latitude, longitude, *decode(geohash))
+
+
+def covering_prefixes(latitude: float, longitude: float, radius_km: float) -> List[str]:
+    """Geohash prefixes whose cells cover every point within ``radius_km`` (bounding box, no wrap)."""
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(min(89.0, abs(latitude) + d_lat)))
+    d_lng = min(180.0, d_lat / cos_lat)
+    south, north = max(-90.0, latitude - d_lat), min(90.0, latitude + d_lat)
+    west, east = max(-180.0, longitude - d_lng), min(180.0, longitude + d_lng)
+    for precision in range(GEOHASH_PRECISION - 1, 0, -1):
+        height, width = cell_size(precision)
+        rows = range(int((south + 90) // height), int(min(north + 90, 180 - height / 2) // height) + 1)
+        columns = range(int((west + 180) // width), int(min(east + 180, 360 - width / 2) // width) + 1)
+        if len(rows) * len(columns) <= MAX_CELLS:
+            return sorted({
+                encode(-90 + (row + 0.5) * height, -180 + (column + 0.5) * width, precision)
+                for row in rows for column in columns
+            })
+    return list(BASE32)
+
+
+def _prefix_upper(prefix: str) -> Optional[str]:
+    """Smallest string above every geohash starting with ``prefix`` (None past the last cell)."""
+    while prefix:
+        position = BASE32.index(prefix[-1])
+        if position + 1 < len(BASE32):
+            return prefix[:-1] + BASE32[position + 1]
+        prefix = prefix[:-1]
+    return None
+
+
+def geohash_filter(db, column, prefixes: Sequence[str]):
+    """``column`` starts with any of ``prefixes``, as index range predicates."""
+    ranges = []
+    for prefix in prefixes:
+        upper = _prefix_upper(prefix)
+        ranges.append(column >= prefix if upper is None else db.and_(column >= prefix, column < upper))
+    return db.or_(*ranges)
+
+
+def parse_point(latitude: Optional[str], longitude: Optional[str]) -> Tuple[float, float]:
+    """``(lat, lng)`` from query values; ValueError when missing or out of range."""
+    if latitude in (None, '') or longitude in (None, ''):
+        raise ValueError("lat and lng are required")
+    try:
+        lat, lng = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid lat/lng")
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValueError("lat/lng out of range")
+    return lat, lng
+
+
+def parse_radius(value: Optional[str]) -> float:
+    """Radius in km from a ``radius`` query value (default ``DEFAULT_RADIUS_KM``, at most ``MAX_RADIUS_KM``)."""
+    if value in (None, ''):
+        return DEFAULT_RADIUS_KM
+    try:
+        radius = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid radius: {value!r}")
+    if not radius > 0:
+        raise ValueError("radius must be positive")
+    return min(radius, MAX_RADIUS_KM)
+
+
+def event_geohash(
+    venue_latitude: Optional[float],
+    venue_longitude: Optional[float],
+    start_latitude: Optional[float],
+    start_longitude: Optional[float],
+) -> Optional[str]:
+    """Geohash of an event's effective location: venue coordinates, else its own (None without either)."""
+    for latitude, longitude in ((venue_latitude, venue_longitude), (start_latitude, start_longitude)):
+        if latitude and longitude and -90 <= latitude <= 90 and -180 <= longitude <= 180:
+            return encode(latitude, longitude)
+    return None
+
+
+def _chunks(values: Sequence[Any], size: int = _UPDATE_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def refresh_event_geohash(
+    connection,
+    Event,
+    Venue,
+    event_ids: Optional[Iterable[int]] = None,
+    venue_ids: Optional[Iterable[int]] = None,
+    only_missing: bool = False,
+) -> int:
+    """
+    Recompute ``events.geohash`` for events matching any of the given ids (all events when no
+    scope is given). Returns the number of rows whose value changed.
+    """
+    from sqlalchemy import bindparam, or_, select, update
+
+    events = Event.__table__
+    venues = Venue.__table__
+    stmt = select(
+        events.c.id, events.c.geohash, events.c.start_latitude, events.c.start_longitude,
+        venues.c.latitude.label('venue_latitude'), venues.c.longitude.label('venue_longitude'),
+    ).select_from(events.outerjoin(venues, events.c.venue_id == venues.c.id))
+    scope = []
+    if event_ids:
+        scope.append(events.c.id.in_(list(event_ids)))
+    if venue_ids:
+        scope.append(events.c.venue_id.in_(list(venue_ids)))
+    if scope:
+        stmt = stmt.where(or_(*scope))
+    elif event_ids is not None or venue_ids is not None:
+        return 0
+    if only_missing:
+        stmt = stmt.where(events.c.geohash.is_(None))
+
+    changed = []
+    for row in connection.execute(stmt):
+        geohash = event_geohash(row.venue_latitude, row.venue_longitude, row.start_latitude, row.start_longitude)
+        if geohash != row.geohash:
+            changed.append({'event_id': row.id, 'new_geohash': geohash})
+    statement = update(events).where(events.c.id == bindparam('event_id')).values(geohash=bindparam('new_geohash'))
+    for chunk in _chunks(changed):
+        connection.execute(statement, list(chunk))
+    return len(changed)
+
+
+def _changed(obj, attributes: Sequence[str]) -> bool:
+    from sqlalchemy import inspect
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def register_geo_hooks(Event, Venue) -> None:
+    """Keep ``events.geohash`` current after every committed session."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    key = 'geohash_refresh'
+
+    def scope(session) -> Dict[str, Any]:
+        return session.info.setdefault(key, {'events': set(), 'venues': set(), 'all': False})
+
+    @event.listens_for(Session, 'after_flush')
+    def _collect(session, flush_context):
+        for obj in session.new:
+            if isinstance(obj, Event):
+                scope(session)['events'].add(obj.id)
+            elif isinstance(obj, Venue):
+                scope(session)['venues'].add(obj.id)
+        for obj in session.dirty:
+            if isinstance(obj, Event) and _changed(obj, EVENT_GEO_INPUTS):
+                scope(session)['events'].add(obj.id)
+            elif isinstance(obj, Venue) and _changed(obj, VENUE_GEO_INPUTS):
+                scope(session)['venues'].add(obj.id)
+
+    @event.listens_for(Session, 'do_orm_execute')
+    def _collect_bulk(orm_execute_state):
+        if not orm_execute_state.is_update:
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None:
+            scope(orm_execute_state.session)['all'] = True
+        elif issubclass(mapper.class_, (Event, Venue)):
+            model, bucket = (Event, 'events') if issubclass(mapper.class_, Event) else (Venue, 'venues')
+            rows = bulk_target_rows(orm_execute_state, model.__table__.c.id)
+            if rows is None:
+                scope(orm_execute_state.session)['all'] = True
+            else:
+                scope(orm_execute_state.session)[bucket].update(row.id for row in rows)
+
+    @event.listens_for(Session, 'after_commit')
+    def _refresh(session):
+        pending = session.info.pop(key, None)
+        if not pending or not (pending['all'] or pending['events'] or pending['venues']):
+            return
+        try:
+            with session.get_bind(mapper=Event.__mapper__).begin() as connection:
+                if pending['all']:
+                    refresh_event_geohash(connection, Event, Venue)
+                else:
+                    refresh_event_geohash(connection, Event, Venue,
+                                          event_ids=pending['events'], venue_ids=pending['venues'])
+        except Exception as e:
+            logger.warning(f"geohash refresh failed: {e}")
+
+    @event.listens_for(Session, 'after_rollback')
+    def _discard(session):
+        session.info.pop(key, None)
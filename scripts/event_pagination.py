@@ -0,0 +1,212 @@
+"""
+Keyset (cursor) pagination and field projection for the events APIs.
+
+``/api/events`` and ``/api/admin/events`` return a single JSON array when called without
+paging parameters (index.html and older clients). With ``limit`` (and then ``cursor``) they
+return one page::
+
+    {"events": [...], "next_cursor": "WyIyMDI2LTAzLTAyIiwgNDJd", "total_estimate": 1830,
+     "total_is_estimate": true}
+
+- **Order:** a sort column plus ``events.id`` as tie-breaker, e.g. ``(start_date, id)`` or
+  ``(updated_at DESC, id DESC)``. NULL sort values come last ascending and first descending,
+  PostgreSQL's btree order, so one ``(sort, id)`` index serves both directions.
+- **Cursor:** URL-safe base64 of the last returned row's ``[sort value, id]``. The next page
+  is ``WHERE (sort, id) > cursor`` in index order, so page N costs the same as page 1
+  (no ``OFFSET`` scan). ``next_cursor`` is null on the last page.
+- **Total:** only on the first page (no cursor). PostgreSQL answers from the planner's row
+  estimate (``EXPLAIN``); other backends count exactly.
+- **Fields:** ``fields=id,title,start_date`` keeps only those keys in each event dict.
+
+Typical pattern:
+  page = keyset_page(fetch_batch, limit, 'start_date', after=decode_cursor(token))
+  return {'events': project(page.items, fields), 'next_cursor': page.next_cursor, ...}
+"""
+
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Query parameters that switch an events endpoint from a plain array to a page envelope
+PAGING_PARAMS = ('limit', 'cursor')
+
+Cursor = Tuple[Any, int]
+
+
+def parse_limit(value: Optional[str], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Page size from a ``limit`` query value, clamped to ``MAX_PAGE_SIZE``."""
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid limit: {value!r}")
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def parse_fields(value: Optional[str], allowed: Sequence[str]) -> Optional[Tuple[str, ...]]:
+    """Requested field names from ``fields=a,b,c`` (None when absent); unknown names raise ValueError."""
+    if not value:
+        return None
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def project(events: List[Dict[str, Any]], fields: Optional[Sequence[str]]) -> List[Dict[str, Any]]:
+    """Event dicts reduced to ``fields`` (all keys when None)."""
+    if not fields:
+        return events
+    return [{name: event.get(name) for name in fields} for event in events]
+
+
+def encode_cursor(value: Any, last_id: int) -> str:
+    """Opaque cursor for the row with sort value ``value`` and id ``last_id``."""
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    raw = json.dumps([value, last_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """``(sort value, id)`` from a cursor; None for no cursor, ValueError for a malformed one."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        value, last_id = json.loads(raw)
+        return value, int(last_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def cursor_value(column, value: Any) -> Any:
+    """A decoded cursor value converted to ``column``'s Python type (dates and timestamps arrive as ISO strings)."""
+    if value is None or not isinstance(value, str):
+        return value
+    python_type = column.type.python_type
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value.rstrip('Z'))
+        if python_type is date:
+            return date.fromisoformat(value[:10])
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    return value
+
+
+def keyset_order(column, id_column, descending: bool = False) -> Tuple[Any, ...]:
+    """ORDER BY terms for (column, id): NULLS LAST ascending, NULLS FIRST descending."""
+    if descending:
+        return column.desc().nulls_first(), id_column.desc()
+    return column.asc().nulls_last(), id_column.asc()
+
+
+def keyset_after(db, column, id_column, cursor: Cursor, descending: bool = False):
+    """Rows strictly after ``cursor`` in ``keyset_order`` order."""
+    value, last_id = cursor
+    value = cursor_value(column, value)
+    if descending:
+        past_id = id_column < last_id
+        if value is None:
+            return db.or_(db.and_(column.is_(None), past_id), column.isnot(None))
+        return db.or_(column < value, db.and_(column == value, past_id))
+    past_id = id_column > last_id
+    if value is None:
+        return db.and_(column.is_(None), past_id)
+    return db.or_(column > value, db.and_(column == value, past_id), column.is_(None))
+
+
+def sort_key(field: str) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """Python sort key matching ascending ``keyset_order`` for serialized dicts (ISO strings sort like dates)."""
+    return lambda event: (event.get(field) is None, event.get(field) or '', event['id'])
+
+
+@dataclass
+class Page:
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+def keyset_page(
+    fetch_batch: Callable[[Optional[Cursor], int], List[Dict[str, Any]]],
+    limit: int,
+    field: str,
+    after: Optional[Cursor] = None,
+    extra: Iterable[Dict[str, Any]] = (),
+    keep: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> Page:
+    """
+    One ascending page over ``(field, id)``.
+
+    ``fetch_batch(after, size)`` returns up to ``size`` serialized rows strictly after ``after``
+    in that order. ``extra`` is an in-memory list merged into the same order (expanded series
+    occurrences). Rows rejected by ``keep`` (filters that only exist in Python) are skipped
+    without shortening the page: more batches are fetched until ``limit`` rows are kept.
+    """
+    key = sort_key(field)
+    after_key = key({field: after[0], 'id': after[1]}) if after else None
+    pending = sorted((item for item in extra if after_key is None or key(item) > after_key), key=key)
+    batch_size = limit + 1
+    items: List[Dict[str, Any]] = []
+    sql_after = after
+    while True:
+        batch = fetch_batch(sql_after, batch_size)
+        exhausted = len(batch) < batch_size
+        if batch:
+            sql_after = (batch[-1].get(field), batch[-1]['id'])
+        # In-memory items up to the last fetched row (all of them once SQL is exhausted)
+        bound = None if exhausted or not batch else key(batch[-1])
+        split = len(pending) if bound is None else next(
+            (position for position, item in enumerate(pending) if key(item) > bound), len(pending))
+        merged, pending = list(heapq.merge(batch, pending[:split], key=key)), pending[split:]
+        for position, item in enumerate(merged):
+            if keep is None or keep(item):
+                items.append(item)
+                if len(items) == limit:
+                    more = position < len(merged) - 1 or pending or not exhausted
+                    cursor = encode_cursor(item.get(field), item['id']) if more else None
+                    return Page(items, cursor)
+        if exhausted:
+            return Page(items, None)
+
+
+def explain_statement(stmt, dialect) -> Tuple[str, Dict[str, Any]]:
+    """``EXPLAIN (FORMAT JSON)`` SQL and driver parameters for a select (expanding ``IN`` lists)."""
+    compiled = stmt.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+    return f"EXPLAIN (FORMAT JSON) {compiled}", dict(compiled.params)
+
+
+def estimate_count(db, stmt) -> Tuple[int, bool]:
+    """
+    Row count for a select: the planner's estimate on PostgreSQL (no scan), an exact
+    ``count(*)`` elsewhere or when the estimate fails. Returns ``(count, is_estimate)``.
+    """
+    if db.engine.dialect.name == 'postgresql':
+        sql, params = explain_statement(stmt, db.engine.dialect)
+        try:
+            # Savepoint: a failed EXPLAIN must not abort the request's transaction
+            with db.session.begin_nested():
+                plan = db.session.connection().exec_driver_sql(sql, params).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows']), True
+        except Exception as e:
+            logger.warning(f"Row estimate failed, counting exactly: {e}")
+    counted = db.select(db.func.count()).select_from(stmt.order_by(None).subquery())
+    return int(db.session.execute(counted).scalar() or 0), False
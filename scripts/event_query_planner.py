@@ -0,0 +1,212 @@
+"""
+Query planner for the public events feed (``/api/events``).
+
+Builds a single SQL statement for a city + time range instead of one query per
+event type. Each event type keeps its own scope and date predicate:
+
+- **Scope:** tours, exhibitions and "other" types match ``city_id`` OR a venue in
+  the city; festivals, photowalks, music, film, workshops, talks and improv match
+  ``city_id`` only.
+- **Dates:** exhibitions and festivals use range *overlap*
+  (``start_date <= end AND end_date >= start``); everything else uses
+  *point-in-range* on ``start_date``.
+
+Typical pattern:
+  start_date, end_date = resolve_time_range(time_range, today, custom_start, custom_end)
+  criteria = build_events_filter(db, Event, Venue, city_id, start_date, end_date, event_type)
+  events = Event.query.filter(criteria).order_by(events_order_by(db, Event), Event.id).all()
+
+The composite indexes in ``EVENT_INDEXES`` back these predicates; they are created by
+``auto_migrate_schema()`` in app.py.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Optional, Tuple, Type
+
+# Event types with a dedicated predicate, in the order /api/events has always returned them
+KNOWN_EVENT_TYPES = ['tour', 'exhibition', 'festival', 'photowalk', 'music', 'film', 'workshop', 'talk', 'improv']
+
+# Types whose date window is a range (start_date..end_date) that must overlap the request
+OVERLAP_EVENT_TYPES = ('exhibition', 'festival')
+
+# Types matched on the event's own city only (no venue-in-city fallback)
+CITY_ONLY_EVENT_TYPES = ('festival', 'photowalk', 'music', 'film', 'workshop', 'talk', 'improv')
+
+# event_type=other excludes these (note: 'event' is excluded, 'improv' is not)
+OTHER_EXCLUDED_EVENT_TYPES = ['tour', 'exhibition', 'festival', 'photowalk', 'film', 'workshop', 'talk', 'music', 'event']
+
+# (index name, column list) for the events table
+EVENT_INDEXES = [
+    ('ix_events_city_type_start', ('city_id', 'event_type', 'start_date')),
+    ('ix_events_venue_start', ('venue_id', 'start_date')),
+    ('ix_events_end_date', ('end_date',)),
+    ('ix_events_series', ('series_id',)),
+    # Keyset pagination (scripts/event_pagination.py): public feed and admin grid sort orders
+    ('ix_events_city_start_id', ('city_id', 'start_date', 'id')),
+    ('ix_events_start_id', ('start_date', 'id')),
+    ('ix_events_updated_id', ('updated_at', 'id')),
+    # Nearby queries (scripts/event_geo.py): geohash prefix range scans
+    ('ix_events_geohash', ('geohash',)),
+]
+
+# Titles of generic recurring tours, hidden by default in the admin grid (lowercase)
+GENERIC_TOUR_TITLES = (
+    'docent-led walk-in tour', 'docent led walk-in tour', 'docent-led walk in tour', 'docent led walk in tour',
+    'walk-in tour', 'walk in tour', 'docent-led tour', 'docent led tour', 'guided tour', 'public tour',
+    'drop-in tour', 'drop in tour', 'self-guided tour', 'self guided tour',
+)
+
+VALID_TIME_RANGES = ('today', 'tomorrow', 'this_week', 'next_week', 'this_month', 'next_month', 'custom', 'all')
+
+
+def resolve_time_range(
+    time_range: str,
+    today: date,
+    custom_start: Optional[str] = None,
+    custom_end: Optional[str] = None,
+) -> Tuple[Optional[date], Optional[date]]:
+    """
+    Translate a ``time_range`` query value into an inclusive (start_date, end_date) pair.
+
+    ``today`` is the current date in the city's timezone. ``all`` returns (None, None).
+    Raises ValueError with the API error message for invalid input.
+    """
+    if time_range == 'today':
+        return today, today
+    if time_range == 'tomorrow':
+        day = today + timedelta(days=1)
+        return day, day
+    if time_range == 'this_week':
+        return today, today + timedelta(days=6)  # 7 days total including today
+    if time_range == 'next_week':
+        return today + timedelta(days=7), today + timedelta(days=13)
+    if time_range == 'this_month':
+        return today, today + timedelta(days=29)  # 30 days total including today
+    if time_range == 'next_month':
+        return today + timedelta(days=30), today + timedelta(days=59)
+    if time_range == 'custom':
+        if not custom_start or not custom_end:
+            raise ValueError('Custom start and end dates required for custom range')
+        try:
+            return (
+                datetime.strptime(custom_start, '%Y-%m-%d').date(),
+                datetime.strptime(custom_end, '%Y-%m-%d').date(),
+            )
+        except ValueError:
+            raise ValueError('Invalid custom date format. Use YYYY-MM-DD')
+    if time_range == 'all':
+        return None, None
+    raise ValueError('Invalid time range')
+
+
+def _date_predicate(db, Event: Type[Any], overlap: bool, start_date: Optional[date], end_date: Optional[date]):
+    if start_date is None or end_date is None:
+        return db.true()
+    if overlap:
+        return db.and_(Event.start_date <= end_date, Event.end_date >= start_date)
+    return db.and_(Event.start_date >= start_date, Event.start_date <= end_date)
+
+
+def _type_branch(db, Event: Type[Any], city_scope, city_or_venue_scope, event_type: str,
+                 start_date: Optional[date], end_date: Optional[date]):
+    scope = city_scope if event_type in CITY_ONLY_EVENT_TYPES else city_or_venue_scope
+    return db.and_(
+        Event.event_type == event_type,
+        scope,
+        _date_predicate(db, Event, event_type in OVERLAP_EVENT_TYPES, start_date, end_date),
+    )
+
+
+def build_events_filter(
+    db,
+    Event: Type[Any],
+    Venue: Type[Any],
+    city_id: int,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    event_type: Optional[str] = None,
+):
+    """
+    Return one boolean SQL expression selecting the events for a city and date window.
+
+    Mirrors the per-type rules of /api/events: an empty ``event_type`` ORs every known
+    type branch plus the catch-all branch for unknown types; ``other`` selects types
+    outside ``OTHER_EXCLUDED_EVENT_TYPES``; any other unknown value matches exactly.
+    """
+    city_scope = Event.city_id == city_id
+    # correlate(None): callers may already join venues in the outer select
+    venue_ids = db.select(Venue.id).where(Venue.city_id == city_id).correlate(None).scalar_subquery()
+    city_or_venue_scope = db.or_(city_scope, Event.venue_id.in_(venue_ids))
+
+    if event_type in KNOWN_EVENT_TYPES:
+        return _type_branch(db, Event, city_scope, city_or_venue_scope, event_type, start_date, end_date)
+
+    other_dates = _date_predicate(db, Event, False, start_date, end_date)
+    if event_type == 'other':
+        return db.and_(city_or_venue_scope, other_dates, ~Event.event_type.in_(OTHER_EXCLUDED_EVENT_TYPES))
+    if event_type:
+        return db.and_(city_or_venue_scope, other_dates, Event.event_type == event_type)
+
+    branches = [
+        _type_branch(db, Event, city_scope, city_or_venue_scope, known_type, start_date, end_date)
+        for known_type in KNOWN_EVENT_TYPES
+    ]
+    branches.append(db.and_(city_or_venue_scope, other_dates, ~Event.event_type.in_(KNOWN_EVENT_TYPES)))
+    return db.or_(*branches)
+
+
+def build_date_filter(
+    db,
+    Event: Type[Any],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    event_type: Optional[str] = None,
+):
+    """
+    The per-type date rules of ``build_events_filter`` without the city scope, for queries
+    scoped some other way (``/api/events/nearby``): overlap for exhibitions and festivals,
+    point-in-range for everything else.
+    """
+    if event_type == 'other':
+        return db.and_(_date_predicate(db, Event, False, start_date, end_date),
+                       ~Event.event_type.in_(OTHER_EXCLUDED_EVENT_TYPES))
+    if event_type:
+        return db.and_(Event.event_type == event_type,
+                       _date_predicate(db, Event, event_type in OVERLAP_EVENT_TYPES, start_date, end_date))
+    return db.or_(
+        db.and_(Event.event_type.in_(OVERLAP_EVENT_TYPES), _date_predicate(db, Event, True, start_date, end_date)),
+        db.and_(~Event.event_type.in_(OVERLAP_EVENT_TYPES), _date_predicate(db, Event, False, start_date, end_date)),
+    )
+
+
+def build_series_filter(db, EventSeries: Type[Any], start_date: Optional[date], end_date: Optional[date]):
+    """
+    Series whose date window overlaps the request (open-ended series have no ``end_date``).
+    Their template events go through ``build_events_filter`` with no dates for the type and
+    scope rules; occurrences are expanded in Python (scripts/event_series.py).
+    """
+    predicates = []
+    if end_date is not None:
+        predicates.append(EventSeries.start_date <= end_date)
+    if start_date is not None:
+        predicates.append(db.or_(EventSeries.end_date.is_(None), EventSeries.end_date >= start_date))
+    return db.and_(db.true(), *predicates)
+
+
+_EVENT_TYPE_POSITIONS = {event_type: position for position, event_type in enumerate(KNOWN_EVENT_TYPES)}
+
+
+def events_order_by(db, Event: Type[Any]):
+    """Group rows by event type in ``KNOWN_EVENT_TYPES`` order, other types last."""
+    return db.case(
+        _EVENT_TYPE_POSITIONS,
+        value=Event.event_type,
+        else_=len(KNOWN_EVENT_TYPES),
+    )
+
+
+def event_type_position(event_type: Optional[str]) -> int:
+    """Sort key matching ``events_order_by`` for event dicts merged in Python."""
+    return _EVENT_TYPE_POSITIONS.get(event_type, len(KNOWN_EVENT_TYPES))
@@ -0,0 +1,239 @@
+"""
+Full-text event search (``/api/events/search``).
+
+The ``event_search`` table indexes each event's title, description, artists, curator,
+organizer and venue name:
+
+- **SQLite:** an FTS5 virtual table (porter stemming, diacritics folded, 2/3-character prefix
+  indexes), ``rowid`` = ``events.id``, ranked with ``bm25`` and per-column weights.
+- **PostgreSQL:** ``event_search(event_id, document tsvector)`` with a GIN index; the document
+  is weighted A (title), B (artists, venue), C (curator, organizer), D (description) and ranked
+  with ``ts_rank_cd``.
+
+Every query term is a prefix match and all terms must match (``mus imp`` finds "Museum of
+Impressionism"). ``search_hits()`` returns a ``(event_id, score)`` subquery, lower score first,
+so callers join it to their own filters and serializer.
+
+The venue name lives on another table, so the index is maintained by the app rather than a
+generated column: ``register_search_hooks()`` refreshes the rows of events written in each
+committed session (scraper save paths, admin edits, bulk statements), and of events at renamed
+venues.
+``create_search_index()`` creates and fills the table on first migration.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from scripts.orm_bulk import bulk_target_rows
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = 'event_search'
+
+# (indexed field, SQLite bm25 weight, PostgreSQL tsvector weight)
+SEARCH_FIELDS = (
+    ('title', 10.0, 'A'),
+    ('description', 1.0, 'D'),
+    ('artists', 5.0, 'B'),
+    ('curator', 3.0, 'C'),
+    ('organizer', 3.0, 'C'),
+    ('venue_name', 5.0, 'B'),
+)
+
+# Event attributes that feed the index; other column changes do not trigger a refresh
+EVENT_SEARCH_INPUTS = ('title', 'description', 'artists', 'curator', 'organizer', 'venue_id')
+
+TS_CONFIG = 'english'
+MAX_TERMS = 8
+MIN_TERM_LENGTH = 2
+
+_UPDATE_CHUNK = 500
+_TERM = re.compile(r'[^\W_]+')
+
+
+def query_terms(text: Optional[str]) -> List[str]:
+    """Lowercased word terms of a search string; ValueError when none is long enough."""
+    terms = list(dict.fromkeys(term for term in _TERM.findall((text or '').lower()) if len(term) >= MIN_TERM_LENGTH))
+    if not terms:
+        raise ValueError(f"Search query needs a word of at least {MIN_TERM_LENGTH} characters")
+    return terms[:MAX_TERMS]
+
+
+def match_expression(terms: Sequence[str], dialect: str) -> str:
+    """All-terms prefix query in the backend's syntax (terms are word characters only)."""
+    if dialect == 'postgresql':
+        return ' & '.join(f'{term}:*' for term in terms)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _dialect(bind) -> str:
+    return bind.dialect.name
+
+
+def create_search_index(connection) -> bool:
+    """Create ``event_search`` if missing; returns True when it was created (and needs a full refresh)."""
+    from sqlalchemy import inspect, text
+
+    if inspect(connection).has_table(SEARCH_TABLE):
+        return False
+    if _dialect(connection) == 'postgresql':
+        connection.execute(text(
+            f"CREATE TABLE {SEARCH_TABLE} ("
+            f"event_id INTEGER PRIMARY KEY REFERENCES events(id) ON DELETE CASCADE, "
+            f"document TSVECTOR NOT NULL)"
+        ))
+        connection.execute(text(f"CREATE INDEX ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING GIN (document)"))
+    else:
+        columns = ', '.join(field for field, _, _ in SEARCH_FIELDS)
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5({columns}, "
+            f"tokenize='porter unicode61 remove_diacritics 2', prefix='2 3')"
+        ))
+    return True
+
+
+def _search_table(dialect: str):
+    from sqlalchemy import Integer, column, table
+
+    if dialect == 'postgresql':
+        return table(SEARCH_TABLE, column('event_id', Integer), column('document'))
+    return table(SEARCH_TABLE, column('rowid', Integer), *(column(field) for field, _, _ in SEARCH_FIELDS))
+
+
+def _chunks(values: Sequence[Any], size: int = _UPDATE_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def refresh_search_index(
+    connection,
+    Event,
+    Venue,
+    event_ids: Optional[Iterable[int]] = None,
+    venue_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Rewrite the index rows of the given events and of events at the given venues (the whole
+    index when no scope is given). Ids of deleted events just lose their row.
+    """
+    from sqlalchemy import delete, func, literal_column, select
+
+    dialect = _dialect(connection)
+    index = _search_table(dialect)
+    events = Event.__table__
+    venues = Venue.__table__
+    values = {field: func.coalesce(events.c[field], '') for field, _, _ in SEARCH_FIELDS if field != 'venue_name'}
+    values['venue_name'] = func.coalesce(venues.c.name, '')
+    if dialect == 'postgresql':
+        key = index.c.event_id
+        config = literal_column(f"'{TS_CONFIG}'::regconfig")
+        parts = [func.setweight(func.to_tsvector(config, values[field]), literal_column(f"'{weight}'"))
+                 for field, _, weight in SEARCH_FIELDS]
+        document = parts[0]
+        for part in parts[1:]:
+            document = document.op('||')(part)
+        names, columns = ['event_id', 'document'], [events.c.id, document]
+    else:
+        key = index.c.rowid
+        names = ['rowid', *(field for field, _, _ in SEARCH_FIELDS)]
+        columns = [events.c.id, *(values[field] for field, _, _ in SEARCH_FIELDS)]
+    source = select(*columns).select_from(events.outerjoin(venues, events.c.venue_id == venues.c.id))
+
+    if event_ids is None and venue_ids is None:
+        connection.execute(delete(index))
+        connection.execute(index.insert().from_select(names, source))
+        return
+    ids = set(event_ids or ())
+    if venue_ids:
+        ids.update(connection.execute(select(events.c.id).where(events.c.venue_id.in_(list(venue_ids)))).scalars())
+    for id_chunk in _chunks(sorted(ids)):
+        connection.execute(delete(index).where(key.in_(id_chunk)))
+        connection.execute(index.insert().from_select(names, source.where(events.c.id.in_(id_chunk))))
+
+
+def search_hits(bind, terms: Sequence[str]):
+    """``(event_id, score)`` subquery of events matching every term; lower score ranks first."""
+    from sqlalchemy import Float, Integer, text
+
+    dialect = _dialect(bind)
+    query = match_expression(terms, dialect)
+    if dialect == 'postgresql':
+        sql = (
+            f"SELECT event_id, -ts_rank_cd(document, to_tsquery('{TS_CONFIG}', :query), 32) AS score "
+            f"FROM {SEARCH_TABLE} WHERE document @@ to_tsquery('{TS_CONFIG}', :query)"
+        )
+    else:
+        weights = ', '.join(str(weight) for _, weight, _ in SEARCH_FIELDS)
+        sql = (
+            f"SELECT rowid AS event_id, bm25({SEARCH_TABLE}, {weights}) AS score "
+            f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :query"
+        )
+    return text(sql).bindparams(query=query).columns(event_id=Integer, score=Float).subquery('search_hits')
+
+
+def _changed(obj, attributes: Sequence[str]) -> bool:
+    from sqlalchemy import inspect
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def register_search_hooks(Event, Venue) -> None:
+    """Keep ``event_search`` current after every committed session."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    key = 'search_refresh'
+
+    def scope(session) -> Dict[str, Any]:
+        return session.info.setdefault(key, {'events': set(), 'venues': set(), 'all': False})
+
+    @event.listens_for(Session, 'after_flush')
+    def _collect(session, flush_context):
+        for obj in session.new:
+            if isinstance(obj, Event):
+                scope(session)['events'].add(obj.id)
+        for obj in session.dirty:
+            if isinstance(obj, Event) and _changed(obj, EVENT_SEARCH_INPUTS):
+                scope(session)['events'].add(obj.id)
+            elif isinstance(obj, Venue) and _changed(obj, ('name',)):
+                scope(session)['venues'].add(obj.id)
+        for obj in session.deleted:
+            if isinstance(obj, Event):
+                scope(session)['events'].add(obj.id)
+
+    @event.listens_for(Session, 'do_orm_execute')
+    def _collect_bulk(orm_execute_state):
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None:
+            scope(orm_execute_state.session)['all'] = True
+        elif issubclass(mapper.class_, (Event, Venue)):
+            model, bucket = (Event, 'events') if issubclass(mapper.class_, Event) else (Venue, 'venues')
+            rows = bulk_target_rows(orm_execute_state, model.__table__.c.id)
+            if rows is None:
+                scope(orm_execute_state.session)['all'] = True
+            else:
+                scope(orm_execute_state.session)[bucket].update(row.id for row in rows)
+
+    @event.listens_for(Session, 'after_commit')
+    def _refresh(session):
+        pending = session.info.pop(key, None)
+        if not pending or not (pending['all'] or pending['events'] or pending['venues']):
+            return
+        try:
+            with session.get_bind(mapper=Event.__mapper__).begin() as connection:
+                if pending['all']:
+                    refresh_search_index(connection, Event, Venue)
+                else:
+                    refresh_search_index(connection, Event, Venue,
+                                         event_ids=pending['events'], venue_ids=pending['venues'])
+        except Exception as e:
+            logger.warning(f"event_search refresh failed: {e}")
+
+    @event.listens_for(Session, 'after_rollback')
+    def _discard(session):
+        session.info.pop(key, None)
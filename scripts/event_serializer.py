@@ -0,0 +1,330 @@
+"""
+Column-projected event serialization for the events APIs.
+
+``Event.to_dict()`` loads a full ORM object (plus lazy ``venue``, ``city`` and
+``linked_source``) for every row. ``EventSerializer`` instead issues one Core
+``select()`` over events with a fixed outer join to venues, cities and sources,
+reads only the columns a field profile needs, and turns each row into a dict with
+getters compiled once per profile.
+
+Field profiles:
+
+- ``list``: what the public feed (index.html, calendar export, visibility filter) reads.
+- ``full``: the same keys, in the same order, as ``Event.to_dict()`` (admin grid).
+
+Typical pattern:
+  serializer = EventSerializer(db, Event, Venue, City, Source, _effective_event_visibility)
+  events = serializer.fetch(criteria, order_by=(Event.updated_at.desc(),), profile='full')
+  return Response(dumps_events(events), mimetype='application/json')
+
+``venue_image_url``, ``event_image_url`` and ``event_maps_link`` are shared with the
+ORM ``to_dict()`` methods so both paths produce identical values.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Type
+from urllib.parse import parse_qs, unquote
+
+from scripts.utils import (
+    IMAGE_PROXY_MAX_WIDTH_EVENT,
+    IMAGE_PROXY_MAX_WIDTH_VENUE,
+    ensure_loadable_image_url,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+VISIBILITY_VALUES = ('public', 'admin_only')
+
+# Keys of Event.to_dict(), in order
+FULL_PROFILE_FIELDS = (
+    'id', 'title', 'description', 'start_date', 'end_date', 'start_time', 'end_time',
+    'image_url', 'maps_link', 'is_online', 'is_baby_friendly', 'is_admin_only', 'visibility',
+    'source_id', 'url', 'is_selected', 'event_type', 'is_registration_required',
+    'registration_opens_date', 'registration_opens_time', 'registration_url', 'registration_info',
+    'start_location', 'end_location', 'venue_id', 'venue_name', 'venue_visibility',
+    'source_visibility', 'venue_type', 'venue_address', 'city_id', 'city_name', 'city_timezone',
+    'start_latitude', 'start_longitude', 'end_latitude', 'end_longitude', 'tour_type',
+    'max_participants', 'price', 'language', 'exhibition_location', 'curator', 'admission_price',
+    'artists', 'exhibition_type', 'collection_period', 'number_of_artworks',
+    'opening_reception_date', 'opening_reception_time', 'is_permanent', 'related_exhibitions',
+    'festival_type', 'multiple_locations', 'difficulty_level', 'equipment_needed', 'organizer',
+    'source', 'source_url', 'social_media_platform', 'social_media_handle',
+    'social_media_page_name', 'social_media_posted_by', 'social_media_url', 'created_at',
+    'updated_at', 'effective_visibility', 'series_id',
+)
+
+# Fields read by the public frontend plus the inputs of the visibility filter
+LIST_PROFILE_FIELDS = tuple(
+    field for field in FULL_PROFILE_FIELDS
+    if field in {
+        'id', 'title', 'description', 'start_date', 'end_date', 'start_time', 'end_time',
+        'image_url', 'maps_link', 'is_online', 'is_baby_friendly', 'is_admin_only', 'visibility',
+        'source_id', 'url', 'event_type', 'is_registration_required', 'registration_url',
+        'registration_info', 'start_location', 'end_location', 'venue_id', 'venue_name',
+        'venue_visibility', 'source_visibility', 'venue_type', 'venue_address', 'city_id',
+        'city_name', 'city_timezone', 'tour_type', 'max_participants', 'price', 'language',
+        'admission_price', 'difficulty_level', 'equipment_needed', 'organizer', 'source',
+        'source_url', 'social_media_platform', 'social_media_handle', 'social_media_page_name',
+        'social_media_posted_by', 'social_media_url', 'updated_at', 'effective_visibility',
+        'series_id',
+    }
+)
+
+FIELD_PROFILES = {
+    'list': LIST_PROFILE_FIELDS,
+    'full': FULL_PROFILE_FIELDS,
+}
+
+# Joined (non-event) columns, labelled on the select
+_JOINED_FIELDS = {
+    'venue_name', 'venue_visibility', 'source_visibility', 'venue_type', 'venue_address',
+    'city_name', 'city_timezone',
+}
+
+# Derived fields and the event columns they read
+_DERIVED_FIELD_COLUMNS = {
+    'image_url': ('image_url',),
+    'maps_link': ('multiple_locations', 'start_location', 'start_latitude', 'start_longitude'),
+    'effective_visibility': ('effective_visibility', 'visibility', 'is_admin_only'),
+}
+
+_DATE_FIELDS = {'start_date', 'end_date', 'registration_opens_date', 'opening_reception_date'}
+_HHMM_TIME_FIELDS = {'start_time', 'end_time', 'registration_opens_time'}
+_ISO_TIME_FIELDS = {'opening_reception_time'}
+_TIMESTAMP_FIELDS = {'created_at', 'updated_at'}
+
+
+def venue_image_url(image_url: Optional[str]) -> Optional[str]:
+    """Venue image as served to clients: Google photo references go through /api/image, external URLs through the resize proxy."""
+    if not image_url or not isinstance(image_url, str):
+        return image_url
+    if image_url.startswith('{'):
+        # Try to parse as JSON if it's a string starting with {
+        try:
+            photo_data = json.loads(image_url)
+            if isinstance(photo_data, dict) and 'photo_reference' in photo_data:
+                return f"/api/image/{photo_data['photo_reference']}"
+        except (json.JSONDecodeError, TypeError):
+            # If it's not valid JSON, treat as raw photo reference
+            if len(image_url) > 50 and not image_url.startswith('http'):
+                return f"/api/image/{image_url}"
+        return image_url
+    if 'maps.googleapis.com' in image_url:
+        # Extract photo reference from existing Google Maps URL
+        match = re.search(r'photoreference=([^&]+)', image_url)
+        if match:
+            return f"/api/image/{match.group(1)}"
+        return image_url
+    if len(image_url) > 50 and not image_url.startswith('http'):
+        # Raw photo reference string
+        return f"/api/image/{image_url}"
+    if image_url.startswith('http'):
+        # External URL - route through proxy to keep at loadable size
+        return ensure_loadable_image_url(image_url, IMAGE_PROXY_MAX_WIDTH_VENUE)
+    return image_url
+
+
+def event_image_url(image_url: Optional[str], venue_image: Optional[str]) -> Optional[str]:
+    """Event image as served to clients, falling back to the venue image when the event has none."""
+    if (not image_url or (isinstance(image_url, str) and not image_url.strip())) and venue_image:
+        image_url = venue_image_url(venue_image)
+
+    # Route external URLs through proxy - all images resized where possible
+    # Decode stored npg.si.edu proxy URLs to raw (proxy blocked from cloud IPs)
+    if image_url and isinstance(image_url, str):
+        if '/api/image-proxy?' in image_url and 'npg.si.edu' in image_url:
+            try:
+                parsed = parse_qs(image_url.split('?', 1)[1])
+                raw_url = parsed.get('url', [None])[0]
+                if raw_url:
+                    image_url = unquote(raw_url)
+            except (IndexError, KeyError):
+                pass
+        if image_url.startswith(('http://', 'https://')):
+            image_url = ensure_loadable_image_url(image_url, IMAGE_PROXY_MAX_WIDTH_EVENT)
+    return image_url
+
+
+def event_maps_link(
+    multiple_locations,
+    start_location: Optional[str],
+    venue_name: Optional[str],
+    venue_latitude: Optional[float],
+    venue_longitude: Optional[float],
+    start_latitude: Optional[float],
+    start_longitude: Optional[float],
+) -> str:
+    """
+    Google Maps link for navigation.
+    Priority: explicit multi-location events > venue coordinates/name > event coordinates > event location.
+    This keeps venue-based events stable, but respects events that move around.
+    """
+    if multiple_locations and start_location and start_location.strip():
+        return f"https://www.google.com/maps/search/{start_location.replace(' ', '+')}"
+    if venue_latitude and venue_longitude:
+        return f"https://www.google.com/maps/@{venue_latitude},{venue_longitude},17z"
+    if venue_name and venue_name.strip():
+        return f"https://www.google.com/maps/search/{venue_name.replace(' ', '+')}"
+    if start_latitude and start_longitude:
+        return f"https://www.google.com/maps/@{start_latitude},{start_longitude},17z"
+    if start_location and start_location.strip():
+        return f"https://www.google.com/maps/search/{start_location.replace(' ', '+')}"
+    return "https://www.google.com/maps"
+
+
+def dumps_events(events: Any) -> bytes:
+    """Encode serialized events (a list, or a page envelope dict) as JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(events)
+    return json.dumps(events, separators=(',', ':')).encode('utf-8')
+
+
+class EventSerializer:
+    """Serialize events straight from a projected Core select, one compiled getter list per profile."""
+
+    def __init__(
+        self,
+        db,
+        Event: Type[Any],
+        Venue: Type[Any],
+        City: Type[Any],
+        Source: Type[Any],
+        effective_visibility: Callable[[Dict[str, Any]], str],
+    ):
+        self.db = db
+        self.Event = Event
+        self.Venue = Venue
+        self.City = City
+        self.Source = Source
+        self.effective_visibility = effective_visibility
+        self._compiled = {profile: self._compile(fields) for profile, fields in FIELD_PROFILES.items()}
+
+    def _compile(self, fields: Sequence[str]):
+        event_columns = self.Event.__table__.c
+        column_names = {'id'}
+        for field in fields:
+            if field in _DERIVED_FIELD_COLUMNS:
+                column_names.update(_DERIVED_FIELD_COLUMNS[field])
+            elif field not in _JOINED_FIELDS:
+                column_names.add(field)
+        columns = [event_columns[name] for name in event_columns.keys() if name in column_names]
+        columns += [
+            self.Venue.name.label('venue_name'),
+            self.Venue.venue_type.label('venue_type'),
+            self.Venue.address.label('venue_address'),
+            self.Venue.latitude.label('venue_latitude'),
+            self.Venue.longitude.label('venue_longitude'),
+            self.Venue.image_url.label('venue_image_url'),
+            self.Venue.visibility.label('venue_visibility_raw'),
+            self.City.name.label('city_name'),
+            self.City.timezone.label('city_timezone'),
+            self.Source.visibility.label('source_visibility_raw'),
+        ]
+        getters = [(field, self._getter(field)) for field in fields]
+        return columns, getters
+
+    def _getter(self, field: str) -> Callable[[Any], Any]:
+        if field in _DATE_FIELDS:
+            return lambda row: value.isoformat() if (value := getattr(row, field)) else None
+        if field in _HHMM_TIME_FIELDS:
+            return lambda row: value.strftime('%H:%M') if (value := getattr(row, field)) else None
+        if field in _ISO_TIME_FIELDS:
+            return lambda row: value.isoformat() if (value := getattr(row, field)) else None
+        if field in _TIMESTAMP_FIELDS:
+            return lambda row: value.isoformat() + 'Z' if (value := getattr(row, field)) else None
+        if field == 'visibility':
+            return lambda row: row.visibility or None
+        if field == 'venue_visibility':
+            return _venue_visibility
+        if field == 'source_visibility':
+            return _source_visibility
+        if field == 'city_timezone':
+            return _city_timezone
+        if field == 'image_url':
+            return lambda row: event_image_url(row.image_url, row.venue_image_url)
+        if field == 'maps_link':
+            return lambda row: event_maps_link(
+                row.multiple_locations, row.start_location, row.venue_name,
+                row.venue_latitude, row.venue_longitude, row.start_latitude, row.start_longitude,
+            )
+        if field == 'effective_visibility':
+            # Stored value (source heuristics included); rows not yet refreshed fall back to the FK source
+            return lambda row: row.effective_visibility or self.effective_visibility({
+                'visibility': row.visibility or None,
+                'is_admin_only': row.is_admin_only,
+                'source_visibility': _source_visibility(row),
+                'venue_visibility': _venue_visibility(row),
+            })
+        return lambda row: getattr(row, field)
+
+    def select(self, profile: str = 'full'):
+        """Core select for ``profile`` with the fixed venue/city/source outer joins."""
+        columns, _ = self._compiled[profile]
+        events = self.Event.__table__
+        return self.db.select(*columns).select_from(
+            events
+            .outerjoin(self.Venue.__table__, events.c.venue_id == self.Venue.id)
+            .outerjoin(self.City.__table__, events.c.city_id == self.City.id)
+            .outerjoin(self.Source.__table__, events.c.source_id == self.Source.id)
+        )
+
+    def rows_to_dicts(self, rows: Iterable[Any], profile: str = 'full') -> List[Dict[str, Any]]:
+        _, getters = self._compiled[profile]
+        return [{field: getter(row) for field, getter in getters} for row in rows]
+
+    def fetch(
+        self,
+        criteria=None,
+        order_by: Sequence[Any] = (),
+        profile: str = 'full',
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run the projected select (optionally filtered, ordered and limited) and return event dicts."""
+        stmt = self.select(profile)
+        if criteria is not None:
+            stmt = stmt.where(criteria)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+        return self.rows_to_dicts(self.db.session.execute(stmt), profile)
+
+    def stream(
+        self,
+        criteria=None,
+        order_by: Sequence[Any] = (),
+        profile: str = 'full',
+        batch_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Like ``fetch`` but yields dicts from a server-side cursor, ``batch_size`` rows at a time."""
+        stmt = self.select(profile).execution_options(yield_per=batch_size)
+        if criteria is not None:
+            stmt = stmt.where(criteria)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+        _, getters = self._compiled[profile]
+        for row in self.db.session.execute(stmt):
+            yield {field: getter(row) for field, getter in getters}
+
+
+def _venue_visibility(row) -> str:
+    return row.venue_visibility_raw or 'public'
+
+
+def _source_visibility(row) -> Optional[str]:
+    return row.source_visibility_raw if row.source_visibility_raw in VISIBILITY_VALUES else None
+
+
+def _city_timezone(row) -> Optional[str]:
+    # Same as Event._get_city_timezone(): a blank timezone is no timezone
+    return row.city_timezone or None
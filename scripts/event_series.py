@@ -0,0 +1,349 @@
+"""
+Recurring event series: one rule instead of one ``Event`` row per date and time.
+
+Walk-in tours (SAAM, Renwick, NGA, Hirshhorn) used to be stored as one row per occurrence for
+the next month, so a museum with three daily tours added ~90 rows per scrape. A series stores:
+
+- an ``event_series`` row with the recurrence rule: ``days_of_week`` (Monday=0), ``times``
+  (``HH:MM``), a ``start_date`` / ``end_date`` window, ``exceptions`` (dates without
+  occurrences) and ``duration_minutes``;
+- one *template* ``Event`` row (``events.series_id``) holding the display fields (title,
+  description, venue, visibility, ...). Templates are excluded from the regular event queries.
+
+``/api/events`` expands a series into occurrence dicts only for the requested window
+(:func:`expand_occurrences`). Each occurrence gets a stable negative integer id
+(:func:`occurrence_id`) so it never collides with a real event id.
+
+Scrapers either emit a series directly (an event dict with a ``recurrence`` dict, see
+:meth:`RecurrenceRule.from_dict`) or keep emitting instances and let
+:func:`split_series` collapse runs of identical single-day events into series.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_DURATION_MINUTES = 60
+MIN_SERIES_DATES = 3  # distinct dates before instances are collapsed into a series
+EXPANSION_HORIZON_DAYS = 90  # open windows ("all") expand from today to today + horizon
+ALL_DAYS = tuple(range(7))
+
+# Instance fields that differ per occurrence and are carried by the rule instead
+OCCURRENCE_FIELDS = ('start_date', 'end_date', 'start_time', 'end_time')
+
+
+def _as_date(value: Any) -> Optional[date]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).strip().replace('Z', '+00:00')).date()
+    except ValueError:
+        return None
+
+
+def _as_time(value: Any) -> Optional[time]:
+    if isinstance(value, time):
+        return value.replace(second=0, microsecond=0)
+    if not isinstance(value, str) or ':' not in value:
+        return None
+    parts = value.strip().split(':')
+    try:
+        return time(int(parts[0]), int(parts[1][:2]))
+    except (ValueError, IndexError):
+        return None
+
+
+def _hhmm(value: time) -> str:
+    return value.strftime('%H:%M')
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Weekly recurrence: every ``times`` slot on ``days_of_week`` between the window dates."""
+    days_of_week: Tuple[int, ...]
+    times: Tuple[time, ...]
+    start_date: date
+    end_date: Optional[date] = None
+    exceptions: FrozenSet[date] = field(default_factory=frozenset)
+    duration_minutes: int = DEFAULT_DURATION_MINUTES
+
+    def occurrences(self, window_start: date, window_end: date) -> Iterator[Tuple[date, time]]:
+        """(date, start time) pairs inside the inclusive window, in chronological order."""
+        first = max(window_start, self.start_date)
+        last = min(window_end, self.end_date) if self.end_date else window_end
+        day = first
+        while day <= last:
+            if day.weekday() in self.days_of_week and day not in self.exceptions:
+                for start in self.times:
+                    yield day, start
+            day += timedelta(days=1)
+
+    def overlaps(self, window_start: Optional[date], window_end: Optional[date]) -> bool:
+        if window_end is not None and self.start_date > window_end:
+            return False
+        return window_start is None or self.end_date is None or self.end_date >= window_start
+
+    def end_time(self, start: time) -> time:
+        minutes = min(start.hour * 60 + start.minute + self.duration_minutes, 23 * 60 + 59)
+        return time(minutes // 60, minutes % 60)
+
+    def merged_with(self, previous: 'RecurrenceRule') -> 'RecurrenceRule':
+        """
+        This (freshly scraped) rule extended back to ``previous``'s start, keeping the older
+        exceptions that fall before the new window. Scrapers only see a rolling month.
+        """
+        start_date = min(self.start_date, previous.start_date)
+        if self.end_date is None or previous.end_date is None:
+            end_date = None
+        else:
+            end_date = max(self.end_date, previous.end_date)
+        exceptions = self.exceptions | {day for day in previous.exceptions if day < self.start_date}
+        return RecurrenceRule(self.days_of_week, self.times, start_date, end_date,
+                              frozenset(exceptions), self.duration_minutes)
+
+    def to_columns(self) -> Dict[str, Any]:
+        """Column values for an ``event_series`` row."""
+        return {
+            'days_of_week': ','.join(str(day) for day in self.days_of_week),
+            'times': json.dumps([_hhmm(start) for start in self.times]),
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'exceptions': json.dumps(sorted(day.isoformat() for day in self.exceptions)),
+            'duration_minutes': self.duration_minutes,
+        }
+
+    @classmethod
+    def from_row(cls, row: Any) -> 'RecurrenceRule':
+        """Rule from an ``event_series`` row (ORM object or Core row)."""
+        days = tuple(sorted(int(day) for day in (row.days_of_week or '').split(',') if day.strip().isdigit()))
+        times = tuple(sorted(filter(None, (_as_time(value) for value in json.loads(row.times or '[]')))))
+        exceptions = frozenset(filter(None, (_as_date(value) for value in json.loads(row.exceptions or '[]'))))
+        return cls(days or ALL_DAYS, times, _as_date(row.start_date), _as_date(row.end_date), exceptions,
+                   row.duration_minutes or DEFAULT_DURATION_MINUTES)
+
+    @classmethod
+    def from_dict(cls, recurrence: Dict[str, Any]) -> Optional['RecurrenceRule']:
+        """
+        Rule from a scraper's ``recurrence`` dict, e.g.
+        ``{'days_of_week': [0, 1, 2, 3, 4, 5], 'times': ['12:00'], 'start_date': date.today(),
+        'end_date': date.today() + timedelta(days=29), 'duration_minutes': 60}``.
+        Returns None when it has no start date or no valid time.
+        """
+        start_date = _as_date(recurrence.get('start_date'))
+        times = tuple(sorted({start for start in map(_as_time, recurrence.get('times') or ()) if start}))
+        if not start_date or not times:
+            return None
+        days = recurrence.get('days_of_week')
+        days = tuple(sorted({int(day) % 7 for day in days})) if days else ALL_DAYS
+        exceptions = frozenset(filter(None, map(_as_date, recurrence.get('exceptions') or ())))
+        duration = int(recurrence.get('duration_minutes') or DEFAULT_DURATION_MINUTES)
+        return cls(days, times, start_date, _as_date(recurrence.get('end_date')), exceptions, duration)
+
+
+def occurrence_id(series_id: int, day: date, start: time) -> int:
+    """Stable id for one occurrence; negative so it never collides with ``events.id``."""
+    return -(series_id * 10 ** 10 + day.toordinal() * 10 ** 4 + start.hour * 100 + start.minute)
+
+
+def expansion_window(start_date: Optional[date], end_date: Optional[date], today: date) -> Tuple[date, date]:
+    """The window to expand for a query; open ends expand from today up to the horizon."""
+    return start_date or today, end_date or (start_date or today) + timedelta(days=EXPANSION_HORIZON_DAYS)
+
+
+def expand_occurrences(
+    templates: Iterable[Dict[str, Any]],
+    rules: Dict[int, RecurrenceRule],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    today: date,
+) -> List[Dict[str, Any]]:
+    """
+    Occurrence dicts for serialized template events (``series_id`` key set) inside the window.
+    Each is a copy of its template with the occurrence's dates, times and id.
+    """
+    window_start, window_end = expansion_window(start_date, end_date, today)
+    occurrences = []
+    for template in templates:
+        series_id = template.get('series_id')
+        rule = rules.get(series_id)
+        if rule is None:
+            continue
+        for day, start in rule.occurrences(window_start, window_end):
+            occurrence = dict(template)
+            occurrence.update(
+                id=occurrence_id(series_id, day, start),
+                start_date=day.isoformat(),
+                end_date=day.isoformat(),
+                start_time=_hhmm(start),
+                end_time=_hhmm(rule.end_time(start)),
+            )
+            occurrences.append(occurrence)
+    occurrences.sort(key=lambda event: (event['start_date'], event['start_time'], event['id']))
+    return occurrences
+
+
+# -- collapsing scraped instances -----------------------------------------------------------------
+
+def _url_base(url: str) -> str:
+    """URL without query/fragment: NGA and Tribe occurrence links differ only there."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/'), '', '')) if parts.netloc else url
+
+
+def _series_key(event: Dict[str, Any]) -> Tuple[str, ...]:
+    url = event.get('url') or event.get('source_url') or ''
+    return (
+        (event.get('title') or '').strip().lower(),
+        event.get('event_type') or 'event',
+        _url_base(url) if url else (event.get('description') or '').strip(),
+        (event.get('start_location') or event.get('location') or '').strip().lower(),
+        (event.get('venue_name') or event.get('organizer') or '').strip().lower(),
+    )
+
+
+def series_match_key(event: Dict[str, Any]) -> str:
+    """
+    What tells same-titled series of one type apart: the rest of ``_series_key`` (URL base or
+    description, location, venue), hashed for ``event_series.match_key``.
+    """
+    return hashlib.sha1('\n'.join(_series_key(event)[2:]).encode('utf-8')).hexdigest()
+
+
+def _single_day_slot(event: Dict[str, Any]) -> Optional[Tuple[date, time]]:
+    day = _as_date(event.get('start_date'))
+    start = _as_time(event.get('start_time'))
+    end_day = _as_date(event.get('end_date'))
+    if day is None or start is None or (end_day is not None and end_day != day):
+        return None
+    return day, start
+
+
+def _template_from(instances: Sequence[Dict[str, Any]], rule: RecurrenceRule) -> Dict[str, Any]:
+    """Display fields for the series: the first instance, with its longest description."""
+    template = dict(instances[0])
+    descriptions = [event.get('description') or '' for event in instances]
+    template['description'] = max(descriptions, key=len) or template.get('description')
+    urls = {event.get('url') for event in instances if event.get('url')}
+    if len(urls) > 1:
+        template['url'] = _url_base(next(iter(urls)))
+    return with_series_dates(template, rule)
+
+
+def with_series_dates(template: Dict[str, Any], rule: RecurrenceRule) -> Dict[str, Any]:
+    """Template dates/times from the rule: window start/end and the first slot."""
+    template = {key: value for key, value in template.items() if key != 'recurrence'}
+    template.update(
+        start_date=rule.start_date,
+        end_date=rule.end_date,
+        start_time=_hhmm(rule.times[0]),
+        end_time=_hhmm(rule.end_time(rule.times[0])),
+    )
+    return template
+
+
+def _rule_from_slots(slots: Dict[date, Tuple[time, ...]], duration_minutes: int) -> Tuple[Optional[RecurrenceRule], List[date]]:
+    """Rule for the dominant daily time set, and the dates it does not cover."""
+    times, _ = Counter(slots.values()).most_common(1)[0]
+    dates = sorted(day for day, day_times in slots.items() if day_times == times)
+    if len(dates) < MIN_SERIES_DATES:
+        return None, list(slots)
+    days_of_week = tuple(sorted({day.weekday() for day in dates}))
+    covered = set(dates)
+    exceptions = set()
+    day = dates[0]
+    while day <= dates[-1]:
+        if day.weekday() in days_of_week and day not in covered:
+            exceptions.add(day)
+        day += timedelta(days=1)
+    rule = RecurrenceRule(days_of_week, times, dates[0], dates[-1], frozenset(exceptions), duration_minutes)
+    return rule, [day for day in slots if day not in covered]
+
+
+def _duration(instances: Sequence[Dict[str, Any]]) -> int:
+    durations = Counter()
+    for event in instances:
+        start, end = _as_time(event.get('start_time')), _as_time(event.get('end_time'))
+        if start and end and end > start:
+            durations[(end.hour * 60 + end.minute) - (start.hour * 60 + start.minute)] += 1
+    return durations.most_common(1)[0][0] if durations else DEFAULT_DURATION_MINUTES
+
+
+def split_series(
+    events: Sequence[Dict[str, Any]],
+    collapse: bool = False,
+) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], RecurrenceRule]]]:
+    """
+    Separate series from single events in a scrape result.
+
+    Event dicts with a ``recurrence`` dict become ``(template, rule)`` pairs. With ``collapse``,
+    single-day instances sharing title, type, URL (minus query), location and venue on at least
+    ``MIN_SERIES_DATES`` dates with the same daily times are folded into one series as well;
+    instances on dates with other times stay single events. Order of singles is preserved.
+    """
+    singles: List[Dict[str, Any]] = []
+    series: List[Tuple[Dict[str, Any], RecurrenceRule]] = []
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for position, event in enumerate(events):
+        recurrence = event.get('recurrence')
+        if isinstance(recurrence, dict):
+            rule = RecurrenceRule.from_dict(recurrence)
+            if rule:
+                series.append((with_series_dates(event, rule), rule))
+            continue
+        if collapse and _single_day_slot(event):
+            groups.setdefault(_series_key(event), []).append(position)
+
+    collapsed = set()
+    for positions in groups.values():
+        slots: Dict[date, set] = {}
+        for position in positions:
+            day, start = _single_day_slot(events[position])
+            slots.setdefault(day, set()).add(start)
+        if len(slots) < MIN_SERIES_DATES:
+            continue
+        instances = [events[position] for position in positions]
+        rule, uncovered = _rule_from_slots(
+            {day: tuple(sorted(times)) for day, times in slots.items()}, _duration(instances))
+        if rule is None:
+            continue
+        uncovered = set(uncovered)
+        members = [position for position in positions if _single_day_slot(events[position])[0] not in uncovered]
+        series.append((_template_from([events[position] for position in members], rule), rule))
+        collapsed.update(members)
+
+    singles.extend(event for position, event in enumerate(events)
+                   if position not in collapsed and not isinstance(event.get('recurrence'), dict))
+    return singles, series
+
+
+def expand_recurring(events: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Event dicts with a ``recurrence`` dict replaced by one single-day instance per occurrence
+    (open-ended rules up to ``EXPANSION_HORIZON_DAYS``), for callers that save instances directly
+    instead of going through ``create_events_in_database``.
+    """
+    expanded: List[Dict[str, Any]] = []
+    for event in events:
+        recurrence = event.get('recurrence')
+        if not isinstance(recurrence, dict):
+            expanded.append(event)
+            continue
+        rule = RecurrenceRule.from_dict(recurrence)
+        if rule is None:
+            continue
+        template = {key: value for key, value in event.items() if key != 'recurrence'}
+        window_end = rule.end_date or rule.start_date + timedelta(days=EXPANSION_HORIZON_DAYS)
+        for day, start in rule.occurrences(rule.start_date, window_end):
+            expanded.append(dict(template, start_date=day, end_date=day, start_time=_hhmm(start),
+                                 end_time=_hhmm(rule.end_time(start))))
+    return expanded
@@ -0,0 +1,316 @@
+"""
+Event visibility resolution: source matching and the materialized ``events.effective_visibility``.
+
+An event's effective visibility depends on its own setting, the venue's, and the visibility of
+its source. The source is the ``source_id`` FK or, failing that, a heuristic match against the
+city's sources (same social handle, or the source URL contained in the event URL).
+``SourceMatcher`` indexes a list of sources once:
+
+- **Handles:** dict lookup on the normalized handle.
+- **URLs:** a character trie of normalized source URLs. Matching walks it from every offset of
+  the event URL, which finds every source URL contained in it. Cost depends on the URL length,
+  not on the number of sources.
+
+Ties resolve to the earliest source in the given list, matching the linear scan this replaces.
+
+``refresh_effective_visibility()`` recomputes the stored column for a scope of events, using the
+public ``/api/events`` semantics (sources of the event's city, or of its venue's city when the
+event has none: such events are listed through the venue-in-city scope). ``register_visibility_hooks()``
+refreshes after each commit that changes an input (ORM flushes and the rows of bulk statements):
+
+- event visibility, source or URL fields;
+- venue visibility or city;
+- any source in a city.
+
+Read paths then only filter on the stored value.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from scripts.orm_bulk import bulk_target_rows
+
+logger = logging.getLogger(__name__)
+
+VISIBILITY_VALUES = ('public', 'admin_only')
+
+# Event attributes that feed effective visibility; other column changes do not trigger a refresh
+EVENT_VISIBILITY_INPUTS = (
+    'visibility', 'is_admin_only', 'source_id', 'social_media_handle', 'source_url', 'url',
+    'city_id', 'venue_id',
+)
+SOURCE_VISIBILITY_INPUTS = ('handle', 'url', 'visibility', 'city_id')
+
+_UPDATE_CHUNK = 500
+_URL_END = object()  # trie node key marking the end of a source URL
+
+
+def _normalize_handle(handle: Optional[str]) -> str:
+    return (handle or '').lstrip('@').lower()
+
+
+def _normalize_url(url: Optional[str]) -> str:
+    return (url or '').rstrip('/').lower()
+
+
+class SourceMatcher:
+    """Index of sources for resolving an event dict's source (FK, then handle, then URL)."""
+
+    def __init__(self, sources: Iterable[Any]):
+        self.sources: List[Any] = list(sources)
+        self.by_id = {source.id: source for source in self.sources}
+        self._by_handle: Dict[str, int] = {}
+        self._url_trie: Dict[Any, Any] = {}
+        for position, source in enumerate(self.sources):
+            handle = _normalize_handle(source.handle)
+            if handle:
+                self._by_handle.setdefault(handle, position)
+            url = _normalize_url(source.url) if source.url else ''
+            if url:
+                node = self._url_trie
+                for char in url:
+                    node = node.setdefault(char, {})
+                node.setdefault(_URL_END, position)
+
+    def _match_url(self, event_url: str) -> Optional[int]:
+        best = None
+        trie = self._url_trie
+        for start in range(len(event_url)):
+            node = trie
+            for char in event_url[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                position = node.get(_URL_END)
+                if position is not None and (best is None or position < best):
+                    best = position
+        return best
+
+    def match(self, event_dict: Dict[str, Any]) -> Optional[Any]:
+        """Resolve the Source for an event dict, or None."""
+        source_id = event_dict.get('source_id')
+        if source_id and source_id in self.by_id:
+            return self.by_id[source_id]
+        handle = _normalize_handle(event_dict.get('social_media_handle'))
+        if handle and handle in self._by_handle:
+            return self.sources[self._by_handle[handle]]
+        event_url = event_dict.get('source_url') or event_dict.get('url') or ''
+        if event_url and self._url_trie:
+            position = self._match_url(event_url.rstrip('/').lower())
+            if position is not None:
+                return self.sources[position]
+        return None
+
+
+def apply_visibility(
+    event_dict: Dict[str, Any],
+    matcher: SourceMatcher,
+    effective_visibility: Callable[[Dict[str, Any]], str],
+) -> Dict[str, Any]:
+    """Attach source_id / source_visibility from the matched source and effective_visibility."""
+    matched_source = matcher.match(event_dict)
+    if matched_source:
+        if not event_dict.get('source_id'):
+            event_dict['source_id'] = matched_source.id
+        if matched_source.visibility in VISIBILITY_VALUES:
+            event_dict['source_visibility'] = matched_source.visibility
+        else:
+            event_dict['source_visibility'] = None
+    else:
+        event_dict.setdefault('source_visibility', None)
+    event_dict['effective_visibility'] = effective_visibility(event_dict)
+    return event_dict
+
+
+def _chunks(values: Sequence[Any], size: int = _UPDATE_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def refresh_effective_visibility(
+    connection,
+    Event,
+    Venue,
+    Source,
+    effective_visibility: Callable[[Dict[str, Any]], str],
+    event_ids: Optional[Iterable[int]] = None,
+    venue_ids: Optional[Iterable[int]] = None,
+    city_ids: Optional[Iterable[int]] = None,
+    only_missing: bool = False,
+) -> int:
+    """
+    Recompute ``events.effective_visibility`` for events matching any of the given ids
+    (all events when no scope is given). Returns the number of rows whose value changed.
+    """
+    from sqlalchemy import and_, or_, select, update
+
+    events = Event.__table__
+    venues = Venue.__table__
+    sources = Source.__table__
+    stmt = select(
+        events.c.id, events.c.city_id, events.c.visibility, events.c.is_admin_only,
+        events.c.source_id, events.c.social_media_handle, events.c.source_url, events.c.url,
+        events.c.effective_visibility,
+        venues.c.visibility.label('venue_visibility_raw'), venues.c.city_id.label('venue_city_id'),
+        sources.c.visibility.label('source_visibility_raw'),
+    ).select_from(
+        events
+        .outerjoin(venues, events.c.venue_id == venues.c.id)
+        .outerjoin(sources, events.c.source_id == sources.c.id)
+    )
+    scope = []
+    if event_ids:
+        scope.append(events.c.id.in_(list(event_ids)))
+    if venue_ids:
+        scope.append(events.c.venue_id.in_(list(venue_ids)))
+    if city_ids:
+        scope.append(events.c.city_id.in_(list(city_ids)))
+        scope.append(and_(events.c.city_id.is_(None), venues.c.city_id.in_(list(city_ids))))
+    if scope:
+        stmt = stmt.where(or_(*scope))
+    elif event_ids is not None or venue_ids is not None or city_ids is not None:
+        return 0
+    if only_missing:
+        stmt = stmt.where(events.c.effective_visibility.is_(None))
+    rows = connection.execute(stmt).all()
+    if not rows:
+        return 0
+
+    # /api/events matches against the sources of the requested city only
+    def source_city(row):
+        return row.city_id if row.city_id is not None else row.venue_city_id
+
+    row_city_ids = sorted({source_city(row) for row in rows if source_city(row) is not None})
+    sources_by_city = defaultdict(list)
+    for city_chunk in _chunks(row_city_ids):
+        source_rows = connection.execute(
+            select(sources.c.id, sources.c.handle, sources.c.url, sources.c.visibility, sources.c.city_id)
+            .where(sources.c.city_id.in_(city_chunk))
+            .order_by(sources.c.id)
+        )
+        for source in source_rows:
+            sources_by_city[source.city_id].append(source)
+    matchers = {city_id: SourceMatcher(city_sources) for city_id, city_sources in sources_by_city.items()}
+    no_sources = SourceMatcher(())
+
+    changed = defaultdict(list)
+    for row in rows:
+        event_dict = apply_visibility({
+            'source_id': row.source_id,
+            'social_media_handle': row.social_media_handle,
+            'source_url': row.source_url,
+            'url': row.url,
+            'visibility': row.visibility or None,
+            'is_admin_only': row.is_admin_only,
+            'source_visibility': row.source_visibility_raw if row.source_visibility_raw in VISIBILITY_VALUES else None,
+            'venue_visibility': row.venue_visibility_raw or 'public',
+        }, matchers.get(source_city(row), no_sources), effective_visibility)
+        if event_dict['effective_visibility'] != row.effective_visibility:
+            changed[event_dict['effective_visibility']].append(row.id)
+
+    for value, ids in changed.items():
+        for id_chunk in _chunks(ids):
+            connection.execute(update(events).where(events.c.id.in_(id_chunk)).values(effective_visibility=value))
+    return sum(len(ids) for ids in changed.values())
+
+
+def _changed(obj, attributes: Sequence[str]) -> bool:
+    from sqlalchemy import inspect
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def _history_values(obj, attribute: str) -> List[Any]:
+    from sqlalchemy import inspect
+    history = inspect(obj).attrs[attribute].history
+    return [value for value in (*history.added, *history.unchanged, *history.deleted) if value is not None]
+
+
+def register_visibility_hooks(Event, Venue, Source, effective_visibility: Callable[[Dict[str, Any]], str]) -> None:
+    """Keep ``events.effective_visibility`` current after every committed session."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    key = 'visibility_refresh'
+
+    def scope(session) -> Dict[str, Any]:
+        return session.info.setdefault(
+            key, {'events': set(), 'venues': set(), 'cities': set(), 'sources': set(), 'all': False})
+
+    @event.listens_for(Session, 'after_flush')
+    def _collect(session, flush_context):
+        for obj in session.new:
+            if isinstance(obj, Event):
+                scope(session)['events'].add(obj.id)
+            elif isinstance(obj, Source):
+                scope(session)['cities'].update(_history_values(obj, 'city_id'))
+        for obj in session.dirty:
+            if isinstance(obj, Event) and _changed(obj, EVENT_VISIBILITY_INPUTS):
+                scope(session)['events'].add(obj.id)
+            elif isinstance(obj, Venue) and _changed(obj, ('visibility', 'city_id')):
+                scope(session)['venues'].add(obj.id)
+            elif isinstance(obj, Source) and _changed(obj, SOURCE_VISIBILITY_INPUTS):
+                scope(session)['cities'].update(_history_values(obj, 'city_id'))
+        for obj in session.deleted:
+            if isinstance(obj, Source):
+                scope(session)['cities'].update(_history_values(obj, 'city_id'))
+
+    @event.listens_for(Session, 'do_orm_execute')
+    def _collect_bulk(orm_execute_state):
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and not issubclass(mapper.class_, (Event, Venue, Source)):
+            return
+        pending = scope(orm_execute_state.session)
+        if mapper is None:
+            pending['all'] = True
+        elif issubclass(mapper.class_, Source):
+            # Cities before the statement now; cities after it from 'sources' at commit
+            rows = bulk_target_rows(orm_execute_state, Source.__table__.c.id, Source.__table__.c.city_id)
+            if rows is None:
+                pending['all'] = True
+            else:
+                pending['sources'].update(row.id for row in rows)
+                pending['cities'].update(row.city_id for row in rows if row.city_id is not None)
+        else:
+            model, bucket = (Event, 'events') if issubclass(mapper.class_, Event) else (Venue, 'venues')
+            rows = bulk_target_rows(orm_execute_state, model.__table__.c.id)
+            if rows is None:
+                pending['all'] = True
+            else:
+                pending[bucket].update(row.id for row in rows)
+
+    @event.listens_for(Session, 'after_commit')
+    def _refresh(session):
+        from sqlalchemy import select
+
+        pending = session.info.pop(key, None)
+        if not pending or not (pending['all'] or pending['events'] or pending['venues'] or pending['cities']
+                               or pending['sources']):
+            return
+        try:
+            with session.get_bind(mapper=Event.__mapper__).begin() as connection:
+                if pending['all']:
+                    refresh_effective_visibility(connection, Event, Venue, Source, effective_visibility)
+                else:
+                    cities = set(pending['cities'])
+                    sources = Source.__table__
+                    for source_chunk in _chunks(sorted(pending['sources'])):
+                        cities.update(connection.execute(
+                            select(sources.c.city_id)
+                            .where(sources.c.id.in_(source_chunk), sources.c.city_id.isnot(None))
+                        ).scalars())
+                    refresh_effective_visibility(
+                        connection, Event, Venue, Source, effective_visibility,
+                        event_ids=pending['events'], venue_ids=pending['venues'], city_ids=cities,
+                    )
+        except Exception as e:
+            logger.warning(f"effective_visibility refresh failed: {e}")
+
+    @event.listens_for(Session, 'after_rollback')
+    def _discard(session):
+        session.info.pop(key, None)
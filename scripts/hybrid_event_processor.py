@@ -28,10 +28,11 @@ import google.generativeai as genai
 
 # OCR fallback
 import pytesseract
-from PIL import Image
 
 # Local imports
+from scripts import tesseract_ocr
 from scripts.image_event_processor import ExtractedEventData, setup_google_credentials
+from scripts.llm_cache import get_llm_cache, prompt_key
 
 logger = logging.getLogger(__name__)
 
@@ -222,14 +223,10 @@ class HybridEventProcessor:
     def _extract_text_with_tesseract(self, image_path: str) -> str:
         """Extract text using Tesseract OCR"""
         try:
-            # Open image with PIL
-            image = Image.open(image_path)
-            
-            # Extract text using Tesseract with optimized settings
-            # PSM 6: Assume a single uniform block of text
-            # OEM 3: Default OCR Engine Mode
-            config = '--psm 6 --oem 3'
-            extracted_text = pytesseract.image_to_string(image, config=config)
+            # Preprocessed once, PSM candidates run concurrently (PSM 6, a single uniform
+            # block of text, first); stops at the first confident result
+            result = tesseract_ocr.ocr_image(image_path)
+            extracted_text = result.text if result else ""
             
             logger.info(f"✅ Tesseract extracted {len(extracted_text)} characters")
             return extracted_text
@@ -402,15 +399,25 @@ class HybridEventProcessor:
             source = "website"
         
         try:
-            response = self.gemini_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.1,  # Low temperature for consistent results
-                    max_output_tokens=1000,
+            # Same screenshot text as an earlier upload: reuse the stored answer
+            cache = get_llm_cache()
+            cache_key = prompt_key(prompt, 'hybrid:gemini-2.0-flash')
+            cached = cache.get(cache_key) if cache else None
+            if cached:
+                llm_response = cached['content']
+                logger.info("🤖 Using cached Gemini response")
+            else:
+                response = self.gemini_model.generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.1,  # Low temperature for consistent results
+                        max_output_tokens=1000,
+                    )
                 )
-            )
+                llm_response = response.text
+                if cache and llm_response:
+                    cache.put(cache_key, {'success': True, 'content': llm_response, 'provider': 'google'})
             
-            llm_response = response.text
             logger.info(f"🤖 Gemini response received: {len(llm_response)} characters")
             logger.info(f"🤖 LLM response: {repr(llm_response)}")
             
@@ -0,0 +1,256 @@
+"""
+Streaming iCalendar (RFC 5545) feed rendering for ``/api/calendar/feed.ics``.
+
+The feed is a subscribable calendar for one ``/api/events`` filter set (city, time range,
+event type). app.py streams it from a server-side cursor; this module only turns serialized
+event dicts (the ``list`` profile of scripts/event_serializer.py) into iCalendar text:
+
+- ``vtimezone(tzid, first_year, last_year)``: a VTIMEZONE with the zone's real UTC offset
+  transitions in those years (one block per feed, shared by every VEVENT).
+- ``render_vevent(event, tzid)``: one VEVENT with a stable ``UID`` (``event-<id>`` for stored
+  events, ``series-<series_id>-<start>`` for expanded series occurrences), so clients update
+  events in place across polls instead of duplicating them.
+- ``iter_calendar(events, tzid, name, ...)``: the whole document as text chunks.
+- ``feed_etag(...)`` / ``not_modified(...)``: the validator and the conditional-GET decision for
+  a poll (RFC 7232 precedence).
+
+All content lines are escaped and folded at 75 octets.
+"""
+
+from __future__ import annotations
+
+import calendar
+import hashlib
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pytz
+
+PRODID = '-//Event Planner//Event Planner//EN'
+UID_DOMAIN = 'eventplanner.com'
+DEFAULT_DURATION = timedelta(hours=1)  # timed events without an end time
+CHUNK_EVENTS = 200  # VEVENTs per yielded chunk
+CRLF = '\r\n'
+
+
+def escape_text(value: Any) -> str:
+    """TEXT value escaping (RFC 5545 3.3.11)."""
+    text = str(value or '')
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n').replace('\r', '\\n'))
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line into 75-octet segments (continuations start with a space)."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + CRLF
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:  # never split a UTF-8 sequence
+            end -= 1
+        parts.append(encoded[start:end].decode('utf-8'))
+        start, limit = end, 74
+    return (CRLF + ' ').join(parts) + CRLF
+
+
+def _offset(delta: timedelta) -> str:
+    minutes = int(delta.total_seconds() // 60)
+    sign = '+' if minutes >= 0 else '-'
+    return f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+
+def _transitions(tz, first_year: int, last_year: int) -> List[Tuple[int, datetime, datetime]]:
+    """(utc timestamp, local time before, local time after) for each offset change in the years."""
+    start = calendar.timegm(date(first_year, 1, 1).timetuple())
+    end = calendar.timegm(date(last_year + 1, 1, 1).timetuple())
+    changes = []
+    previous = datetime.fromtimestamp(start, tz)
+    step = 86400
+    for moment in range(start + step, end + step, step):
+        current = datetime.fromtimestamp(moment, tz)
+        if current.utcoffset() == previous.utcoffset() and current.tzname() == previous.tzname():
+            previous = current
+            continue
+        low, high = moment - step, moment  # bisect to the second of the change
+        while high - low > 1:
+            middle = (low + high) // 2
+            if datetime.fromtimestamp(middle, tz).utcoffset() == previous.utcoffset():
+                low = middle
+            else:
+                high = middle
+        changes.append((high, datetime.fromtimestamp(high - 1, tz), datetime.fromtimestamp(high, tz)))
+        previous = current
+    return changes
+
+
+@lru_cache(maxsize=64)
+def vtimezone(tzid: str, first_year: int, last_year: int) -> str:
+    """VTIMEZONE block for ``tzid`` with its offset transitions between the years (inclusive)."""
+    try:
+        tz = pytz.timezone(tzid)
+    except pytz.UnknownTimeZoneError:
+        tz, tzid = pytz.UTC, 'UTC'
+    initial = datetime.fromtimestamp(calendar.timegm(date(first_year, 1, 1).timetuple()), tz)
+    observances = [(initial, initial, initial)]
+    observances += [(after, before, after) for _, before, after in _transitions(tz, first_year, last_year)]
+    lines = ['BEGIN:VTIMEZONE', f'TZID:{tzid}']
+    for start, before, after in observances:
+        kind = 'DAYLIGHT' if after.dst() else 'STANDARD'
+        # DTSTART is the local wall-clock time of the change in the offset it replaces
+        local_start = (start.replace(tzinfo=None) - after.utcoffset() + before.utcoffset())
+        lines += [
+            f'BEGIN:{kind}',
+            f"DTSTART:{local_start.strftime('%Y%m%dT%H%M%S')}",
+            f'TZOFFSETFROM:{_offset(before.utcoffset())}',
+            f'TZOFFSETTO:{_offset(after.utcoffset())}',
+            f'TZNAME:{after.tzname()}',
+            f'END:{kind}',
+        ]
+    lines.append('END:VTIMEZONE')
+    return ''.join(fold_line(line) for line in lines)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10]) if value else None
+    except ValueError:
+        return None
+
+
+def _parse_time(value: Any) -> Optional[time]:
+    if isinstance(value, time):
+        return value
+    try:
+        return time.fromisoformat(str(value)) if value else None
+    except ValueError:
+        return None
+
+
+def _utc_stamp(value: Any, fallback: datetime) -> str:
+    stamp = fallback
+    if isinstance(value, datetime):
+        stamp = value
+    elif value:
+        try:
+            stamp = datetime.fromisoformat(str(value).rstrip('Z'))
+        except ValueError:
+            pass
+    return stamp.strftime('%Y%m%dT%H%M%SZ')
+
+
+def event_uid(event: Dict[str, Any]) -> str:
+    """Stable UID: stored events by id, series occurrences by series and start."""
+    if event.get('id', 0) < 0 and event.get('series_id'):
+        start = f"{event['start_date'].replace('-', '')}T{(event.get('start_time') or '0000').replace(':', '')}"
+        return f"series-{event['series_id']}-{start}@{UID_DOMAIN}"
+    return f"event-{event['id']}@{UID_DOMAIN}"
+
+
+def _location(event: Dict[str, Any]) -> str:
+    parts = [event.get('venue_name'), event.get('venue_address') or event.get('start_location')]
+    return ', '.join(part.strip() for part in parts if part and part.strip())
+
+
+def _description(event: Dict[str, Any]) -> str:
+    parts = [event.get('description') or '']
+    if event.get('start_location') and event.get('start_location') != event.get('venue_name'):
+        parts.insert(0, f"Meeting Location: {event['start_location']}")
+    if event.get('price'):
+        parts.append(f"Price: ${event['price']}")
+    if event.get('url'):
+        parts.append(f"Website: {event['url']}")
+    return '\n\n'.join(part for part in parts if part)
+
+
+def render_vevent(event: Dict[str, Any], tzid: str, now: datetime) -> str:
+    """
+    One VEVENT. Events without times, and multi-day events without an end time
+    (exhibitions with an opening hour), are all-day spans with an exclusive end date.
+    """
+    start_date = _parse_date(event.get('start_date'))
+    if start_date is None:
+        return ''
+    end_date = _parse_date(event.get('end_date')) or start_date
+    start_time, end_time = _parse_time(event.get('start_time')), _parse_time(event.get('end_time'))
+    stamp = _utc_stamp(event.get('updated_at'), now)
+    lines = ['BEGIN:VEVENT', f'UID:{event_uid(event)}', f'DTSTAMP:{stamp}', f'LAST-MODIFIED:{stamp}']
+    if end_time is None and (start_time is None or end_date > start_date):
+        lines += [
+            f"DTSTART;VALUE=DATE:{start_date.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(max(end_date, start_date) + timedelta(days=1)).strftime('%Y%m%d')}",
+        ]
+    else:
+        start = datetime.combine(start_date, start_time or time(0, 0))
+        end = datetime.combine(end_date, end_time) if end_time else start + DEFAULT_DURATION
+        if end <= start:
+            end = start + DEFAULT_DURATION
+        lines += [
+            f"DTSTART;TZID={tzid}:{start.strftime('%Y%m%dT%H%M%S')}",
+            f"DTEND;TZID={tzid}:{end.strftime('%Y%m%dT%H%M%S')}",
+        ]
+    lines.append(f"SUMMARY:{escape_text(event.get('title'))}")
+    description = _description(event)
+    if description:
+        lines.append(f'DESCRIPTION:{escape_text(description)}')
+    location = _location(event)
+    if location:
+        lines.append(f'LOCATION:{escape_text(location)}')
+    if event.get('url'):
+        lines.append(f"URL:{event['url']}")
+    if event.get('event_type'):
+        lines.append(f"CATEGORIES:{escape_text(event['event_type'])}")
+    lines.append('END:VEVENT')
+    return ''.join(fold_line(line) for line in lines)
+
+
+def iter_calendar(
+    events: Iterable[Dict[str, Any]],
+    tzid: str,
+    name: str,
+    years: Tuple[int, int],
+    now: Optional[datetime] = None,
+    refresh_minutes: int = 60,
+) -> Iterator[str]:
+    """The VCALENDAR as text chunks: header and VTIMEZONE first, then VEVENTs in batches."""
+    now = now or datetime.utcnow()
+    header = [
+        'BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{PRODID}', 'CALSCALE:GREGORIAN', 'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape_text(name)}', f'X-WR-TIMEZONE:{tzid}',
+        f'REFRESH-INTERVAL;VALUE=DURATION:PT{refresh_minutes}M', f'X-PUBLISHED-TTL:PT{refresh_minutes}M',
+    ]
+    yield ''.join(fold_line(line) for line in header) + vtimezone(tzid, *years)
+    chunk: List[str] = []
+    for event in events:
+        chunk.append(render_vevent(event, tzid, now))
+        if len(chunk) >= CHUNK_EVENTS:
+            yield ''.join(chunk)
+            chunk = []
+    chunk.append('END:VCALENDAR' + CRLF)
+    yield ''.join(chunk)
+
+
+def feed_etag(cache_key: str, *state: Any) -> str:
+    """
+    Opaque ETag (unquoted) for a feed: the response cache key plus ``state`` read from the data
+    (counts, latest ``updated_at``), so the validator changes with the rows even when the cache
+    generation does not.
+    """
+    raw = '|'.join([cache_key, *(str(value) for value in state)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+
+def not_modified(if_none_match, etag: str, if_modified_since: Optional[datetime],
+                 last_modified: Optional[datetime]) -> bool:
+    """
+    Whether a poll gets 304 (RFC 7232 section 6): ``If-None-Match`` decides whenever the client
+    sent one, and ``If-Modified-Since`` is only consulted without it. ``max(updated_at)`` does not
+    move when an event is deleted, but the ETag does, so a stale ETag must win over a recent date.
+    """
+    if if_none_match:
+        return if_none_match.contains(etag)
+    return bool(if_modified_since and last_modified and last_modified <= if_modified_since)
@@ -14,12 +14,13 @@ import tempfile
 from datetime import datetime, date, time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from PIL import Image
 import pytesseract
 from google.cloud import vision
 from google.cloud.vision_v1 import types as vision_types
 import pytz
 
+from scripts import tesseract_ocr
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -303,53 +304,28 @@ class ImageEventProcessor:
             return ""
     
     def _extract_text_tesseract(self, image_path: str) -> str:
-        """Extract text using Tesseract OCR with multiple fallback methods"""
+        """Extract text using Tesseract OCR (parallel PSM candidates, then a whitelist fallback)"""
         try:
-            image = Image.open(image_path)
-            
-            # Try different PSM modes to get better results
-            psm_modes = [6, 3, 8, 13]  # Different page segmentation modes
-            best_text = ""
-            best_confidence = 0
-            
-            for psm in psm_modes:
-                try:
-                    # Extract text with confidence scores
-                    data = pytesseract.image_to_data(image, config=f'--psm {psm}', output_type=pytesseract.Output.DICT)
-                    
-                    # Calculate average confidence
-                    confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-                    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-                    
-                    # Extract text
-                    text = pytesseract.image_to_string(image, config=f'--psm {psm}')
-                    
-                    # Clean up the text
-                    text = self._clean_ocr_text(text)
-                    
-                    # Choose the result with highest confidence and reasonable length
-                    if avg_confidence > best_confidence and len(text.strip()) > 5:
-                        best_text = text
-                        best_confidence = avg_confidence
+            with tesseract_ocr.prepared_image(image_path) as prepared_path:
+                # Several page segmentation modes run concurrently; the most confident one wins
+                result = tesseract_ocr.recognize(
+                    prepared_path,
+                    accept=lambda text: len(self._clean_ocr_text(text).strip()) > 5,
+                )
+                best_text = self._clean_ocr_text(result.text) if result else ""
+                
+                # If we got garbled text, try a simpler approach
+                if self._is_garbled_text(best_text):
+                    logger.warning("Detected garbled text, trying simpler extraction")
+                    try:
+                        # Try with basic settings
+                        simple = tesseract_ocr.run_psm(prepared_path, 3, extra_config='-c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789@#.,:!?')
+                        simple_text = self._clean_ocr_text(simple.text)
                         
-                    logger.info(f"PSM {psm}: confidence={avg_confidence:.1f}, text_length={len(text)}")
-                    
-                except Exception as e:
-                    logger.warning(f"PSM {psm} failed: {e}")
-                    continue
-            
-            # If we got garbled text, try a simpler approach
-            if self._is_garbled_text(best_text):
-                logger.warning("Detected garbled text, trying simpler extraction")
-                try:
-                    # Try with basic settings
-                    simple_text = pytesseract.image_to_string(image, config='--psm 3 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789@#.,:!? ')
-                    simple_text = self._clean_ocr_text(simple_text)
-                    
-                    if not self._is_garbled_text(simple_text) and len(simple_text.strip()) > 3:
-                        return simple_text
-                except Exception as e:
-                    logger.warning(f"Simple extraction failed: {e}")
+                        if not self._is_garbled_text(simple_text) and len(simple_text.strip()) > 3:
+                            return simple_text
+                    except Exception as e:
+                        logger.warning(f"Simple extraction failed: {e}")
             
             return best_text if best_text else ""
             
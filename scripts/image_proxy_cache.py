@@ -0,0 +1,256 @@
+"""
+Persistent on-disk cache for ``/api/image-proxy``.
+
+Resized image variants are stored content-addressed by (url, width) so a city page
+that renders the same image many times, or many workers serving the same feed,
+fetch and resize it once.
+
+- **Layout:** ``<root>/<key[:2]>/<key>.img`` plus a ``<key>.json`` sidecar holding the
+  content type and ETag (a hash of the stored bytes).
+- **Eviction:** size-bounded LRU. Hits touch the file mtime; when the cache grows past
+  ``max_bytes`` the least recently used variants are removed down to 90%.
+- **Negative caching:** upstream 404s are remembered per URL and 403s per host for
+  ``negative_ttl`` seconds, so blocked hosts are redirected without a fetch.
+- **Single-flight:** ``single_flight(key)`` serializes fetches of one key across threads
+  (in-process lock) and gunicorn workers (``fcntl`` file lock where available).
+
+Configuration (env): ``IMAGE_PROXY_CACHE_DIR`` (default ``instance/image_cache``),
+``IMAGE_PROXY_CACHE_MAX_MB`` (default 256), ``IMAGE_PROXY_NEGATIVE_TTL`` seconds
+(default 3600). ``IMAGE_PROXY_CACHE_MAX_MB=0`` disables storage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, 'instance', 'image_cache')
+DEFAULT_MAX_MB = 256
+DEFAULT_NEGATIVE_TTL = 3600
+
+# Re-scan the directory for eviction after this many writes (other workers write too)
+_RESCAN_EVERY_PUTS = 50
+
+
+@dataclass
+class CachedImage:
+    """A stored image variant."""
+    path: str
+    content_type: str
+    etag: str
+    size: int
+
+    def read(self) -> bytes:
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+
+class ImageProxyCache:
+    """Disk-backed LRU cache of proxied (and resized) images."""
+
+    def __init__(self, root: str, max_bytes: int, negative_ttl: int = DEFAULT_NEGATIVE_TTL):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._total_bytes: Optional[int] = None
+        self._puts_since_scan = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def key(url: str, width: int) -> str:
+        return hashlib.sha256(f"{url}\n{width}".encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.root, key[:2], key)
+        return base + '.img', base + '.json'
+
+    def get(self, key: str) -> Optional[CachedImage]:
+        """Return the cached variant (and mark it recently used), or None."""
+        if not self.enabled:
+            return None
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            size = os.path.getsize(data_path)
+            os.utime(data_path, None)
+        except (OSError, ValueError):
+            return None
+        return CachedImage(data_path, meta.get('content_type', 'image/jpeg'), meta.get('etag', ''), size)
+
+    def put(self, key: str, content: bytes, content_type: str, url: str = '', width: int = 0) -> CachedImage:
+        """Store a variant; returns it even when storage is disabled or fails (served from memory)."""
+        etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+        data_path, meta_path = self._paths(key)
+        if not self.enabled:
+            return _InMemoryImage(data_path, content_type, etag, len(content), content)
+        try:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            # Write to temp files and rename so readers never see partial data
+            tmp_suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(data_path + tmp_suffix, 'wb') as f:
+                f.write(content)
+            with open(meta_path + tmp_suffix, 'w', encoding='utf-8') as f:
+                json.dump({'content_type': content_type, 'etag': etag, 'url': url, 'w': width}, f)
+            os.replace(data_path + tmp_suffix, data_path)
+            os.replace(meta_path + tmp_suffix, meta_path)
+        except OSError as e:
+            logger.debug(f"[image-cache] Could not store {url[:80]}: {e}")
+            return _InMemoryImage(data_path, content_type, etag, len(content), content)
+        self._account_put(len(content))
+        return CachedImage(data_path, content_type, etag, len(content))
+
+    def _account_put(self, size: int) -> None:
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._total_bytes is None or self._puts_since_scan >= _RESCAN_EVERY_PUTS:
+                self._total_bytes = None
+            else:
+                self._total_bytes += size
+            needs_scan = self._total_bytes is None or self._total_bytes > self.max_bytes
+        if needs_scan:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used variants until the cache fits in 90% of max_bytes. Returns bytes freed."""
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith('.img'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        freed = 0
+        if total > self.max_bytes:
+            target = int(self.max_bytes * 0.9)
+            for _, size, path in sorted(entries):
+                if total - freed <= target:
+                    break
+                for victim in (path, path[:-len('.img')] + '.json'):
+                    try:
+                        os.remove(victim)
+                    except OSError:
+                        pass
+                freed += size
+            logger.debug(f"[image-cache] Evicted {freed} bytes")
+        with self._lock:
+            self._total_bytes = total - freed
+            self._puts_since_scan = 0
+        return freed
+
+    # --- Negative cache ---------------------------------------------------
+
+    def _negative_path(self, scope: str) -> str:
+        return os.path.join(self.root, 'negative', hashlib.sha256(scope.encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def _negative_scopes(url: str):
+        return ('url:' + url, 'host:' + (urlparse(url).netloc or '').lower())
+
+    def is_negative(self, url: str) -> Optional[int]:
+        """Upstream status (403/404) remembered for this URL or its host, or None."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        for scope in self._negative_scopes(url):
+            path = self._negative_path(scope)
+            try:
+                if now - os.path.getmtime(path) > self.negative_ttl:
+                    continue
+                with open(path, 'r', encoding='utf-8') as f:
+                    return int(f.read().strip() or 0) or None
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def mark_negative(self, url: str, status_code: int) -> None:
+        """Remember a 404 for this URL, or a 403 for the whole host."""
+        if not self.enabled or status_code not in (403, 404):
+            return
+        url_scope, host_scope = self._negative_scopes(url)
+        path = self._negative_path(host_scope if status_code == 403 else url_scope)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(str(status_code))
+        except OSError as e:
+            logger.debug(f"[image-cache] Could not record negative entry: {e}")
+
+    # --- Single-flight ----------------------------------------------------
+
+    @contextmanager
+    def single_flight(self, key: str) -> Iterator[None]:
+        """Hold the per-key fetch lock; callers re-check ``get(key)`` once inside."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            lock_file = None
+            if self.enabled and FCNTL_AVAILABLE:
+                try:
+                    lock_dir = os.path.join(self.root, 'locks')
+                    os.makedirs(lock_dir, exist_ok=True)
+                    lock_file = open(os.path.join(lock_dir, key), 'w')
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                except OSError:
+                    lock_file = None
+            try:
+                yield
+            finally:
+                if lock_file is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                    lock_file.close()
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+
+class _InMemoryImage(CachedImage):
+    """Variant that could not be written to disk."""
+
+    def __init__(self, path: str, content_type: str, etag: str, size: int, content: bytes):
+        super().__init__(path, content_type, etag, size)
+        self._content = content
+
+    def read(self) -> bytes:
+        return self._content
+
+
+def create_image_proxy_cache() -> ImageProxyCache:
+    """Build the cache from environment settings."""
+    root = os.getenv('IMAGE_PROXY_CACHE_DIR') or DEFAULT_CACHE_DIR
+    try:
+        max_mb = float(os.getenv('IMAGE_PROXY_CACHE_MAX_MB', DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    try:
+        negative_ttl = int(os.getenv('IMAGE_PROXY_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL))
+    except ValueError:
+        negative_ttl = DEFAULT_NEGATIVE_TTL
+    return ImageProxyCache(root, int(max_mb * 1024 * 1024), negative_ttl)
@@ -0,0 +1,539 @@
+"""
+Background job queue for admin scrapes (``/api/scrape``, ``/api/scrape-stream``, ``/api/admin/scrape-*``).
+
+Web requests enqueue a job and return its id; a separate worker process
+(``scripts/scrape_job_worker.py``) runs it. Scrapes no longer hold a gunicorn worker for minutes.
+
+- **Storage:** two tables on the app database (SQLite locally, Postgres in production):
+  ``scrape_jobs`` (one row per job) and ``scrape_job_events`` (append-only progress log that
+  the SSE endpoints tail).
+- **Claiming:** compare-and-set ``UPDATE`` with a lease. The worker extends the lease while the
+  job runs. A job whose lease expires (worker killed, deploy, crash) is queued again, or failed
+  once it has used ``max_attempts``.
+- **Retries:** automatic for worker-level failures (uncaught exception, lost lease), with linear
+  backoff. A scrape that ran and reported an error is final. ``retry()`` re-queues any finished job.
+- **Cancel:** queued jobs are cancelled at once. Running jobs get ``cancel_requested``; the worker
+  terminates the job process (or, in-thread, the job stops at its next ``emit()``).
+
+Configuration (env): ``SCRAPE_JOBS=inline`` runs scrapes in the request as before (default
+``queue``), ``SCRAPE_JOB_MAX_ATTEMPTS`` (default 3), ``SCRAPE_JOB_LEASE_SECONDS`` (default 60),
+``SCRAPE_JOB_RETENTION_DAYS`` (default 14; older finished jobs and their events are pruned).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import (
+    Boolean, Column, Float, Integer, MetaData, String, Table, Text, and_, delete, insert, select,
+    update,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_LEASE_SECONDS = 60
+DEFAULT_RETENTION_DAYS = 14
+RETRY_BACKOFF_SECONDS = 30
+
+metadata = MetaData()
+
+scrape_jobs = Table(
+    'scrape_jobs', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('kind', String(100), nullable=False),
+    Column('payload', Text),
+    Column('status', String(20), nullable=False, index=True),
+    Column('attempts', Integer, nullable=False, default=0),
+    Column('max_attempts', Integer, nullable=False, default=DEFAULT_MAX_ATTEMPTS),
+    Column('cancel_requested', Boolean, nullable=False, default=False),
+    Column('worker_id', String(100)),
+    Column('lease_expires_at', Float),
+    Column('run_after', Float, nullable=False),
+    Column('result', Text),
+    Column('error', Text),
+    Column('created_at', Float, nullable=False),
+    Column('started_at', Float),
+    Column('finished_at', Float),
+)
+
+scrape_job_events = Table(
+    'scrape_job_events', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('job_id', Integer, nullable=False, index=True),
+    Column('data', Text, nullable=False),
+    Column('created_at', Float, nullable=False),
+)
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job when a cancel was requested."""
+
+
+@dataclass
+class Job:
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    worker_id: Optional[str]
+    result: Any
+    error: Optional[str]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'cancel_requested': self.cancel_requested,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+def _loads(value):
+    return json.loads(value) if value else None
+
+
+def _job_from_row(row) -> Job:
+    return Job(
+        id=row.id, kind=row.kind, payload=_loads(row.payload) or {}, status=row.status,
+        attempts=row.attempts, max_attempts=row.max_attempts, cancel_requested=bool(row.cancel_requested),
+        worker_id=row.worker_id, result=_loads(row.result), error=row.error, created_at=row.created_at,
+        started_at=row.started_at, finished_at=row.finished_at,
+    )
+
+
+class JobQueue:
+    """Database-backed job queue; every method is one short transaction on ``engine``."""
+
+    def __init__(self, engine, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.engine = engine
+        self.max_attempts = max(1, max_attempts)
+        self._tables_ready = False
+        self._tables_lock = threading.Lock()
+
+    def _begin(self):
+        if not self._tables_ready:
+            with self._tables_lock:
+                if not self._tables_ready:
+                    metadata.create_all(self.engine, checkfirst=True)
+                    self._tables_ready = True
+        return self.engine.begin()
+
+    # -- producers -----------------------------------------------------------------------------
+
+    def enqueue(self, kind: str, payload: Optional[Dict[str, Any]] = None, max_attempts: Optional[int] = None) -> int:
+        now = time.time()
+        with self._begin() as conn:
+            result = conn.execute(insert(scrape_jobs).values(
+                kind=kind, payload=json.dumps(payload or {}, default=str), status=QUEUED, attempts=0,
+                max_attempts=max_attempts or self.max_attempts, cancel_requested=False,
+                run_after=now, created_at=now,
+            ))
+            job_id = result.inserted_primary_key[0]
+            self._append(conn, job_id, {'type': 'job', 'status': QUEUED})
+        return job_id
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._begin() as conn:
+            row = conn.execute(select(scrape_jobs).where(scrape_jobs.c.id == job_id)).first()
+        return _job_from_row(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Job]:
+        stmt = select(scrape_jobs).order_by(scrape_jobs.c.id.desc()).limit(limit)
+        if status:
+            stmt = stmt.where(scrape_jobs.c.status == status)
+        with self._begin() as conn:
+            return [_job_from_row(row) for row in conn.execute(stmt)]
+
+    def cancel(self, job_id: int) -> Optional[Job]:
+        """Cancel a queued job now, or ask the worker to stop a running one."""
+        now = time.time()
+        with self._begin() as conn:
+            cancelled = conn.execute(
+                update(scrape_jobs)
+                .where(scrape_jobs.c.id == job_id, scrape_jobs.c.status == QUEUED)
+                .values(status=CANCELLED, cancel_requested=True, finished_at=now)
+            ).rowcount
+            if cancelled:
+                self._append(conn, job_id, {'type': 'job', 'status': CANCELLED})
+            else:
+                conn.execute(
+                    update(scrape_jobs)
+                    .where(scrape_jobs.c.id == job_id, scrape_jobs.c.status == RUNNING)
+                    .values(cancel_requested=True)
+                )
+        return self.get(job_id)
+
+    def retry(self, job_id: int) -> Optional[Job]:
+        """Queue a finished job again with a fresh attempt budget."""
+        with self._begin() as conn:
+            requeued = conn.execute(
+                update(scrape_jobs)
+                .where(scrape_jobs.c.id == job_id, scrape_jobs.c.status.in_(FINISHED_STATUSES))
+                .values(status=QUEUED, attempts=0, cancel_requested=False, worker_id=None, lease_expires_at=None,
+                        run_after=time.time(), result=None, error=None, started_at=None, finished_at=None)
+            ).rowcount
+            if requeued:
+                self._append(conn, job_id, {'type': 'job', 'status': QUEUED, 'retry': True})
+        return self.get(job_id)
+
+    # -- events --------------------------------------------------------------------------------
+
+    @staticmethod
+    def _append(conn, job_id: int, data: Dict[str, Any]) -> None:
+        conn.execute(insert(scrape_job_events).values(
+            job_id=job_id, data=json.dumps(data, default=str), created_at=time.time(),
+        ))
+
+    def append_event(self, job_id: int, data: Dict[str, Any]) -> None:
+        with self._begin() as conn:
+            self._append(conn, job_id, data)
+
+    def events_since(self, job_id: int, after_id: int = 0, limit: int = 500) -> List[tuple]:
+        """``(event_id, data)`` pairs for ``job_id`` newer than ``after_id``, oldest first."""
+        with self._begin() as conn:
+            rows = conn.execute(
+                select(scrape_job_events.c.id, scrape_job_events.c.data)
+                .where(scrape_job_events.c.job_id == job_id, scrape_job_events.c.id > after_id)
+                .order_by(scrape_job_events.c.id)
+                .limit(limit)
+            ).all()
+        return [(row.id, json.loads(row.data)) for row in rows]
+
+    def tail(self, job_id: int, after_id: int = 0, poll_interval: float = 0.5,
+             keepalive: float = 15.0) -> Iterator[Optional[tuple]]:
+        """
+        Yield ``(event_id, data)`` as events arrive until the job is finished and drained.
+        Yields ``None`` after ``keepalive`` seconds without events (for SSE keep-alive comments).
+        """
+        last_event_at = time.monotonic()
+        while True:
+            events = self.events_since(job_id, after_id)
+            for event_id, data in events:
+                after_id = event_id
+                yield event_id, data
+            if events:
+                last_event_at = time.monotonic()
+                continue
+            job = self.get(job_id)
+            if job is None:
+                return
+            if job.finished:
+                # Events committed together with the final status are already drained above
+                if not self.events_since(job_id, after_id, limit=1):
+                    return
+                continue
+            if time.monotonic() - last_event_at >= keepalive:
+                last_event_at = time.monotonic()
+                yield None
+            time.sleep(poll_interval)
+
+    # -- workers -------------------------------------------------------------------------------
+
+    def _expire_leases(self, conn, now: float) -> None:
+        expired = and_(scrape_jobs.c.status == RUNNING, scrape_jobs.c.lease_expires_at < now)
+        rows = conn.execute(
+            select(scrape_jobs.c.id, scrape_jobs.c.attempts, scrape_jobs.c.max_attempts, scrape_jobs.c.cancel_requested)
+            .where(expired)
+        ).all()
+        for row in rows:
+            if row.cancel_requested or row.attempts >= row.max_attempts:
+                status = CANCELLED if row.cancel_requested else FAILED
+                values = dict(status=status, finished_at=now, error='worker lost (lease expired)')
+            else:
+                status = QUEUED
+                values = dict(status=QUEUED, run_after=now)
+            if conn.execute(
+                update(scrape_jobs).where(scrape_jobs.c.id == row.id, expired).values(worker_id=None, **values)
+            ).rowcount:
+                self._append(conn, row.id, {'type': 'job', 'status': status, 'reason': 'lease expired'})
+
+    def claim(self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Job]:
+        """Take the oldest runnable job (re-queueing jobs whose worker disappeared first)."""
+        now = time.time()
+        with self._begin() as conn:
+            self._expire_leases(conn, now)
+            candidates = conn.execute(
+                select(scrape_jobs.c.id)
+                .where(scrape_jobs.c.status == QUEUED, scrape_jobs.c.run_after <= now)
+                .order_by(scrape_jobs.c.id)
+                .limit(10)
+            ).scalars().all()
+        for job_id in candidates:
+            with self._begin() as conn:
+                claimed = conn.execute(
+                    update(scrape_jobs)
+                    .where(scrape_jobs.c.id == job_id, scrape_jobs.c.status == QUEUED)
+                    .values(status=RUNNING, worker_id=worker_id, attempts=scrape_jobs.c.attempts + 1,
+                            lease_expires_at=now + lease_seconds, started_at=now)
+                ).rowcount
+                if claimed:
+                    self._append(conn, job_id, {'type': 'job', 'status': RUNNING})
+            if claimed:
+                return self.get(job_id)
+        return None
+
+    def _owned(self, job_id: int, worker_id: str):
+        return and_(scrape_jobs.c.id == job_id, scrape_jobs.c.worker_id == worker_id, scrape_jobs.c.status == RUNNING)
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[bool]:
+        """Extend the lease. Returns ``cancel_requested``, or None when the job is no longer ours."""
+        with self._begin() as conn:
+            extended = conn.execute(
+                update(scrape_jobs).where(self._owned(job_id, worker_id))
+                .values(lease_expires_at=time.time() + lease_seconds)
+            ).rowcount
+            if not extended:
+                return None
+            return bool(conn.execute(
+                select(scrape_jobs.c.cancel_requested).where(scrape_jobs.c.id == job_id)
+            ).scalar())
+
+    def cancel_requested(self, job_id: int) -> bool:
+        with self._begin() as conn:
+            return bool(conn.execute(
+                select(scrape_jobs.c.cancel_requested).where(scrape_jobs.c.id == job_id)
+            ).scalar())
+
+    def complete(self, job_id: int, worker_id: str, result: Any = None) -> bool:
+        with self._begin() as conn:
+            done = conn.execute(
+                update(scrape_jobs).where(self._owned(job_id, worker_id))
+                .values(status=SUCCEEDED, result=json.dumps(result, default=str), finished_at=time.time(),
+                        lease_expires_at=None)
+            ).rowcount
+            if done:
+                self._append(conn, job_id, {'type': 'job', 'status': SUCCEEDED})
+        return bool(done)
+
+    def mark_cancelled(self, job_id: int, worker_id: str) -> bool:
+        with self._begin() as conn:
+            done = conn.execute(
+                update(scrape_jobs).where(self._owned(job_id, worker_id))
+                .values(status=CANCELLED, finished_at=time.time(), lease_expires_at=None)
+            ).rowcount
+            if done:
+                self._append(conn, job_id, {'type': 'job', 'status': CANCELLED})
+        return bool(done)
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Record a worker-level failure: queued again with backoff while attempts remain."""
+        now = time.time()
+        with self._begin() as conn:
+            row = conn.execute(
+                select(scrape_jobs.c.attempts, scrape_jobs.c.max_attempts).where(self._owned(job_id, worker_id))
+            ).first()
+            if row is None:
+                return False
+            if row.attempts < row.max_attempts:
+                status = QUEUED
+                values = dict(status=QUEUED, run_after=now + RETRY_BACKOFF_SECONDS * row.attempts)
+            else:
+                status = FAILED
+                values = dict(status=FAILED, finished_at=now)
+            conn.execute(
+                update(scrape_jobs).where(self._owned(job_id, worker_id))
+                .values(error=error, worker_id=None, lease_expires_at=None, **values)
+            )
+            summary = (error.strip().splitlines() or ['job failed'])[-1]
+            self._append(conn, job_id, {'type': 'job', 'status': status, 'error': summary})
+        return True
+
+    def prune(self, older_than_days: float = DEFAULT_RETENTION_DAYS) -> int:
+        """Delete finished jobs (and their events) older than ``older_than_days``."""
+        cutoff = time.time() - older_than_days * 86400
+        with self._begin() as conn:
+            old_ids = conn.execute(
+                select(scrape_jobs.c.id)
+                .where(scrape_jobs.c.status.in_(FINISHED_STATUSES), scrape_jobs.c.finished_at < cutoff)
+            ).scalars().all()
+            for start in range(0, len(old_ids), 500):
+                chunk = old_ids[start:start + 500]
+                conn.execute(delete(scrape_job_events).where(scrape_job_events.c.job_id.in_(chunk)))
+                conn.execute(delete(scrape_jobs).where(scrape_jobs.c.id.in_(chunk)))
+        return len(old_ids)
+
+
+class JobContext:
+    """Handed to a running job: ``emit()`` progress events, ``check_cancelled()`` between steps."""
+
+    CANCEL_CHECK_INTERVAL = 1.0
+
+    def __init__(self, queue: JobQueue, job: Job):
+        self.queue = queue
+        self.job = job
+        self.cancelled = threading.Event()
+        self._last_check = 0.0
+
+    def check_cancelled(self) -> None:
+        now = time.monotonic()
+        if not self.cancelled.is_set() and now - self._last_check >= self.CANCEL_CHECK_INTERVAL:
+            self._last_check = now
+            if self.queue.cancel_requested(self.job.id):
+                self.cancelled.set()
+        if self.cancelled.is_set():
+            raise JobCancelled(f"job {self.job.id} cancelled")
+
+    def emit(self, data: Dict[str, Any]) -> None:
+        self.check_cancelled()
+        self.queue.append_event(self.job.id, data)
+
+
+JobHandler = Callable[[Job, JobContext], Any]
+
+
+def _run_job(queue: JobQueue, handler: JobHandler, job: Job, worker_id: str, context: Optional[JobContext] = None) -> None:
+    context = context or JobContext(queue, job)
+    try:
+        result = handler(job, context)
+    except JobCancelled:
+        queue.mark_cancelled(job.id, worker_id)
+    except Exception:
+        logger.exception(f"Job {job.id} ({job.kind}) failed")
+        queue.fail(job.id, worker_id, traceback.format_exc())
+    else:
+        queue.complete(job.id, worker_id, result)
+
+
+def _run_job_in_child(queue: JobQueue, handler: JobHandler, job: Job, worker_id: str) -> None:
+    queue.engine.dispose(close=False)  # never share the parent's pooled connections
+    _run_job(queue, handler, job, worker_id)
+
+
+class JobWorker:
+    """
+    Claims jobs and runs ``handler(job, context)``, renewing the lease while it runs.
+
+    With ``isolate`` (default, needs ``fork``) each job runs in a child process, so a cancel
+    terminates it and a crash only fails that job. Otherwise jobs run on a thread and cancel is
+    cooperative (``context.emit`` / ``check_cancelled`` raise ``JobCancelled``).
+    """
+
+    def __init__(self, queue: JobQueue, handler: JobHandler, worker_id: Optional[str] = None,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS, poll_interval: float = 2.0, isolate: bool = True):
+        self.queue = queue
+        self.handler = handler
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.isolate = isolate and 'fork' in multiprocessing.get_all_start_methods()
+
+    def _supervise(self, job: Job, is_alive: Callable[[], bool], wait: Callable[[float], None],
+                   on_cancel: Callable[[], None]) -> bool:
+        """Heartbeat until the job ends. Returns False when the lease was lost to another worker."""
+        interval = max(0.05, self.lease_seconds / 3)
+        while is_alive():
+            wait(interval)
+            if not is_alive():
+                break
+            state = self.queue.heartbeat(job.id, self.worker_id, self.lease_seconds)
+            if state is None:
+                logger.warning(f"Lost lease on job {job.id}; abandoning it")
+                on_cancel()
+                return False
+            if state:
+                on_cancel()
+        return True
+
+    def run_once(self) -> bool:
+        """Run one job if one is ready; returns False when the queue had nothing runnable."""
+        job = self.queue.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return False
+        logger.info(f"▶️ Job {job.id} ({job.kind}) attempt {job.attempts}/{job.max_attempts}")
+        if self.isolate:
+            process = multiprocessing.get_context('fork').Process(
+                target=_run_job_in_child, args=(self.queue, self.handler, job, self.worker_id), daemon=True,
+            )
+            process.start()
+
+            def terminate():
+                if process.is_alive():
+                    process.terminate()
+                    process.join(10)
+                    self.queue.mark_cancelled(job.id, self.worker_id)
+
+            self._supervise(job, process.is_alive, process.join, terminate)
+            process.join()
+            current = self.queue.get(job.id)
+            if current and current.status == RUNNING and current.worker_id == self.worker_id:
+                self.queue.fail(job.id, self.worker_id, f"job process exited with code {process.exitcode}")
+        else:
+            context = JobContext(self.queue, job)
+            thread = threading.Thread(target=_run_job, args=(self.queue, self.handler, job, self.worker_id, context),
+                                      daemon=True)
+            thread.start()
+            self._supervise(job, thread.is_alive, thread.join, context.cancelled.set)
+            thread.join()
+        finished = self.queue.get(job.id)
+        logger.info(f"⏹️ Job {job.id} ({job.kind}): {finished.status if finished else 'gone'}")
+        return True
+
+    def run_forever(self, stop: Optional[threading.Event] = None) -> None:
+        stop = stop or threading.Event()
+        logger.info(f"Scrape job worker {self.worker_id} started")
+        while not stop.is_set():
+            try:
+                ran = self.run_once()
+            except Exception as e:
+                logger.error(f"Job worker error: {e}")
+                ran = False
+            if not ran:
+                stop.wait(self.poll_interval)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def jobs_enabled() -> bool:
+    """Whether scrape endpoints enqueue (``SCRAPE_JOBS`` != ``inline``)."""
+    return os.getenv('SCRAPE_JOBS', 'queue').strip().lower() != 'inline'
+
+
+def create_job_queue(engine) -> JobQueue:
+    """Build the queue on ``engine`` from environment settings."""
+    return JobQueue(engine, max_attempts=_env_int('SCRAPE_JOB_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+
+
+def create_job_worker(queue: JobQueue, handler: JobHandler, isolate: bool = True) -> JobWorker:
+    """Build a worker from environment settings."""
+    return JobWorker(queue, handler, lease_seconds=_env_int('SCRAPE_JOB_LEASE_SECONDS', DEFAULT_LEASE_SECONDS),
+                     isolate=isolate)
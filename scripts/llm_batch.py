@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Batched LLM extraction: many pages per prompt.
+
+``extract_batch(llm, instructions, items)`` packs several items (``{'id', 'content'}``) into
+one structured prompt and asks for a JSON object keyed by item id, so N pages cost
+ceil(N / batch size) round-trips instead of N. Items missing or unparseable in the batch
+answer are retried one at a time. Prompts go through ``query_with_fallback()``, so they
+share its prompt cache and provider circuit breaker.
+
+``compact_page_text()`` turns a page into the text worth sending: visible text without
+navigation, headers, footers, scripts and styles, plus the page title, meta description and
+JSON-LD blocks (which JavaScript-rendered pages often carry even when their HTML is empty).
+Items are trimmed and grouped by ``chunk_items()`` to fit a prompt token budget.
+
+Configuration (env): ``LLM_BATCH_TOKEN_BUDGET`` (prompt tokens per batch, default 6000),
+``LLM_BATCH_MAX_ITEMS`` (items per batch, default 5; answers share the model's output limit),
+``LLM_BATCH_ITEM_MAX_CHARS`` (page text per item, default 6000).
+"""
+
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup, NavigableString
+
+from scripts.scraper_utils import parse_html
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = 6000
+DEFAULT_MAX_ITEMS = 5
+DEFAULT_ITEM_MAX_CHARS = 6000
+CHARS_PER_TOKEN = 4  # rough estimate; good enough to stay under provider limits
+
+BOILERPLATE_TAGS = frozenset({
+    'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'nav', 'header', 'footer', 'form', 'aside',
+})
+
+_FENCE = re.compile(r'^```(?:json)?\s*|\s*```$', re.IGNORECASE)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def compact_page_text(page: Union[BeautifulSoup, str, bytes], max_chars: Optional[int] = None) -> str:
+    """Text of a page without boilerplate, for an LLM prompt (the soup is not modified)."""
+    max_chars = max_chars or _env_int('LLM_BATCH_ITEM_MAX_CHARS', DEFAULT_ITEM_MAX_CHARS)
+    soup = page if isinstance(page, BeautifulSoup) else parse_html(page)
+
+    parts = []
+    if soup.title and soup.title.string:
+        parts.append(f"Title: {soup.title.string.strip()}")
+    description = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+    if description and description.get('content'):
+        parts.append(f"Description: {description['content'].strip()}")
+    for script in soup.find_all('script', type='application/ld+json'):
+        data = ' '.join((script.string or '').split())
+        if data:
+            parts.append(f"JSON-LD: {data}")
+
+    seen = set()
+    for text in soup.find_all(string=True):
+        if type(text) is not NavigableString:  # comments, doctype, CDATA
+            continue
+        if any(parent.name in BOILERPLATE_TAGS for parent in text.parents):
+            continue
+        line = ' '.join(text.split())
+        if len(line) < 2 or line in seen:
+            continue
+        seen.add(line)
+        parts.append(line)
+
+    compact = '\n'.join(parts)
+    return compact[:max_chars]
+
+
+def chunk_items(items: List[Dict[str, str]], token_budget: Optional[int] = None,
+                max_items: Optional[int] = None) -> List[List[Dict[str, str]]]:
+    """Group items into batches that fit ``token_budget`` prompt tokens and ``max_items``."""
+    token_budget = token_budget or _env_int('LLM_BATCH_TOKEN_BUDGET', DEFAULT_TOKEN_BUDGET)
+    max_items = max(1, max_items or _env_int('LLM_BATCH_MAX_ITEMS', DEFAULT_MAX_ITEMS))
+    item_budget = max(1, token_budget * CHARS_PER_TOKEN)
+
+    batches: List[List[Dict[str, str]]] = []
+    current: List[Dict[str, str]] = []
+    used = 0
+    for item in items:
+        content = item['content'][:item_budget]
+        cost = estimate_tokens(content)
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(dict(item, content=content))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_json_answer(content: str) -> Any:
+    """JSON value in an LLM answer (tolerates code fences and text around it); None if absent."""
+    text = _FENCE.sub('', (content or '').strip())
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    # Outermost value first: whichever bracket opens earlier
+    for opening, closing in sorted((('{', '}'), ('[', ']')), key=lambda pair: (text.find(pair[0]) == -1, text.find(pair[0]))):
+        start, end = text.find(opening), text.rfind(closing)
+        if start != -1 and end > start:
+            try:
+                return json.loads(text[start:end + 1])
+            except ValueError:
+                continue
+    return None
+
+
+def _batch_prompt(instructions: str, batch: List[Dict[str, str]]) -> str:
+    blocks = '\n\n'.join(f"=== ITEM {item['id']} ===\n{item['content']}" for item in batch)
+    ids = ', '.join(json.dumps(str(item['id'])) for item in batch)
+    return f"""{instructions}
+
+Apply these instructions to EACH of the {len(batch)} items below separately.
+
+Return ONLY a JSON object with one key per item id ({ids}); each value is the result for
+that item exactly as the instructions describe. No other text.
+
+{blocks}"""
+
+
+def _single_prompt(instructions: str, item: Dict[str, str]) -> str:
+    return f"""{instructions}
+
+Return ONLY the JSON result, no other text.
+
+{item['content']}"""
+
+
+def _answer(llm, prompt: str) -> Any:
+    response = llm.query_with_fallback(prompt)
+    if not response or not response.get('success') or response.get('provider') == 'mock':
+        return None
+    return parse_json_answer(response.get('content', ''))
+
+
+def extract_batch(llm, instructions: str, items: List[Dict[str, str]], token_budget: Optional[int] = None,
+                  max_items: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run ``instructions`` over every item; returns ``{item id: parsed JSON result or None}``.
+
+    ``llm`` is an ``EnhancedLLMFallback``. Each item is ``{'id': str, 'content': str}``.
+    """
+    results: Dict[str, Any] = {str(item['id']): None for item in items}
+    retry: List[Dict[str, str]] = []
+
+    for batch in chunk_items(items, token_budget, max_items):
+        if len(batch) == 1:
+            retry.extend(batch)
+            continue
+        answer = _answer(llm, _batch_prompt(instructions, batch))
+        if not isinstance(answer, dict):
+            logger.info(f"LLM batch of {len(batch)} items returned no usable JSON; retrying items one by one")
+            retry.extend(batch)
+            continue
+        for item in batch:
+            value = answer.get(str(item['id']))
+            if value is None:
+                retry.append(item)
+            else:
+                results[str(item['id'])] = value
+
+    for item in retry:
+        results[str(item['id'])] = _answer(llm, _single_prompt(instructions, item))
+
+    logger.info(f"LLM batch extraction: {len(items)} items, "
+                f"{sum(1 for value in results.values() if value is not None)} answered, {len(retry)} sent individually")
+    return results
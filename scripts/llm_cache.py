@@ -0,0 +1,106 @@
+"""Persistent cache of LLM answers keyed by prompt hash (used by EnhancedLLMFallback).
+
+Scrapers resend the same page text to the LLM on every run (vipassana and generic venue
+LLM fallbacks, URL auto-fill, image extraction). The first successful answer for a
+prompt is stored in a small SQLite file and returned for identical prompts until it is
+older than the TTL, so repeat scrapes cost neither latency nor paid tokens.
+
+Only real provider answers are stored; the mock fallback response never is.
+
+Configuration (env): ``LLM_CACHE_PATH`` (default ``instance/llm_cache.sqlite3``),
+``LLM_CACHE_TTL_HOURS`` (default 168, one week), ``LLM_CACHE=0`` disables.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.path.join(PROJECT_ROOT, 'instance', 'llm_cache.sqlite3')
+DEFAULT_TTL_HOURS = 168
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def prompt_key(prompt: str, context: str = '') -> str:
+    """Cache key for a prompt (and its optional context)."""
+    return hashlib.sha256(f"{context}\x00{prompt}".encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed store of successful LLM responses with a TTL."""
+
+    def __init__(self, path: str, ttl_hours: float = DEFAULT_TTL_HOURS):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.execute(_SCHEMA)
+                    conn.execute('DELETE FROM llm_cache WHERE created_at < ?', (time.time() - self.ttl_seconds,))
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            'SELECT response FROM llm_cache WHERE key = ? AND created_at >= ?',
+            (key, time.time() - self.ttl_seconds),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)',
+            (key, json.dumps(response, default=str), time.time()),
+        )
+        conn.commit()
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Process-wide cache from environment settings, or None when disabled."""
+    global _cache
+    if os.environ.get('LLM_CACHE', '').strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                ttl_hours = float(os.getenv('LLM_CACHE_TTL_HOURS', DEFAULT_TTL_HOURS))
+            except ValueError:
+                ttl_hours = DEFAULT_TTL_HOURS
+            _cache = LLMResponseCache(os.getenv('LLM_CACHE_PATH') or DEFAULT_CACHE_PATH, ttl_hours)
+        return _cache
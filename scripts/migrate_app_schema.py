@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Release step: run app.py's schema migrations once, then seed an empty database.
+
+Web workers no longer migrate on every boot; they read the ``schema_version`` row and skip the
+migrations when it matches ``SCHEMA_VERSION`` (scripts/schema_version.py). This script runs them
+(column auto-migration, indexes, effective_visibility and visit rollup backfills), records the
+version, and loads cities/venues/sources from JSON when the database is empty
+(scripts/migrations/reset_railway_database.py).
+
+Usage:
+    python scripts/migrate_app_schema.py               # migrate + seed
+    python scripts/migrate_app_schema.py --if-needed   # no-op (no app import) when the version is current
+
+Procfile:
+    release: python scripts/migrate_app_schema.py
+    web: (python scripts/migrate_app_schema.py --if-needed || true) && gunicorn app:app ...
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.schema_version import SCHEMA_VERSION, database_url, schema_is_current_at
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run app schema migrations and seed an empty database")
+    parser.add_argument('--if-needed', action='store_true',
+                        help='exit right away when the stored schema version is current')
+    args = parser.parse_args()
+
+    if args.if_needed and schema_is_current_at(database_url(str(project_root))):
+        print(f"✅ Schema version {SCHEMA_VERSION} is current, nothing to migrate")
+        return 0
+
+    # The app must not migrate on import; this script does it explicitly below
+    os.environ['SCHEMA_MIGRATIONS'] = 'skip'
+    from app import app, db, run_schema_migrations
+
+    with app.app_context():
+        db.create_all()
+    if not run_schema_migrations():
+        print("❌ Schema migrations did not complete; the version was not recorded")
+        return 1
+    print(f"✅ Schema migrated to version {SCHEMA_VERSION}")
+
+    from scripts.migrations.reset_railway_database import main as seed_empty_database
+    return 0 if seed_empty_database() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+Scope of ORM bulk statements for the after-commit refresh hooks.
+
+``session.execute(update(Event).where(...))`` and ``Query.delete()`` bypass the flush, so the
+hooks in scripts/event_visibility.py, scripts/event_search.py and scripts/event_geo.py cannot
+see which rows they touched. ``bulk_target_rows()`` reads them from a ``do_orm_execute``
+listener, before the statement runs, with a SELECT over the statement's own WHERE clause, so a
+hook refreshes those rows rather than rebuilding everything (the series save path retires old
+occurrence rows this way on every scrape).
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+
+def bulk_target_rows(orm_execute_state, *columns) -> Optional[List[Any]]:
+    """
+    ``columns`` of the rows an ORM bulk UPDATE or DELETE is about to touch; None when the
+    statement has no WHERE clause (the whole table).
+    """
+    from sqlalchemy import select
+
+    whereclause = orm_execute_state.statement.whereclause
+    if whereclause is None:
+        return None
+    return orm_execute_state.session.execute(select(*columns).where(whereclause)).all()
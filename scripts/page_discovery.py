@@ -7,6 +7,7 @@ Discovers relevant pages without manual configuration
 import re
 import requests
 from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 import logging
 
@@ -149,7 +150,7 @@ class PageDiscovery:
         try:
             response = self.session.get(base_url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response)
                 
                 # Find navigation elements
                 nav_selectors = [
@@ -235,7 +236,7 @@ class PageDiscovery:
         try:
             response = self.session.get(base_url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response)
                 
                 # Look for breadcrumbs
                 breadcrumbs = soup.find_all(['nav', 'ol', 'ul'], 
@@ -266,7 +267,7 @@ class PageDiscovery:
         try:
             response = self.session.get(category_url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response)
                 
                 # Find links that look like individual event/exhibition pages
                 links = soup.find_all('a', href=True)
@@ -0,0 +1,231 @@
+"""
+Scrape progress bus (replaces the shared ``scraping_progress.json`` file).
+
+Scrapers report progress to a named channel: one per scrape job (``job:<id>``, set by the
+job worker), or ``default`` outside jobs. Concurrent scrapes no longer overwrite each other.
+
+- **Writers** (``progress.update()`` / ``replace()`` / ``increment()``) only touch an in-memory
+  snapshot under a lock. ``events_found`` / ``events_saved`` / ``events_updated`` are
+  counters that ``increment()`` bumps atomically.
+- **Flushing:** a background thread writes changed snapshots to the ``scrape_progress`` table
+  (one row per channel, with a version that increases on every write) at most every
+  ``PROGRESS_FLUSH_INTERVAL`` seconds. The hot loop never does I/O. Job runners call
+  ``flush()`` before exiting.
+- **Readers** (``/api/scrape-progress``) read the row: latest snapshot, long-poll until the
+  version moves (``wait()``), or an SSE stream built on ``wait()``. Any web worker can serve
+  any channel, including ones written by the job worker process.
+
+Without ``configure(engine)`` (standalone scripts) snapshots stay in memory.
+
+Configuration (env): ``PROGRESS_FLUSH_INTERVAL`` seconds (default 0.5).
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, Text, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = 'default'
+DEFAULT_FLUSH_INTERVAL = 0.5
+COUNTER_FIELDS = ('events_found', 'events_saved', 'events_updated')
+RECENT_EVENTS_LIMIT = 10
+
+metadata = MetaData()
+
+scrape_progress = Table(
+    'scrape_progress', metadata,
+    Column('channel', String(100), primary_key=True),
+    Column('data', Text, nullable=False),
+    Column('version', Integer, nullable=False),
+    Column('updated_at', Float, nullable=False),
+)
+
+_current_channel: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('progress_channel', default=None)
+
+
+class ProgressBus:
+    """Per-channel progress snapshots in memory, flushed to the database in the background."""
+
+    def __init__(self, engine=None, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.engine = engine
+        self.flush_interval = max(0.05, flush_interval)
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher_pid = None
+        self._tables_ready = False
+
+    def configure(self, engine) -> None:
+        self.engine = engine
+        self._tables_ready = False
+
+    # -- channels ------------------------------------------------------------------------------
+
+    def channel(self) -> str:
+        """Channel for the caller: the active ``use_channel()``, else ``default``."""
+        return _current_channel.get() or DEFAULT_CHANNEL
+
+    @contextmanager
+    def use_channel(self, name: str):
+        """
+        Report to ``name`` inside the block, in this thread only. Other threads (request
+        handlers, the cron pool, the job worker's next job) keep their own channel; a thread
+        the block starts reports here when run via ``contextvars.copy_context().run``.
+        """
+        token = _current_channel.set(name)
+        try:
+            yield name
+        finally:
+            _current_channel.reset(token)
+
+    # -- writers -------------------------------------------------------------------------------
+
+    def _write(self, channel: Optional[str], mutate) -> Dict[str, Any]:
+        channel = channel or self.channel()
+        with self._lock:
+            snapshot = self._snapshots.setdefault(channel, {})
+            mutate(snapshot)
+            snapshot['timestamp'] = datetime.now().isoformat()
+            self._dirty.add(channel)
+            result = dict(snapshot)
+        self._ensure_flusher()
+        if result.get('percentage', 0) >= 100 or result.get('error'):
+            self._wake.set()  # final states go out right away
+        return result
+
+    def replace(self, data: Dict[str, Any], channel: Optional[str] = None) -> Dict[str, Any]:
+        """Start a new snapshot (a new scrape run) with ``data``."""
+        def mutate(snapshot):
+            snapshot.clear()
+            snapshot.update(data)
+        return self._write(channel, mutate)
+
+    def update(self, channel: Optional[str] = None, **fields) -> Dict[str, Any]:
+        """Merge ``fields`` into the snapshot."""
+        return self._write(channel, lambda snapshot: snapshot.update(fields))
+
+    def increment(self, channel: Optional[str] = None, **counters: int) -> Dict[str, Any]:
+        """Add to counters, e.g. ``increment(events_saved=1)``."""
+        def mutate(snapshot):
+            for name, amount in counters.items():
+                snapshot[name] = (snapshot.get(name) or 0) + amount
+        return self._write(channel, mutate)
+
+    def add_recent_event(self, event: Dict[str, Any], channel: Optional[str] = None) -> Dict[str, Any]:
+        """Prepend an event summary to ``recent_events`` (newest first, capped)."""
+        def mutate(snapshot):
+            snapshot['recent_events'] = ([event] + list(snapshot.get('recent_events') or []))[:RECENT_EVENTS_LIMIT]
+        return self._write(channel, mutate)
+
+    def snapshot(self, channel: Optional[str] = None) -> Dict[str, Any]:
+        """This process's view of a channel (no database read)."""
+        with self._lock:
+            return dict(self._snapshots.get(channel or self.channel(), {}))
+
+    # -- flushing ------------------------------------------------------------------------------
+
+    def _ensure_flusher(self) -> None:
+        if self.engine is None or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            # Also after fork: the parent's thread does not exist in the child
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_loop, name='progress-bus-flusher', daemon=True).start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _begin(self):
+        if not self._tables_ready:
+            metadata.create_all(self.engine, checkfirst=True)
+            self._tables_ready = True
+        return self.engine.begin()
+
+    def flush(self) -> None:
+        """Write changed snapshots now."""
+        if self.engine is None:
+            return
+        with self._lock:
+            pending = {channel: json.dumps(self._snapshots[channel], default=str) for channel in self._dirty}
+            self._dirty.clear()
+        for channel, data in pending.items():
+            try:
+                self._store(channel, data)
+            except Exception as e:
+                logger.debug(f"progress flush failed for {channel}: {e}")
+                with self._lock:
+                    self._dirty.add(channel)
+
+    def _store(self, channel: str, data: str) -> None:
+        now = time.time()
+        with self._begin() as conn:
+            updated = conn.execute(
+                update(scrape_progress).where(scrape_progress.c.channel == channel)
+                .values(data=data, version=scrape_progress.c.version + 1, updated_at=now)
+            ).rowcount
+            if updated:
+                return
+        try:
+            with self._begin() as conn:
+                conn.execute(insert(scrape_progress).values(channel=channel, data=data, version=1, updated_at=now))
+        except IntegrityError:
+            self._store(channel, data)  # another process created the row first
+
+    # -- readers -------------------------------------------------------------------------------
+
+    def read(self, channel: Optional[str] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """``(version, snapshot)`` for ``channel``; the most recently updated channel when None."""
+        if self.engine is None:
+            snapshot = self.snapshot(channel or DEFAULT_CHANNEL)
+            return (1, snapshot) if snapshot else (0, None)
+        stmt = select(scrape_progress.c.version, scrape_progress.c.data)
+        if channel:
+            stmt = stmt.where(scrape_progress.c.channel == channel)
+        else:
+            stmt = stmt.order_by(scrape_progress.c.updated_at.desc()).limit(1)
+        with self._begin() as conn:
+            row = conn.execute(stmt).first()
+        if row is None:
+            return 0, None
+        return row.version, json.loads(row.data)
+
+    def wait(self, channel: Optional[str], since_version: int = 0, timeout: float = 25.0,
+             poll_interval: float = 0.25) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Long-poll: return once the channel's version passes ``since_version`` or on timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            version, snapshot = self.read(channel)
+            if version > since_version or time.monotonic() >= deadline:
+                return version, snapshot
+            time.sleep(poll_interval)
+
+
+def _flush_interval() -> float:
+    try:
+        return float(os.getenv('PROGRESS_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL))
+    except ValueError:
+        return DEFAULT_FLUSH_INTERVAL
+
+
+# Process-wide bus; the app calls progress.configure(db.engine)
+progress = ProgressBus(flush_interval=_flush_interval())
+atexit.register(progress.flush)
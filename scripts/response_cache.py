@@ -0,0 +1,300 @@
+"""
+Response cache for the public read endpoints (``/api/cities``, ``/api/venues``, ``/api/sources``,
+``/api/stats``, ``/api/events``).
+
+Rendered JSON bodies are cached by endpoint + normalized query args + role (admin / public),
+each with an ETag (hash of the body) so clients revalidate with ``If-None-Match`` and get 304s.
+
+- **Backends:** an in-process LRU (default), or any Redis-compatible client (``get`` / ``set`` with
+  ``ex`` / ``incr``) when ``RESPONSE_CACHE_REDIS_URL`` is set and the ``redis`` package is installed.
+- **Invalidation:** every cache key embeds a generation token; ``invalidate()`` bumps it, which
+  orphans all entries at once. ``register_invalidation_hooks()`` bumps it after any commit that
+  wrote a watched model (admin edits and deletes, scraper upserts). The token must be reachable
+  by every process that writes events: the web workers, the scrape job worker (Procfile
+  ``worker:``) and the cron services, which on Railway each run in their own container. With
+  the in-process backend it is a counter in the one-row ``response_cache_generation`` table of
+  the app database (``create_response_cache(engine)``); with Redis it is a shared counter.
+  Without an engine (standalone scripts, tests) it falls back to a small file, which only
+  processes on the same disk share.
+- **TTL:** entries expire after ``ttl`` seconds regardless, bounding staleness from writers that
+  cannot reach the token (and rolling time ranges like ``today`` over).
+
+Configuration (env): ``RESPONSE_CACHE_TTL`` seconds (default 300; 0 disables storage),
+``RESPONSE_CACHE_MAX_ENTRIES`` (default 512, in-process backend), ``RESPONSE_CACHE_REDIS_URL``,
+``RESPONSE_CACHE_GENERATION_PATH`` (default ``instance/response_cache.generation``; only used
+without an engine).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import BigInteger, Column, Integer, MetaData, Table, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_GENERATION_PATH = os.path.join(PROJECT_ROOT, 'instance', 'response_cache.generation')
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 512
+REDIS_PREFIX = 'planner:response-cache:'
+
+metadata = MetaData()
+
+response_cache_generation = Table(
+    'response_cache_generation', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=False),
+    Column('generation', BigInteger, nullable=False),
+)
+
+
+@dataclass
+class CachedResponse:
+    """A rendered response body and its validator."""
+    body: bytes
+    mimetype: str
+    etag: str
+
+    def to_bytes(self) -> bytes:
+        return json.dumps({'mimetype': self.mimetype, 'etag': self.etag}).encode('utf-8') + b'\n' + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CachedResponse':
+        header, _, body = data.partition(b'\n')
+        meta = json.loads(header)
+        return cls(body, meta['mimetype'], meta['etag'])
+
+
+def body_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class MemoryBackend:
+    """
+    In-process LRU with per-entry expiry. The generation token lives in the database when an
+    ``engine`` is given (shared by every process and container), else in a file.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, generation_path: str = DEFAULT_GENERATION_PATH,
+                 engine=None):
+        self.max_entries = max(1, max_entries)
+        self.generation_path = generation_path
+        self.engine = engine
+        self._entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._tables_ready = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _begin(self):
+        if not self._tables_ready:
+            metadata.create_all(self.engine, checkfirst=True)
+            self._tables_ready = True
+        return self.engine.begin()
+
+    def generation(self) -> str:
+        if self.engine is not None:
+            table = response_cache_generation
+            with self._begin() as conn:
+                return str(conn.execute(select(table.c.generation).where(table.c.id == 1)).scalar() or 0)
+        try:
+            with open(self.generation_path, 'r', encoding='utf-8') as f:
+                return f.read().strip() or '0'
+        except OSError:
+            return '0'
+
+    def bump_generation(self) -> None:
+        if self.engine is not None:
+            self._bump_stored()
+            with self._lock:
+                self._entries.clear()
+            return
+        # Unique per bump (nanoseconds + pid); written atomically so readers never see a partial token
+        token = f"{time.time_ns()}-{os.getpid()}"
+        tmp_path = f"{self.generation_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.generation_path) or '.', exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(token)
+            os.replace(tmp_path, self.generation_path)
+        except OSError as e:
+            logger.warning(f"Could not write response cache generation ({e}); clearing local entries only")
+        with self._lock:
+            self._entries.clear()
+
+    def _bump_stored(self) -> None:
+        table = response_cache_generation
+        try:
+            with self._begin() as conn:
+                bumped = conn.execute(
+                    update(table).where(table.c.id == 1).values(generation=table.c.generation + 1)
+                ).rowcount
+                if not bumped:
+                    conn.execute(insert(table).values(id=1, generation=1))
+        except IntegrityError:
+            self._bump_stored()  # another process created the row first
+
+
+class RedisBackend:
+    """Shared backend over a Redis-compatible client (``get``, ``set(..., ex=)``, ``incr``)."""
+
+    def __init__(self, client, prefix: str = REDIS_PREFIX):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+    def generation(self) -> str:
+        value = self.client.get(self.prefix + 'generation')
+        if isinstance(value, bytes):
+            value = value.decode('ascii')
+        return str(value or '0')
+
+    def bump_generation(self) -> None:
+        self.client.incr(self.prefix + 'generation')
+
+
+class ResponseCache:
+    """Generation-keyed response cache over a backend; backend errors degrade to a miss."""
+
+    def __init__(self, backend, ttl: int = DEFAULT_TTL):
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def key(self, endpoint: str, args: Iterable[Tuple[str, str]], role: str) -> str:
+        """
+        Key for the current generation; take it before computing the response so a write that
+        lands mid-request orphans the result. Query args are sorted and blank values dropped.
+        """
+        normalized = sorted((name, value.strip()) for name, value in args if value and value.strip())
+        raw = json.dumps([endpoint, role, normalized], separators=(',', ':'))
+        try:
+            generation = self.backend.generation()
+        except Exception as e:
+            logger.warning(f"Response cache generation read failed: {e}")
+            generation = 'unavailable'
+        return f"{generation}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if not self.enabled:
+            return None
+        try:
+            data = self.backend.get(key)
+            return CachedResponse.from_bytes(data) if data else None
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    def put(self, key: str, body: bytes, mimetype: str) -> CachedResponse:
+        """Store a rendered body; returns it with its ETag even when storage is disabled or fails."""
+        cached = CachedResponse(body, mimetype, body_etag(body))
+        if self.enabled:
+            try:
+                self.backend.set(key, cached.to_bytes(), self.ttl)
+            except Exception as e:
+                logger.warning(f"Response cache write failed: {e}")
+        return cached
+
+    def invalidate(self) -> None:
+        """Drop every cached response (all workers sharing the backend / generation file)."""
+        try:
+            self.backend.bump_generation()
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+
+
+def register_invalidation_hooks(cache: ResponseCache, watched_models) -> None:
+    """
+    Invalidate ``cache`` after any committed session that wrote one of ``watched_models``:
+    ORM flushes (add / modify / delete) and bulk ``update()`` / ``delete()`` statements.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    watched = tuple(watched_models)
+    flag = 'response_cache_dirty'
+
+    @event.listens_for(Session, 'after_flush')
+    def _mark_flush(session, flush_context):
+        if any(isinstance(obj, watched) for obj in (*session.new, *session.dirty, *session.deleted)):
+            session.info[flag] = True
+
+    @event.listens_for(Session, 'do_orm_execute')
+    def _mark_bulk(orm_execute_state):
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None or issubclass(mapper.class_, watched):
+            orm_execute_state.session.info[flag] = True
+
+    @event.listens_for(Session, 'after_commit')
+    def _invalidate(session):
+        if session.info.pop(flag, False):
+            cache.invalidate()
+
+    @event.listens_for(Session, 'after_rollback')
+    def _discard(session):
+        session.info.pop(flag, None)
+
+
+def create_response_cache(engine=None) -> ResponseCache:
+    """
+    Build the cache from environment settings. Pass the app's ``engine`` so the in-process
+    backend keeps its generation in the database, where separate workers and cron containers
+    bump it too.
+    """
+    try:
+        ttl = int(os.getenv('RESPONSE_CACHE_TTL', DEFAULT_TTL))
+    except ValueError:
+        ttl = DEFAULT_TTL
+    redis_url = os.getenv('RESPONSE_CACHE_REDIS_URL')
+    if redis_url and REDIS_AVAILABLE:
+        return ResponseCache(RedisBackend(redis.Redis.from_url(redis_url, socket_timeout=0.5)), ttl)
+    if redis_url:
+        logger.warning('RESPONSE_CACHE_REDIS_URL is set but the redis package is not installed; using in-process cache')
+    try:
+        max_entries = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES))
+    except ValueError:
+        max_entries = DEFAULT_MAX_ENTRIES
+    generation_path = os.getenv('RESPONSE_CACHE_GENERATION_PATH') or DEFAULT_GENERATION_PATH
+    return ResponseCache(MemoryBackend(max_entries, generation_path, engine=engine), ttl)
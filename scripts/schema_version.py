@@ -0,0 +1,104 @@
+"""
+Schema version guard for app.py's startup migrations.
+
+The migration routines in app.py (column auto-migration, indexes, effective_visibility backfill,
+visit rollup) used to run on every import, in every gunicorn worker. They now run once per
+``SCHEMA_VERSION``: the release step (``scripts/migrate_app_schema.py``) runs them and records the
+version in a one-row ``schema_version`` table; app boot only reads that row.
+
+Bump ``SCHEMA_VERSION`` whenever a migration routine in app.py changes.
+
+``SCHEMA_MIGRATIONS`` (env) controls what app boot does:
+
+- ``auto`` (default): run the migrations when the stored version is behind (release step not
+  run, e.g. local ``python app.py``), then record it. Otherwise skip them.
+- ``skip``: never migrate at boot (the release step owns migrations).
+- ``always``: run them on every boot (previous behavior).
+
+This module only needs SQLAlchemy, so the release step can check the version without importing
+app.py.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Optional
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, create_engine, insert, inspect, select, update
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 6
+
+MIGRATIONS_AUTO = 'auto'
+MIGRATIONS_SKIP = 'skip'
+MIGRATIONS_ALWAYS = 'always'
+
+metadata = MetaData()
+
+schema_version = Table(
+    'schema_version', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=False),
+    Column('version', Integer, nullable=False),
+    Column('migrated_at', Float, nullable=False),
+)
+
+
+def migrations_mode() -> str:
+    mode = os.getenv('SCHEMA_MIGRATIONS', MIGRATIONS_AUTO).strip().lower()
+    return mode if mode in (MIGRATIONS_AUTO, MIGRATIONS_SKIP, MIGRATIONS_ALWAYS) else MIGRATIONS_AUTO
+
+
+def read_schema_version(engine) -> int:
+    """Stored schema version; 0 when the table is missing (fresh or pre-versioning database)."""
+    with engine.connect() as conn:
+        if not inspect(conn).has_table('schema_version'):
+            return 0
+        version = conn.execute(select(schema_version.c.version).where(schema_version.c.id == 1)).scalar()
+    return version or 0
+
+
+def record_schema_version(engine, version: int = SCHEMA_VERSION) -> None:
+    metadata.create_all(engine, checkfirst=True)
+    with engine.begin() as conn:
+        updated = conn.execute(
+            update(schema_version).where(schema_version.c.id == 1).values(version=version, migrated_at=time.time())
+        ).rowcount
+        if not updated:
+            conn.execute(insert(schema_version).values(id=1, version=version, migrated_at=time.time()))
+
+
+def schema_is_current(engine) -> bool:
+    try:
+        return read_schema_version(engine) >= SCHEMA_VERSION
+    except Exception as e:
+        logger.debug(f"schema_version check failed: {e}")
+        return False
+
+
+def should_migrate_on_boot(engine) -> bool:
+    mode = migrations_mode()
+    if mode == MIGRATIONS_ALWAYS:
+        return True
+    if mode == MIGRATIONS_SKIP:
+        return False
+    return not schema_is_current(engine)
+
+
+def database_url(project_root: Optional[str] = None) -> str:
+    """The URL app.py uses: DATABASE_URL, else instance/events.db."""
+    if os.getenv('DATABASE_URL'):
+        return os.getenv('DATABASE_URL')
+    project_root = project_root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return f"sqlite:///{os.path.join(project_root, 'instance', 'events.db')}"
+
+
+def schema_is_current_at(url: str) -> bool:
+    """``schema_is_current()`` for a URL, without importing the app."""
+    engine = create_engine(url)
+    try:
+        return schema_is_current(engine)
+    finally:
+        engine.dispose()
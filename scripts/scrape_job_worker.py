@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Worker process for queued admin scrapes (scripts/job_queue.py).
+
+The web app enqueues /api/scrape, /api/scrape-stream and /api/admin/scrape-* requests; this
+process claims them from the database and runs each one in a child process. Stop it with
+SIGTERM/Ctrl+C: it finishes the running job first. If it is killed mid-job, the job's lease
+expires and the next worker picks it up again (up to SCRAPE_JOB_MAX_ATTEMPTS).
+
+Usage:
+    source venv/bin/activate && python scripts/scrape_job_worker.py
+    python scripts/scrape_job_worker.py --once     # run queued jobs, then exit
+
+Procfile:
+    worker: python scripts/scrape_job_worker.py
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.job_queue import DEFAULT_RETENTION_DAYS, create_job_worker
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Run queued admin scrape jobs')
+    parser.add_argument('--once', action='store_true', help='run every runnable job, then exit')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    from app import app, run_scrape_job, scrape_job_queue
+
+    try:
+        retention_days = float(os.getenv('SCRAPE_JOB_RETENTION_DAYS', DEFAULT_RETENTION_DAYS))
+    except ValueError:
+        retention_days = DEFAULT_RETENTION_DAYS
+    with app.app_context():
+        pruned = scrape_job_queue.prune(retention_days)
+    if pruned:
+        logger.info(f"Pruned {pruned} finished jobs older than {retention_days:g} days")
+
+    worker = create_job_worker(scrape_job_queue, run_scrape_job)
+    if args.once:
+        while worker.run_once():
+            pass
+        return 0
+
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info('Stopping after the current job...')
+        stop.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    worker.run_forever(stop)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,6 +9,15 @@ from .session import (
     probe_public_ip_with_session,
     scraper_proxy_opt_in,
 )
+from .async_fetch import (
+    HTTPX_AVAILABLE,
+    AsyncFetchClient,
+    FetchResult,
+    fetch_many,
+)
+from .http_cache import HttpCache, cached_get, get_http_cache
+from .fingerprints import FingerprintStore, get_fingerprint_store
+from .html_parser import LXML_AVAILABLE, parse_cache, parse_html, select_parser
 from .date_parser import parse_date
 from .time_parser import parse_time, parse_time_range
 
@@ -20,6 +29,19 @@ __all__ = [
     'get_webshare_proxy_dict',
     'probe_public_ip_with_session',
     'scraper_proxy_opt_in',
+    'AsyncFetchClient',
+    'FetchResult',
+    'HTTPX_AVAILABLE',
+    'fetch_many',
+    'HttpCache',
+    'cached_get',
+    'get_http_cache',
+    'FingerprintStore',
+    'get_fingerprint_store',
+    'LXML_AVAILABLE',
+    'parse_html',
+    'parse_cache',
+    'select_parser',
     'parse_date',
     'parse_time',
     'parse_time_range',
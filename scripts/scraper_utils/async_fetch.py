@@ -0,0 +1,245 @@
+"""Concurrent page fetching for scrapers (detail-page fan-out).
+
+``AsyncFetchClient`` is an asyncio client on ``httpx`` with one pooled connection set per
+client, HTTP/2 when the ``h2`` package is installed, and a per-host concurrency cap.
+``fetch_many(urls)`` is the sync facade for existing scrapers: hand it the detail URLs
+collected from a listing page and get one ``FetchResult`` per URL back, in order.
+
+Proxy handling matches the requests sessions: pass ``scraper_key`` and the Webshare proxy
+is used when ``scraper_proxy_opt_in(scraper_key)`` says so (or force with ``use_proxy``).
+Retries mirror ``create_scraper_session``: 500/502/503/504 and connection errors, with
+exponential backoff.
+
+Without ``httpx`` installed, ``fetch_many`` falls back to a thread pool over a
+``create_scraper_session`` session with the same per-host cap.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from .session import (
+    DEFAULT_HEADERS,
+    _log_proxy_session_created,
+    create_scraper_session,
+    get_webshare_proxy_dict,
+    scraper_proxy_opt_in,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+DEFAULT_PER_HOST = 4
+DEFAULT_MAX_CONNECTIONS = 20
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one GET. ``error`` is set when no response was received."""
+    url: str
+    status_code: int = 0
+    content: bytes = b''
+    text: str = ''
+    headers: Dict[str, str] = field(default_factory=dict)
+    final_url: str = ''
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status_code < 400
+
+
+def _host(url: str) -> str:
+    return (urlparse(url).hostname or '').lower()
+
+
+def _resolve_use_proxy(scraper_key: Optional[str], use_proxy: Optional[bool]) -> bool:
+    if use_proxy is not None:
+        return use_proxy
+    return bool(scraper_key) and scraper_proxy_opt_in(scraper_key)
+
+
+class AsyncFetchClient:
+    """
+    Pooled asyncio HTTP client with per-host concurrency caps.
+
+    Usage::
+
+        async with AsyncFetchClient(scraper_key='nga') as client:
+            results = await client.fetch_all(detail_urls)
+    """
+
+    def __init__(
+        self,
+        scraper_key: Optional[str] = None,
+        use_proxy: Optional[bool] = None,
+        verify_ssl: bool = True,
+        per_host: int = DEFAULT_PER_HOST,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = 20.0,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+        headers: Optional[Dict[str, str]] = None,
+        http2: bool = True,
+    ):
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError('httpx is not installed; use fetch_many() for the requests fallback')
+        self.scraper_key = scraper_key
+        self.use_proxy = _resolve_use_proxy(scraper_key, use_proxy)
+        self.verify_ssl = verify_ssl
+        self.per_host = max(1, per_host)
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.retry_backoff = retry_backoff
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._client = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _transport(self, proxy_url: Optional[str]):
+        return httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            verify=self.verify_ssl,
+            proxy=proxy_url or None,
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections),
+        )
+
+    async def __aenter__(self) -> 'AsyncFetchClient':
+        proxies = get_webshare_proxy_dict() if self.use_proxy else None
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            mounts={
+                'http://': self._transport(proxies and proxies.get('http')),
+                'https://': self._transport(proxies and proxies.get('https')),
+            },
+        )
+        _log_proxy_session_created(
+            session_kind='httpx',
+            scraper_key=self.scraper_key,
+            use_proxy_requested=self.use_proxy,
+            proxy_applied=bool(proxies),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._client.aclose()
+        self._client = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = _host(url)
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    async def fetch(self, url: str) -> FetchResult:
+        """GET one URL, retrying 5xx and connection errors."""
+        async with self._host_limit(url):
+            for attempt in range(self.retries + 1):
+                try:
+                    response = await self._client.get(url)
+                except httpx.HTTPError as e:
+                    if attempt < self.retries:
+                        await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+                        continue
+                    logger.debug(f"fetch failed for {url}: {e}")
+                    return FetchResult(url=url, error=str(e) or e.__class__.__name__)
+                if response.status_code in RETRY_STATUS_CODES and attempt < self.retries:
+                    await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+                    continue
+                return FetchResult(
+                    url=url,
+                    status_code=response.status_code,
+                    content=response.content,
+                    text=response.text,
+                    headers=dict(response.headers),
+                    final_url=str(response.url),
+                )
+
+    async def fetch_all(self, urls: Iterable[str]) -> List[FetchResult]:
+        """Fetch all URLs concurrently; results are in input order."""
+        return list(await asyncio.gather(*(self.fetch(url) for url in urls)))
+
+
+async def _fetch_all_async(urls: List[str], client_kwargs: Dict) -> List[FetchResult]:
+    async with AsyncFetchClient(**client_kwargs) as client:
+        return await client.fetch_all(urls)
+
+
+def _fetch_many_with_requests(urls: List[str], client_kwargs: Dict) -> List[FetchResult]:
+    """Thread-pool fallback over one requests session (urllib3 pools connections per host)."""
+    use_proxy = _resolve_use_proxy(client_kwargs.get('scraper_key'), client_kwargs.get('use_proxy'))
+    session = create_scraper_session(
+        verify_ssl=client_kwargs.get('verify_ssl', True),
+        retry_total=client_kwargs.get('retries', 2),
+        retry_backoff=client_kwargs.get('retry_backoff', 1.0),
+        use_proxy=use_proxy,
+        scraper_key=client_kwargs.get('scraper_key'),
+    )
+    if client_kwargs.get('headers'):
+        session.headers.update(client_kwargs['headers'])
+    per_host = max(1, client_kwargs.get('per_host', DEFAULT_PER_HOST))
+    host_limits = defaultdict(lambda: threading.Semaphore(per_host))
+    for url in urls:
+        host_limits[_host(url)]  # create before threads start
+    timeout = client_kwargs.get('timeout', 20.0)
+
+    def fetch(url: str) -> FetchResult:
+        with host_limits[_host(url)]:
+            try:
+                response = session.get(url, timeout=timeout)
+            except Exception as e:
+                return FetchResult(url=url, error=str(e) or e.__class__.__name__)
+            return FetchResult(
+                url=url,
+                status_code=response.status_code,
+                content=response.content,
+                text=response.text,
+                headers=dict(response.headers),
+                final_url=response.url,
+            )
+
+    workers = min(len(urls), client_kwargs.get('max_connections', DEFAULT_MAX_CONNECTIONS)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fetch, urls))
+
+
+def fetch_many(urls: Iterable[str], **client_kwargs) -> List[FetchResult]:
+    """
+    Fetch URLs in parallel from synchronous code; returns one FetchResult per URL, in order.
+
+    Accepts the ``AsyncFetchClient`` keyword arguments (``scraper_key``, ``use_proxy``,
+    ``verify_ssl``, ``per_host``, ``timeout``, ...). Safe to call while an event loop is
+    running in this thread (the fetch then runs on a helper thread).
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    if not HTTPX_AVAILABLE:
+        return _fetch_many_with_requests(urls, client_kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_fetch_all_async(urls, client_kwargs))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _fetch_all_async(urls, client_kwargs)).result()
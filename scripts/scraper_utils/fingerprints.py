@@ -0,0 +1,268 @@
+"""Content fingerprints for incremental scraping.
+
+Two kinds of fingerprint are kept in a small SQLite file:
+
+- **Pages:** key (URL + extraction settings) → hash of the normalized page content and the
+  events extracted from it. When a listing page hashes the same as last run, its stored
+  events are replayed instead of parsing the page (and following its detail links) again.
+- **Event sets:** key (scraper / venue) → hash of the events a scraper returned. When a
+  scraper returns the same events as the last reconciled run, the database upsert is skipped.
+
+Fingerprints older than the max age are ignored (pages are re-parsed, event sets are
+reconciled again), so date-window filtering and manual database edits cannot drift forever. ``SCRAPER_FULL_RESCAN=1`` (or
+``force_full=True`` / ``--full-rescan`` on the cron script) ignores stored fingerprints for a
+run while still recording fresh ones.
+
+``store.stats`` counts checks and hits; ``format_stats()`` is logged at the end of cron runs.
+
+Configuration (env): ``SCRAPER_FINGERPRINT_PATH`` (default ``instance/scraper_fingerprints.sqlite3``),
+``SCRAPER_FINGERPRINT_MAX_AGE_DAYS`` (default 7), ``SCRAPER_FINGERPRINTS=0`` disables.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as time_class
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_FINGERPRINT_PATH = os.path.join(PROJECT_ROOT, 'instance', 'scraper_fingerprints.sqlite3')
+DEFAULT_MAX_AGE_DAYS = 7
+
+# Event keys that change on every run without the event changing
+VOLATILE_EVENT_KEYS = frozenset({'scraped_at'})
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS page_fingerprints (
+        key TEXT PRIMARY KEY,
+        content_hash TEXT NOT NULL,
+        events_hash TEXT NOT NULL,
+        events TEXT,
+        checked_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS event_fingerprints (
+        key TEXT PRIMARY KEY,
+        events_hash TEXT NOT NULL,
+        reconciled_at REAL NOT NULL
+    )
+    """,
+)
+
+# Markup that changes per request without changing the page: scripts (nonces, tracking,
+# build hashes), styles, comments, CSRF inputs and nonce attributes.
+_VOLATILE_MARKUP = re.compile(
+    rb'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<noscript\b.*?</noscript\s*>|<!--.*?-->'
+    rb'|<input\b[^>]*type=["\']?hidden[^>]*>|\snonce=["\'][^"\']*["\']',
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE = re.compile(rb'\s+')
+
+
+def normalize_content(content) -> bytes:
+    """Page bytes with volatile markup removed and whitespace collapsed."""
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'replace')
+    content = _VOLATILE_MARKUP.sub(b'', content or b'')
+    return _WHITESPACE.sub(b' ', content).strip()
+
+
+def page_fingerprint(content) -> str:
+    return hashlib.sha256(normalize_content(content)).hexdigest()
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    if isinstance(value, time_class):
+        return {'__time__': value.isoformat()}
+    raise TypeError(f"not serializable: {type(value).__name__}")
+
+
+def _decode_value(obj):
+    if '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    if '__date__' in obj:
+        return date.fromisoformat(obj['__date__'])
+    if '__time__' in obj:
+        return time_class.fromisoformat(obj['__time__'])
+    return obj
+
+
+def events_fingerprint(events: Iterable[Dict]) -> str:
+    """Order-independent hash of event dicts (volatile keys ignored)."""
+    canonical = sorted(
+        json.dumps({k: v for k, v in event.items() if k not in VOLATILE_EVENT_KEYS},
+                   sort_keys=True, default=str)
+        for event in events or []
+    )
+    return hashlib.sha256('\n'.join(canonical).encode('utf-8')).hexdigest()
+
+
+class PageCheck:
+    """Result of ``FingerprintStore.check_page``: ``unchanged`` pages carry their stored ``events``."""
+
+    def __init__(self, key: str, content_hash: str, unchanged: bool = False, events: Optional[List[Dict]] = None):
+        self.key = key
+        self.content_hash = content_hash
+        self.unchanged = unchanged
+        self.events = events or []
+
+
+class FingerprintStore:
+    """SQLite-backed page and event-set fingerprints with per-run hit counters.
+
+    Store errors never fail a scrape: lookups then report "changed" and writes are dropped.
+    """
+
+    def __init__(self, path: str, max_age_days: float = DEFAULT_MAX_AGE_DAYS, force_full: bool = False):
+        self.path = path
+        self.max_age_seconds = max_age_days * 86400
+        self.force_full = force_full
+        self.stats = {'pages_checked': 0, 'pages_unchanged': 0, 'event_sets_checked': 0, 'event_sets_unchanged': 0}
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def _write(self, sql: str, params) -> None:
+        # A failed write only costs a re-parse / re-reconcile next run
+        try:
+            conn = self._connect()
+            conn.execute(sql, params)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"fingerprint write failed: {e}")
+
+    def _count(self, checked: str, hit: str, unchanged: bool) -> None:
+        with self._stats_lock:
+            self.stats[checked] += 1
+            if unchanged:
+                self.stats[hit] += 1
+
+    def check_page(self, key: str, content) -> PageCheck:
+        """Fingerprint a fetched page; unchanged pages come back with their stored events."""
+        digest = page_fingerprint(content)
+        check = PageCheck(key, digest)
+        if not self.force_full:
+            try:
+                row = self._connect().execute(
+                    'SELECT content_hash, events, checked_at FROM page_fingerprints WHERE key = ?', (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"fingerprint lookup failed for {key}: {e}")
+                row = None
+            # Extraction filters by date, so even an unchanged page is re-parsed once stale
+            if row and row[0] == digest and row[1] is not None and time.time() - row[2] < self.max_age_seconds:
+                check.unchanged = True
+                check.events = json.loads(row[1], object_hook=_decode_value)
+        self._count('pages_checked', 'pages_unchanged', check.unchanged)
+        return check
+
+    def record_page(self, check: PageCheck, events: List[Dict]) -> None:
+        """Store the events parsed from a changed page under its new fingerprint."""
+        try:
+            payload = json.dumps(events, default=_encode_value)
+        except TypeError:
+            payload = None  # hash only: the page is parsed again next run
+        self._write(
+            'INSERT OR REPLACE INTO page_fingerprints (key, content_hash, events_hash, events, checked_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (check.key, check.content_hash, events_fingerprint(events), payload, time.time()),
+        )
+
+    def events_unchanged(self, key: str, events_hash: str) -> bool:
+        """True when ``events_hash`` matches the last reconciled set for ``key`` and it is not stale.
+
+        Hash with ``events_fingerprint()`` before saving: save handlers mutate the event dicts.
+        """
+        unchanged = False
+        if not self.force_full:
+            try:
+                row = self._connect().execute(
+                    'SELECT events_hash, reconciled_at FROM event_fingerprints WHERE key = ?', (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"fingerprint lookup failed for {key}: {e}")
+                row = None
+            unchanged = bool(row and row[0] == events_hash and time.time() - row[1] < self.max_age_seconds)
+        self._count('event_sets_checked', 'event_sets_unchanged', unchanged)
+        return unchanged
+
+    def mark_reconciled(self, key: str, events_hash: str) -> None:
+        """Record the event set just written to the database for ``key``."""
+        self._write(
+            'INSERT OR REPLACE INTO event_fingerprints (key, events_hash, reconciled_at) VALUES (?, ?, ?)',
+            (key, events_hash, time.time()),
+        )
+
+    def format_stats(self) -> str:
+        """``pages 3/5 unchanged (60%), event sets 8/12 unchanged (67%)``"""
+        def part(label, hits, checked):
+            rate = f" ({hits / checked:.0%})" if checked else ''
+            return f"{label} {hits}/{checked} unchanged{rate}"
+        with self._stats_lock:
+            stats = dict(self.stats)
+        line = ', '.join((
+            part('pages', stats['pages_unchanged'], stats['pages_checked']),
+            part('event sets', stats['event_sets_unchanged'], stats['event_sets_checked']),
+        ))
+        return line + (' [full rescan]' if self.force_full else '')
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+_store: Optional[FingerprintStore] = None
+_store_lock = threading.Lock()
+
+
+def get_fingerprint_store(force_full: Optional[bool] = None) -> Optional[FingerprintStore]:
+    """Process-wide store from environment settings, or None when disabled.
+
+    ``force_full`` switches the shared store into full-rescan mode (it stays on for the process).
+    """
+    global _store
+    if os.environ.get('SCRAPER_FINGERPRINTS', '').strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    with _store_lock:
+        if _store is None:
+            try:
+                max_age = float(os.getenv('SCRAPER_FINGERPRINT_MAX_AGE_DAYS', DEFAULT_MAX_AGE_DAYS))
+            except ValueError:
+                max_age = DEFAULT_MAX_AGE_DAYS
+            _store = FingerprintStore(
+                os.getenv('SCRAPER_FINGERPRINT_PATH') or DEFAULT_FINGERPRINT_PATH,
+                max_age,
+                force_full=_env_flag('SCRAPER_FULL_RESCAN'),
+            )
+        if force_full:
+            _store.force_full = True
+        return _store
@@ -0,0 +1,179 @@
+"""Shared HTML parsing for scrapers: lxml by default, parsed trees memoized per body.
+
+``parse_html(source)`` takes a ``requests`` response, bytes or str and returns a
+``BeautifulSoup`` tree:
+
+- **Parser:** ``lxml`` when installed (several times faster than ``html.parser``).
+  ``html.parser`` is used when lxml is missing, for hosts in the fallback list (sites
+  whose broken markup lxml repairs differently from what their scraper expects), and when
+  lxml fails or returns an empty tree for a non-empty page.
+- **Memoization:** the tree is cached on the response object and in a small LRU keyed by
+  the body's hash. Helpers that parse the same page again (listing and detail helpers,
+  or a body replayed from the HTTP cache) get the same tree back without re-parsing.
+  The tree is shared, so callers must not modify it (``decompose()``, ``extract()``).
+  Pass ``cache=False`` for a private copy.
+
+``scripts/diagnostics/benchmark_html_parsers.py`` compares the parsers on stored pages.
+
+Configuration (env): ``SCRAPER_HTML_PARSER`` (``lxml`` / ``html.parser``, default lxml),
+``SCRAPER_HTML_PARSER_FALLBACK_HOSTS`` (comma-separated hosts that always use html.parser),
+``SCRAPER_PARSE_CACHE_SIZE`` (default 32 trees; 0 disables the LRU).
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401 - BeautifulSoup 'lxml' tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER = 'html.parser'
+LXML_PARSER = 'lxml'
+DEFAULT_CACHE_SIZE = 32
+
+# Hosts whose scrapers depend on html.parser's handling of their malformed markup
+FALLBACK_HOSTS = frozenset()
+
+_CHARSET = re.compile(r'charset=([\w-]+)', re.IGNORECASE)
+_RESPONSE_ATTR = '_parsed_html'
+
+
+def _env_hosts() -> frozenset:
+    raw = os.getenv('SCRAPER_HTML_PARSER_FALLBACK_HOSTS', '')
+    return frozenset(host.strip().lower() for host in raw.split(',') if host.strip())
+
+
+def _host(url: Optional[str]) -> str:
+    host = (urlparse(url).hostname or '').lower() if url else ''
+    return host[4:] if host.startswith('www.') else host
+
+
+def select_parser(url: Optional[str] = None) -> str:
+    """Parser name for a page at ``url``."""
+    if not LXML_AVAILABLE or os.getenv('SCRAPER_HTML_PARSER', LXML_PARSER).strip().lower() == HTML_PARSER:
+        return HTML_PARSER
+    host = _host(url)
+    if host and (host in FALLBACK_HOSTS or host in _env_hosts()):
+        return HTML_PARSER
+    return LXML_PARSER
+
+
+class _ParseCache:
+    """Thread-safe LRU of parsed trees keyed by (body hash, parser)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[tuple, BeautifulSoup]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            soup = self._entries.get(key)
+            if soup is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return soup
+
+    def put(self, key, soup) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = soup
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def _cache_size() -> int:
+    try:
+        return int(os.getenv('SCRAPER_PARSE_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+    except ValueError:
+        return DEFAULT_CACHE_SIZE
+
+
+parse_cache = _ParseCache(_cache_size())
+
+
+def _declared_encoding(response) -> Optional[str]:
+    # requests defaults text/* to ISO-8859-1 without a charset; only trust an explicit one
+    headers = response.headers or {}
+    content_type = headers.get('Content-Type') or headers.get('content-type') or ''
+    match = _CHARSET.search(content_type)
+    return match.group(1) if match else None
+
+
+def _build(markup: Union[bytes, str], parser: str, from_encoding: Optional[str]) -> BeautifulSoup:
+    kwargs = {'from_encoding': from_encoding} if from_encoding and isinstance(markup, bytes) else {}
+    if parser == LXML_PARSER:
+        try:
+            soup = BeautifulSoup(markup, LXML_PARSER, **kwargs)
+            if soup.find(True) is not None or not markup.strip():
+                return soup
+            logger.debug('lxml returned an empty tree; re-parsing with html.parser')
+        except Exception as e:
+            logger.debug(f"lxml parse failed ({e}); re-parsing with html.parser")
+    return BeautifulSoup(markup, HTML_PARSER, **kwargs)
+
+
+def parse_html(source, url: Optional[str] = None, parser: Optional[str] = None, cache: bool = True) -> BeautifulSoup:
+    """
+    Parse a response / bytes / str into a (shared, read-only) BeautifulSoup tree.
+
+    ``url`` selects the parser for bare markup (responses use their own URL). ``parser``
+    forces one (e.g. ``'xml'`` for sitemaps).
+    """
+    from_encoding = None
+    response = None
+    if hasattr(source, 'content') and hasattr(source, 'headers'):
+        response = source
+        url = url or getattr(response, 'url', None)
+        from_encoding = _declared_encoding(response)
+        markup = response.content
+    else:
+        markup = source if source is not None else ''
+    parser = parser or select_parser(url)
+
+    if not cache:
+        return _build(markup, parser, from_encoding)
+
+    if response is not None:
+        memo = getattr(response, _RESPONSE_ATTR, None)
+        if memo is not None and parser in memo:
+            return memo[parser]
+
+    data = markup.encode('utf-8', 'surrogatepass') if isinstance(markup, str) else markup
+    key = (hashlib.sha1(data).hexdigest(), type(markup).__name__, parser, from_encoding)
+    soup = parse_cache.get(key)
+    if soup is None:
+        soup = _build(markup, parser, from_encoding)
+        parse_cache.put(key, soup)
+
+    if response is not None:
+        try:
+            memo = getattr(response, _RESPONSE_ATTR, None) or {}
+            memo[parser] = soup
+            setattr(response, _RESPONSE_ATTR, memo)
+        except AttributeError:
+            pass  # objects with __slots__
+    return soup
@@ -0,0 +1,217 @@
+"""Persistent HTTP validator cache for scraper fetches (conditional GET).
+
+Stores, per URL, the ``ETag`` / ``Last-Modified`` validators, the last 200 body and its
+content hash in a small SQLite file, so the next cron run can:
+
+- send ``If-None-Match`` / ``If-Modified-Since`` and get a 304 instead of the full page
+  (saves bandwidth through the paid proxy);
+- receive the cached body back as a normal 200 response on 304;
+- see ``response.content_unchanged`` (304, or a 200 whose body hash matches the previous
+  run) and skip re-parsing the page.
+
+Typical pattern::
+
+    response = cached_get(session, url, timeout=20)
+    if response.content_unchanged:
+        ...  # same page as last run
+
+Configuration (env): ``SCRAPER_HTTP_CACHE_PATH`` (default ``instance/scraper_http_cache.sqlite3``),
+``SCRAPER_HTTP_CACHE_MAX_AGE_DAYS`` (default 30; older entries are pruned),
+``SCRAPER_HTTP_CACHE=0`` disables the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_PATH = os.path.join(PROJECT_ROOT, 'instance', 'scraper_http_cache.sqlite3')
+DEFAULT_MAX_AGE_DAYS = 30
+
+# Response headers replayed with a cached body
+_REPLAYED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Content-Language')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    body BLOB,
+    headers TEXT,
+    encoding TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content or b'').hexdigest()
+
+
+class HttpCache:
+    """SQLite-backed store of validators, bodies and content hashes keyed by URL."""
+
+    def __init__(self, path: str, max_age_days: float = DEFAULT_MAX_AGE_DAYS):
+        self.path = path
+        self.max_age_seconds = max_age_days * 86400
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.execute(_SCHEMA)
+                    conn.execute(
+                        'DELETE FROM http_cache WHERE fetched_at < ?',
+                        (time.time() - self.max_age_seconds,),
+                    )
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            'SELECT etag, last_modified, content_hash, body, headers, encoding FROM http_cache WHERE url = ?',
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, body, headers, encoding = row
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': digest,
+            'body': body,
+            'headers': json.loads(headers or '{}'),
+            'encoding': encoding,
+        }
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for a conditional GET (empty when nothing usable is stored)."""
+        entry = self.lookup(url)
+        if not entry or entry['body'] is None:
+            return {}
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, response: requests.Response) -> str:
+        """Remember a 200 response; the body is kept only when it carries validators. Returns its hash."""
+        body = response.content
+        digest = content_hash(body)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        keep_body = bool(etag or last_modified)
+        headers = {name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers}
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO http_cache '
+            '(url, etag, last_modified, content_hash, body, headers, encoding, fetched_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (url, etag, last_modified, digest, body if keep_body else None,
+             json.dumps(headers), response.encoding, time.time()),
+        )
+        conn.commit()
+        return digest
+
+    def touch(self, url: str) -> None:
+        conn = self._connect()
+        conn.execute('UPDATE http_cache SET fetched_at = ? WHERE url = ?', (time.time(), url))
+        conn.commit()
+
+    def resolve(self, url: str, response: requests.Response) -> requests.Response:
+        """
+        Post-process a response fetched with ``conditional_headers(url)``.
+
+        A 304 becomes a 200 carrying the cached body. Sets ``from_cache`` and
+        ``content_unchanged`` attributes on the returned response.
+        """
+        entry = self.lookup(url)
+        if response.status_code == 304 and entry and entry['body'] is not None:
+            self.touch(url)
+            cached = requests.Response()
+            cached.status_code = 200
+            cached.reason = 'OK (cached)'
+            cached._content = entry['body']
+            cached.headers = CaseInsensitiveDict(entry['headers'])
+            cached.encoding = entry['encoding']
+            cached.url = response.url
+            cached.request = response.request
+            cached.from_cache = True
+            cached.content_unchanged = True
+            return cached
+
+        response.from_cache = False
+        response.content_unchanged = False
+        if response.status_code == 200:
+            digest = self.store(url, response)
+            response.content_unchanged = bool(entry and entry['content_hash'] == digest)
+        return response
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Process-wide cache from environment settings, or None when disabled."""
+    global _cache
+    if os.environ.get('SCRAPER_HTTP_CACHE', '').strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                max_age = float(os.getenv('SCRAPER_HTTP_CACHE_MAX_AGE_DAYS', DEFAULT_MAX_AGE_DAYS))
+            except ValueError:
+                max_age = DEFAULT_MAX_AGE_DAYS
+            _cache = HttpCache(os.getenv('SCRAPER_HTTP_CACHE_PATH') or DEFAULT_CACHE_PATH, max_age)
+        return _cache
+
+
+def cached_get(session, url: str, cache: Optional[HttpCache] = None, **kwargs) -> requests.Response:
+    """
+    ``session.get(url, **kwargs)`` as a conditional request against the HTTP cache.
+
+    Works with requests and cloudscraper sessions. Cache errors never fail the fetch: the
+    request is then sent unconditionally and returned as-is.
+    """
+    cache = cache or get_http_cache()
+    if cache is None:
+        return session.get(url, **kwargs)
+    try:
+        validators = cache.conditional_headers(url)
+    except sqlite3.Error as e:
+        logger.debug(f"http cache lookup failed for {url}: {e}")
+        return session.get(url, **kwargs)
+    request_kwargs = dict(kwargs)
+    if validators:
+        request_kwargs['headers'] = dict(kwargs.get('headers') or {}, **validators)
+    response = session.get(url, **request_kwargs)
+    try:
+        return cache.resolve(url, response)
+    except sqlite3.Error as e:
+        logger.debug(f"http cache update failed for {url}: {e}")
+        if response.status_code == 304:
+            return session.get(url, **kwargs)
+        return response
@@ -9,7 +9,7 @@ import re
 import logging
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 import requests
 import urllib3
@@ -97,7 +97,7 @@ def scrape_exhibition_detail(scraper, url: str) -> Optional[Dict]:
         response = scraper.get(url, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract title
         title_elem = soup.find('h1') or soup.find('title')
@@ -189,7 +189,7 @@ def scrape_african_art_exhibitions(scraper=None) -> List[Dict]:
         response = scraper.get(AFRICAN_ART_EXHIBITIONS_URL, timeout=15, allow_redirects=True)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         page_title = soup.title.string if soup.title else 'No title'
         logger.info(f"   📄 Page title: {page_title}")
@@ -9,7 +9,7 @@ import re
 import logging
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 import requests
 from requests.exceptions import Timeout, RequestException, ConnectionError, ReadTimeout, ConnectTimeout, HTTPError
@@ -469,7 +469,7 @@ def scrape_exhibition_detail(scraper, url: str, max_retries: int = 1) -> Optiona
 
     try:
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract title
         title = None
@@ -632,7 +632,7 @@ def scrape_asian_art_exhibitions(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping Asian Art exhibitions (fetch failed).")
             return events
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find all exhibition items - they're in h3 headings
         exhibitions = soup.find_all('h3')
@@ -917,7 +917,7 @@ def scrape_event_detail(scraper, url: str, max_retries: int = 1) -> Optional[Dic
 
     try:
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract title
         title = None
@@ -1423,7 +1423,7 @@ def scrape_asian_art_events(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping Asian Art events (fetch failed).")
             return events
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find event links - they're in h3 headings with links to /whats-on/events/search/event:ID
         event_links = soup.find_all('a', href=re.compile(r'/whats-on/events/search/event:', re.I))
@@ -1481,7 +1481,7 @@ def scrape_asian_art_films(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping Asian Art films (fetch failed).")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find event links - they're in h3 headings with links to /whats-on/events/search/event:ID
         event_links = soup.find_all('a', href=re.compile(r'/whats-on/events/search/event:', re.I))
@@ -1546,7 +1546,7 @@ def scrape_asian_art_performances(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping Asian Art performances (fetch failed).")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find event links - they're in h3 headings with links to /whats-on/events/search/event:ID
         event_links = soup.find_all('a', href=re.compile(r'/whats-on/events/search/event:', re.I))
@@ -28,7 +28,7 @@ from bs4 import BeautifulSoup
 
 from scripts.event_database_handler import create_events_in_database
 from scripts.scraper_db_lookup import resolve_city_by_name, resolve_venue_in_city
-from scripts.scraper_utils import create_cloudscraper_session, scraper_proxy_opt_in
+from scripts.scraper_utils import create_cloudscraper_session, parse_html, scraper_proxy_opt_in
 from scripts.wharf_dc_scraper import get_event_urls_from_venue
 
 logger = logging.getLogger(__name__)
@@ -214,7 +214,7 @@ def _is_candidate_tour_url(url: str) -> bool:
 
 def _parse_tour_links_from_listing(html: str, listing_url: str) -> List[Tuple[str, str]]:
     """Return list of (absolute_url, link_text) for tour detail pages."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     seen: Dict[str, str] = {}
     for a in soup.select('a[href*="bigonion.com"]'):
         href = (a.get("href") or "").strip()
@@ -248,7 +248,7 @@ def _meta_content(soup: BeautifulSoup, prop: str) -> Optional[str]:
 
 
 def _parse_json_ld_events(html: str) -> List[dict]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     out = []
     for script in soup.find_all("script", type="application/ld+json"):
         raw = script.string or script.get_text() or ""
@@ -589,7 +589,7 @@ def _resolve_tour_title(soup: BeautifulSoup, page_url: str, json_ld_name: Option
 
 def _enrich_from_detail(html: str, page_url: str) -> Dict[str, Any]:
     """Pull description, image, location, price, and schedule from a tour detail page."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     out: Dict[str, Any] = {}
     desc = _meta_content(soup, "og:description") or _meta_content(soup, "description")
     if desc:
@@ -10,7 +10,7 @@ import logging
 import json
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional, Tuple
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin
 import requests
 import urllib3
@@ -103,7 +103,7 @@ def scrape_event_details(scraper, event_url: str) -> Dict:
         logger.info(f"  ∟ 🔍 Fetching details from: {event_url}")
         response = scraper.get(event_url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # 1. Extract Image
         # Look for the main event image
@@ -146,7 +146,7 @@ def scrape_culture_dc() -> List[Dict]:
         logger.info(f"🚀 Starting scrape for {VENUE_NAME}...")
         response = scraper.get(EVENTS_URL, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Look for links to /events/
         event_links = soup.find_all('a', href=re.compile(r'/events/'))
@@ -15,7 +15,7 @@ import sys
 sys.path.insert(0, str(project_root))
 
 import requests
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 from scripts.event_database_handler import create_events_in_database
 
@@ -82,7 +82,7 @@ def _scrape_faq_route_and_timing(session: requests.Session) -> dict:
     try:
         resp = session.get(DCPARADE_FAQ_URL, timeout=10)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = parse_html(resp)
         page_text = soup.get_text()
 
         # Route: "starts on 6th and Eye St NW and ends on 6th and H"
@@ -135,7 +135,7 @@ def scrape_dcparade_events() -> list:
     try:
         resp = session.get(DCPARADE_URL, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = parse_html(resp)
 
         # Title from h2 or h1
         title = None
@@ -14,7 +14,7 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -232,7 +232,7 @@ def scrape_deyoung_events() -> List[Dict]:
     if not html:
         return events
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     today = date.today()
 
     links = soup.find_all(
@@ -310,7 +310,7 @@ def _scrape_calendar_events(session, today: date) -> List[Dict]:
         logger.warning(f"Failed to fetch de Young calendar: {e}")
         return events
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     seen_urls = set()
 
     for a in soup.find_all("a", href=True):
@@ -15,7 +15,7 @@ import logging
 from datetime import datetime, timedelta, date, time
 from typing import List, Dict, Optional, Any
 from urllib.parse import urlparse, parse_qs, urlencode
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 import time as time_module
 
 # Add project root to path
@@ -794,7 +794,7 @@ class EventbriteScraper:
             response = scraper.get(search_url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response)
             
             # Find organizer links in the page
             # Eventbrite organizer links typically look like: /o/organizer-name-1234567890
@@ -27,6 +27,9 @@ from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
+from scripts.llm_batch import compact_page_text
+from scripts import title_rules
 import requests
 from requests.exceptions import Timeout, ConnectionError, RequestException
 import requests.exceptions
@@ -38,6 +41,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scripts.scraper_utils import (
     CLOUDSCRAPER_AVAILABLE,
     apply_webshare_proxy_to_session,
+    cached_get,
     create_cloudscraper_session,
 )
 
@@ -131,9 +135,9 @@ class GenericVenueScraper:
                 
                 if use_cloudscraper and CLOUDSCRAPER_AVAILABLE:
                     scraper = self._get_cloudscraper(base_url or url)
-                    response = scraper.get(url, timeout=20, verify=False)
+                    response = cached_get(scraper, url, timeout=20, verify=False)
                 else:
-                    response = self.session.get(url, timeout=20)
+                    response = cached_get(self.session, url, timeout=20)
                 
                 # If we get a 403 and not using cloudscraper yet, try cloudscraper
                 if response.status_code == 403 and not use_cloudscraper and CLOUDSCRAPER_AVAILABLE:
@@ -149,7 +153,7 @@ class GenericVenueScraper:
                             pass
                         # Now retry with cloudscraper
                         try:
-                            response = scraper.get(url, timeout=20, verify=False)
+                            response = cached_get(scraper, url, timeout=20, verify=False)
                             if response.status_code == 200:
                                 return response
                             # If still 403, continue to next attempt
@@ -333,6 +337,7 @@ class GenericVenueScraper:
         """
         events = []
         llm_fallback_used = False  # Track if we've already used LLM fallback
+        llm_pages = []  # JS-rendered pages without pattern matches, sent to the LLM together
         
         try:
             logger.info(f"🔍 Generic scraper: Starting scrape for {venue_url}")
@@ -354,7 +359,7 @@ class GenericVenueScraper:
                 try:
                     page_events = self._scrape_event_page(
                         page_url, venue_name, event_type, time_range, 
-                        use_llm_fallback=not llm_fallback_used
+                        use_llm_fallback=not llm_fallback_used, llm_pages=llm_pages
                     )
                     # If LLM fallback was used and returned events, mark it
                     if page_events and any(e.get('llm_extracted') for e in page_events):
@@ -375,13 +380,16 @@ class GenericVenueScraper:
                 logger.info(f"   Scraping main page: {venue_url}")
                 main_events = self._scrape_event_page(
                     venue_url, venue_name, event_type, time_range,
-                    use_llm_fallback=not llm_fallback_used
+                    use_llm_fallback=not llm_fallback_used, llm_pages=llm_pages
                 )
                 if main_events and any(e.get('llm_extracted') for e in main_events):
                     llm_fallback_used = True
                 logger.info(f"      Found {len(main_events)} events on main page")
                 events.extend(main_events)
             
+            if llm_pages:
+                events.extend(self._extract_events_with_llm(llm_pages, venue_url, venue_name, event_type))
+            
             logger.info(f"   Total events before deduplication: {len(events)}")
             
             # Deduplicate
@@ -444,7 +452,7 @@ class GenericVenueScraper:
                 logger.info(f"📄 Discovered {len(event_pages)} potential event pages (from common paths)")
                 return event_pages[:10]  # Return common paths even if main page fails
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response)
             
             # Museum-specific event page keywords (prioritized)
             museum_keywords = [
@@ -742,18 +750,7 @@ Important:
                     try:
                         llm_events = json.loads(json_match.group())
                         for event_data in llm_events:
-                            event = {
-                                'title': event_data.get('title', ''),
-                                'description': event_data.get('description', ''),
-                                'start_date': event_data.get('start_date'),
-                                'end_date': event_data.get('end_date'),
-                                'event_type': event_data.get('event_type', event_type or 'exhibition'),
-                                'url': event_data.get('url', venue_url),
-                                'image_url': event_data.get('image_url'),  # Include image URL from LLM extraction
-                                'venue_name': venue_name,
-                                'llm_extracted': True,
-                                'confidence': 'medium'
-                            }
+                            event = self._llm_event(event_data, venue_url, venue_name, event_type)
                             if event['title']:
                                 events.append(event)
                         logger.info(f"✅ LLM fallback extracted {len(events)} events")
@@ -769,9 +766,81 @@ Important:
         
         return events
     
+    def _llm_event(self, event_data: Dict, venue_url: str, venue_name: str = None,
+                   event_type: str = None) -> Dict:
+        """Event dict from one LLM-extracted item"""
+        return {
+            'title': event_data.get('title', ''),
+            'description': event_data.get('description', ''),
+            'start_date': event_data.get('start_date'),
+            'end_date': event_data.get('end_date'),
+            'event_type': event_data.get('event_type', event_type or 'exhibition'),
+            'url': event_data.get('url', venue_url),
+            'image_url': event_data.get('image_url'),  # Include image URL from LLM extraction
+            'venue_name': venue_name,
+            'llm_extracted': True,
+            'confidence': 'medium'
+        }
+    
+    def _extract_events_with_llm(self, pages: List[Dict[str, str]], venue_url: str,
+                                 venue_name: str = None, event_type: str = None) -> List[Dict]:
+        """Extract events from JS-rendered pages' text with batched LLM queries
+        
+        Args:
+            pages: [{'id': page URL, 'content': compact page text}] queued by _scrape_event_page
+        
+        Falls back to _use_llm_fallback_for_venue (one knowledge-based query) when the
+        pages' text yields no events.
+        """
+        events = []
+        try:
+            from scripts.enhanced_llm_fallback import EnhancedLLMFallback
+            logger.info(f"🤖 Using LLM extraction for {len(pages)} JS-rendered page(s) of {venue_name or venue_url}")
+            
+            instructions = f"""Extract current and upcoming exhibitions/events at {venue_name or 'this museum'} (website: {venue_url}) from the webpage text.
+
+The result is a JSON array of events with this structure:
+[
+    {{
+        "title": "exhibition or event name",
+        "description": "brief description",
+        "start_date": "YYYY-MM-DD or null",
+        "end_date": "YYYY-MM-DD or null",
+        "event_type": "exhibition or event",
+        "url": "event page URL if given, else null"
+    }}
+]
+
+Important:
+- Use only information in the webpage text; the result is [] when it lists no events
+- Include only current or upcoming events (not past)
+- Use null for missing dates"""
+            
+            llm = EnhancedLLMFallback(silent=True)
+            results = llm.extract_batch(instructions, pages)
+            for page in pages:
+                page_events = results.get(page['id'])
+                if not isinstance(page_events, list):
+                    continue
+                for event_data in page_events:
+                    if not isinstance(event_data, dict):
+                        continue
+                    event = self._llm_event(event_data, page['id'], venue_name, event_type)
+                    if event['title']:
+                        events.append(event)
+            logger.info(f"✅ LLM extraction found {len(events)} events on {len(pages)} page(s)")
+        except Exception as e:
+            logger.debug(f"Error in batched LLM extraction: {e}")
+        
+        if not events:
+            base_url = urlparse(venue_url).scheme + '://' + urlparse(venue_url).netloc
+            events = self._use_llm_fallback_for_venue(base_url, venue_name, event_type)
+        return events
+    
     def _scrape_event_page(self, url: str, venue_name: str = None, 
                           event_type: str = None, time_range: str = 'this_month',
-                          use_llm_fallback: bool = True) -> List[Dict]:
+                          use_llm_fallback: bool = True,
+                          llm_pages: Optional[List[Dict[str, str]]] = None) -> List[Dict]:
         """Scrape events from a single page
         
         Args:
@@ -780,6 +849,8 @@ Important:
             event_type: Optional event type filter
             time_range: Time range filter
             use_llm_fallback: Whether to use LLM fallback if page is JS-rendered (default: True)
+            llm_pages: When given, JS-rendered pages are queued here for one batched LLM
+                extraction (see _extract_events_with_llm) instead of querying per page
         """
         events = []
         
@@ -807,7 +878,7 @@ Important:
             
             html_content = response.text
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content)
             
             # Check if page is JavaScript-rendered (but still try pattern matching first!)
             is_js_rendered = self._is_javascript_rendered(soup)
@@ -874,6 +945,10 @@ Important:
             # 2. Pattern matching found no events AND
             # 3. LLM fallback is enabled
             if is_js_rendered and len(events) == 0 and use_llm_fallback:
+                if llm_pages is not None:
+                    logger.info(f"⚠️  Pattern matching found no events on JS-rendered page, queued for LLM extraction")
+                    llm_pages.append({'id': url, 'content': compact_page_text(soup)})
+                    return events
                 logger.info(f"⚠️  Pattern matching found no events on JS-rendered page, trying LLM fallback...")
                 llm_events = self._use_llm_fallback_for_venue(base_url, venue_name, event_type)
                 if llm_events:
@@ -1071,21 +1146,9 @@ Important:
         if not title or len(title) < 3:
             return False
         
-        title_lower = title.lower().strip()
-        title_original = title.strip()
-        
-        # Filter out permanent collection/gallery pages (not temporary exhibitions)
-        permanent_collection_patterns = [
-            r'^gallery\s+highlights?$',
-            r'^permanent\s+collection',
-            r'^collection\s+highlights?',
-            r'^on\s+view\s+permanent',
-            r'^permanent\s+galleries?',
-            r'^highlights?\s+of\s+the\s+collection',
-        ]
-        for pattern in permanent_collection_patterns:
-            if re.match(pattern, title_lower, re.IGNORECASE):
-                return False
+        # Permanent collection pages, calendar/navigation widgets, code and bare dates
+        if title_rules.is_page_element(title):
+            return False
         
         # Filter out URLs that indicate permanent galleries (not exhibitions)
         if url:
@@ -1102,81 +1165,6 @@ Important:
             if has_permanent_indicator and not has_exhibition_indicator:
                 return False
         
-        # Filter out navigation and page elements
-        invalid_patterns = [
-            # Calendar navigation - day abbreviations (with or without double letters)
-            r'^(s?sun|m?mon|t?tue|w?wed|t?thu|f?fri|s?sat)$',
-            # Calendar event counts
-            r'^\d+\s+events?,\s*\d+$',  # "0 events,3", "1 event,5"
-            r'^\d+\s+event,\d+$',  # "1 event,5"
-            r'^\d+\s+event,\s*\d+$',  # "1 event, 5"
-            # Navigation elements
-            r'^events?\s+search',  # "Events Search"
-            r'^event\s+views?\s+navigation',  # "Event Views Navigation"
-            r'^calendar\s+of\s+events?$',  # "Calendar of Events"
-            r'^view\s+calendar$',
-            r'^view\s+all\s+events?$',
-            r'^upcoming\s+events?$',
-            r'^past\s+events?$',
-            r'^all\s+events?$',
-            # Generic page elements
-            r'^(details?|organizer|venue|location|date|time)$',
-            r'^(filter|search|browse|explore)$',
-            r'^(loading|loading\s+view)$',
-            r'^(month|list|week|photo|day)$',
-            r'^(select\s+date|this\s+month)$',
-            # JavaScript/function code
-            r'^\s*\(?\s*function\s*\(',
-            r'^\s*var\s+\w+\s*=',
-            r'^\s*if\s*\(',
-            # Very short or generic
-            r'^[a-z]$',  # Single letter
-            r'^\d+$',  # Just numbers
-            r'^[a-z]\d+$',  # "M1", "T2", etc.
-            # Date-only patterns without event name
-            r'^(december|january|february|march|april|may|june|july|august|september|october|november)\s+\d+\s*@?\s*\d+:\d+',  # "December 5 @ 10:00"
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.match(pattern, title_lower, re.IGNORECASE):
-                return False
-        
-        # Filter out titles that are clearly not events (exact matches)
-        invalid_keywords = [
-            'details', 'organizer', 'venue', 'location', 'date:', 'time:',
-            'filter', 'search', 'browse', 'explore', 'loading', 'select',
-            'month', 'list', 'week', 'photo', 'day', 'sun', 'mon', 'tue',
-            'wed', 'thu', 'fri', 'sat', 'view calendar', 'view all',
-            'upcoming events', 'past events', 'all events', 'all past events', 'all past events→', 'calendar of events',
-            'ssun', 'mmon', 'ttue', 'wwed', 'tthu', 'ffri', 'ssat',
-            'events search and views navigation', 'event views navigation',
-            'upcoming events', 'past events', 'all events',
-            'gallery highlights',  # Permanent collection pages
-        ]
-        
-        if title_lower in invalid_keywords:
-            return False
-        
-        # Filter out titles that end with navigation symbols (arrows, etc.)
-        if title.endswith('→') or title.endswith('←') or title.endswith('›') or title.endswith('»'):
-            return False
-        
-        # Filter out titles that start with invalid keywords (partial match)
-        for keyword in ['details', 'organizer', 'venue', 'filter', 'search', 'loading', 'gallery highlights']:
-            if title_lower.startswith(keyword + ' ') or title_lower == keyword:
-                return False
-        
-        # Filter out titles that are just dates/times without event info
-        # Pattern: "Month Day @ Time" or "Month Day Time"
-        date_time_pattern = r'^(december|january|february|march|april|may|june|july|august|september|october|november)\s+\d+(\s*@\s*|\s+)\d+:\d+'
-        if re.match(date_time_pattern, title_lower):
-            # This is just a date/time string, not an event title
-            return False
-        
-        # Filter out very short titles that are likely navigation
-        if len(title_original) <= 5 and title_lower in ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat']:
-            return False
-        
         return True
     
     def _clean_title(self, title: str) -> str:
@@ -1450,7 +1438,7 @@ Important:
                     # Use fetch_with_retry for better bot protection handling
                     event_response = self._fetch_with_retry(url, base_url=base_url)
                     if event_response and event_response.status_code == 200:
-                        event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                        event_soup = parse_html(event_response)
                         # Try to find the main content area, but be more specific
                         # Look for article, main, or content containers, but prefer more specific ones
                         event_main_content = None
@@ -3083,7 +3071,7 @@ Important:
                             continue
                         
                         if event_response.status_code == 200:
-                            event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                            event_soup = parse_html(event_response)
                             
                             # Extract dates from the exhibition detail page (MoPOP format)
                             # Look for patterns like "Open now through November 10, 2025" or "Opens March 4, 2017"
@@ -3441,7 +3429,7 @@ Important:
                             continue
                         
                         if event_response.status_code == 200:
-                            event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                            event_soup = parse_html(event_response)
                             # Use enhanced image extraction on the full page
                             image_url = self._extract_image(event_soup, base_url)
                             if image_url:
@@ -3644,7 +3632,7 @@ Important:
                                     if not event_response:
                                         logger.debug(f"   ⚠️  Could not fetch event page for date extraction: {full_url}")
                                     elif event_response.status_code == 200:
-                                        event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                                        event_soup = parse_html(event_response)
                                         
                                         # Strategy 1: Look for date patterns in headings (common pattern)
                                         # This handles cases like "January 15, 20267:30 pm" where date and time are concatenated
@@ -4025,7 +4013,7 @@ Important:
                                     logger.debug(f"   🖼️  No image on listing page, trying event page: {full_url}")
                                     event_response = self._fetch_with_retry(full_url, base_url=base_url)
                                     if event_response and event_response.status_code == 200:
-                                        event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                                        event_soup = parse_html(event_response)
                                         image_url = self._extract_image(event_soup, base_url)
                                         if image_url:
                                             logger.info(f"   ✅ Found image from event page: {image_url[:80]}")
@@ -4042,7 +4030,7 @@ Important:
                                     if not event_response:
                                         logger.debug(f"   ⚠️  Could not fetch event page for date extraction: {full_url}")
                                     elif event_response.status_code == 200:
-                                        event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                                        event_soup = parse_html(event_response)
                                         # Look for dates on the event page - check h2 headings first (common pattern)
                                         # Find all headings and check their text for date patterns
                                         all_headings = event_soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
@@ -4268,24 +4256,7 @@ Important:
     
     def _is_shopping_event(self, title: str, description: str = '', url: str = '') -> bool:
         """Detect if an event is shopping-related and should be excluded"""
-        combined_text = f"{title.lower()} {description.lower()} {url.lower()}"
-        
-        # Keywords that indicate shopping events
-        shopping_keywords = [
-            'pop-up', 'popup', 'pop up',
-            'shopping', 'retail', 'store', 'boutique',
-            'sale', 'discount', 'clearance',
-            'lingerie', 'fashion', 'clothing', 'apparel',
-            'holiday shopping', 'shopping event', 'shopping day',
-            'market', 'vendor', 'merchant',
-            'exclusive shopping', 'private shopping',
-            'trunk show', 'sample sale'
-        ]
-        
-        if any(keyword in combined_text for keyword in shopping_keywords):
-            return True
-        
-        return False
+        return title_rules.is_shopping(title, description, url)
     
     def _detect_family_friendly(self, title: str, description: str = '', element=None) -> bool:
         """Detect if an event is family/kid/baby-friendly"""
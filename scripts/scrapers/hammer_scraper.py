@@ -10,7 +10,7 @@ from datetime import date, datetime, time
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -207,7 +207,7 @@ def scrape_hammer_events() -> List[Dict]:
     if not html:
         return events
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     today = date.today()
 
     # Find all occurrence blocks (each has date, parent link, title, etc.)
@@ -25,6 +25,7 @@ sys.path.insert(0, str(project_root))
 from bs4 import BeautifulSoup
 
 from scripts.scraper_logging import get_scraper_logger
+from scripts.scraper_utils import parse_html
 
 logger = get_scraper_logger(__name__)
 
@@ -407,7 +408,7 @@ def _map_exhibition_post(raw: Dict[str, Any]) -> Dict[str, Any]:
 def _events_from_listing_jsonld(html_text: str) -> List[Dict[str, Any]]:
     """Minimal fallback: JSON-LD Event blocks on exhibitions-events page."""
     events: List[Dict[str, Any]] = []
-    soup = BeautifulSoup(html_text, 'html.parser')
+    soup = parse_html(html_text)
     for script in soup.find_all('script', type='application/ld+json'):
         try:
             data = json.loads(script.string or '')
@@ -587,6 +588,7 @@ def create_events_in_database(events: List[Dict[str, Any]]) -> Tuple[int, int, i
             logger_instance=logger,
             source_url=TRIBE_EVENTS_API,
             custom_event_processor=processor,
+            collapse_series=True,  # Tribe lists each daily tour occurrence separately
         )
 
 
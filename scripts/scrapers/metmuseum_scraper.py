@@ -24,7 +24,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import requests
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 from scripts.event_database_handler import create_events_in_database
 from scripts.scraper_db_lookup import resolve_city_by_name, resolve_venue_in_city
@@ -272,7 +272,7 @@ def _fetch_met_free_tours_html() -> Optional[str]:
 
 def parse_met_free_tours_html(html: str) -> List[Dict[str, Any]]:
     """Parse Met /es/tours HTML into event dicts (caller filters English if needed)."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     main = soup.find("main")
     if not main:
         return []
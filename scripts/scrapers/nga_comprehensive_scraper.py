@@ -10,6 +10,7 @@ import json
 import logging
 from datetime import datetime, date, time, timedelta
 from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 import platform
 
@@ -26,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 # Import shared progress update function
 from scripts.utils import update_scraping_progress
+from scripts.progress_bus import progress
+from scripts.scraper_utils import cached_get
 
 VENUE_NAME = "National Gallery of Art"
 CITY_NAME = "Washington, DC"
@@ -147,7 +150,7 @@ def fetch_with_retry(scraper, url, max_retries=3, delay=2):
                 logger.error("   nga: no session available url=%s", url)
                 return None
 
-            response = current_scraper.get(url, timeout=20)
+            response = cached_get(current_scraper, url, timeout=20)
             last_response = response
             last_status = response.status_code
 
@@ -456,7 +459,7 @@ def scrape_nga_exhibitions(scraper):
                     logger.warning(f"   ⚠️  Failed to fetch exhibitions page {page} after retries")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = parse_html(response)
                 
                 page_entries = []
                 all_links = soup.find_all('a', href=True)
@@ -518,7 +521,7 @@ def scrape_nga_exhibition_page(exhibition_url, scraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract title - prioritize OG title, then title tag, then H1 (skip generic H1s like "Global Search")
@@ -761,7 +764,7 @@ def scrape_nga_tours(scraper):
                     logger.warning(f"   ⚠️  Failed to fetch tours page {page} after retries")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = parse_html(response)
                 
                 # Find all tour event links on this page
                 page_links = []
@@ -836,23 +839,11 @@ def scrape_nga_tours(scraper):
         total_tours = len(tour_links)
         for idx, tour_url in enumerate(tour_links, 1):
             try:
-                # Update progress during tour scraping
-                if total_tours > 0 and idx % max(1, total_tours // 5) == 0:  # Update every 20% or at least once
-                    try:
-                        import json
-                        progress_file = os.path.join(project_root, 'scraping_progress.json')
-                        if os.path.exists(progress_file):
-                            with open(progress_file, 'r') as f:
-                                progress_data = json.load(f)
-                            progress_data.update({
-                                'message': f'Scraping tours... ({idx}/{total_tours})',
-                                'timestamp': datetime.now().isoformat(),
-                                'events_found': len(events) if 'events' in locals() else 0
-                            })
-                            with open(progress_file, 'w') as f:
-                                json.dump(progress_data, f)
-                    except Exception:
-                        pass
+                # Update progress during tour scraping (in memory; the progress bus flushes it)
+                progress.update(
+                    message=f'Scraping tours... ({idx}/{total_tours})',
+                    events_found=len(events) if 'events' in locals() else 0,
+                )
                 
                 logger.debug(f"   📄 Scraping tour {idx}/{len(tour_links)}: {tour_url}")
                 event_data = scrape_nga_tour_page(tour_url, scraper)
@@ -912,7 +903,7 @@ def scrape_nga_tour_page(tour_url, scraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract title - prioritize OG title and title tag over H1 (H1 might be navigation)
@@ -1079,7 +1070,7 @@ def scrape_nga_films(scraper):
             logger.warning(f"   ⚠️  Failed to fetch films page after retries")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find all film event links - they use the same pattern as tours (calendar URLs with evd parameter)
         film_links = []
@@ -1125,23 +1116,11 @@ def scrape_nga_films(scraper):
         total_films = len(film_links)
         for idx, film_url in enumerate(film_links, 1):
             try:
-                # Update progress during film scraping
-                if total_films > 0 and idx % max(1, total_films // 5) == 0:  # Update every 20% or at least once
-                    try:
-                        import json
-                        progress_file = os.path.join(project_root, 'scraping_progress.json')
-                        if os.path.exists(progress_file):
-                            with open(progress_file, 'r') as f:
-                                progress_data = json.load(f)
-                            progress_data.update({
-                                'message': f'Scraping films... ({idx}/{total_films})',
-                                'timestamp': datetime.now().isoformat(),
-                                'events_found': len(events) if 'events' in locals() else 0
-                            })
-                            with open(progress_file, 'w') as f:
-                                json.dump(progress_data, f)
-                    except Exception:
-                        pass
+                # Update progress during film scraping (in memory; the progress bus flushes it)
+                progress.update(
+                    message=f'Scraping films... ({idx}/{total_films})',
+                    events_found=len(events) if 'events' in locals() else 0,
+                )
                 
                 logger.debug(f"   📄 Scraping film {idx}/{len(film_links)}: {film_url}")
                 event_data = scrape_nga_film_page(film_url, scraper)
@@ -1217,7 +1196,7 @@ def scrape_nga_nights(scraper):
             logger.warning("   ⚠️  Failed to fetch National Gallery Nights page")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract title, description, image
@@ -1273,7 +1252,7 @@ def scrape_nga_nights(scraper):
                                     try:
                                         ev_resp = fetch_with_retry(scraper, ev_url, max_retries=2, delay=1)
                                         if ev_resp:
-                                            ev_soup = BeautifulSoup(ev_resp.text, 'html.parser')
+                                            ev_soup = parse_html(ev_resp)
                                             ev_text = ev_soup.get_text()
                                             ev_og = ev_soup.find('meta', property='og:image')
                                             if ev_og and ev_og.get('content'):
@@ -1396,7 +1375,7 @@ def scrape_nga_film_page(film_url, scraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract title - prioritize OG title and title tag over H1
@@ -1529,7 +1508,7 @@ def scrape_nga_talks(scraper):
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = parse_html(response)
                 
                 # Find all talk/lecture links
                 talk_links = []
@@ -1570,7 +1549,7 @@ def scrape_nga_talk_page(talk_url, scraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract title
@@ -1641,7 +1620,7 @@ def scrape_nga_calendar_events(scraper):
         if not response:
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find all event links (excluding ones we've already scraped)
         event_links = []
@@ -1681,7 +1660,7 @@ def scrape_nga_generic_event_page(event_url, scraper):
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract title
@@ -2035,27 +2014,18 @@ def create_events_in_database(events):
             batch_size=5,
             logger_instance=logger,
             source_url=NGA_CALENDAR_URL,
-            custom_event_processor=nga_event_processor
+            custom_event_processor=nga_event_processor,
+            bulk=True,  # hundreds of recurring tour instances per run
+            collapse_series=True  # ...which are stored as event series
         )
         
-        # Update progress file (NGA-specific)
-        try:
-            import json
-            progress_file = os.path.join(project_root, 'scraping_progress.json')
-            if os.path.exists(progress_file):
-                with open(progress_file, 'r') as f:
-                    progress_data = json.load(f)
-                progress_data.update({
-                    'events_saved': created_count,
-                    'events_updated': updated_count,
-                    'percentage': min(80 + int(((created_count + updated_count) / max(len(events), 1)) * 20), 99),
-                    'message': f'Saving events to database... ({created_count + updated_count}/{len(events)})',
-                    'timestamp': datetime.now().isoformat()
-                })
-                with open(progress_file, 'w') as f:
-                    json.dump(progress_data, f)
-        except Exception as e:
-            logger.debug(f"Could not update progress file: {e}")
+        # Update progress (NGA-specific)
+        progress.update(
+            events_saved=created_count,
+            events_updated=updated_count,
+            percentage=min(80 + int(((created_count + updated_count) / max(len(events), 1)) * 20), 99),
+            message=f'Saving events to database... ({created_count + updated_count}/{len(events)})',
+        )
         
         return created_count, updated_count
 if __name__ == '__main__':
@@ -10,7 +10,7 @@ import logging
 import time as time_module
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 import urllib.parse
 
 # Add project root to path
@@ -103,7 +103,7 @@ def scrape_individual_event(event_url, scraper=None):
             
         if not response or response.status_code != 200: return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # 1. Extract Title
@@ -276,7 +276,7 @@ def scrape_all_finding_awe_events(save_incrementally=False, max_days_ahead=30):
         logger.warning("   ⚠️  Finding Awe returned 403, skipping.")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = parse_html(response)
 
     try:
         # Find specific event links
@@ -9,7 +9,7 @@ import re
 import logging
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 import requests
 from requests.exceptions import Timeout, RequestException, ConnectionError, ReadTimeout, ConnectTimeout, HTTPError
@@ -368,7 +368,7 @@ def scrape_npg_exhibitions(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping NPG exhibitions (fetch failed).")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find all exhibition items - they're in h3 headings with dates below
         # Based on the page structure, exhibitions appear as h3 headings
@@ -605,7 +605,7 @@ def scrape_exhibition_detail(scraper, url: str) -> Optional[Dict]:
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract title
         title = None
@@ -778,7 +778,7 @@ def scrape_npg_tours(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping NPG tours (fetch failed).")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract tour information from the page
         page_text = soup.get_text()
@@ -872,7 +872,7 @@ def scrape_npg_events(scraper=None) -> List[Dict]:
             logger.warning("   ⚠️  Skipping NPG events (fetch failed).")
             return events
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find all event links
         event_links = soup.find_all('a', href=re.compile(r'/event/'))
@@ -918,7 +918,7 @@ def scrape_event_detail(scraper, url: str) -> Optional[Dict]:
         if not response:
             return None
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract title
         title = None
@@ -1194,7 +1194,7 @@ def scrape_npg_programs(scraper=None) -> List[Dict]:
         if not response:
             logger.warning("   ⚠️  Skipping NPG adult programs (fetch failed).")
         else:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response)
 
             # Hardcoded recurring programs on adult page
             program_headings = soup.find_all(['h2', 'h3', 'h4'])
@@ -1270,7 +1270,7 @@ def scrape_npg_programs(scraper=None) -> List[Dict]:
         if not response:
             logger.warning("   ⚠️  Skipping NPG family programs (fetch failed).")
         else:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response)
 
             # Links on family page
             for link in soup.find_all('a', href=re.compile(r'/event/|/program')):
@@ -14,17 +14,14 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 def update_progress(step, total_steps, message):
-    """Update progress file for real-time tracking"""
-    progress = {
+    """Update scraping progress (scripts/progress_bus.py) for real-time tracking"""
+    from scripts.progress_bus import progress as progress_bus
+    progress = progress_bus.replace({
         'current_step': step,
         'total_steps': total_steps,
         'percentage': int((step / total_steps) * 100),
         'message': message,
-        'timestamp': datetime.now().isoformat()
-    }
-    
-    with open('scraping_progress.json', 'w') as f:
-        json.dump(progress, f)
+    })
     
     print(f"Progress {progress['percentage']}%: {message}")
 
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime, date, time as dt_time, timedelta
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 
 # Add project root to path
@@ -35,6 +36,7 @@ SAAM_BASE_URL = 'https://americanart.si.edu'
 SAAM_EXHIBITIONS_URL = 'https://americanart.si.edu/exhibitions'
 SAAM_EVENTS_URL = 'https://americanart.si.edu/search/events?content_type=event'
 SAAM_TOURS_URL = 'https://americanart.si.edu/visit/tours'
+WALKIN_TOUR_DAYS = 30  # Recurring walk-in tours are published for this many days ahead
 
 
 def create_scraper():
@@ -273,7 +275,7 @@ def scrape_saam_exhibitions(scraper=None) -> List[Dict]:
         response = scraper.get(SAAM_EXHIBITIONS_URL, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find all exhibition items
         # Based on the page structure, exhibitions are likely in sections or divs
@@ -451,7 +453,7 @@ def scrape_exhibition_detail(scraper, url: str) -> Optional[Dict]:
         response = scraper.get(url, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Extract title
         title = None
@@ -1281,6 +1283,29 @@ def parse_exhibitions_from_page(soup: BeautifulSoup) -> List[Dict]:
     return events
 
 
+def _parse_walkin_times(times: List[str]) -> List[dt_time]:
+    """Start times from walk-in tour text like '12:30 p.m.', '2 p.m.' or 'noon' (unparseable entries are dropped)."""
+    start_times = []
+    for time_str in times:
+        if 'noon' in time_str.lower():
+            start_times.append(dt_time(12, 0))
+            continue
+        time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*([ap])\.?m\.?', time_str, re.IGNORECASE)
+        if not time_match:
+            continue
+        hour = int(time_match.group(1))
+        minute = int(time_match.group(2)) if time_match.group(2) else 0
+        am_pm = time_match.group(3).upper()
+        
+        # Convert to 24-hour format
+        if am_pm == 'P' and hour != 12:
+            hour += 12
+        elif am_pm == 'A' and hour == 12:
+            hour = 0
+        start_times.append(dt_time(hour, minute))
+    return sorted(set(start_times))
+
+
 def scrape_saam_tours(scraper=None) -> List[Dict]:
     """Scrape tours from SAAM tours page, including walk-in tours"""
     if scraper is None:
@@ -1293,7 +1318,7 @@ def scrape_saam_tours(scraper=None) -> List[Dict]:
         response = scraper.get(SAAM_TOURS_URL, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # First, parse walk-in tours from the page content
         # Look for list items that contain walk-in tour information
@@ -1464,56 +1489,35 @@ def scrape_saam_tours(scraper=None) -> List[Dict]:
                     times = re.findall(r'(\d{1,2}(?::\d{2})?\s*[ap]\.?m?\.?)', saam_context, re.IGNORECASE)
                     logger.info(f"   🔄 Times near 'main building': {times[:5]}")
             
-            saam_tour_count = 0
-            logger.info(f"   🔄 Creating walk-in tour events for {len(times)} time slot(s) over next 30 days...")
-            for time_str in times:
-                # Create recurring tour events for each time slot
-                # These happen daily, so we'll create events for the next 30 days
-                from datetime import timedelta
+            # Daily tours: one recurring event (stored as an event series and expanded per
+            # requested date window) instead of one event per time slot per day
+            start_times = _parse_walkin_times(times)
+            if start_times:
                 today = date.today()
-                
-                for day_offset in range(30):  # Next 30 days
-                    tour_date = today + timedelta(days=day_offset)
-                    
-                    # Parse time
-                    time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*([ap])\.?m\.?', time_str, re.IGNORECASE)
-                    if time_match:
-                        hour = int(time_match.group(1))
-                        minute = int(time_match.group(2)) if time_match.group(2) else 0
-                        am_pm = time_match.group(3).upper()
-                        
-                        # Convert to 24-hour format
-                        if am_pm == 'P' and hour != 12:
-                            hour += 12
-                        elif am_pm == 'A' and hour == 12:
-                            hour = 0
-                        
-                        start_time = dt_time(hour, minute)
-                        end_time = dt_time(hour + 1, minute)  # Tours last approximately one hour
-                        
-                        event = {
-                            'title': 'Docent-Led Walk-In Tour',
-                            'description': 'Free, docent-led walk-in tour at the Smithsonian American Art Museum. Tours last approximately one hour.',
-                            'event_type': 'tour',
-                            'start_date': tour_date,  # This is a date object
-                            'end_date': tour_date,    # This is a date object
-                            'start_time': start_time.strftime('%H:%M'),  # String format 'HH:MM'
-                            'end_time': end_time.strftime('%H:%M'),      # String format 'HH:MM'
-                            'organizer': VENUE_NAME,
-                            'source_url': SAAM_TOURS_URL,
-                            'url': SAAM_TOURS_URL,  # Also set url field
-                            'social_media_platform': 'website',
-                            'social_media_url': SAAM_TOURS_URL,
-                            'meeting_point': 'Check with the Information Desk when you arrive',
-                            'is_selected': True,  # Make sure tours are visible
-                            'source': 'website',  # Set source field
-                        }
-                        events.append(event)
-                        saam_tour_count += 1
-                        if saam_tour_count <= 3:  # Log first 3 for debugging
-                            logger.info(f"   📝 Sample SAAM tour event: {event['title']} on {event['start_date']} at {event['start_time']}")
-            
-            logger.info(f"   ✅ Created {saam_tour_count} SAAM walk-in tour events in memory")
+                event = {
+                    'title': 'Docent-Led Walk-In Tour',
+                    'description': 'Free, docent-led walk-in tour at the Smithsonian American Art Museum. Tours last approximately one hour.',
+                    'event_type': 'tour',
+                    'recurrence': {
+                        'days_of_week': list(range(7)),
+                        'times': [start_time.strftime('%H:%M') for start_time in start_times],
+                        'start_date': today,
+                        'end_date': today + timedelta(days=WALKIN_TOUR_DAYS - 1),
+                        'duration_minutes': 60,  # Tours last approximately one hour
+                    },
+                    'organizer': VENUE_NAME,
+                    'source_url': SAAM_TOURS_URL,
+                    'url': SAAM_TOURS_URL,  # Also set url field
+                    'social_media_platform': 'website',
+                    'social_media_url': SAAM_TOURS_URL,
+                    'meeting_point': 'Check with the Information Desk when you arrive',
+                    'is_selected': True,  # Make sure tours are visible
+                    'source': 'website',  # Set source field
+                }
+                events.append(event)
+                logger.info(f"   📝 SAAM walk-in tour series: daily at {event['recurrence']['times']} for the next {WALKIN_TOUR_DAYS} days")
+            else:
+                logger.warning(f"   ⚠️  Could not parse SAAM walk-in tour times: {times}")
         else:
             logger.warning(f"   ⚠️  Could not find SAAM walk-in tour information on tours page")
         
@@ -1612,61 +1616,33 @@ def scrape_saam_tours(scraper=None) -> List[Dict]:
             days_match = re.search(r'(Monday through Saturday|Monday-Saturday|Mon-Sat)', renwick_walkin_text, re.IGNORECASE)
             is_weekdays_only = days_match is not None
             
-            renwick_tour_count = 0
-            for time_str in times:
-                from datetime import timedelta
+            start_times = _parse_walkin_times(times)
+            if start_times:
                 today = date.today()
-                
-                for day_offset in range(30):  # Next 30 days
-                    tour_date = today + timedelta(days=day_offset)
-                    
-                    # Skip Sundays if it's weekdays only
-                    if is_weekdays_only and tour_date.weekday() == 6:  # Sunday is 6
-                        continue
-                    
-                    # Parse time
-                    if 'noon' in time_str.lower():
-                        start_time = dt_time(12, 0)
-                    else:
-                        time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*([ap])\.?m\.?', time_str, re.IGNORECASE)
-                        if time_match:
-                            hour = int(time_match.group(1))
-                            minute = int(time_match.group(2)) if time_match.group(2) else 0
-                            am_pm = time_match.group(3).upper()
-                            
-                            if am_pm == 'P' and hour != 12:
-                                hour += 12
-                            elif am_pm == 'A' and hour == 12:
-                                hour = 0
-                            
-                            start_time = dt_time(hour, minute)
-                    end_time = dt_time(start_time.hour + 1, start_time.minute)  # Tours last approximately one hour
-                    
-                    event = {
-                        'title': 'Docent-Led Walk-In Tour',
-                        'description': 'Free, docent-led walk-in tour at the Renwick Gallery. Tours last approximately one hour.',
-                        'event_type': 'tour',
-                        'start_date': tour_date,  # This is a date object
-                        'end_date': tour_date,    # This is a date object
-                        'start_time': start_time.strftime('%H:%M'),  # String format 'HH:MM'
-                        'end_time': end_time.strftime('%H:%M'),      # String format 'HH:MM'
-                        'organizer': RENWICK_VENUE_NAME,  # This should be "Renwick Gallery"
-                        'source_url': SAAM_TOURS_URL,
-                        'url': SAAM_TOURS_URL,  # Also set url field
-                        'social_media_platform': 'website',
-                        'social_media_url': SAAM_TOURS_URL,
-                        'meeting_point': 'Check with the Information Desk when you arrive',
-                        'location': RENWICK_VENUE_NAME,  # Also set location to ensure detection
-                        'venue_name': RENWICK_VENUE_NAME,  # Explicitly set venue_name for detection
-                        'is_selected': True,  # Make sure tours are visible
-                        'source': 'website',  # Set source field
-                    }
-                    events.append(event)
-                    renwick_tour_count += 1
-                    if renwick_tour_count <= 3:  # Log first 3 for debugging
-                        logger.info(f"   📝 Sample Renwick tour event: {event['title']} on {event['start_date']} at {event['start_time']}")
-            
-            logger.info(f"   ✅ Created {renwick_tour_count} Renwick walk-in tour events in memory")
+                event = {
+                    'title': 'Docent-Led Walk-In Tour',
+                    'description': 'Free, docent-led walk-in tour at the Renwick Gallery. Tours last approximately one hour.',
+                    'event_type': 'tour',
+                    'recurrence': {
+                        'days_of_week': list(range(6)) if is_weekdays_only else list(range(7)),  # No tours on Sundays
+                        'times': [start_time.strftime('%H:%M') for start_time in start_times],
+                        'start_date': today,
+                        'end_date': today + timedelta(days=WALKIN_TOUR_DAYS - 1),
+                        'duration_minutes': 60,  # Tours last approximately one hour
+                    },
+                    'organizer': RENWICK_VENUE_NAME,  # This should be "Renwick Gallery"
+                    'source_url': SAAM_TOURS_URL,
+                    'url': SAAM_TOURS_URL,  # Also set url field
+                    'social_media_platform': 'website',
+                    'social_media_url': SAAM_TOURS_URL,
+                    'meeting_point': 'Check with the Information Desk when you arrive',
+                    'location': RENWICK_VENUE_NAME,  # Also set location to ensure detection
+                    'venue_name': RENWICK_VENUE_NAME,  # Explicitly set venue_name for detection
+                    'is_selected': True,  # Make sure tours are visible
+                    'source': 'website',  # Set source field
+                }
+                events.append(event)
+                logger.info(f"   📝 Renwick walk-in tour series: {event['recurrence']['times']} on days {event['recurrence']['days_of_week']} for the next {WALKIN_TOUR_DAYS} days")
         else:
             logger.warning(f"   ⚠️  Could not find Renwick walk-in tour information on tours page")
             # Debug: Show what we did find
@@ -1737,7 +1713,7 @@ def scrape_saam_events(scraper=None) -> List[Dict]:
         response = scraper.get(visit_url, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find event links on visit page
         visit_event_links = soup.find_all('a', href=re.compile(r'/events/[^/]+'))
@@ -1794,7 +1770,7 @@ def scrape_saam_events(scraper=None) -> List[Dict]:
         response = scraper.get(SAAM_EVENTS_URL, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Find event links - look for links to /events/ pages
         # Filter out navigation and search-related links
@@ -1929,7 +1905,7 @@ def scrape_event_detail(scraper, url: str, event_type: str = 'event') -> Optiona
         response = scraper.get(url, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Check if page redirects (common for access program series)
         if soup.find('title') and 'redirecting' in soup.find('title').get_text().lower():
@@ -2916,7 +2892,8 @@ def create_events_in_database(events: List[Dict]) -> tuple:
                     Venue=Venue,
                     batch_size=5,
                     logger_instance=logger,
-                    custom_event_processor=saam_event_processor
+                    custom_event_processor=saam_event_processor,
+                    bulk=True
                 )
                 total_created += created
                 total_updated += updated
@@ -2947,7 +2924,8 @@ def create_events_in_database(events: List[Dict]) -> tuple:
                     Venue=Venue,
                     batch_size=5,
                     logger_instance=logger,
-                    custom_event_processor=renwick_event_processor
+                    custom_event_processor=renwick_event_processor,
+                    bulk=True
                 )
                 total_created += created
                 total_updated += updated
@@ -2981,7 +2959,8 @@ def create_events_in_database(events: List[Dict]) -> tuple:
                         Venue=Venue,
                         batch_size=5,
                         logger_instance=logger,
-                        custom_event_processor=renwick_under_saam_processor
+                        custom_event_processor=renwick_under_saam_processor,
+                        bulk=True
                     )
                     total_created += created
                     total_updated += updated
@@ -21,10 +21,8 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 from typing import List, Optional
 
-from bs4 import BeautifulSoup
-
 from scripts.generic_source_scraper import scrape_source_listing
-from scripts.scraper_utils import parse_date, parse_time_range
+from scripts.scraper_utils import parse_date, parse_html, parse_time_range
 
 logger = logging.getLogger(__name__)
 
@@ -180,7 +178,7 @@ def _extract_shoot_nyc_events(html: str, base_url: str) -> List[dict]:
     """
     events = []
     skipped_past = 0
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
     today = date.today()
 
     try:
@@ -185,11 +185,11 @@ class SmithsonianScraper:
     
     def _extract_description(self, content: str) -> Optional[str]:
         """Extract event description from content using shared utility function."""
-        from bs4 import BeautifulSoup
+        from scripts.scraper_utils import parse_html
         from scripts.utils import extract_description_from_soup
         
         # Parse content to soup and use shared utility
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = parse_html(content)
         description = extract_description_from_soup(soup, max_length=2000)
         
         if description:
@@ -11,7 +11,7 @@ import logging
 import json
 import re
 from datetime import datetime, timedelta, date, time
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 
 # Add project root to path
@@ -166,7 +166,7 @@ class SourceEventScraper:
             response = self.session.get(source.url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response)
             
             # Extract events based on common patterns
             events = self._extract_events_from_html(soup, source)
@@ -238,7 +238,7 @@ class SourceEventScraper:
             response = self.session.get(url, headers=headers, timeout=limits['request_timeout'])
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response)
             
             # Extract posts from embedded JSON data
             posts = self._extract_instagram_posts(soup, username, source)
@@ -282,7 +282,7 @@ class SourceEventScraper:
             response = self.session.get(post_url, headers=headers, timeout=limits['request_timeout'])
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response)
             
             # Extract shortcode from URL
             shortcode_match = re.search(r'/p/([^/]+)/', post_url)
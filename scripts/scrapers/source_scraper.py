@@ -10,7 +10,7 @@ import re
 import json
 import os
 import gc
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urlparse
 import time
 
@@ -115,7 +115,7 @@ def scrape_instagram_info(username_or_url):
             gc.collect()
         
         # Parse the page
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = parse_html(response)
         
         # Initialize with basic info
         info = {
@@ -210,7 +210,7 @@ def scrape_website_info(url):
         response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = parse_html(response)
         parsed_url = urlparse(url)
         
         info = {
@@ -280,7 +280,7 @@ def scrape_meetup_info(url):
         response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = parse_html(response)
         
         # Extract group name from URL
         match = re.search(r'meetup\.com/([^/?]+)', url)
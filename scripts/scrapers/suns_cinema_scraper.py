@@ -9,7 +9,7 @@ import re
 import logging
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional, Tuple
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin
 import requests
 import urllib3
@@ -20,6 +20,7 @@ sys.path.insert(0, project_root)
 
 from app import app, db, Event, Venue, City
 from scripts.utils import update_scraping_progress, parse_date_range
+from scripts.scraper_utils import fetch_many
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -59,14 +60,8 @@ def parse_time(time_str: str) -> Optional[time]:
         except ValueError:
             return None
 
-def scrape_movie_details(scraper, movie_url: str) -> Dict:
-    """
-    Scrapes details for a specific movie from its page
-    """
-    if movie_url in movie_details_cache:
-        return movie_details_cache[movie_url]
-    
-    details = {
+def _empty_movie_details() -> Dict:
+    return {
         'description': "",
         'image_url': None,
         'run_time': None,
@@ -75,93 +70,119 @@ def scrape_movie_details(scraper, movie_url: str) -> Dict:
         'starring': None,
         'found_times': []
     }
+
+def prefetch_movie_details(movie_urls: List[str]) -> None:
+    """Fetch movie pages in parallel and fill movie_details_cache (failures are retried serially later)."""
+    urls = list(dict.fromkeys(u for u in movie_urls if u and u != BASE_URL and u not in movie_details_cache))
+    if not urls:
+        return
+    logger.info(f"  ∟ 🔍 Fetching {len(urls)} movie pages in parallel")
+    for result in fetch_many(urls, verify_ssl=False, timeout=10, scraper_key='suns_cinema'):
+        if result.ok:
+            try:
+                movie_details_cache[result.url] = parse_movie_details(result.text)
+            except Exception as e:
+                logger.error(f"    ❌ Error parsing movie details: {e}")
+
+def scrape_movie_details(scraper, movie_url: str) -> Dict:
+    """
+    Scrapes details for a specific movie from its page
+    """
+    if movie_url in movie_details_cache:
+        return movie_details_cache[movie_url]
     
     if not movie_url or movie_url == BASE_URL:
-        return details
+        return _empty_movie_details()
         
     try:
         logger.info(f"  ∟ 🔍 Fetching details from: {movie_url}")
         response = scraper.get(movie_url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 1. Extract Image
-        img_elem = soup.find('img', alt=re.compile(r'Poster for', re.I))
-        if not img_elem:
-            img_elem = soup.select_one('.movie-poster img, .poster img')
-            
-        if img_elem and img_elem.get('src'):
-            details['image_url'] = img_elem.get('src')
-        
-        # 2. Extract Metadata
-        page_text = soup.get_text()
-        
-        # Extract Director - Use non-greedy match until "Run Time" or newline
-        dir_match = re.search(r'Director:\s*(.*?)(?=\s*(?:Run Time|Release Year|Language|Starring|$|\n))', page_text, re.I | re.DOTALL)
-        if dir_match:
-            details['director'] = dir_match.group(1).strip().rstrip('.').rstrip(',')
+        details = parse_movie_details(response.text)
+        movie_details_cache[movie_url] = details
+        return details
         
-        # Extract Run Time
-        rt_match = re.search(r'Run Time:\s*(\d+)\s*min', page_text, re.I)
-        if rt_match:
-            details['run_time'] = int(rt_match.group(1))
+    except Exception as e:
+        logger.error(f"    ❌ Error fetching movie details: {e}")
+        return _empty_movie_details()
+
+def parse_movie_details(html: str) -> Dict:
+    """Extract poster, metadata, description and showtimes from a movie page."""
+    details = _empty_movie_details()
+    soup = parse_html(html)
+    
+    # 1. Extract Image
+    img_elem = soup.find('img', alt=re.compile(r'Poster for', re.I))
+    if not img_elem:
+        img_elem = soup.select_one('.movie-poster img, .poster img')
         
-        # Extract Language
-        lang_match = re.search(r'Language:\s*([^\n|.]+)', page_text, re.I)
-        if lang_match:
-            details['language'] = lang_match.group(1).strip()
+    if img_elem and img_elem.get('src'):
+        details['image_url'] = img_elem.get('src')
+    
+    # 2. Extract Metadata
+    page_text = soup.get_text()
+    
+    # Extract Director - Use non-greedy match until "Run Time" or newline
+    dir_match = re.search(r'Director:\s*(.*?)(?=\s*(?:Run Time|Release Year|Language|Starring|$|\n))', page_text, re.I | re.DOTALL)
+    if dir_match:
+        details['director'] = dir_match.group(1).strip().rstrip('.').rstrip(',')
+    
+    # Extract Run Time
+    rt_match = re.search(r'Run Time:\s*(\d+)\s*min', page_text, re.I)
+    if rt_match:
+        details['run_time'] = int(rt_match.group(1))
+    
+    # Extract Language
+    lang_match = re.search(r'Language:\s*([^\n|.]+)', page_text, re.I)
+    if lang_match:
+        details['language'] = lang_match.group(1).strip()
 
-        # Extract Starring
-        star_match = re.search(r'Starring:\s*(.*?)(?=\s*(?:Legendary|Restored|Trailer|Copyright|$|\n))', page_text, re.I | re.DOTALL)
-        if star_match:
-            details['starring'] = star_match.group(1).strip()
+    # Extract Starring
+    star_match = re.search(r'Starring:\s*(.*?)(?=\s*(?:Legendary|Restored|Trailer|Copyright|$|\n))', page_text, re.I | re.DOTALL)
+    if star_match:
+        details['starring'] = star_match.group(1).strip()
 
-        # 3. Extract Description
-        description_parts = []
-        for p in soup.find_all('p'):
-            p_text = p.get_text(strip=True)
-            if len(p_text) > 50 and not any(x in p_text for x in ['Director:', 'Starring:', 'Run Time:', 'Language:']):
-                if not any(x in p_text.lower() for x in ['copyright', 'powered by', 'skip to content']):
-                    description_parts.append(p_text)
-                    if len(description_parts) >= 2: break
+    # 3. Extract Description
+    description_parts = []
+    for p in soup.find_all('p'):
+        p_text = p.get_text(strip=True)
+        if len(p_text) > 50 and not any(x in p_text for x in ['Director:', 'Starring:', 'Run Time:', 'Language:']):
+            if not any(x in p_text.lower() for x in ['copyright', 'powered by', 'skip to content']):
+                description_parts.append(p_text)
+                if len(description_parts) >= 2: break
 
-        details['description'] = "\n\n".join(description_parts)
-        
-        # 4. Extract Showtimes
-        time_matches = re.findall(r'(\d{1,2}:\d{2})\s*(am|pm)', page_text, re.I)
-        if time_matches:
-            details['found_times'] = [f"{t[0]} {t[1]}" for t in time_matches]
+    details['description'] = "\n\n".join(description_parts)
+    
+    # 4. Extract Showtimes
+    time_matches = re.findall(r'(\d{1,2}:\d{2})\s*(am|pm)', page_text, re.I)
+    if time_matches:
+        details['found_times'] = [f"{t[0]} {t[1]}" for t in time_matches]
 
-        # Construct enhanced description
-        meta_info = []
-        if details['director']:
-            # Shorten "Director" to "Dir." for a more professional, cinematic feel
-            meta_info.append(f"Dir. {details['director']}")
-        if details['language']:
-            meta_info.append(details['language'])
-        if details['run_time']:
-            meta_info.append(f"{details['run_time']} min")
-            
-        header = " • ".join(meta_info)
+    # Construct enhanced description
+    meta_info = []
+    if details['director']:
+        # Shorten "Director" to "Dir." for a more professional, cinematic feel
+        meta_info.append(f"Dir. {details['director']}")
+    if details['language']:
+        meta_info.append(details['language'])
+    if details['run_time']:
+        meta_info.append(f"{details['run_time']} min")
         
-        enhanced_parts = []
-        if header:
-            enhanced_parts.append(header)
-        if details['starring']:
-            enhanced_parts.append(f"Cast: {details['starring']}")
-            
-        if details['description']:
-            # Use double newlines for clear separation
-            enhanced_parts.append(details['description'])
-            
-        details['full_description'] = "\n\n".join(enhanced_parts)
+    header = " • ".join(meta_info)
+    
+    enhanced_parts = []
+    if header:
+        enhanced_parts.append(header)
+    if details['starring']:
+        enhanced_parts.append(f"Cast: {details['starring']}")
         
-        movie_details_cache[movie_url] = details
-        return details
+    if details['description']:
+        # Use double newlines for clear separation
+        enhanced_parts.append(details['description'])
         
-    except Exception as e:
-        logger.error(f"    ❌ Error fetching movie details: {e}")
-        return details
+    details['full_description'] = "\n\n".join(enhanced_parts)
+
+    return details
 
 def scrape_suns_cinema() -> List[Dict]:
     scraper = create_scraper()
@@ -172,10 +193,18 @@ def scrape_suns_cinema() -> List[Dict]:
         response = scraper.get(BASE_URL, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         today = date.today()
         current_year = today.year
         
+        # Fetch every linked movie page up front, in parallel
+        movie_urls = []
+        for heading in soup.find_all(['h2', 'h3']):
+            link_elem = heading.find_parent('a') or heading.find('a')
+            if link_elem and link_elem.get('href'):
+                movie_urls.append(urljoin(BASE_URL, link_elem.get('href')))
+        prefetch_movie_details(movie_urls)
+        
         # 1. Scrape Current Showtimes
         h2_tags = soup.find_all('h2')
         for h2 in h2_tags:
@@ -171,8 +171,8 @@ def scrape_tulipday_event() -> Optional[Dict]:
             return None
         soup = None
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
+            from scripts.scraper_utils import parse_html
+            soup = parse_html(html)
             page_text = unescape(soup.get_text(" ", strip=True))
         except Exception:
             # Fallback: strip tags with regex if BeautifulSoup isn't available
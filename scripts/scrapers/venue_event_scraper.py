@@ -21,7 +21,7 @@ from requests.exceptions import (
 from socket import timeout as SocketTimeout
 import logging
 from datetime import datetime, timedelta, date, time as time_class
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 from urllib.parse import urljoin, urlparse
 import time
 import re
@@ -34,6 +34,9 @@ sys.path.insert(0, project_root)
 from app import app, db, Venue, Event, City
 from scripts.scraper_logging import get_scraper_logger
 from scripts.enhanced_llm_fallback import get_llm_fallback_count, reset_llm_fallback_count
+from scripts.scraper_utils import get_fingerprint_store
+from scripts.progress_bus import progress
+from scripts import title_rules
 
 # Setup logging - use scraper helper for SCRAPER_DEBUG=1 support
 logging.basicConfig(level=logging.INFO)
@@ -46,30 +49,21 @@ HIRSHHORN_BASE_URL = 'https://hirshhorn.si.edu'
 def update_progress(step, total_steps, message, merge_existing=True, events_found=None, events_found_add=None):
     """Update scraping progress. When merge_existing=True, preserves events_found, events_saved, recent_events.
     events_found: set directly (e.g. exhibition count). events_found_add: add to existing (e.g. tours)."""
-    progress = {
+    fields = {
         'current_step': step,
         'total_steps': total_steps,
         'message': message,
         'percentage': int((step / total_steps) * 100),
-        'timestamp': datetime.now().isoformat()
     }
-    if merge_existing:
-        try:
-            with open('scraping_progress.json', 'r') as f:
-                existing = json.load(f)
-            for key in ('events_found', 'events_saved', 'recent_events', 'venues_processed', 'total_venues', 'current_venue'):
-                if key in existing:
-                    progress[key] = existing[key]
-            if events_found_add is not None:
-                progress['events_found'] = existing.get('events_found', 0) + events_found_add
-        except (FileNotFoundError, json.JSONDecodeError):
-            if events_found_add is not None:
-                progress['events_found'] = events_found_add
     if events_found is not None:
-        progress['events_found'] = events_found
-    with open('scraping_progress.json', 'w') as f:
-        json.dump(progress, f)
-    logger.debug("Progress %s%%: %s", progress['percentage'], message)
+        fields['events_found'] = events_found
+    if not merge_existing:
+        progress.replace(fields)
+    else:
+        progress.update(**fields)
+    if events_found_add is not None and events_found is None:
+        progress.increment(events_found=events_found_add)
+    logger.debug("Progress %s%%: %s", fields['percentage'], message)
 
 class VenueEventScraper:
     """Scrapes events from venue websites and social media"""
@@ -483,8 +477,10 @@ class VenueEventScraper:
             logger.debug("Using SAAM scraper for %s", venue.name)
             try:
                 from scripts.saam_scraper import scrape_all_saam_events
+                from scripts.event_series import expand_recurring
                 # Pass venue name to filter events for this specific venue
-                saam_events = scrape_all_saam_events(target_venue_name=venue.name)
+                # (walk-in tours come back as series; callers here save one row per event)
+                saam_events = expand_recurring(scrape_all_saam_events(target_venue_name=venue.name) or [])
                 if saam_events:
                     # CRITICAL: Filter out events that belong to other venues BEFORE assigning venue_id
                     filtered_saam_events = []
@@ -954,7 +950,7 @@ class VenueEventScraper:
                     logger.info("   hirshhorn: homepage fetch failed; trying %s", exhibitions_hub)
                     response = self._fetch_hirshhorn_page(exhibitions_hub)
                 if response:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = parse_html(response)
                 else:
                     logger.warning(
                         "⚠️ Hirshhorn fetch failed for homepage and exhibitions-events hub — skipping venue"
@@ -980,7 +976,7 @@ class VenueEventScraper:
                             )
                             response = self._fetch_hirshhorn_page(venue.website_url)
                             if response:
-                                soup = BeautifulSoup(response.text, 'html.parser')
+                                soup = parse_html(response)
                             else:
                                 return events
                         else:
@@ -988,7 +984,7 @@ class VenueEventScraper:
                             try:
                                 html_content = self._scrape_with_cloudscraper(venue.website_url)
                                 if html_content:
-                                    soup = BeautifulSoup(html_content, 'html.parser')
+                                    soup = parse_html(html_content)
                                     logger.info(f"✅ Successfully bypassed 403 using cloudscraper for {venue.website_url}")
                                 else:
                                     logger.warning(f"⚠️ Cloudscraper also failed for {venue.website_url} - skipping this venue (site may have strong bot protection)")
@@ -1000,7 +996,7 @@ class VenueEventScraper:
                         logger.error(f"❌ Request error accessing {venue.website_url}: {e} - skipping")
                         return events
                 else:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = parse_html(response)
 
             if soup is None:
                 return events
@@ -1014,7 +1010,7 @@ class VenueEventScraper:
                     events_response = self.session.get(events_page_url, timeout=10)
                     logger.debug("Response status: %s", events_response.status_code)
                     if events_response.status_code == 200:
-                        events_soup = BeautifulSoup(events_response.content, 'html.parser')
+                        events_soup = parse_html(events_response)
                         # Log a sample of the page to debug
                         page_text_sample = events_soup.get_text()[:500]
                         logger.debug("Page text sample: %s", page_text_sample)
@@ -1093,11 +1089,11 @@ class VenueEventScraper:
                             exhibition_response = self._fetch_hirshhorn_page(exhibition_url, max_retries=2)
                             if not exhibition_response:
                                 continue
-                            exhibition_soup = BeautifulSoup(exhibition_response.text, 'html.parser')
+                            exhibition_soup = parse_html(exhibition_response)
                         else:
                             exhibition_response = self.session.get(exhibition_url, timeout=10)
                             exhibition_response.raise_for_status()
-                            exhibition_soup = BeautifulSoup(exhibition_response.content, 'html.parser')
+                            exhibition_soup = parse_html(exhibition_response)
                         
                         # For exhibition pages, treat the page itself as an exhibition event
                         # Check if this is an individual exhibition page (not a listing page)
@@ -1277,7 +1273,7 @@ class VenueEventScraper:
                                                 logger.debug("Following link to individual exhibition: %s", individual_url)
                                                 individual_response = self.session.get(individual_url, timeout=10)
                                                 individual_response.raise_for_status()
-                                                individual_soup = BeautifulSoup(individual_response.content, 'html.parser')
+                                                individual_soup = parse_html(individual_response)
                                                 individual_event = self._extract_exhibition_from_page(
                                                     individual_soup, venue, individual_url, event_type, time_range
                                                 )
@@ -1316,7 +1312,7 @@ class VenueEventScraper:
                         logger.debug("Checking Hirshhorn tours page: %s", tours_page_url)
                         tours_response = self._fetch_hirshhorn_page(tours_page_url)
                         if tours_response and tours_response.status_code == 200:
-                            tours_soup = BeautifulSoup(tours_response.content, 'html.parser')
+                            tours_soup = parse_html(tours_response)
                             hirshhorn_tours = self._extract_hirshhorn_tours(
                                 tours_soup, venue, tours_page_url, event_type=event_type, time_range=time_range
                             )
@@ -1341,7 +1337,7 @@ class VenueEventScraper:
                         logger.debug("Scraping tour page: %s", tour_url)
                         tour_response = self.session.get(tour_url, timeout=10)
                         tour_response.raise_for_status()
-                        tour_soup = BeautifulSoup(tour_response.content, 'html.parser')
+                        tour_soup = parse_html(tour_response)
                         
                         # Extract events from tour page with tour URL context
                         tour_events = self._extract_events_from_html(
@@ -1371,7 +1367,7 @@ class VenueEventScraper:
                     logger.debug("Checking British Museum exhibitions-events page: %s", exhibitions_url)
                     exhibitions_response = self.session.get(exhibitions_url, timeout=10)
                     if exhibitions_response.status_code == 200:
-                        exhibitions_soup = BeautifulSoup(exhibitions_response.content, 'html.parser')
+                        exhibitions_soup = parse_html(exhibitions_response)
                         bm_exhibitions = self._extract_british_museum_exhibitions(exhibitions_soup, venue, exhibitions_url, event_type=event_type, time_range=time_range, max_exhibitions_per_venue=max_exhibitions_per_venue)
                         if bm_exhibitions:
                             logger.debug("Extracted %d exhibitions from British Museum exhibitions-events page", len(bm_exhibitions))
@@ -1380,7 +1376,7 @@ class VenueEventScraper:
                         # Try cloudscraper for 403 errors
                         html_content = self._scrape_with_cloudscraper(exhibitions_url)
                         if html_content:
-                            exhibitions_soup = BeautifulSoup(html_content, 'html.parser')
+                            exhibitions_soup = parse_html(html_content)
                             bm_exhibitions = self._extract_british_museum_exhibitions(exhibitions_soup, venue, exhibitions_url, event_type=event_type, time_range=time_range, max_exhibitions_per_venue=max_exhibitions_per_venue)
                             if bm_exhibitions:
                                 logger.debug("Extracted %d exhibitions from British Museum exhibitions-events page (via cloudscraper)", len(bm_exhibitions))
@@ -1394,7 +1390,7 @@ class VenueEventScraper:
                     logger.debug("Checking British Museum tours-and-talks page: %s", tours_talks_url)
                     tours_response = self.session.get(tours_talks_url, timeout=10)
                     if tours_response.status_code == 200:
-                        tours_soup = BeautifulSoup(tours_response.content, 'html.parser')
+                        tours_soup = parse_html(tours_response)
                         bm_tours_talks = self._extract_british_museum_tours_talks(tours_soup, venue, tours_talks_url, event_type=event_type, time_range=time_range)
                         if bm_tours_talks:
                             logger.debug("Extracted %d tours/talks from British Museum tours-and-talks page", len(bm_tours_talks))
@@ -1403,7 +1399,7 @@ class VenueEventScraper:
                         # Try cloudscraper for 403 errors
                         html_content = self._scrape_with_cloudscraper(tours_talks_url)
                         if html_content:
-                            tours_soup = BeautifulSoup(html_content, 'html.parser')
+                            tours_soup = parse_html(html_content)
                             bm_tours_talks = self._extract_british_museum_tours_talks(tours_soup, venue, tours_talks_url, event_type=event_type, time_range=time_range)
                             if bm_tours_talks:
                                 logger.debug("Extracted %d tours/talks from British Museum tours-and-talks page (via cloudscraper)", len(bm_tours_talks))
@@ -1423,7 +1419,7 @@ class VenueEventScraper:
                     logger.debug("Checking OCMA calendar page: %s", calendar_url)
                     calendar_response = self.session.get(calendar_url, timeout=10)
                     if calendar_response.status_code == 200:
-                        calendar_soup = BeautifulSoup(calendar_response.content, 'html.parser')
+                        calendar_soup = parse_html(calendar_response)
                         ocma_events = self._extract_ocma_calendar_events(calendar_soup, venue, calendar_url, event_type=event_type, time_range=time_range)
                         if ocma_events:
                             logger.debug("Extracted %d events from OCMA calendar page", len(ocma_events))
@@ -1454,7 +1450,7 @@ class VenueEventScraper:
                         logger.debug("Scraping event page: %s", event_url)
                         event_response = self.session.get(event_url, timeout=10)
                         event_response.raise_for_status()
-                        event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                        event_soup = parse_html(event_response)
                         
                         # Extract events from event page
                         event_events = self._extract_events_from_html(
@@ -1474,7 +1470,7 @@ class VenueEventScraper:
                     logger.debug("Scraping LACMA exhibitions page: %s", exhibitions_page_url)
                     exhibitions_response = self.session.get(exhibitions_page_url, timeout=10)
                     if exhibitions_response.status_code == 200:
-                        exhibitions_soup = BeautifulSoup(exhibitions_response.content, 'html.parser')
+                        exhibitions_soup = parse_html(exhibitions_response)
                         # Find all exhibition links
                         lacma_exhibition_links = exhibitions_soup.find_all('a', href=lambda href: href and '/art/exhibition/' in href.lower())
                         for link in lacma_exhibition_links[:15]:  # Check first 15 exhibitions
@@ -1483,7 +1479,7 @@ class VenueEventScraper:
                                 logger.debug("Scraping LACMA exhibition: %s", exhibition_url)
                                 exhibition_response = self.session.get(exhibition_url, timeout=10)
                                 exhibition_response.raise_for_status()
-                                exhibition_soup = BeautifulSoup(exhibition_response.content, 'html.parser')
+                                exhibition_soup = parse_html(exhibition_response)
                                 
                                 # For exhibition pages, treat the page itself as an exhibition event
                                 # Check if it's an individual exhibition page (same logic as above)
@@ -1546,7 +1542,7 @@ class VenueEventScraper:
                         logger.debug("Scraping known tour page: %s", tour_url)
                         tour_response = self.session.get(tour_url, timeout=10)
                         tour_response.raise_for_status()
-                        tour_soup = BeautifulSoup(tour_response.content, 'html.parser')
+                        tour_soup = parse_html(tour_response)
                         
                         # Extract events from tour page with tour URL context
                         tour_events = self._extract_events_from_html(
@@ -2071,7 +2067,7 @@ class VenueEventScraper:
             try:
                 response = self.session.get(tour_url, timeout=5)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response)
                 
                 # Try to get the real page title
                 page_title = soup.find('title')
@@ -2510,7 +2506,7 @@ class VenueEventScraper:
                 page_html = self._scrape_with_cloudscraper(url)
                 
                 if page_html:
-                    soup = BeautifulSoup(page_html, 'html.parser')
+                    soup = parse_html(page_html)
                     page_text = soup.get_text()
                     
                     logger.debug("Page text sample: %s", page_text[:500])
@@ -3279,7 +3275,7 @@ class VenueEventScraper:
                             exhibition_response = self._fetch_hirshhorn_page(exhibition_url, max_retries=2)
                             if not exhibition_response:
                                 continue
-                            exhibition_soup = BeautifulSoup(exhibition_response.text, 'html.parser')
+                            exhibition_soup = parse_html(exhibition_response)
                             
                             # Extract title from page if not found (usually in h1)
                             if not title or len(title) < 5:
@@ -3881,20 +3877,7 @@ class VenueEventScraper:
                     continue
                 
                 # Detect if event is baby-friendly
-                is_baby_friendly = False
-                combined_text = f"{title.lower()} {parent_text.lower()}"
-                baby_keywords = [
-                    'baby', 'babies', 'toddler', 'toddlers', 'infant', 'infants',
-                    'ages 0-2', 'ages 0–2', 'ages 0 to 2', '0-2 years', '0–2 years',
-                    'ages 0-3', 'ages 0–3', 'ages 0 to 3', '0-3 years', '0–3 years',
-                    'bring your own baby', 'byob', 'baby-friendly', 'baby friendly',
-                    'stroller', 'strollers', 'nursing', 'breastfeeding',
-                    'family program', 'family-friendly', 'family friendly',
-                    'art & play', 'art and play', 'play time', 'playtime',
-                    'children', 'kids', 'little ones', 'young families'
-                ]
-                if any(keyword in combined_text for keyword in baby_keywords):
-                    is_baby_friendly = True
+                is_baby_friendly = title_rules.is_baby_friendly(title, parent_text)
                 
                 # Build full URL
                 from urllib.parse import urljoin
@@ -3940,7 +3923,7 @@ class VenueEventScraper:
                         logger.debug("Event page response status: %s for %s", event_response.status_code, full_url)
                         if event_response.status_code == 200:
                             logger.debug("Successfully fetched event page: %s", full_url)
-                            event_soup = BeautifulSoup(event_response.content, 'html.parser')
+                            event_soup = parse_html(event_response)
                             # Look for main content area
                             main_content = event_soup.find('article') or event_soup.find('main') or event_soup
                             
@@ -4698,7 +4681,7 @@ class VenueEventScraper:
                     
                     if response.status_code == 200:
                         # Check if the page has event-related content
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = parse_html(response)
                         page_text = soup.get_text().lower()
                         
                         # Look for indicators that this is an event page
@@ -4779,6 +4762,8 @@ class VenueEventScraper:
                 if path:
                     paths_to_scrape.append((path_type, path))
         
+        fingerprints = get_fingerprint_store()
+
         # Scrape each path
         for path_type, path in paths_to_scrape:
             # Handle full URLs (for subdomains) vs relative paths
@@ -4794,12 +4779,23 @@ class VenueEventScraper:
                     response = self._fetch_hirshhorn_page(full_url)
                     if not response:
                         continue
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    markup = response.text
                 else:
                     response = self.session.get(full_url, timeout=10)
                     if response.status_code != 200:
                         continue
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    markup = response.content
+                # Unchanged listing page since last run: replay its events instead of re-parsing
+                page_check = None
+                if fingerprints:
+                    page_check = fingerprints.check_page(
+                        f"{full_url}|{path_type}|{event_type or ''}|{max_exhibitions_per_venue}", markup
+                    )
+                    if page_check.unchanged:
+                        logger.debug("Saved %s path unchanged since last run: %s", path_type, full_url)
+                        events.extend(page_check.events)
+                        continue
+                soup = parse_html(markup)
                 if soup:
                     # Use existing extraction methods based on path type
                     if path_type == 'exhibitions':
@@ -4808,6 +4804,8 @@ class VenueEventScraper:
                         # For other types, use generic extraction
                         extracted = self._extract_events_from_html(soup, venue, full_url, event_type=event_type, time_range='this_month')
                     
+                    if page_check:
+                        fingerprints.record_page(page_check, extracted or [])
                     if extracted:
                         events.extend(extracted)
                         logger.debug("Extracted %d events from %s path", len(extracted), path_type)
@@ -4964,7 +4962,7 @@ class VenueEventScraper:
             if not response:
                 return None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response)
             
             # Extract title from h1
             title = None
@@ -6453,47 +6451,7 @@ class VenueEventScraper:
     
     def _is_english(self, text):
         """Check if text is primarily in English"""
-        if not text or not isinstance(text, str):
-            return True  # Default to English if we can't determine
-        
-        text_lower = text.lower()
-        
-        # Common non-English words/patterns (Spanish, French, German, etc.)
-        non_english_indicators = [
-            # Spanish
-            r'\b(conversaci[oó]n|galer[ií]as|vida|trabajo|mi[eé]rcoles|diciembre|encu[eé]ntranos|boleto|admisi[oó]n|esperar|dispositivos|escucha|asistida|disponibles|reservaci[oó]n|correo|semanas|anticipaci[oó]n)\b',
-            r'\b(que|de|la|el|en|y|a|es|son|para|con|por|del|las|los|una|un|este|esta|estos|estas)\b',
-            # French
-            r'\b(conversation|galeries|mercredi|d[eé]cembre|trouvez|billet|admission|attendre|dispositifs|écoute|assistée|disponibles|réservation|courriel|semaines|anticipation)\b',
-            # German
-            r'\b(gespr[aä]ch|galerien|mittwoch|dezember|finden|ticket|eintritt|erwarten|ger[aä]te|h[öo]ren|assistiert|verf[üu]gbar|reservierung|e-mail|wochen|vorlaufzeit)\b',
-        ]
-        
-        # Check for accented characters common in non-English languages
-        accented_chars = ['á', 'é', 'í', 'ó', 'ú', 'ñ', 'ü', 'à', 'è', 'ì', 'ò', 'ù', 'â', 'ê', 'î', 'ô', 'û', 
-                         'ä', 'ë', 'ï', 'ö', 'ü', 'ç', 'ã', 'õ', 'å', 'æ', 'ø']
-        
-        # Count non-English indicators
-        non_english_count = 0
-        for pattern in non_english_indicators:
-            matches = len(re.findall(pattern, text_lower))
-            non_english_count += matches
-        
-        # Count accented characters
-        accented_count = sum(1 for char in text if char in accented_chars)
-        
-        # If there are many non-English indicators or accented characters, likely not English
-        # Use a threshold: if more than 2 non-English words or more than 3 accented chars, filter out
-        if non_english_count > 2 or accented_count > 3:
-            return False
-        
-        # Also check if title starts with common non-English words
-        first_words = text_lower.split()[:3]
-        non_english_starters = ['conversación', 'conversacion', 'galerias', 'galerías', 'miércoles', 'miercoles']
-        if any(word in first_words for word in non_english_starters):
-            return False
-        
-        return True
+        return title_rules.is_english(text)
     
     def _is_uncertain_title(self, title: str) -> bool:
         """Check if a title is uncertain and might need NLP validation"""
@@ -6591,17 +6549,17 @@ Be strict - if it's clearly a section header or navigation element, mark it as I
         if not title or not isinstance(title, str):
             return False
         
-        # Check if event is in English (filter out non-English events)
-        if not self._is_english(title):
+        description = event_data.get('description', '') or ''
+        flags = title_rules.classify(title, description)
+        
+        # Filter out non-English events (title, or a substantial description)
+        if flags.non_english:
             logger.debug(f"⚠️ Filtered out non-English event: '{title}'")
             return False
         
-        description = event_data.get('description', '') or ''
-        if isinstance(description, str) and description:
-            # Also check description if it's substantial
-            if len(description) > 50 and not self._is_english(description):
-                logger.debug(f"⚠️ Filtered out event with non-English description: '{title}'")
-                return False
+        # Filter out generic titles, section headers and navigation/page titles
+        if flags.listing_title:
+            return False
         
         title = title.lower().strip()
         
@@ -6610,64 +6568,6 @@ Be strict - if it's clearly a section header or navigation element, mark it as I
         else:
             description = ''
         
-        # Filter out overly generic single-word titles and navigation/page titles
-        generic_titles = [
-            'tour', 'tours', 'visit', 'admission', 'hours', 
-            'tickets', 'information', 'about', 'overview', 'home',
-            'location', 'contact', 'directions', 'address',
-            # Navigation and page titles
-            'exhibitions & events', 'exhibitions and events', 'exhibitions',
-            "today's events", 'todays events', 'today events',
-            'results', 'calendar', 'events calendar', 'event calendar',
-            'resources for groups', 'resources', 'groups',
-            'search', 'filter', 'browse', 'explore',
-            'upcoming events', 'past events', 'all events', 'all past events', 'all past events→',
-            'event listings', 'event list', 'event schedule',
-            'art sense', 'art sense 2025',  # OCMA special events listing
-            'what\'s on', 'whats on', 'what is on',
-            'programs', 'program', 'activities',
-            'visit us', 'plan your visit', 'getting here',
-            'news', 'press', 'media', 'blog',
-            'support', 'donate', 'membership', 'join',
-            'shop', 'store', 'gift shop', 'cafe', 'restaurant',
-            'education', 'learn', 'schools', 'teachers',
-            'collections', 'collection', 'artworks', 'artwork',
-            'exhibitions', 'current exhibitions', 'past exhibitions',
-            'virtual tour', 'virtual tours', 'online tour',
-            'accessibility', 'access', 'wheelchair',
-            'faq', 'frequently asked questions', 'help',
-            'our staff', 'staff',
-            'now open!', 'exhibition highlights', 'image slideshow', 'gallery', 'slideshow',
-            'join us for an event', 'join us', 'join us for', 'join us!',
-            'meet your new favorite artist', 'program recordings', 'recordings', 'past programs',
-            # Booking/reservation titles
-            'book a tour', 'book tour', 'book tours', 'book now', 'reserve a tour',
-            'reserve tour', 'reserve tours', 'booking', 'reservations',
-            'schedule a tour', 'schedule tour', 'schedule tours'
-        ]
-        if title in generic_titles:
-            return False
-        
-        # Filter out titles that end with navigation symbols (arrows, etc.)
-        if title.endswith('→') or title.endswith('←') or title.endswith('›') or title.endswith('»'):
-            return False
-        
-        # Common sense: Filter out obvious section headers/navigation elements
-        # These are clearly not events - they're page sections or navigation
-        section_headers = [
-            'past events', 'upcoming events', 'all events', 'all past events',
-            'today\'s events', 'todays events', 'today events',
-            'current events', 'future events', 'recent events',
-            'event listings', 'event list', 'event schedule', 'event calendar',
-            'what\'s on', 'whats on', 'what is on',
-            'exhibitions & events', 'exhibitions and events',
-        ]
-        # Check exact match or if title starts with these (case-insensitive)
-        title_lower_check = title.lower().strip()
-        for header in section_headers:
-            if title_lower_check == header or title_lower_check.startswith(header + ' ') or title_lower_check.startswith(header + '→'):
-                return False
-        
         # Use NLP/LLM for uncertain cases (titles that pass heuristics but might still be invalid)
         # Only check if title seems potentially problematic (short, generic, or contains common section words)
         # NOTE: Skip LLM validation for exhibitions - they're usually clearly identifiable and LLM adds latency/cost
@@ -6679,35 +6579,6 @@ Be strict - if it's clearly a section header or navigation element, mark it as I
                 logger.debug(f"⚠️ NLP filtered out invalid title: '{title}'")
                 return False
         
-        # Also filter titles that are clearly navigation/page titles (case-insensitive partial match)
-        navigation_patterns = [
-            r'^(exhibitions?\s*[&]?\s*events?)$',
-            r"^(today'?s?\s*events?)$",
-            r'^(results?)$',
-            r'^(calendar)$',
-            r'^(resources?\s*(for|about)?\s*(groups?|visitors?)?)$',
-            r'^(event\s*(list|listing|schedule|calendar|search))$',
-            r"^(what'?s?\s*on)$",
-            r'^(upcoming|past|all)\s*(past\s*)?events?$',
-            r'^(plan\s*your\s*visit)$',
-            r'^(visit\s*us)$',
-            r'^(getting\s*here)$',
-            r'^(current|past|upcoming)\s*exhibitions?$',
-            r'^(join\s*us\s*(for\s*(an\s*)?(event|program|activity))?)$',  # "Join us", "Join us for", "Join us for an event"
-            # Booking/reservation patterns
-            r'^(book\s*(a\s*)?(tour|tours?|now))$',
-            r'^(reserve\s*(a\s*)?(tour|tours?))$',
-            r'^(schedule\s*(a\s*)?(tour|tours?))$',
-            r'^(booking|reservations?)$'
-        ]
-        for pattern in navigation_patterns:
-            try:
-                if re.match(pattern, title, re.IGNORECASE):
-                    return False
-            except (TypeError, AttributeError):
-                # Title might be None or not a string, skip pattern matching
-                pass
-        
         # Check event type
         event_type = event_data.get('event_type', '').lower()
         
@@ -10,6 +10,7 @@ import re
 import logging
 from datetime import datetime, date, time, timedelta
 from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 import pytz
 
 # Add project root to path
@@ -228,7 +229,7 @@ def scrape_vipassana_events():
         if 'noscript' in page_text_preview or 'loading' in page_text_preview:
             logger.warning("   ⚠️  Page might require JavaScript to load content")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = parse_html(html_content)
         
         # Debug: Log page title and some content
         page_title = soup.find('title')
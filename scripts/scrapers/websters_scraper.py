@@ -8,7 +8,7 @@ import sys
 import re
 import logging
 from datetime import datetime, date, time
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -46,7 +46,7 @@ def scrape_websters_events():
         response = scraper.get(WEBSTERS_URL, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Pattern to match date markers: "Jan 29th:", "Feb 1st:", "Feb 12th", "March 1st", etc.
@@ -20,7 +20,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import requests
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 from scripts.generic_venue_scraper import GenericVenueScraper
 from scripts.event_database_handler import create_events_in_database
@@ -107,7 +107,7 @@ def _extract_wharf_events(html: str, base_url: str, venue_name: str) -> list:
     Wharf-specific extraction: page has h3 event titles, date/time/location blocks, Learn More links.
     """
     events = []
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
     from urllib.parse import urljoin
 
     # Find event blocks - typically each event is in a section/card with h3 heading
@@ -211,7 +211,7 @@ def _extract_image_from_page(html: str, page_url: str) -> str | None:
     Extract event image URL from a Wharf DC event detail page.
     Tries og:image first (most reliable), then hero/feature/event img elements.
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     # Strategy 1: og:image meta tag (most reliable on event pages)
     og_image = soup.find('meta', property='og:image')
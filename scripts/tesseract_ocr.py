@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tesseract OCR pipeline for event images.
+
+Used by ImageEventProcessor and HybridEventProcessor when Google Vision is not available:
+
+- **Preprocess once:** EXIF rotation, grayscale, scale to a size Tesseract reads well
+  (large phone screenshots are downscaled, small images upscaled), deskew of small angles,
+  Otsu binarization (inverted for light-on-dark flyers). The result is written to one
+  temporary PNG that every pass reads.
+- **Concurrent PSM candidates:** each page segmentation mode runs as its own ``tesseract``
+  process, started from a shared thread pool, so the candidates run side by side.
+- **One call per candidate:** text is rebuilt from the ``image_to_data`` words (grouped
+  into lines) instead of a second ``image_to_string`` call.
+- **Early exit:** the first candidate whose mean word confidence reaches the threshold
+  wins; candidates that have not started are cancelled.
+
+Configuration (env): ``OCR_PSM_MODES`` (default ``6,3,8,13``),
+``OCR_CONFIDENCE_THRESHOLD`` (mean word confidence 0-100 that ends the search, default 80),
+``OCR_MAX_WORKERS`` (parallel tesseract processes, default 4),
+``OCR_MAX_DIMENSION`` (longest side after preprocessing, default 2000 px),
+``OCR_TIMEOUT_SECONDS`` (per tesseract process, default 30).
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pytesseract
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PSM_MODES = (6, 3, 8, 13)
+DEFAULT_CONFIDENCE_THRESHOLD = 80.0
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_DIMENSION = 2000
+DEFAULT_TIMEOUT_SECONDS = 30
+MIN_DIMENSION = 1000           # smaller images are upscaled; Tesseract misses small glyphs
+DESKEW_MAX_ANGLE = 5           # degrees; larger tilts are left to Tesseract's own layout analysis
+DESKEW_SAMPLE_SIZE = 600       # deskew angle is estimated on a thumbnail this wide
+MIN_TEXT_LENGTH = 5
+
+
+@dataclass
+class OCRResult:
+    """Text and mean word confidence of one Tesseract pass."""
+    psm: int
+    text: str = ""
+    confidence: float = 0.0
+    word_count: int = 0
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def psm_modes_from_env() -> List[int]:
+    raw = os.getenv('OCR_PSM_MODES', '')
+    try:
+        modes = [int(mode) for mode in raw.split(',') if mode.strip()]
+    except ValueError:
+        modes = []
+    return modes or list(DEFAULT_PSM_MODES)
+
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Process-wide pool; each task blocks on its own tesseract subprocess."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = max(1, int(_env_float('OCR_MAX_WORKERS', DEFAULT_MAX_WORKERS)))
+            _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tesseract')
+        return _pool
+
+
+# -- preprocessing -----------------------------------------------------------------------------
+
+def _otsu_threshold(gray: Image.Image) -> int:
+    histogram = gray.histogram()[:256]
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    background = weighted_background = 0
+    best_threshold, best_variance = 127, -1.0
+    for level, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += level * count
+        mean_background = weighted_background / background
+        mean_foreground = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = level, variance
+    return best_threshold
+
+
+def _skew_angle(binary: Image.Image) -> float:
+    """Angle that makes text rows most distinct (projection profile on a thumbnail)."""
+    sample = binary.copy()
+    sample.thumbnail((DESKEW_SAMPLE_SIZE, DESKEW_SAMPLE_SIZE))
+    ink = ImageOps.invert(sample.convert('L'))  # text pixels > 0
+    best_angle, best_score = 0.0, -1.0
+    for angle in np.arange(-DESKEW_MAX_ANGLE, DESKEW_MAX_ANGLE + 0.5, 1.0):
+        rows = np.asarray(ink.rotate(float(angle), expand=True, fillcolor=0), dtype=np.float32).sum(axis=1)
+        score = float(np.sum(np.diff(rows) ** 2))
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    return best_angle
+
+
+def preprocess_image(image: Image.Image) -> Image.Image:
+    """Grayscale, rescaled, binarized (dark text on white) and deskewed copy of ``image``."""
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        image = Image.alpha_composite(background, image)
+    gray = image.convert('L')
+
+    longest = max(gray.size)
+    max_dimension = int(_env_float('OCR_MAX_DIMENSION', DEFAULT_MAX_DIMENSION))
+    if longest > max_dimension:
+        scale = max_dimension / longest
+    elif longest < MIN_DIMENSION:
+        scale = min(2.0, MIN_DIMENSION / longest)
+    else:
+        scale = 1.0
+    if scale != 1.0:
+        gray = gray.resize((max(1, round(gray.width * scale)), max(1, round(gray.height * scale))),
+                           Image.Resampling.LANCZOS)
+
+    threshold = _otsu_threshold(gray)
+    binary = gray.point(lambda value: 255 if value > threshold else 0, mode='L')
+    # Mostly dark after thresholding: light text on a dark flyer; Tesseract wants dark on light
+    if np.asarray(binary, dtype=np.uint8).mean() < 127:
+        binary = ImageOps.invert(binary)
+
+    angle = _skew_angle(binary)
+    if angle:
+        binary = binary.rotate(angle, expand=True, fillcolor=255, resample=Image.Resampling.BICUBIC)
+    return binary.convert('1')
+
+
+@contextmanager
+def prepared_image(image_path: str) -> Iterator[str]:
+    """Preprocess ``image_path`` once; yields the path of a temporary PNG for tesseract."""
+    with Image.open(image_path) as image:
+        prepared = preprocess_image(image)
+    handle, path = tempfile.mkstemp(prefix='ocr_', suffix='.png')
+    os.close(handle)
+    try:
+        prepared.save(path, format='PNG')
+        yield path
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# -- recognition -------------------------------------------------------------------------------
+
+def text_from_data(data: Dict[str, list]) -> OCRResult:
+    """Rebuild text (one line per Tesseract line, blank line between blocks) and mean confidence."""
+    lines: Dict[tuple, List[str]] = {}
+    confidences = []
+    for index, word in enumerate(data.get('text', [])):
+        word = (word or '').strip()
+        if not word:
+            continue
+        key = (data['block_num'][index], data['par_num'][index], data['line_num'][index])
+        lines.setdefault(key, []).append(word)
+        confidence = float(data['conf'][index])
+        if confidence > 0:
+            confidences.append(confidence)
+
+    parts = []
+    previous_block = None
+    for (block, _, _), words in lines.items():
+        if previous_block is not None and block != previous_block:
+            parts.append('')
+        parts.append(' '.join(words))
+        previous_block = block
+    return OCRResult(
+        psm=0,
+        text='\n'.join(parts),
+        confidence=sum(confidences) / len(confidences) if confidences else 0.0,
+        word_count=len(confidences),
+    )
+
+
+def run_psm(path: str, psm: int, extra_config: str = '') -> OCRResult:
+    """One ``tesseract`` pass over a prepared image."""
+    data = pytesseract.image_to_data(
+        path,
+        config=f'--psm {psm} {extra_config}'.strip(),
+        output_type=pytesseract.Output.DICT,
+        timeout=_env_float('OCR_TIMEOUT_SECONDS', DEFAULT_TIMEOUT_SECONDS),
+    )
+    result = text_from_data(data)
+    result.psm = psm
+    return result
+
+
+def recognize(path: str, psm_modes: Optional[Sequence[int]] = None, threshold: Optional[float] = None,
+              extra_config: str = '', accept: Optional[Callable[[str], bool]] = None) -> Optional[OCRResult]:
+    """
+    Run the PSM candidates on a prepared image concurrently; return the most confident usable one.
+
+    ``accept(text)`` decides whether a candidate is usable (default: more than a few characters).
+    Returns as soon as a usable candidate reaches ``threshold``; None when no candidate is usable.
+    """
+    psm_modes = list(psm_modes or psm_modes_from_env())
+    if threshold is None:
+        threshold = _env_float('OCR_CONFIDENCE_THRESHOLD', DEFAULT_CONFIDENCE_THRESHOLD)
+    accept = accept or (lambda text: len(text.strip()) > MIN_TEXT_LENGTH)
+
+    pool = _get_pool()
+    pending = {pool.submit(run_psm, path, psm, extra_config): psm for psm in psm_modes}
+    best: Optional[OCRResult] = None
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                psm = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"PSM {psm} failed: {e}")
+                    continue
+                logger.info(f"PSM {psm}: confidence={result.confidence:.1f}, text_length={len(result.text)}")
+                if not accept(result.text):
+                    continue
+                if best is None or result.confidence > best.confidence:
+                    best = result
+            if best is not None and best.confidence >= threshold:
+                logger.info(f"PSM {best.psm} reached confidence {best.confidence:.1f}; skipping remaining modes")
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+    return best
+
+
+def ocr_image(image_path: str, psm_modes: Optional[Sequence[int]] = None,
+              threshold: Optional[float] = None) -> Optional[OCRResult]:
+    """Preprocess ``image_path`` and return the best Tesseract result (None when nothing was read)."""
+    with prepared_image(image_path) as path:
+        return recognize(path, psm_modes=psm_modes, threshold=threshold)
@@ -0,0 +1,452 @@
+"""
+Compiled title/description rules for scraped events.
+
+The keyword and pattern lists that used to live inline in ``is_navigation_text``,
+``is_category_heading``, ``is_spanish_language_event`` (scripts/utils.py),
+``VenueEventScraper._is_english`` / ``_is_valid_event``, ``GenericVenueScraper._is_valid_event_title`` /
+``_is_shopping_event`` and the baby-friendly keyword list in ``save_event_to_database`` are compiled
+here once, at import:
+
+- **Keyword lists** become one alternation regex per list (``KeywordMatcher``). ``search()`` answers
+  "is any keyword a substring?" in one scan; ``present()`` returns every keyword that occurs
+  (overlapping ones included) from one zero-width lookahead scan.
+- **Pattern lists** become one alternation regex per list.
+
+``classify(title, description, url)`` evaluates every rule and returns a ``TitleFlags``; results are
+memoized because the same titles show up on every page of a listing. The old functions call
+the individual predicates and keep their behavior.
+
+Benchmark: ``python scripts/diagnostics/benchmark_title_rules.py`` (events in data/events.json).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import FrozenSet, Iterable, List, Optional
+
+CLASSIFY_CACHE_SIZE = 4096
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Alternation of ``words`` factored on common prefixes ("bab(?:y(?: friendly)?|ies)").
+
+    The regex engine then checks one branch per character instead of every word at every
+    position, and greedy optional tails make the match at a position the longest word there.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node):
+        terminal = '' in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            return f'(?:{body})?'
+        return body
+
+    return emit(trie)
+
+
+class KeywordMatcher:
+    """A fixed set of substring keywords compiled into a single regex."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        alternation = _trie_regex(self.keywords)
+        self._any = re.compile(alternation)
+        self._each = re.compile(f'(?=({alternation}))')
+        # The match at a position is the longest keyword there; the others are its prefixes
+        self._prefixes = {
+            keyword: frozenset(other for other in self.keywords if keyword.startswith(other))
+            for keyword in self.keywords
+        }
+
+    def search(self, text: str) -> bool:
+        """True when any keyword occurs in ``text``."""
+        return self._any.search(text) is not None
+
+    def present(self, text: str) -> FrozenSet[str]:
+        """Every keyword that occurs in ``text``."""
+        found = set()
+        for match in self._each.finditer(text):
+            found |= self._prefixes[match.group(1)]
+        return frozenset(found)
+
+
+def _any_pattern(patterns: Iterable[str], flags: int = 0) -> re.Pattern:
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+
+NAVIGATION_ARROWS = ('→', '←', '›', '»')
+
+# -- navigation / menu text (is_navigation_text) ------------------------------------------------
+
+NAVIGATION_KEYWORDS = [
+    'exhibits', 'exhibitions', 'group visits', 'field trips', 'events',
+    'current events', 'press', 'about us', 'about', 'buy gift cards',
+    'gift cards', 'contact', 'buy tickets', 'tickets', 'visit', 'visits',
+    'hours', 'admission', 'directions', 'parking', 'accessibility',
+    'shop', 'store', 'membership', 'donate', 'support', 'news', 'blog',
+    'search', 'menu', 'navigation', 'skip to', 'home', 'main', 'site map'
+]
+_navigation_keywords = KeywordMatcher(NAVIGATION_KEYWORDS)
+_navigation_words = frozenset(NAVIGATION_KEYWORDS)
+
+# -- category headings (is_category_heading) ----------------------------------------------------
+
+CATEGORY_HEADING_PATTERNS = [
+    r'(past|traveling|upcoming|current)\s+exhibitions?',
+    r'browse\s+exhibitions?',
+    r'view\s+all\s+exhibitions?',
+    r'all\s+exhibitions?',
+    r'exhibitions?',
+]
+_category_heading = _any_pattern(CATEGORY_HEADING_PATTERNS)
+
+# -- language ------------------------------------------------------------------------------------
+
+_spanish_language = re.compile(r'\bspanish[\s-]language\b')
+
+# Word lists per language; a word listed for two languages counts twice (as it always has)
+NON_ENGLISH_WORD_PATTERNS = [
+    # Spanish
+    r'conversaci[oó]n|galer[ií]as|vida|trabajo|mi[eé]rcoles|diciembre|encu[eé]ntranos|boleto|admisi[oó]n|esperar|dispositivos|escucha|asistida|disponibles|reservaci[oó]n|correo|semanas|anticipaci[oó]n',
+    r'que|de|la|el|en|y|a|es|son|para|con|por|del|las|los|una|un|este|esta|estos|estas',
+    # French
+    r'conversation|galeries|mercredi|d[eé]cembre|trouvez|billet|admission|attendre|dispositifs|écoute|assistée|disponibles|réservation|courriel|semaines|anticipation',
+    # German
+    r'gespr[aä]ch|galerien|mittwoch|dezember|finden|ticket|eintritt|erwarten|ger[aä]te|h[öo]ren|assistiert|verf[üu]gbar|reservierung|e-mail|wochen|vorlaufzeit',
+]
+
+
+def _expand_words(alternation: str) -> List[str]:
+    """Literal words of an alternation of words with ``[..]`` character classes."""
+    words = []
+    for alternative in alternation.split('|'):
+        parts = re.split(r'\[([^\]]+)\]', alternative)
+        # Odd positions hold the contents of a character class
+        choices = [[part] if index % 2 == 0 else list(part) for index, part in enumerate(parts)]
+        words.extend(''.join(combination) for combination in product(*choices))
+    return words
+
+
+# Each listed word must be a whole word (``\b`` on both sides), i.e. a complete ``\w+`` run of
+# the text; words with a hyphen are counted with a separate regex
+_non_english_weights = Counter(
+    word for words in NON_ENGLISH_WORD_PATTERNS for word in set(_expand_words(words))
+)
+_word_runs = re.compile(r'\w+')
+_hyphenated_non_english = re.compile(
+    r'\b(?:' + '|'.join(re.escape(word) for word in _non_english_weights if not _word_runs.fullmatch(word)) + r')\b'
+)
+_accented_chars = re.compile('[áéíóúñüàèìòùâêîôûäëïöçãõåæø]')
+NON_ENGLISH_STARTERS = frozenset(['conversación', 'conversacion', 'galerias', 'galerías', 'miércoles', 'miercoles'])
+
+
+# -- baby-friendly (save_event_to_database, VenueEventScraper) ----------------------------------
+
+BABY_FRIENDLY_KEYWORDS = [
+    'baby', 'babies', 'toddler', 'toddlers', 'infant', 'infants',
+    'ages 0-2', 'ages 0–2', 'ages 0 to 2', '0-2 years', '0–2 years',
+    'ages 0-3', 'ages 0–3', 'ages 0 to 3', '0-3 years', '0–3 years',
+    'bring your own baby', 'byob', 'baby-friendly', 'baby friendly',
+    'stroller', 'strollers', 'nursing', 'breastfeeding',
+    'family program', 'family-friendly', 'family friendly',
+    'art & play', 'art and play', 'play time', 'playtime',
+    'children', 'kids', 'little ones', 'young families'
+]
+_baby_friendly = KeywordMatcher(BABY_FRIENDLY_KEYWORDS)
+
+# -- shopping (GenericVenueScraper._is_shopping_event) ------------------------------------------
+
+SHOPPING_KEYWORDS = [
+    'pop-up', 'popup', 'pop up',
+    'shopping', 'retail', 'store', 'boutique',
+    'sale', 'discount', 'clearance',
+    'lingerie', 'fashion', 'clothing', 'apparel',
+    'holiday shopping', 'shopping event', 'shopping day',
+    'market', 'vendor', 'merchant',
+    'exclusive shopping', 'private shopping',
+    'trunk show', 'sample sale'
+]
+_shopping = KeywordMatcher(SHOPPING_KEYWORDS)
+
+# -- listing/section titles (VenueEventScraper._is_valid_event) ---------------------------------
+
+LISTING_TITLES = frozenset([
+    'tour', 'tours', 'visit', 'admission', 'hours',
+    'tickets', 'information', 'about', 'overview', 'home',
+    'location', 'contact', 'directions', 'address',
+    # Navigation and page titles
+    'exhibitions & events', 'exhibitions and events', 'exhibitions',
+    "today's events", 'todays events', 'today events',
+    'results', 'calendar', 'events calendar', 'event calendar',
+    'resources for groups', 'resources', 'groups',
+    'search', 'filter', 'browse', 'explore',
+    'upcoming events', 'past events', 'all events', 'all past events', 'all past events→',
+    'event listings', 'event list', 'event schedule',
+    'art sense', 'art sense 2025',  # OCMA special events listing
+    'what\'s on', 'whats on', 'what is on',
+    'programs', 'program', 'activities',
+    'visit us', 'plan your visit', 'getting here',
+    'news', 'press', 'media', 'blog',
+    'support', 'donate', 'membership', 'join',
+    'shop', 'store', 'gift shop', 'cafe', 'restaurant',
+    'education', 'learn', 'schools', 'teachers',
+    'collections', 'collection', 'artworks', 'artwork',
+    'current exhibitions', 'past exhibitions',
+    'virtual tour', 'virtual tours', 'online tour',
+    'accessibility', 'access', 'wheelchair',
+    'faq', 'frequently asked questions', 'help',
+    'our staff', 'staff',
+    'now open!', 'exhibition highlights', 'image slideshow', 'gallery', 'slideshow',
+    'join us for an event', 'join us', 'join us for', 'join us!',
+    'meet your new favorite artist', 'program recordings', 'recordings', 'past programs',
+    # Booking/reservation titles
+    'book a tour', 'book tour', 'book tours', 'book now', 'reserve a tour',
+    'reserve tour', 'reserve tours', 'booking', 'reservations',
+    'schedule a tour', 'schedule tour', 'schedule tours'
+])
+
+# Section headers: the whole title, or the start of it followed by a space or an arrow
+SECTION_HEADERS = [
+    'past events', 'upcoming events', 'all events', 'all past events',
+    'today\'s events', 'todays events', 'today events',
+    'current events', 'future events', 'recent events',
+    'event listings', 'event list', 'event schedule', 'event calendar',
+    'what\'s on', 'whats on', 'what is on',
+    'exhibitions & events', 'exhibitions and events',
+]
+_section_header = re.compile(
+    '(?:' + '|'.join(re.escape(header) for header in SECTION_HEADERS) + r')(?:\Z| |→)'
+)
+
+LISTING_TITLE_PATTERNS = [
+    r'^(exhibitions?\s*[&]?\s*events?)$',
+    r"^(today'?s?\s*events?)$",
+    r'^(results?)$',
+    r'^(calendar)$',
+    r'^(resources?\s*(for|about)?\s*(groups?|visitors?)?)$',
+    r'^(event\s*(list|listing|schedule|calendar|search))$',
+    r"^(what'?s?\s*on)$",
+    r'^(upcoming|past|all)\s*(past\s*)?events?$',
+    r'^(plan\s*your\s*visit)$',
+    r'^(visit\s*us)$',
+    r'^(getting\s*here)$',
+    r'^(current|past|upcoming)\s*exhibitions?$',
+    r'^(join\s*us\s*(for\s*(an\s*)?(event|program|activity))?)$',  # "Join us", "Join us for", "Join us for an event"
+    # Booking/reservation patterns
+    r'^(book\s*(a\s*)?(tour|tours?|now))$',
+    r'^(reserve\s*(a\s*)?(tour|tours?))$',
+    r'^(schedule\s*(a\s*)?(tour|tours?))$',
+    r'^(booking|reservations?)$'
+]
+_listing_title_patterns = _any_pattern(LISTING_TITLE_PATTERNS, re.IGNORECASE)
+
+# -- page elements (GenericVenueScraper._is_valid_event_title) ----------------------------------
+
+_MONTHS = 'december|january|february|march|april|may|june|july|august|september|october|november'
+
+PAGE_ELEMENT_PATTERNS = [
+    # Permanent collection/gallery pages (not temporary exhibitions)
+    r'^gallery\s+highlights?$',
+    r'^permanent\s+collection',
+    r'^collection\s+highlights?',
+    r'^on\s+view\s+permanent',
+    r'^permanent\s+galleries?',
+    r'^highlights?\s+of\s+the\s+collection',
+    # Calendar navigation - day abbreviations (with or without double letters)
+    r'^(s?sun|m?mon|t?tue|w?wed|t?thu|f?fri|s?sat)$',
+    # Calendar event counts: "0 events,3", "1 event,5", "1 event, 5"
+    r'^\d+\s+events?,\s*\d+$',
+    # Navigation elements
+    r'^events?\s+search',  # "Events Search"
+    r'^event\s+views?\s+navigation',  # "Event Views Navigation"
+    r'^calendar\s+of\s+events?$',  # "Calendar of Events"
+    r'^view\s+calendar$',
+    r'^view\s+all\s+events?$',
+    r'^upcoming\s+events?$',
+    r'^past\s+events?$',
+    r'^all\s+events?$',
+    # Generic page elements
+    r'^(details?|organizer|venue|location|date|time)$',
+    r'^(filter|search|browse|explore)$',
+    r'^(loading|loading\s+view)$',
+    r'^(month|list|week|photo|day)$',
+    r'^(select\s+date|this\s+month)$',
+    # JavaScript/function code
+    r'^\s*\(?\s*function\s*\(',
+    r'^\s*var\s+\w+\s*=',
+    r'^\s*if\s*\(',
+    # Very short or generic
+    r'^[a-z]$',  # Single letter
+    r'^\d+$',  # Just numbers
+    r'^[a-z]\d+$',  # "M1", "T2", etc.
+    # Date/time without an event name: "December 5 @ 10:00", "December 5 10:00"
+    rf'^({_MONTHS})\s+\d+\s*@?\s*\d+:\d+',
+]
+_page_element_patterns = _any_pattern(PAGE_ELEMENT_PATTERNS, re.IGNORECASE)
+
+PAGE_ELEMENT_TITLES = frozenset([
+    'details', 'organizer', 'venue', 'location', 'date:', 'time:',
+    'filter', 'search', 'browse', 'explore', 'loading', 'select',
+    'month', 'list', 'week', 'photo', 'day', 'sun', 'mon', 'tue',
+    'wed', 'thu', 'fri', 'sat', 'view calendar', 'view all',
+    'upcoming events', 'past events', 'all events', 'all past events', 'all past events→', 'calendar of events',
+    'ssun', 'mmon', 'ttue', 'wwed', 'tthu', 'ffri', 'ssat',
+    'events search and views navigation', 'event views navigation',
+    'gallery highlights',  # Permanent collection pages
+])
+PAGE_ELEMENT_PREFIXES = ['details', 'organizer', 'venue', 'filter', 'search', 'loading', 'gallery highlights']
+_page_element_prefix = re.compile('(?:' + '|'.join(PAGE_ELEMENT_PREFIXES) + r')(?:\Z| )')
+
+
+# -- predicates ----------------------------------------------------------------------------------
+
+def is_navigation(title: Optional[str]) -> bool:
+    """Menu/navigation text rather than an event title (long, or mostly navigation keywords)."""
+    if not title:
+        return False
+    title = title.strip()
+    # Navigation text concatenated together can be much longer than any event title
+    if len(title) > 200:
+        return True
+    title_lower = title.lower().strip()
+
+    keyword_count = len(_navigation_keywords.present(title_lower))
+    if keyword_count >= 3:
+        return True
+
+    words = title_lower.split()
+    # A word repeated in a long title that also has navigation keywords
+    if len(words) > 5 and keyword_count >= 2:
+        word_counts = {}
+        for word in words:
+            word_counts[word] = word_counts.get(word, 0) + 1
+        if max(word_counts.values()) >= 2:
+            return True
+    # Just a list of navigation items (60%+ of the words)
+    if len(words) >= 5:
+        navigation_word_count = sum(1 for word in words if word in _navigation_words)
+        if navigation_word_count >= len(words) * 0.6:
+            return True
+    return False
+
+
+def is_heading(title: Optional[str]) -> bool:
+    """Category heading such as "Past Exhibitions" rather than an exhibition title."""
+    if not title:
+        return False
+    return _category_heading.fullmatch(title.lower().strip()) is not None
+
+
+def is_spanish_language(title: Optional[str]) -> bool:
+    """Event conducted in Spanish ("Spanish-Language Walk-In Tours")."""
+    if not title or not isinstance(title, str):
+        return False
+    return _spanish_language.search(title.lower()) is not None
+
+
+def is_english(text: Optional[str]) -> bool:
+    """True unless the text has several non-English words or accented characters."""
+    if not text or not isinstance(text, str):
+        return True  # Default to English if we can't determine
+    text_lower = text.lower()
+
+    weights = _non_english_weights
+    non_english_count = sum(weights.get(word, 0) for word in _word_runs.findall(text_lower))
+    non_english_count += sum(weights[word] for word in _hyphenated_non_english.findall(text_lower))
+    accented_count = len(_accented_chars.findall(text))
+    # More than 2 non-English words or more than 3 accented characters
+    if non_english_count > 2 or accented_count > 3:
+        return False
+
+    # Title starts with a common non-English word
+    if any(word in NON_ENGLISH_STARTERS for word in text_lower.split()[:3]):
+        return False
+    return True
+
+
+def is_baby_friendly(title: Optional[str], description: Optional[str] = '') -> bool:
+    return _baby_friendly.search(f"{(title or '').lower()} {(description or '').lower()}")
+
+
+def is_shopping(title: Optional[str], description: Optional[str] = '', url: Optional[str] = '') -> bool:
+    return _shopping.search(f"{(title or '').lower()} {(description or '').lower()} {(url or '').lower()}")
+
+
+def is_listing_title(title: Optional[str]) -> bool:
+    """Listing-page / section title ("Upcoming Events", "Plan Your Visit", "Book a Tour")."""
+    if not title:
+        return False
+    title_lower = title.lower().strip()
+    return (
+        title_lower in LISTING_TITLES
+        or title_lower.endswith(NAVIGATION_ARROWS)
+        or _section_header.match(title_lower) is not None
+        or _listing_title_patterns.match(title_lower) is not None
+    )
+
+
+def is_page_element(title: Optional[str]) -> bool:
+    """Calendar/navigation widget text, code, or a bare date ("Filter", "0 events,3", "December 5 @ 10:00")."""
+    if not title:
+        return False
+    title_lower = title.lower().strip()
+    return (
+        title_lower in PAGE_ELEMENT_TITLES
+        or title_lower.endswith(NAVIGATION_ARROWS)
+        or _page_element_prefix.match(title_lower) is not None
+        or _page_element_patterns.match(title_lower) is not None
+    )
+
+
+# -- one-pass classification --------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class TitleFlags:
+    heading: bool
+    navigation: bool
+    non_english: bool  # title, or a description longer than 50 characters
+    spanish_language: bool
+    baby_friendly: bool
+    shopping: bool
+    listing_title: bool
+    page_element: bool
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def _classify(title: str, description: str, url: str) -> TitleFlags:
+    return TitleFlags(
+        heading=is_heading(title),
+        navigation=is_navigation(title),
+        non_english=not is_english(title) or (len(description) > 50 and not is_english(description)),
+        spanish_language=is_spanish_language(title),
+        baby_friendly=is_baby_friendly(title, description),
+        shopping=is_shopping(title, description, url),
+        listing_title=is_listing_title(title),
+        page_element=is_page_element(title),
+    )
+
+
+def classify(title: Optional[str], description: Optional[str] = '', url: Optional[str] = '') -> TitleFlags:
+    """Every flag for one candidate event (memoized)."""
+    return _classify(
+        title if isinstance(title, str) else '',
+        description if isinstance(description, str) else '',
+        url if isinstance(url, str) else '',
+    )
+
+
+def clear_cache() -> None:
+    _classify.cache_clear()
@@ -10,7 +10,7 @@ import sys
 import re
 import logging
 from datetime import datetime, date, time, timedelta
-from bs4 import BeautifulSoup
+from scripts.scraper_utils import parse_html
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -314,7 +314,6 @@ def extract_event_data_from_url(url):
             try:
                 logger.info(f"🎯 Detected SAAM event page - using direct scraping")
                 from scripts.scraper_utils import create_cloudscraper_session
-                from bs4 import BeautifulSoup
                 from datetime import datetime
                 
                 scraper = create_cloudscraper_session()
@@ -323,7 +322,7 @@ def extract_event_data_from_url(url):
                 response = scraper.get(url, timeout=15)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = parse_html(response)
                 
                 # Extract title from h1
                 title = None
@@ -825,8 +824,7 @@ def extract_event_data_from_url(url):
                         logger.info(f"📡 Response status: {response.status_code}")
                         
                         if response.status_code == 200:
-                            from bs4 import BeautifulSoup
-                            soup = BeautifulSoup(response.content, 'html.parser')
+                            soup = parse_html(response)
                             
                             # Extract using the same logic as _extract_ocma_calendar_events
                             # but for a single event page
@@ -1026,7 +1024,7 @@ def extract_event_data_from_url(url):
                         scraper = create_cloudscraper_session()
                         if scraper:
                             response = scraper.get(url, timeout=15)
-                            soup = BeautifulSoup(response.text, 'html.parser')
+                            soup = parse_html(response)
                             page_text = soup.get_text()
                             language = _detect_language(soup, event_data.get('title'), event_data.get('description'), page_text)
                         else:
@@ -1087,7 +1085,7 @@ def extract_event_data_from_url(url):
                         if not language or language == 'English':
                             try:
                                 response = scraper.session.get(url, timeout=15)
-                                soup = BeautifulSoup(response.text, 'html.parser')
+                                soup = parse_html(response)
                                 page_text = soup.get_text()
                                 language = _detect_language(soup, tour_event.get('title'), tour_event.get('description'), page_text)
                             except:
@@ -1146,7 +1144,7 @@ def extract_event_data_from_url(url):
                     if not language or language == 'English':
                         try:
                             response = scraper.get(url, timeout=15)
-                            soup = BeautifulSoup(response.text, 'html.parser')
+                            soup = parse_html(response)
                             page_text = soup.get_text()
                             language = _detect_language(soup, event_data.get('title'), event_data.get('description'), page_text)
                         except:
@@ -1227,7 +1225,7 @@ def extract_event_data_from_url(url):
                         # Re-detect from the page if not already set
                         try:
                             response = scraper.get(url, timeout=15)
-                            soup = BeautifulSoup(response.text, 'html.parser')
+                            soup = parse_html(response)
                             page_text = soup.get_text()
                             language = _detect_language(soup, event_data.get('title'), event_data.get('description'), page_text)
                         except:
@@ -1306,7 +1304,7 @@ def extract_event_data_from_url(url):
             from scripts.llm_url_extractor import extract_event_with_llm
             return extract_event_with_llm(url)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         page_text = soup.get_text()
         
         # Extract event information
@@ -1904,7 +1902,7 @@ def scrape_event_from_url(url, venue, city, period_start, period_end, override_d
                         raise
                     logger.warning(f"Request failed on attempt {attempt + 1}: {e}")
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response)
             page_text = soup.get_text()
             
             # Extract basic event information
@@ -2084,7 +2082,7 @@ def scrape_event_from_url(url, venue, city, period_start, period_end, override_d
                             scraper = create_cloudscraper_session()
                             if scraper:
                                 response = scraper.get(url, timeout=15)
-                                soup = BeautifulSoup(response.text, 'html.parser')
+                                soup = parse_html(response)
                                 page_text = soup.get_text()
                                 language = _detect_language(soup, title, description, page_text)
                         except Exception:
@@ -2192,7 +2190,7 @@ def scrape_event_from_url(url, venue, city, period_start, period_end, override_d
                             scraper = create_cloudscraper_session()
                             if scraper:
                                 response = scraper.get(url, timeout=15)
-                                soup = BeautifulSoup(response.text, 'html.parser')
+                                soup = parse_html(response)
                                 page_text = soup.get_text()
                             else:
                                 page_text = f"{title} {description}"
@@ -2224,7 +2222,7 @@ def scrape_event_from_url(url, venue, city, period_start, period_end, override_d
                         scraper = create_cloudscraper_session()
                         if scraper:
                             response = scraper.get(url, timeout=15)
-                            soup = BeautifulSoup(response.text, 'html.parser')
+                            soup = parse_html(response)
                             page_text = soup.get_text()
                             language = _detect_language(soup, title, description, page_text)
                     except Exception:
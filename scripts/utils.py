@@ -56,9 +56,6 @@ ensure_env_loaded()
 app_config = get_app_config()
 DEFAULT_MAX_VENUES = app_config['max_venues_per_city']
 
-# Ensure environment is loaded
-ensure_env_loaded()
-
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -80,6 +77,9 @@ from scripts.dynamic_prompts import DynamicPromptGenerator
 # Import venue types from centralized module
 from scripts.venue_types import get_allowed_venue_types
 
+# Compiled title/description rules (navigation, headings, language, baby-friendly, ...)
+from scripts import title_rules
+
 # Virtual environment auto-activation
 def ensure_venv_activated():
     """Ensure virtual environment is activated and dependencies are available"""
@@ -279,54 +279,23 @@ def is_navigation_text(title: str) -> bool:
     Returns:
         True if the title appears to be navigation text, False otherwise
     """
-    if not title:
-        return False
-    
-    title = title.strip()
-    
-    # Length check: legitimate event titles are rarely longer than 200 characters
-    # Navigation text concatenated together can be much longer
-    if len(title) > 200:
-        return True
-    
-    title_lower = title.lower().strip()
-    
-    # Navigation keywords that indicate this is menu/navigation text
-    navigation_keywords = [
-        'exhibits', 'exhibitions', 'group visits', 'field trips', 'events', 
-        'current events', 'press', 'about us', 'about', 'buy gift cards', 
-        'gift cards', 'contact', 'buy tickets', 'tickets', 'visit', 'visits',
-        'hours', 'admission', 'directions', 'parking', 'accessibility',
-        'shop', 'store', 'membership', 'donate', 'support', 'news', 'blog',
-        'search', 'menu', 'navigation', 'skip to', 'home', 'main', 'site map'
-    ]
-    
-    # Count how many navigation keywords appear in the title
-    keyword_count = sum(1 for keyword in navigation_keywords if keyword in title_lower)
-    
-    # If title contains 3+ navigation keywords, it's likely navigation text
-    if keyword_count >= 3:
-        return True
-    
-    # Check for patterns that indicate navigation (repeated phrases, etc.)
-    # If the same word appears multiple times, it's likely navigation
-    words = title_lower.split()
-    if len(words) > 5:
-        word_counts = {}
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
-        # If any word appears 2+ times in a long title, it might be navigation
-        if max(word_counts.values()) >= 2 and keyword_count >= 2:
-            return True
-    
-    # Check if title is just a list of navigation items (no actual event name)
-    # Pattern: multiple capitalized words that are all navigation keywords
-    if len(words) >= 5:
-        navigation_word_count = sum(1 for word in words if word in navigation_keywords)
-        if navigation_word_count >= len(words) * 0.6:  # 60%+ are navigation words
-            return True
-    
-    return False
+    return title_rules.is_navigation(title)
+
+
+# Venue name suffixes removed from titles ("| National Gallery of Art", "- Museum Name")
+_VENUE_SUFFIX_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\s*\|\s*National Gallery of Art\s*$',
+        r'\s*-\s*National Gallery of Art\s*$',
+        r'\s*\|\s*Smithsonian.*?Museum\s*$',
+        r'\s*-\s*Smithsonian.*?Museum\s*$',
+        r'\s*\|\s*.*?Museum\s*$',  # Generic | Museum Name
+        r'\s*-\s*.*?Museum\s*$',   # Generic - Museum Name
+    )
+]
+_HOUR_RUN_ON = re.compile(r'\b(Hour)([A-Z][a-z])')
+_CAMEL_RUN_ON = re.compile(r"([a-z])([A-Z][a-z])")
+_WHITESPACE = re.compile(r'\s+')
 
 
 def clean_event_title(title: str) -> str:
@@ -359,27 +328,17 @@ def clean_event_title(title: str) -> str:
             return None
     
     # Remove common venue name suffix patterns (case-insensitive)
-    # Pattern: | Venue Name or - Venue Name at the end
-    patterns = [
-        r'\s*\|\s*National Gallery of Art\s*$',
-        r'\s*-\s*National Gallery of Art\s*$',
-        r'\s*\|\s*Smithsonian.*?Museum\s*$',
-        r'\s*-\s*Smithsonian.*?Museum\s*$',
-        r'\s*\|\s*.*?Museum\s*$',  # Generic | Museum Name
-        r'\s*-\s*.*?Museum\s*$',   # Generic - Museum Name
-    ]
-    
-    for pattern in patterns:
-        title = re.sub(pattern, '', title, flags=re.IGNORECASE)
+    for pattern in _VENUE_SUFFIX_PATTERNS:
+        title = pattern.sub('', title)
     
     # Fix missing space between "Hour" and "Conversation" (e.g., "Art Happy HourConversation" -> "Art Happy Hour Conversation")
-    title = re.sub(r'\b(Hour)([A-Z][a-z])', r'\1 \2', title)
+    title = _HOUR_RUN_ON.sub(r'\1 \2', title)
     
     # Fix missing spaces before capital letters after lowercase (e.g., "wordWord" -> "word Word")
-    title = re.sub(r"([a-z])([A-Z][a-z])", r"\1 \2", title)
+    title = _CAMEL_RUN_ON.sub(r"\1 \2", title)
     
     # Normalize multiple spaces to single space
-    title = re.sub(r'\s+', ' ', title)
+    title = _WHITESPACE.sub(' ', title)
     
     title = title.strip()
     
@@ -849,45 +808,7 @@ def is_category_heading(title: str) -> bool:
     Returns:
         True if the title is a category heading, False otherwise
     """
-    if not title:
-        return False
-    
-    title_lower = title.lower().strip()
-    
-    # Exact matches for common category headings
-    category_headings = [
-        'past exhibitions',
-        'traveling exhibitions',
-        'upcoming exhibitions',
-        'current exhibitions',
-        'past exhibition',
-        'traveling exhibition',
-        'upcoming exhibition',
-        'current exhibition',
-        'browse exhibitions',
-        'view all exhibitions',
-        'all exhibitions',
-        'exhibitions',
-        'exhibition'
-    ]
-    
-    if title_lower in category_headings:
-        return True
-    
-    # Pattern matches for category headings
-    import re
-    category_patterns = [
-        r'^(past|traveling|upcoming|current)\s+exhibitions?$',
-        r'^browse\s+exhibitions?$',
-        r'^view\s+all\s+exhibitions?$',
-        r'^all\s+exhibitions?$',
-    ]
-    
-    for pattern in category_patterns:
-        if re.match(pattern, title_lower):
-            return True
-    
-    return False
+    return title_rules.is_heading(title)
 
 
 def is_spanish_language_event(title: str) -> bool:
@@ -896,9 +817,7 @@ def is_spanish_language_event(title: str) -> bool:
     (e.g. "Spanish-Language Walk-In Tours", "Spanish Language Tour").
     These should be filtered from results for now.
     """
-    if not title or not isinstance(title, str):
-        return False
-    return bool(re.search(r'\bspanish[\s-]language\b', title.lower()))
+    return title_rules.is_spanish_language(title)
 
 
 def clean_text_field(value):
@@ -1480,7 +1399,7 @@ def validate_database_schema() -> Dict[str, Any]:
 
 # File utilities
 def update_scraping_progress(step, total_steps, message, events_found=0, events_saved=0, events_updated=0, venue_name=None):
-    """Update scraping progress file for real-time tracking
+    """Update scraping progress for real-time tracking (scripts/progress_bus.py)
     
     Args:
         step: Current step number (1-based)
@@ -1492,55 +1411,28 @@ def update_scraping_progress(step, total_steps, message, events_found=0, events_
         venue_name: Name of venue being scraped (optional)
     """
     try:
-        import json
-        from datetime import datetime
+        from scripts.progress_bus import progress
         
-        # Get project root (parent of scripts directory)
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        progress_file = os.path.join(project_root, 'scraping_progress.json')
-        
-        # Read existing progress or create new
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r') as f:
-                progress_data = json.load(f)
-        else:
-            progress_data = {
-                'current_step': 1,
-                'total_steps': total_steps,
-                'percentage': 0,
-                'message': 'Starting...',
-                'timestamp': datetime.now().isoformat(),
-                'events_found': 0,
-                'events_saved': 0,
-                'events_updated': 0,
-                'venues_processed': 0,
-                'total_venues': 1,
-                'current_venue': venue_name or 'Unknown',
-                'recent_events': []
-            }
-        
-        # Update progress
-        progress_data.update({
+        fields = {
             'current_step': step,
             'total_steps': total_steps,
             'percentage': min(int((step / total_steps) * 100), 99),  # Cap at 99% until complete
             'message': message,
-            'timestamp': datetime.now().isoformat(),
-            'events_found': events_found if events_found > 0 else progress_data.get('events_found', 0),
-            'events_saved': events_saved if events_saved > 0 else progress_data.get('events_saved', 0),
-            'events_updated': events_updated if events_updated > 0 else progress_data.get('events_updated', 0),
-        })
-        
-        # Update venue name if provided
+        }
+        # Counts only move when a new value is reported
+        if events_found > 0:
+            fields['events_found'] = events_found
+        if events_saved > 0:
+            fields['events_saved'] = events_saved
+        if events_updated > 0:
+            fields['events_updated'] = events_updated
         if venue_name:
-            progress_data['current_venue'] = venue_name
-        
-        with open(progress_file, 'w') as f:
-            json.dump(progress_data, f)
+            fields['current_venue'] = venue_name
+        progress.update(**fields)
     except Exception as e:
         # Don't fail if progress update fails - just log it
         import logging
-        logging.getLogger(__name__).debug(f"Could not update progress file: {e}")
+        logging.getLogger(__name__).debug(f"Could not update progress: {e}")
 
 
 def ensure_directory_exists(path: str) -> bool:
@@ -0,0 +1,250 @@
+"""
+Buffered visit logging for ``/api/log-visit`` and pre-aggregated stats for ``/api/admin/visit-stats``.
+
+- **Recording** (``visits.record()``) appends the visit to an in-memory buffer under a lock; the
+  request never touches the database. The visit's timestamp is taken at record time.
+- **Flushing:** a background thread writes the buffer in one transaction once it holds
+  ``VISIT_FLUSH_SIZE`` visits or ``VISIT_FLUSH_INTERVAL`` seconds after the oldest buffered
+  visit, whichever comes first. The same transaction adds the batch's per-day, per-city counts
+  to ``visit_daily_stats``, so the rollup always matches the ``visits`` table. A batch that fails
+  (e.g. a ``city_id`` that no longer exists) is retried row by row and bad rows are dropped.
+  If the database is unreachable visits stay buffered, up to ``VISIT_BUFFER_MAX``.
+- **Reading:** totals and by-city counts come from ``visit_daily_stats`` (a handful of rows per
+  day) instead of counting ``visits``. The rollup is rebuilt from ``visits`` when it is empty
+  and visits exist (first deploy, or after a manual reset).
+
+Without ``configure(engine, table)`` (standalone scripts) visits are discarded on flush.
+
+Configuration (env): ``VISIT_FLUSH_SIZE`` (default 50), ``VISIT_FLUSH_INTERVAL`` seconds
+(default 5), ``VISIT_BUFFER_MAX`` (default 5000).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Column, Date, Integer, MetaData, Table, delete, func, insert, select, update
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_BUFFER_MAX = 5000
+NO_CITY = 0  # visit_daily_stats.city_id for visits without a city (main page)
+
+metadata = MetaData()
+
+visit_daily_stats = Table(
+    'visit_daily_stats', metadata,
+    Column('day', Date, primary_key=True),
+    Column('city_id', Integer, primary_key=True, autoincrement=False),
+    Column('count', Integer, nullable=False),
+)
+
+
+class VisitRecorder:
+    """Per-process visit buffer, flushed to ``visits`` and ``visit_daily_stats`` in batches."""
+
+    def __init__(self, engine=None, table: Optional[Table] = None, flush_size: int = DEFAULT_FLUSH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, buffer_max: int = DEFAULT_BUFFER_MAX):
+        self.engine = engine
+        self.table = table
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = max(0.05, flush_interval)
+        self.buffer_max = max(self.flush_size, buffer_max)
+        self._buffer: List[Dict[str, Any]] = []
+        self._oldest: Optional[float] = None
+        self._buffer_pid = os.getpid()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher_pid = None
+        self._tables_ready = False
+
+    def configure(self, engine, table: Table) -> None:
+        self.engine = engine
+        self.table = table
+        self._tables_ready = False
+
+    # -- recording -----------------------------------------------------------------------------
+
+    def record(self, **fields) -> None:
+        """Buffer one visit (``visits`` column values); ``timestamp`` defaults to now (UTC)."""
+        fields.setdefault('timestamp', datetime.utcnow())
+        with self._lock:
+            if self._buffer_pid != os.getpid():
+                # Forked worker: the parent flushes its own copy of the buffer
+                self._buffer, self._oldest, self._buffer_pid = [], None, os.getpid()
+            if len(self._buffer) >= self.buffer_max:
+                del self._buffer[0]
+                logger.warning("visit buffer full, dropping oldest visit")
+            self._buffer.append(fields)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            full = len(self._buffer) >= self.flush_size
+        self._ensure_flusher()
+        if full:
+            self._wake.set()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    # -- flushing ------------------------------------------------------------------------------
+
+    def _ensure_flusher(self) -> None:
+        if self.engine is None or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_loop, name='visit-recorder-flusher', daemon=True).start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._lock:
+                due = None if self._oldest is None else self._oldest + self.flush_interval - time.monotonic()
+                full = len(self._buffer) >= self.flush_size
+            if full or (due is not None and due <= 0):
+                self.flush()
+                continue
+            self._wake.wait(due if due is not None else self.flush_interval)
+            self._wake.clear()
+
+    def _begin(self):
+        if not self._tables_ready:
+            metadata.create_all(self.engine, checkfirst=True)
+            with self.engine.begin() as conn:
+                for index in self.table.indexes:
+                    index.create(conn, checkfirst=True)
+            self._tables_ready = True
+        return self.engine.begin()
+
+    def flush(self) -> int:
+        """Write buffered visits now; returns how many were stored."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer, self._oldest = self._buffer, [], None
+            if not batch or self.engine is None:
+                return 0
+            try:
+                self._store(batch)
+                return len(batch)
+            except Exception as e:
+                if _is_connection_error(e):
+                    logger.debug(f"visit flush failed, keeping {len(batch)} visits buffered: {e}")
+                    self._requeue(batch)
+                    return 0
+                logger.debug(f"visit batch flush failed ({len(batch)} visits), storing one by one: {e}")
+            stored = 0
+            for position, row in enumerate(batch):
+                try:
+                    self._store([row])
+                    stored += 1
+                except Exception as e:
+                    if _is_connection_error(e):
+                        self._requeue(batch[position:])
+                        break
+                    logger.warning(f"dropping visit that could not be stored: {e}")
+            return stored
+
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._buffer[:0] = rows
+            del self._buffer[:max(0, len(self._buffer) - self.buffer_max)]
+            if self._buffer and self._oldest is None:
+                self._oldest = time.monotonic()
+
+    def _store(self, rows: List[Dict[str, Any]]) -> None:
+        counts = Counter((row['timestamp'].date(), row.get('city_id') or NO_CITY) for row in rows)
+        with self._begin() as conn:
+            conn.execute(insert(self.table), rows)
+            for (day, city_id), count in counts.items():
+                _add_daily_count(conn, day, city_id, count)
+
+    # -- rollup --------------------------------------------------------------------------------
+
+    def ensure_rollup(self) -> int:
+        """Build ``visit_daily_stats`` from ``visits`` if it is empty; returns rows written."""
+        with self._begin() as conn:
+            if conn.execute(select(visit_daily_stats.c.day).limit(1)).first() is not None:
+                return 0
+            if conn.execute(select(self.table.c.id).limit(1)).first() is None:
+                return 0
+        return self.rebuild_rollup()
+
+    def rebuild_rollup(self) -> int:
+        """Recompute ``visit_daily_stats`` from the ``visits`` table."""
+        day = func.date(self.table.c.timestamp)
+        stmt = (
+            select(day, func.coalesce(self.table.c.city_id, NO_CITY), func.count())
+            .group_by(day, func.coalesce(self.table.c.city_id, NO_CITY))
+        )
+        with self._begin() as conn:
+            rows = [
+                {'day': _as_date(row[0]), 'city_id': row[1], 'count': row[2]}
+                for row in conn.execute(stmt)
+            ]
+            conn.execute(delete(visit_daily_stats))
+            if rows:
+                conn.execute(insert(visit_daily_stats), rows)
+        return len(rows)
+
+    def clear(self) -> None:
+        """Discard buffered visits and the rollup (the caller deletes ``visits``)."""
+        with self._lock:
+            self._buffer, self._oldest = [], None
+        if self.engine is not None:
+            with self._begin() as conn:
+                conn.execute(delete(visit_daily_stats))
+
+    def totals_by_city(self, conn) -> Dict[int, int]:
+        """``{city_id: visits}`` from the rollup; ``NO_CITY`` for the main page."""
+        stmt = select(visit_daily_stats.c.city_id, func.sum(visit_daily_stats.c.count)).group_by(
+            visit_daily_stats.c.city_id
+        )
+        return {city_id: int(total) for city_id, total in conn.execute(stmt)}
+
+
+def _add_daily_count(conn, day, city_id: int, count: int) -> None:
+    key = (visit_daily_stats.c.day == day) & (visit_daily_stats.c.city_id == city_id)
+    updated = conn.execute(
+        update(visit_daily_stats).where(key).values(count=visit_daily_stats.c.count + count)
+    ).rowcount
+    if not updated:
+        # A concurrent first insert for the same key fails this transaction; flush() retries it
+        conn.execute(insert(visit_daily_stats).values(day=day, city_id=city_id, count=count))
+
+
+def _as_date(value):
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], '%Y-%m-%d').date()
+    return value
+
+
+def _is_connection_error(error: Exception) -> bool:
+    return bool(getattr(error, 'connection_invalidated', False)) or type(error).__name__ == 'OperationalError'
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+# Process-wide recorder; the app calls visits.configure(db.engine, Visit.__table__)
+visits = VisitRecorder(
+    flush_size=_env_number('VISIT_FLUSH_SIZE', DEFAULT_FLUSH_SIZE, int),
+    flush_interval=_env_number('VISIT_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL, float),
+    buffer_max=_env_number('VISIT_BUFFER_MAX', DEFAULT_BUFFER_MAX, int),
+)
+atexit.register(visits.flush)
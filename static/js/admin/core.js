@@ -1,12 +1,44 @@
-// Redirect to login on 401 from admin API (session expired or not logged in)
+// Redirect to login on 401 from admin API (session expired or not logged in).
+// Scrape endpoints answer 202 with a job id (scrapes run on the job worker): wait for the job
+// and resolve with its final response, so callers keep reading the scrape result as before.
 (function() {
     const originalFetch = window.fetch;
+    const JOB_POLL_MS = 2000;
+    const FINISHED_JOB_STATUSES = ['succeeded', 'failed', 'cancelled'];
+
+    async function waitForScrapeJob(jobId) {
+        while (true) {
+            await new Promise(resolve => setTimeout(resolve, JOB_POLL_MS));
+            const statusResponse = await originalFetch(`/api/admin/jobs/${jobId}`, { cache: 'no-store' });
+            if (!statusResponse.ok) continue;
+            const job = await statusResponse.json();
+            if (!FINISHED_JOB_STATUSES.includes(job.status)) continue;
+            const result = job.result || {};
+            const body = result.body || {
+                success: false,
+                error: job.status === 'cancelled' ? 'Scrape job cancelled' : (job.error || 'Scrape job failed')
+            };
+            return new Response(JSON.stringify(body), {
+                status: result.status_code || 500,
+                headers: { 'Content-Type': 'application/json', 'X-Job-Id': String(jobId) }
+            });
+        }
+    }
+
     window.fetch = function(url, options) {
-        return originalFetch.apply(this, arguments).then(function(response) {
+        return originalFetch.apply(this, arguments).then(async function(response) {
             if (response.status === 401 && response.url && response.url.includes('/api/admin/')) {
                 window.location.href = '/auth/login';
                 return Promise.reject(new Error('Authentication required'));
             }
+            if (response.status === 202 && response.url && response.url.includes('/api/admin/scrape-')) {
+                const queued = await response.clone().json().catch(() => null);
+                if (queued && queued.job_id) {
+                    // Progress polling follows this job's channel (concurrent scrapes don't mix)
+                    window.activeScrapeJobId = queued.job_id;
+                    return waitForScrapeJob(queued.job_id);
+                }
+            }
             return response;
         });
     };
@@ -65,6 +65,68 @@ function toggleEventsWithoutTimesVisibilityAdmin() {
     applyEventFilters(); // Re-apply filters to update display
 }
 
+// Admin grid pages through /api/admin/events (keyset cursor); filters and sort run server-side
+const ADMIN_EVENTS_PAGE_SIZE = 200;
+const ADMIN_EVENTS_SERVER_SORTS = ['updated_at', 'created_at', 'start_date', 'title', 'id'];
+let adminEventsCursor = null;
+let adminEventsTotal = null;
+let adminEventsSort = { field: 'updated_at', order: 'desc' };
+let adminEventsRequest = 0;
+let adminEventsFilterTimer = null;
+
+function adminEventsUrl(cursor) {
+    const params = new URLSearchParams({
+        limit: ADMIN_EVENTS_PAGE_SIZE,
+        sort: adminEventsSort.field,
+        order: adminEventsSort.order
+    });
+    const searchTerm = (document.getElementById('eventSearch')?.value || '').trim();
+    const typeFilter = document.getElementById('eventTypeFilter')?.value;
+    const cityFilter = document.getElementById('eventCityFilter')?.value;
+    const venueFilter = document.getElementById('eventVenueFilter')?.value;
+    if (searchTerm) params.append('q', searchTerm);
+    if (typeFilter) params.append('event_type', typeFilter);
+    if (cityFilter && /^\d+$/.test(cityFilter)) params.append('city_id', cityFilter);
+    if (venueFilter) params.append('venue_name', venueFilter);
+    if (!showRecurringToursAdmin) params.append('hide_recurring_tours', 'true');
+    if (!showEventsWithoutTimesAdmin) params.append('has_times', 'true');
+    if (cursor) params.append('cursor', cursor);
+    return `/api/admin/events?${params}`;
+}
+
+// Fetch one page; append=true adds the next page to the loaded rows
+async function loadEventsPage(append = false) {
+    const requestId = ++adminEventsRequest;
+    const response = await fetch(adminEventsUrl(append ? adminEventsCursor : null));
+    const page = await response.json();
+    if (page.error) throw new Error(page.error);
+    if (requestId !== adminEventsRequest) return;  // a newer filter change superseded this request
+    
+    window.allEvents = append ? (window.allEvents || []).concat(page.events) : page.events;
+    window.filteredEvents = window.allEvents;
+    adminEventsCursor = page.next_cursor;
+    if (!append) adminEventsTotal = page.total_estimate;
+    updateEventFilterSummary();
+    renderEventsTable();
+}
+
+async function loadMoreEvents() {
+    if (!adminEventsCursor) return;
+    try {
+        await loadEventsPage(true);
+    } catch (error) {
+        console.error('Error loading more events:', error);
+    }
+}
+
+// Server-side sort for the events table header (sortTable in venues.js); false = sort loaded rows locally
+function sortEventsOnServer(field, ascending) {
+    if (!ADMIN_EVENTS_SERVER_SORTS.includes(field)) return false;
+    adminEventsSort = { field: field, order: ascending ? 'asc' : 'desc' };
+    loadEventsPage().catch(error => console.error('Error sorting events:', error));
+    return true;
+}
+
 // Load events data
 async function loadEvents() {
     try {
@@ -84,23 +146,8 @@ async function loadEvents() {
             }
         }
         
-        const response = await fetch('/api/admin/events');
-        const events = await response.json();
-        
-        if (events.error) throw new Error(events.error);
-        
-        // Sort by most recently updated first (descending)
-        events.sort((a, b) => {
-            const aDate = new Date(a.updated_at || a.created_at || 0);
-            const bDate = new Date(b.updated_at || b.created_at || 0);
-            return bDate - aDate; // Descending order (most recent first)
-        });
-        
-        // Store events globally for filtering
-        window.allEvents = events;
-        
-        // Apply filters (which will hide recurring tours by default)
-        applyEventFilters();
+        // First page with the current filters (recurring tours hidden by default)
+        await loadEventsPage();
         
         // Update recurring tours toggle button
         const toggleBtn = document.getElementById('recurringToursToggleBtn');
@@ -114,8 +161,6 @@ async function loadEvents() {
             noTimesToggleBtn.textContent = showEventsWithoutTimesAdmin ? '▼ Hide' : '▶ Show';
         }
         
-        // Render the events table
-        renderEventsTable();
         populateEventFilters();
         
     } catch (error) {
@@ -703,49 +748,21 @@ function deleteEvent(id) {
 function applyEventFilters() {
     if (!window.allEvents) return;
     
-    const searchTerm = document.getElementById('eventSearch').value.toLowerCase();
-    const typeFilter = document.getElementById('eventTypeFilter').value;
-    const cityFilter = document.getElementById('eventCityFilter').value;
-    const venueFilter = document.getElementById('eventVenueFilter').value;
-    
-    window.filteredEvents = window.allEvents.filter(event => {
-        // Filter out recurring tours if not shown
-        if (!showRecurringToursAdmin && event.event_type === 'tour' && isGenericTourTitle(event.title)) {
-            return false;
-        }
-        
-        // Filter out events without both start_time and end_time if not shown
-        if (!showEventsWithoutTimesAdmin) {
-            const hasStartTime = event.start_time && event.start_time.trim() !== '';
-            const hasEndTime = event.end_time && event.end_time.trim() !== '';
-            if (!hasStartTime || !hasEndTime) {
-                return false;
-            }
-        }
-        
-        const matchesSearch = !searchTerm || 
-            event.title.toLowerCase().includes(searchTerm) ||
-            (event.event_type && event.event_type.toLowerCase().includes(searchTerm)) ||
-            (event.description && event.description.toLowerCase().includes(searchTerm));
-        
-        const matchesType = !typeFilter || event.event_type === typeFilter;
-        const matchesCity = !cityFilter || 
-            (event.city_id && String(event.city_id) === cityFilter) ||
-            (event.city_name && event.city_name.toLowerCase() === cityFilter.toLowerCase());
-        const matchesVenue = !venueFilter || event.venue_name === venueFilter;
-        
-        return matchesSearch && matchesType && matchesCity && matchesVenue;
-    });
-    
-    // Sort by most recently updated first (descending) - default sort order
-    window.filteredEvents.sort((a, b) => {
-        const aDate = new Date(a.updated_at || a.created_at || 0);
-        const bDate = new Date(b.updated_at || b.created_at || 0);
-        return bDate - aDate; // Descending order (most recent first)
-    });
-    
-    // Update filter summary
+    // Debounced so typing in the search box sends one request
+    clearTimeout(adminEventsFilterTimer);
+    adminEventsFilterTimer = setTimeout(() => {
+        loadEventsPage().catch(error => console.error('Error filtering events:', error));
+    }, 250);
+}
+
+function updateEventFilterSummary() {
     const summary = document.getElementById('eventFilterSummary');
+    if (!summary) return;
+    const searchTerm = (document.getElementById('eventSearch')?.value || '').trim();
+    const typeFilter = document.getElementById('eventTypeFilter')?.value;
+    const cityFilter = document.getElementById('eventCityFilter')?.value;
+    const venueFilter = document.getElementById('eventVenueFilter')?.value;
+    
     const activeFilters = [];
     if (searchTerm) activeFilters.push(`Search: "${searchTerm}"`);
     if (typeFilter) activeFilters.push(`Type: ${typeFilter}`);
@@ -762,15 +779,25 @@ function applyEventFilters() {
         activeFilters.push(`Events Without Times: Hidden`);
     }
     
-    if (activeFilters.length > 0) {
-        summary.textContent = `Active filters: ${activeFilters.join(' • ')} | Showing ${window.filteredEvents.length} of ${window.allEvents.length} events`;
+    const loaded = (window.allEvents || []).length;
+    const total = adminEventsTotal != null ? ` of ~${adminEventsTotal}` : '';
+    const more = adminEventsCursor
+        ? ' <button onclick="loadMoreEvents()" class="filter-button">⬇ Load more</button>'
+        : '';
+    const prefix = activeFilters.length > 0 ? `Active filters: ${activeFilters.join(' • ')} | ` : '';
+    if (activeFilters.length > 0 || adminEventsCursor) {
+        summary.innerHTML = `${escapeHtmlText(prefix)}Showing ${loaded}${total} events${more}`;
         summary.classList.add('active');
     } else {
         summary.textContent = '';
         summary.classList.remove('active');
     }
-    
-    renderEventsTable();
+}
+
+function escapeHtmlText(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
 }
 
 function clearEventFilters() {
@@ -798,12 +825,15 @@ function populateEventFilters() {
     
     if (!typeFilter || !cityFilter || !venueFilter || !window.allEvents) return;
     
-    const types = [...new Set(window.allEvents.map(event => event.event_type).filter(Boolean))].sort();
+    // Only one page of events is loaded: keep the current choices and list all known venues
+    const selected = { type: typeFilter.value, city: cityFilter.value, venue: venueFilter.value };
+    const types = [...new Set(window.allEvents.map(event => event.event_type).concat(selected.type).filter(Boolean))].sort();
     const cities = [...new Set(window.allEvents.map(event => {
         // Use city_id if available, otherwise use city_name
         return event.city_id ? String(event.city_id) : (event.city_name || '');
     }).filter(Boolean))].sort();
-    const venues = [...new Set(window.allEvents.map(event => event.venue_name).filter(Boolean))].sort();
+    const venueNames = (window.allVenues || []).map(venue => venue.name).concat(window.allEvents.map(event => event.venue_name));
+    const venues = [...new Set(venueNames.concat(selected.venue).filter(Boolean))].sort();
     
     typeFilter.innerHTML = '<option value="">All Types</option>';
     types.forEach(type => {
@@ -828,6 +858,10 @@ function populateEventFilters() {
     venues.forEach(venue => {
         venueFilter.innerHTML += '<option value="' + venue + '">' + venue + '</option>';
     });
+    
+    typeFilter.value = selected.type;
+    cityFilter.value = selected.city;
+    venueFilter.value = selected.venue;
 }
 
 // Suppress browser extension errors (they're not our problem)
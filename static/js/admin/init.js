@@ -2294,7 +2294,7 @@ async function startDCEmbassyEventbriteScraping() {
 }
 
 async function startNGAScraping() {
-    // No polling until scrape-nga writes scraping_progress.json; polling would show stale parade/other runs.
+    // No polling until scrape-nga writes scrape progress; polling would show stale parade/other runs.
     showScrapingProgressModal('National Gallery of Art', false);
     updateScrapingProgress({
         percentage: 5,
@@ -2597,7 +2597,7 @@ async function startCultureDCScraping() {
 }
 
 async function startShootNYCScraping() {
-    showScrapingProgressModal('Shoot New York City', false); // No polling - Shoot NYC does not write to scraping_progress.json
+    showScrapingProgressModal('Shoot New York City', false); // No polling - Shoot NYC does not report scrape progress
     
     try {
         const response = await fetch('/api/admin/scrape-shoot-nyc', {
@@ -2791,7 +2791,7 @@ async function startBigOnionScraping() {
     }
 }
 
-/** Shared admin flow for Meetup group scrapers (progress modal, no scraping_progress.json polling). */
+/** Shared admin flow for Meetup group scrapers (progress modal, no scrape progress polling). */
 async function runMeetupGroupScrape(displayName, apiPath) {
     showScrapingProgressModal(displayName, false);
 
@@ -3103,7 +3103,7 @@ async function resolveAmericanHistoryVenueId() {
 }
 
 async function startAmericanHistoryEventbriteScraping() {
-    // No polling: scrape-eventbrite does not write scraping_progress.json (polling would show stale parade/other runs).
+    // No polling: scrape-eventbrite does not report scrape progress (polling would show stale parade/other runs).
     showScrapingProgressModal('American History (Eventbrite)', false);
     updateScrapingProgress({
         percentage: 5,
@@ -3442,6 +3442,7 @@ function showScrapingProgressModal(sourceName = 'Scraping', usePolling = true) {
     // Reset tracking variables when starting new scraping
     lastEventsSavedCount = 0;
     lastTableRefreshTime = 0;
+    window.activeScrapeJobId = null;
     
     // Create modal if it doesn't exist (replace legacy markup missing the four stat cards)
     let modal = document.getElementById('scrapingProgressModal');
@@ -3620,7 +3621,10 @@ async function pollScrapingProgress() {
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), 5000);
         
-        const response = await fetch('/api/scrape-progress', {
+        const progressUrl = window.activeScrapeJobId
+            ? `/api/scrape-progress?job_id=${window.activeScrapeJobId}`
+            : '/api/scrape-progress';
+        const response = await fetch(progressUrl, {
             signal: controller.signal
         });
         
@@ -109,6 +109,12 @@ function sortTable(tableId, field) {
     table.dataset.currentField = field;
     table.dataset.currentSort = ascending ? 'asc' : 'desc';
     
+    // Events are paged from the server: re-query in the new order instead of sorting one page
+    if (tableId === 'eventsTable' && typeof sortEventsOnServer === 'function' && sortEventsOnServer(field, ascending)) {
+        updateSortArrows(table, field, ascending);
+        return;
+    }
+    
     // Create a copy to sort (don't mutate the original)
     const sortedArray = [...filteredArray].sort((a, b) => {
         let aVal = a[field];
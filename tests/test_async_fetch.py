@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for scraper_utils.fetch_many: input order, per-host cap, 5xx retry.
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.scraper_utils import fetch_many
+
+
+@pytest.fixture
+def server():
+    state = {'active': 0, 'peak': 0, 'hits': {}}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                state['hits'][self.path] = state['hits'].get(self.path, 0) + 1
+                first_hit = state['hits'][self.path] == 1
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            body = f'page {self.path}'.encode()
+            self.send_response(503 if self.path == '/flaky' and first_hit else 200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{httpd.server_port}', state
+    httpd.shutdown()
+
+
+def test_fetch_many_keeps_order_and_caps_per_host(server):
+    base, state = server
+    urls = [f'{base}/p{i}' for i in range(8)]
+    results = fetch_many(urls, per_host=2, use_proxy=False)
+    assert [r.text for r in results] == [f'page /p{i}' for i in range(8)]
+    assert all(r.ok for r in results)
+    assert state['peak'] <= 2
+
+
+def test_fetch_many_retries_server_errors(server):
+    base, _ = server
+    result, = fetch_many([f'{base}/flaky'], retry_backoff=0.01, use_proxy=False)
+    assert result.status_code == 200
+
+
+def test_fetch_many_reports_connection_errors():
+    result, = fetch_many(['http://127.0.0.1:9/'], retries=0, timeout=2, use_proxy=False)
+    assert not result.ok and result.error
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk_loader: in-memory city resolution, upserts by natural key, truncation, replace.
+"""
+import json
+import os
+import sys
+
+import pytest
+from sqlalchemy import (
+    Boolean, Column, DateTime, Float, ForeignKey, Integer, MetaData, String, Table, Text, create_engine,
+    func, select,
+)
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.bulk_loader import VENUE_FIELDS, BulkLoader
+
+
+def _tables():
+    metadata = MetaData()
+    cities = Table(
+        'cities', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('name', String(100), nullable=False),
+        Column('state', String(50)),
+        Column('country', String(100), nullable=False),
+        Column('timezone', String(50), nullable=False),
+    )
+    venue_columns = [Column(f, String(200)) for f in VENUE_FIELDS if f not in ('name', 'venue_type', 'city_id', 'email')]
+    venues = Table(
+        'venues', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('name', String(200), nullable=False),
+        Column('venue_type', String(50), nullable=False),
+        Column('email', String(100)),
+        Column('city_id', Integer, ForeignKey('cities.id'), nullable=False),
+        *venue_columns,
+    )
+    sources = Table(
+        'sources', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('name', String(200), nullable=False),
+        Column('handle', String(100), nullable=False),
+        Column('source_type', String(50), nullable=False),
+        Column('url', String(500)),
+        Column('description', Text),
+        Column('city_id', Integer, ForeignKey('cities.id')),
+        Column('covers_multiple_cities', Boolean),
+        Column('covered_cities', Text),
+        Column('event_types', Text),
+        Column('is_active', Boolean),
+        Column('last_checked', DateTime),
+        Column('last_event_found', DateTime),
+        Column('events_found_count', Integer),
+        Column('reliability_score', Float),
+        Column('posting_frequency', String(50)),
+        Column('notes', Text),
+        Column('scraping_pattern', Text),
+        Column('visibility', String(20)),
+    )
+    events = Table(
+        'events', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('venue_id', Integer, ForeignKey('venues.id')),
+    )
+    return metadata, cities, venues, sources, events
+
+
+def _write_data(data_dir, venues=None, sources=None):
+    data_dir.mkdir(exist_ok=True)
+    (data_dir / 'cities.json').write_text(json.dumps({'metadata': {}, 'cities': {
+        '1': {'name': 'Washington', 'state': 'District of Columbia', 'country': 'United States',
+              'timezone': 'America/New_York'},
+        '2': {'name': 'London', 'state': '', 'country': 'United Kingdom', 'timezone': 'Europe/London'},
+    }}))
+    (data_dir / 'venues.json').write_text(json.dumps({'metadata': {}, 'venues': venues or {
+        '1': {'name': 'Arena Stage', 'venue_type': 'theater', 'city_name': 'Washington, DC',
+              'email': 'x' * 150},
+        '2': {'name': 'Tate Modern', 'venue_type': 'museum', 'city_name': 'london'},
+        '3': {'name': 'Nowhere Hall', 'venue_type': 'museum', 'city_name': 'Atlantis'},
+    }}))
+    (data_dir / 'sources.json').write_text(json.dumps({'metadata': {}, 'sources': sources or {
+        '1': {'name': 'AF Washington DC', 'handle': '@afwashington_dc', 'source_type': 'instagram',
+              'city_id': 1, 'event_types': ['lectures'], 'last_checked': '2025-10-08T20:50:45',
+              'visibility': 'Admin_Only'},
+        '2': {'name': 'London Walks', 'source_type': 'website', 'city_id': 2},
+    }}))
+
+
+@pytest.fixture
+def setup(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'load.db'}")
+    metadata, cities, venues, sources, events = _tables()
+    metadata.create_all(engine)
+    _write_data(tmp_path / 'data')
+    loader = BulkLoader(cities, venues, sources, data_dir=tmp_path / 'data')
+    return engine, loader, cities, venues, sources, events
+
+
+def _rows(engine, table):
+    with engine.connect() as conn:
+        return {row.name: row for row in conn.execute(select(table))}
+
+
+def test_load_resolves_cities_and_truncates(setup):
+    engine, loader, cities, venues, sources, _ = setup
+    with engine.begin() as conn:
+        result = loader.load(conn)
+
+    assert result['cities'].inserted == 2
+    assert (result['venues'].inserted, result['venues'].skipped) == (2, 1)
+    city_ids = {row.name: row.id for row in _rows(engine, cities).values()}
+    loaded = _rows(engine, venues)
+    assert loaded['Arena Stage'].city_id == city_ids['Washington']
+    assert loaded['Tate Modern'].city_id == city_ids['London']
+    assert len(loaded['Arena Stage'].email) == 100
+
+    source_rows = _rows(engine, sources)
+    assert source_rows['AF Washington DC'].event_types == '["lectures"]'
+    assert source_rows['AF Washington DC'].last_checked.year == 2025
+    assert source_rows['AF Washington DC'].visibility == 'admin_only'
+    assert source_rows['London Walks'].handle == ''
+    assert source_rows['London Walks'].city_id == city_ids['London']
+    assert result.throughput()['venues']['rows_per_second'] > 0
+
+
+def test_reload_updates_in_place_and_keeps_absent_fields(setup, tmp_path):
+    engine, loader, cities, venues, sources, _ = setup
+    with engine.begin() as conn:
+        loader.load(conn)
+        conn.execute(venues.update().where(venues.c.name == 'Tate Modern').values(address='Bankside'))
+    before = {name: row.id for name, row in _rows(engine, venues).items()}
+
+    _write_data(tmp_path / 'data', venues={
+        '1': {'name': 'ARENA STAGE ', 'venue_type': 'theatre', 'city_name': 'Washington'},
+        '2': {'name': 'Tate Modern', 'city_name': 'London', 'description': 'Modern art'},
+        '3': {'name': 'Tate Modern', 'city_name': 'London', 'website_url': 'https://tate.org.uk'},
+    })
+    with engine.begin() as conn:
+        result = loader.load(conn)
+
+    assert (result['cities'].inserted, result['cities'].updated) == (0, 2)
+    assert (result['venues'].inserted, result['venues'].updated) == (0, 2)
+    after = _rows(engine, venues)
+    assert {name: row.id for name, row in after.items()} == {'ARENA STAGE': before['Arena Stage'],
+                                                             'Tate Modern': before['Tate Modern']}
+    tate = after['Tate Modern']
+    assert (tate.address, tate.description, tate.website_url, tate.venue_type) == (
+        'Bankside', 'Modern art', 'https://tate.org.uk', 'museum')
+
+
+def test_replace_clears_tables_first(setup):
+    engine, loader, cities, venues, sources, events = setup
+    with engine.begin() as conn:
+        loader.load(conn)
+        conn.execute(events.insert(), [{'venue_id': None}])
+    with engine.begin() as conn:
+        result = loader.load(conn, replace=True, clear=(events, venues, sources, cities))
+
+    assert result['venues'].inserted == 2 and result['venues'].updated == 0
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(events)).scalar() == 0
+        assert conn.execute(select(func.count()).select_from(cities)).scalar() == 2
+
+
+def test_grouped_venues_file_and_rollback(setup, tmp_path):
+    engine, loader, cities, venues, sources, _ = setup
+    _write_data(tmp_path / 'data', venues={
+        '1': {'name': 'Washington', 'venues': [{'name': 'Arena Stage', 'venue_type': 'theater'}]},
+    }, sources={'1': {'name': None, 'city_id': 1}, '2': {'name': 'Bad', 'source_type': None, 'city_id': 1}})
+    with engine.begin() as conn:
+        result = loader.load(conn)
+    assert result['venues'].inserted == 1
+    assert result['sources'].skipped == 1
+    assert _rows(engine, sources)['Bad'].source_type == 'website'
+
+    # A failure anywhere rolls the whole load back
+    (tmp_path / 'data' / 'sources.json').write_text('{not json')
+    with pytest.raises(ValueError):
+        with engine.begin() as conn:
+            loader.load(conn, replace=True, clear=(venues, sources, cities))
+    assert len(_rows(engine, venues)) == 1
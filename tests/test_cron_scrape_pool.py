@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for cron_scrape_pool: per-domain limits, start spacing, result order and error capture.
+"""
+import os
+import sys
+import threading
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.cron.cron_scrape_pool import ScrapeJob, ScrapeResult, ScrapeScheduler, politeness_domain
+
+
+def test_politeness_domain_groups_subdomains():
+    assert politeness_domain('https://npg.si.edu/events') == 'si.edu'
+    assert politeness_domain('https://www.nga.gov/calendar') == 'nga.gov'
+    assert politeness_domain('deyoung.famsf.org') == 'famsf.org'
+    assert politeness_domain(None) == ''
+
+
+def _tracking_job(domain, active, peak, lock, found):
+    def run():
+        with lock:
+            active[domain] = active.get(domain, 0) + 1
+            peak[domain] = max(peak.get(domain, 0), active[domain])
+        time.sleep(0.05)
+        with lock:
+            active[domain] -= 1
+        return ScrapeResult(found=found, saved=found)
+    return ScrapeJob(f'{domain} {found}', domain, run)
+
+
+def test_limits_concurrency_per_domain_and_keeps_job_order():
+    active, peak, lock = {}, {}, threading.Lock()
+    jobs = [_tracking_job('si.edu', active, peak, lock, i) for i in range(3)]
+    jobs += [_tracking_job(f'site{i}.org', active, peak, lock, 10 + i) for i in range(3)]
+    scheduler = ScrapeScheduler(max_workers=4, per_domain=1, domain_interval=0)
+    results = scheduler.run(jobs)
+    assert [r.found for r in results] == [0, 1, 2, 10, 11, 12]
+    assert peak['si.edu'] == 1
+
+
+def test_spaces_job_starts_on_one_domain():
+    starts = []
+    jobs = [ScrapeJob(str(i), 'si.edu', lambda: starts.append(time.monotonic())) for i in range(3)]
+    ScrapeScheduler(max_workers=3, per_domain=3, domain_interval=0.1).run(jobs)
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 3 and min(gaps) >= 0.09
+
+
+def test_job_error_is_captured_in_result():
+    def boom():
+        raise RuntimeError('403 Forbidden')
+    results = ScrapeScheduler(max_workers=2, domain_interval=0).run(
+        [ScrapeJob('bad', 'a.org', boom), ScrapeJob('ok', 'b.org', lambda: ScrapeResult(found=1))]
+    )
+    assert results[0].error == '403 Forbidden'
+    assert results[1].found == 1 and results[1].error is None
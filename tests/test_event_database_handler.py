@@ -11,13 +11,19 @@ Manual integration test steps (run a real scraper and verify):
 """
 import os
 import sys
-from datetime import date, timedelta
+from datetime import date, time as dt_time, timedelta
+from types import SimpleNamespace
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from scripts.event_database_handler import is_event_past
+from scripts.event_database_handler import (
+    _ExistingEventIndex,
+    create_events_in_database,
+    is_event_past,
+    track_save_errors,
+)
 
 
 def test_is_event_past_past_single_day():
@@ -75,6 +81,44 @@ def test_is_event_past_string_dates():
     assert is_event_past({'start_date': yesterday.isoformat(), 'title': 'Past'}) is True
     assert is_event_past({'start_date': today.isoformat(), 'end_date': (today + timedelta(days=1)).isoformat(), 'title': 'Current'}) is False
 
+def _event(id, title, start_date, start_time=None, url=None, venue_id=1, event_type='tour'):
+    return SimpleNamespace(id=id, title=title, start_date=start_date, start_time=start_time, url=url,
+                           source_url=None, venue_id=venue_id, city_id=1, event_type=event_type)
+
+
+def test_bulk_index_matches_recurring_tours_by_url_date_and_time():
+    """Recurring tours sharing one URL match only the instance with the same date and time."""
+    today = date.today()
+    index = _ExistingEventIndex(venue_id=1, city_id=1)
+    ten, two = dt_time(10, 0), dt_time(14, 0)
+    index.add(_event(1, 'Walk-In Tour', today, ten, 'https://nga.gov/tour/'), same_website=True)
+    index.add(_event(2, 'Walk-In Tour', today, two, 'https://nga.gov/tour/'), same_website=True)
+    assert index.find('Walk-In Tour', 'https://nga.gov/tour/', 'tour', today, two).id == 2
+    assert index.find('Other title', 'https://nga.gov/tour/', 'tour', today, ten).id == 1
+    assert index.find('Walk-In Tour', 'https://nga.gov/tour/', 'tour', today, dt_time(16, 0)) is None
+
+
+def test_bulk_index_refresh_after_venue_correction():
+    """An exhibition moved to this venue by an update becomes matchable by title."""
+    today = date.today()
+    index = _ExistingEventIndex(venue_id=1, city_id=1)
+    renwick = _event(5, 'Craft Show', today, venue_id=2, event_type='exhibition')
+    index.add(renwick, same_website=True)
+    assert index.find('Craft Show', '', 'talk', today, None) is None
+    renwick.venue_id = 1
+    index.refresh(renwick)
+    assert index.find('Craft Show', '', 'talk', today, None) is renwick
+
+
+def test_bulk_index_prefers_stored_rows_over_pending():
+    today = date.today()
+    index = _ExistingEventIndex(venue_id=1, city_id=1)
+    pending = _event(None, 'Talk', today)
+    index.add(pending, same_website=True, pending=True)
+    stored = _event(9, 'Talk', today)
+    index.add(stored, same_website=True)
+    assert index.find('Talk', '', 'talk', today, None) is stored
+
 
 def run_tests():
     """Run all tests and report results."""
@@ -87,6 +131,9 @@ def run_tests():
         test_is_event_past_multi_day_fully_past,
         test_is_event_past_no_start_date,
         test_is_event_past_string_dates,
+        test_bulk_index_matches_recurring_tours_by_url_date_and_time,
+        test_bulk_index_refresh_after_venue_correction,
+        test_bulk_index_prefers_stored_rows_over_pending,
     ]
     passed = 0
     for t in tests:
@@ -104,3 +151,16 @@ if __name__ == '__main__':
     print("Running is_event_past tests...")
     ok = run_tests()
     sys.exit(0 if ok else 1)
+
+
+
+def test_track_save_errors_counts_events_the_handler_swallows():
+    session = SimpleNamespace(commit=lambda: None, rollback=lambda: None)
+    Event = SimpleNamespace(__mapper__=SimpleNamespace(relationships={}))  # no series support
+    with track_save_errors() as report:
+        counts = create_events_in_database([{'title': None}], 1, 1, 'Museum', SimpleNamespace(session=session),
+                                           Event, None)
+    assert counts == (0, 0, 0) and report.errors == 1
+    with track_save_errors() as report:
+        pass
+    assert report.errors == 0
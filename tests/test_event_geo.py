@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for event_geo: geohash encoding, radius coverage, index range filters and the maintained column.
+"""
+import os
+import random
+import sys
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import Column, Float, ForeignKey, Integer, String, create_engine, select, update
+from sqlalchemy.orm import Session, declarative_base
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.event_geo import (
+    covering_prefixes,
+    decode,
+    distance_km,
+    encode,
+    geohash_filter,
+    haversine_km,
+    parse_point,
+    parse_radius,
+    refresh_event_geohash,
+    register_geo_hooks,
+)
+
+
+def test_encode_decode_round_trip():
+    assert encode(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+    latitude, longitude = decode(encode(38.8913, -77.0199))
+    assert haversine_km(latitude, longitude, 38.8913, -77.0199) < 0.005
+    assert round(haversine_km(38.8977, -77.0365, 40.7484, -73.9857)) == 332  # White House to Empire State
+
+
+@pytest.mark.parametrize('radius_km', [0.2, 2.0, 15.0, 50.0])
+def test_covering_prefixes_contain_every_point_in_radius(radius_km):
+    rng = random.Random(11)
+    for _ in range(40):
+        latitude, longitude = rng.uniform(-60, 60), rng.uniform(-170, 170)
+        prefixes = covering_prefixes(latitude, longitude, radius_km)
+        assert 1 <= len(prefixes) <= 9
+        for _ in range(50):
+            # Random point inside the radius (rejection sample over the bounding box)
+            point_lat = latitude + rng.uniform(-1, 1) * radius_km / 111.0
+            point_lng = longitude + rng.uniform(-1, 1) * radius_km / 50.0
+            if haversine_km(latitude, longitude, point_lat, point_lng) <= radius_km:
+                assert encode(point_lat, point_lng).startswith(tuple(prefixes))
+
+
+def test_parse_point_and_radius():
+    assert parse_point('38.9', '-77.03') == (38.9, -77.03)
+    for latitude, longitude in ((None, '1'), ('x', '1'), ('91', '0')):
+        with pytest.raises(ValueError):
+            parse_point(latitude, longitude)
+    assert parse_radius(None) == 2.0 and parse_radius('500') == 50.0
+    with pytest.raises(ValueError):
+        parse_radius('0')
+
+
+Base = declarative_base()
+
+
+class Venue(Base):
+    __tablename__ = 'venues'
+    id = Column(Integer, primary_key=True)
+    latitude = Column(Float)
+    longitude = Column(Float)
+
+
+class Event(Base):
+    __tablename__ = 'events'
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    venue_id = Column(Integer, ForeignKey('venues.id'))
+    start_latitude = Column(Float)
+    start_longitude = Column(Float)
+    geohash = Column(String(12), index=True)
+
+
+register_geo_hooks(Event, Venue)
+
+
+def _near(engine, latitude, longitude, radius_km):
+    criteria = geohash_filter(sa, Event.geohash, covering_prefixes(latitude, longitude, radius_km))
+    with engine.connect() as conn:
+        rows = conn.execute(select(Event.id, Event.geohash).where(criteria)).all()
+    return sorted(row.id for row in rows if distance_km(latitude, longitude, row.geohash) <= radius_km)
+
+
+def test_geohash_maintained_from_venue_then_event_coordinates():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        museum = Venue(id=1, latitude=38.8913, longitude=-77.0199)
+        session.add_all([
+            museum,
+            Event(id=1, title='Gallery talk', venue_id=1),
+            Event(id=2, title='Walking tour', start_latitude=38.8895, start_longitude=-77.0353),
+            Event(id=3, title='Meeting point ignored', venue_id=1, start_latitude=40.0, start_longitude=-75.0),
+            Event(id=4, title='Online'),
+            Event(id=5, title='Far away', start_latitude=40.7484, start_longitude=-73.9857),
+        ])
+        session.commit()
+        assert _near(engine, 38.8900, -77.0250, 2.0) == [1, 2, 3]
+        assert _near(engine, 38.8913, -77.0199, 0.1) == [1, 3]
+
+        museum.latitude, museum.longitude = 40.7479, -73.9850
+        session.get(Event, 2).start_latitude = None
+        session.commit()
+    assert _near(engine, 38.8900, -77.0250, 2.0) == []
+    assert _near(engine, 40.7484, -73.9857, 1.0) == [1, 3, 5]
+
+    with engine.begin() as conn:
+        conn.execute(Event.__table__.insert().values(id=6, title='Core insert', venue_id=1))
+        assert refresh_event_geohash(conn, Event, Venue, only_missing=True) == 1
+        assert refresh_event_geohash(conn, Event, Venue) == 0
+    assert 6 in _near(engine, 40.7484, -73.9857, 1.0)
+
+    # Bulk updates refresh the rows they touch, not every event
+    with engine.begin() as conn:  # Core write: no hook sees it
+        conn.execute(Event.__table__.insert().values(id=7, title='Stale',
+                                                     start_latitude=38.8913, start_longitude=-77.0199))
+    with Session(engine) as session:
+        session.execute(update(Event).where(Event.id == 5).values(start_latitude=38.8895, start_longitude=-77.0353))
+        session.commit()
+    assert _near(engine, 38.8900, -77.0250, 2.0) == [5]
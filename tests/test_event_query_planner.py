@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for event_query_planner: time range resolution and the single-statement
+/api/events filter (per-type scope and date predicates).
+"""
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import declarative_base, Session
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.event_query_planner import build_date_filter, build_events_filter, resolve_time_range
+
+Base = declarative_base()
+
+
+class Venue(Base):
+    __tablename__ = 'venues'
+    id = sa.Column(sa.Integer, primary_key=True)
+    city_id = sa.Column(sa.Integer)
+
+
+class Event(Base):
+    __tablename__ = 'events'
+    id = sa.Column(sa.Integer, primary_key=True)
+    title = sa.Column(sa.String(200))
+    event_type = sa.Column(sa.String(50))
+    start_date = sa.Column(sa.Date)
+    end_date = sa.Column(sa.Date)
+    city_id = sa.Column(sa.Integer)
+    venue_id = sa.Column(sa.Integer)
+
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def session():
+    engine = sa.create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        s.add_all([
+            Venue(id=1, city_id=1),
+            Venue(id=2, city_id=2),
+            # Tour at a city-1 venue but without city_id: matched through the venue
+            Event(title='Venue tour', event_type='tour', start_date=TODAY, venue_id=1),
+            # Festival at a city-1 venue but without city_id: festivals are city-only
+            Event(title='Venue festival', event_type='festival', start_date=TODAY,
+                  end_date=TODAY + timedelta(days=2), venue_id=1),
+            # Exhibition that started last month and is still running: overlap match
+            Event(title='Running show', event_type='exhibition', start_date=TODAY - timedelta(days=30),
+                  end_date=TODAY + timedelta(days=30), city_id=1),
+            # Talk that started last month: point-in-range excludes it
+            Event(title='Old talk', event_type='talk', start_date=TODAY - timedelta(days=30), city_id=1),
+            Event(title='Food fair', event_type='food', start_date=TODAY, city_id=1),
+            Event(title='Generic', event_type='event', start_date=TODAY, city_id=1),
+            Event(title='Improv night', event_type='improv', start_date=TODAY, city_id=1),
+            Event(title='Other city', event_type='tour', start_date=TODAY, city_id=2),
+        ])
+        s.commit()
+        yield s
+
+
+def _titles(session, event_type=None, time_range='today'):
+    start_date, end_date = resolve_time_range(time_range, TODAY)
+    criteria = build_events_filter(sa, Event, Venue, 1, start_date, end_date, event_type)
+    return sorted(e.title for e in session.query(Event).filter(criteria))
+
+
+def test_resolve_time_range_windows():
+    assert resolve_time_range('today', TODAY) == (TODAY, TODAY)
+    assert resolve_time_range('this_week', TODAY) == (TODAY, TODAY + timedelta(days=6))
+    assert resolve_time_range('next_month', TODAY) == (TODAY + timedelta(days=30), TODAY + timedelta(days=59))
+    assert resolve_time_range('all', TODAY) == (None, None)
+    assert resolve_time_range('custom', TODAY, '2026-01-01', '2026-01-31') == (date(2026, 1, 1), date(2026, 1, 31))
+
+
+def test_resolve_time_range_errors():
+    with pytest.raises(ValueError, match='Invalid time range'):
+        resolve_time_range('someday', TODAY)
+    with pytest.raises(ValueError, match='required'):
+        resolve_time_range('custom', TODAY, '2026-01-01')
+    with pytest.raises(ValueError, match='YYYY-MM-DD'):
+        resolve_time_range('custom', TODAY, '01/01/2026', '2026-01-31')
+
+
+def test_all_types_single_statement(session):
+    assert _titles(session) == ['Food fair', 'Generic', 'Improv night', 'Running show', 'Venue tour']
+
+
+def test_time_range_all_skips_date_predicates(session):
+    assert 'Old talk' in _titles(session, time_range='all')
+
+
+def test_festival_is_city_only(session):
+    assert _titles(session, 'festival') == []
+
+
+def test_other_excludes_generic_event_type(session):
+    assert _titles(session, 'other') == ['Food fair', 'Improv night']
+
+
+def test_unknown_type_matches_exactly(session):
+    assert _titles(session, 'food') == ['Food fair']
+
+
+def test_date_filter_keeps_type_rules_without_city_scope(session):
+    criteria = build_date_filter(sa, Event, TODAY, TODAY)
+    titles = sorted(e.title for e in session.query(Event).filter(criteria))
+    assert titles == ['Food fair', 'Generic', 'Improv night', 'Other city', 'Running show', 'Venue festival',
+                      'Venue tour']
+    assert [e.title for e in session.query(Event).filter(build_date_filter(sa, Event, TODAY, TODAY, 'exhibition'))] \
+        == ['Running show']
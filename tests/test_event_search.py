@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for event_search: query parsing, the SQLite FTS5 index, ranking and session maintenance.
+"""
+import os
+import sys
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, Text, create_engine, select, update
+from sqlalchemy.orm import Session, declarative_base
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.event_search import (
+    create_search_index,
+    match_expression,
+    query_terms,
+    refresh_search_index,
+    register_search_hooks,
+    search_hits,
+)
+
+Base = declarative_base()
+
+
+class Venue(Base):
+    __tablename__ = 'venues'
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class Event(Base):
+    __tablename__ = 'events'
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    description = Column(Text)
+    artists = Column(Text)
+    curator = Column(String)
+    organizer = Column(String)
+    venue_id = Column(Integer, ForeignKey('venues.id'))
+
+
+register_search_hooks(Event, Venue)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        assert create_search_index(conn)
+        assert not create_search_index(conn)
+    return engine
+
+
+def _search(engine, text):
+    hits = search_hits(engine, query_terms(text))
+    with engine.connect() as conn:
+        return [row.event_id for row in conn.execute(select(hits.c.event_id).order_by(hits.c.score, hits.c.event_id))]
+
+
+def test_query_terms_and_match_expression():
+    assert query_terms('  Monet, "Water-Lilies" a monet ') == ['monet', 'water', 'lilies']
+    with pytest.raises(ValueError):
+        query_terms('a ! ?')
+    assert match_expression(['mus', 'art'], 'sqlite') == '"mus"* "art"*'
+    assert match_expression(['mus', 'art'], 'postgresql') == 'mus:* & art:*'
+
+
+def test_session_writes_maintain_index_and_ranking(engine):
+    with Session(engine) as session:
+        museum = Venue(id=1, name='National Gallery of Art')
+        session.add_all([
+            museum,
+            Event(id=1, title='Impressionist Landscapes', description='Monet and friends', venue_id=1),
+            Event(id=2, title='Evening Lecture', description='A talk about Monet', curator='Jane Doe'),
+            Event(id=3, title='Monet: Water Lilies', artists='Claude Monet'),
+            Event(id=4, title='Photowalk', organizer='DC Urban Walkers'),
+        ])
+        session.commit()
+
+        assert _search(engine, 'monet')[0] == 3  # title + artists outrank description-only matches
+        assert set(_search(engine, 'monet')) == {1, 2, 3}
+        assert _search(engine, 'impress land') == [1]  # every term, as prefixes
+        assert _search(engine, 'walkers') == [4]
+        assert _search(engine, 'national gallery') == [1]  # venue name
+
+        museum.name = 'Smithsonian American Art Museum'
+        session.get(Event, 4).title = 'Night Photography'
+        session.delete(session.get(Event, 2))
+        session.commit()
+
+    assert _search(engine, 'national') == []
+    assert _search(engine, 'smithsonian') == [1]
+    assert _search(engine, 'night photo') == [4]
+    assert set(_search(engine, 'monet')) == {1, 3}
+
+
+def test_bulk_statements_refresh_their_rows_and_rollback_discards(engine):
+    with Session(engine) as session:
+        session.add_all([Event(id=1, title='Gallery Talk'), Event(id=3, title='Garden Concert')])
+        session.commit()
+        with engine.begin() as conn:  # Core write: no hook sees it
+            conn.execute(Event.__table__.insert().values(id=4, title='Unindexed Garden Walk'))
+
+        session.execute(update(Event).where(Event.id == 1).values(title='Sculpture Garden Tour'))
+        session.query(Event).filter(Event.title.like('%Concert')).delete(synchronize_session=False)
+        session.commit()
+        assert _search(engine, 'sculpture') == [1]
+        assert _search(engine, 'garden') == [1]  # scoped to the touched rows, not a rebuild
+
+        session.add(Event(id=2, title='Cancelled Concert'))
+        session.flush()
+        session.rollback()
+    assert _search(engine, 'concert') == []
+
+    with engine.begin() as conn:
+        conn.execute(Event.__table__.insert().values(id=5, title='Loaded Without ORM'))
+        refresh_search_index(conn, Event, Venue)
+    assert _search(engine, 'loaded') == [5]
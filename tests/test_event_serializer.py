@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for event_serializer helpers shared by Event.to_dict() and the projected serializer.
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.event_serializer import (
+    FULL_PROFILE_FIELDS,
+    LIST_PROFILE_FIELDS,
+    event_image_url,
+    event_maps_link,
+    venue_image_url,
+    _city_timezone,
+)
+
+
+def test_venue_image_url_photo_reference_json():
+    assert venue_image_url('{"photo_reference": "abc"}') == '/api/image/abc'
+
+
+def test_venue_image_url_google_maps_url():
+    url = 'https://maps.googleapis.com/maps/api/place/photo?photoreference=XYZ&maxwidth=400'
+    assert venue_image_url(url) == '/api/image/XYZ'
+
+
+def test_venue_image_url_external_is_proxied():
+    assert venue_image_url('https://example.org/a.jpg').startswith('/api/image-proxy?url=')
+
+
+def test_event_image_url_falls_back_to_venue_image():
+    assert event_image_url('  ', '{"photo_reference": "abc"}') == '/api/image/abc'
+    assert event_image_url(None, None) is None
+
+
+def test_event_image_url_unwraps_npg_proxy_url():
+    stored = '/api/image-proxy?url=https%3A%2F%2Fnpg.si.edu%2Fa.jpg&w=400'
+    assert event_image_url(stored, None) == 'https://npg.si.edu/a.jpg'
+
+
+def test_event_maps_link_priority():
+    assert event_maps_link(True, 'Dupont Circle', 'NGA', 38.9, -77.0, None, None) == \
+        'https://www.google.com/maps/search/Dupont+Circle'
+    assert event_maps_link(False, 'Dupont Circle', 'NGA', 38.9, -77.0, None, None) == \
+        'https://www.google.com/maps/@38.9,-77.0,17z'
+    assert event_maps_link(False, None, 'National Gallery', None, None, None, None) == \
+        'https://www.google.com/maps/search/National+Gallery'
+    assert event_maps_link(False, None, None, None, None, None, None) == 'https://www.google.com/maps'
+
+
+def test_list_profile_is_ordered_subset_of_full():
+    assert [f for f in FULL_PROFILE_FIELDS if f in LIST_PROFILE_FIELDS] == list(LIST_PROFILE_FIELDS)
+    assert 'effective_visibility' in LIST_PROFILE_FIELDS
+
+
+def test_city_timezone_matches_event_to_dict():
+    # Event._get_city_timezone() returns None for a missing or blank timezone
+    assert _city_timezone(SimpleNamespace(city_timezone='America/New_York')) == 'America/New_York'
+    assert _city_timezone(SimpleNamespace(city_timezone='')) is None
+    assert _city_timezone(SimpleNamespace(city_timezone=None)) is None
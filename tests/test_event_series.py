@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for event_series: rule expansion, occurrence ids, collapsing scraped instances, merging.
+"""
+import os
+import sys
+from datetime import date, time, timedelta
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.event_series import (
+    RecurrenceRule,
+    expand_occurrences,
+    expand_recurring,
+    occurrence_id,
+    series_match_key,
+    split_series,
+)
+
+MONDAY = date(2026, 3, 2)
+
+
+def _tour(day, start, **fields):
+    event = {
+        'title': 'Docent-Led Walk-In Tour',
+        'event_type': 'tour',
+        'url': f'https://www.nga.gov/calendar/walk-in-tour?evd={day:%Y%m%d}',
+        'start_date': day,
+        'end_date': day,
+        'start_time': start,
+        'end_time': f'{int(start[:2]) + 1:02d}{start[2:]}',
+    }
+    event.update(fields)
+    return event
+
+
+def test_rule_occurrences_respect_days_window_and_exceptions():
+    rule = RecurrenceRule.from_dict({
+        'days_of_week': [0, 1, 2, 3, 4, 5],
+        'times': ['14:00', '12:30'],
+        'start_date': MONDAY,
+        'end_date': MONDAY + timedelta(days=13),
+        'exceptions': ['2026-03-03'],
+    })
+    assert rule.times == (time(12, 30), time(14, 0))
+
+    occurrences = list(rule.occurrences(MONDAY - timedelta(days=5), MONDAY + timedelta(days=7)))
+    days = sorted({day for day, _ in occurrences})
+    assert MONDAY + timedelta(days=1) not in days  # exception
+    assert MONDAY + timedelta(days=6) not in days  # Sunday
+    assert days[0] == MONDAY and days[-1] == MONDAY + timedelta(days=7)
+    assert len(occurrences) == 2 * len(days) == 12
+    assert rule.end_time(time(23, 30)) == time(23, 59)
+
+    assert rule.overlaps(MONDAY + timedelta(days=13), None)
+    assert not rule.overlaps(MONDAY + timedelta(days=14), None)
+    assert not rule.overlaps(None, MONDAY - timedelta(days=1))
+
+
+def test_expand_occurrences_within_window():
+    rule = RecurrenceRule((0,), (time(11, 0),), MONDAY, None)
+    template = {'id': 7, 'series_id': 3, 'title': 'Tour', 'start_date': MONDAY.isoformat()}
+    occurrences = expand_occurrences([template], {3: rule}, MONDAY, MONDAY + timedelta(days=20), MONDAY)
+
+    assert [o['start_date'] for o in occurrences] == ['2026-03-02', '2026-03-09', '2026-03-16']
+    assert occurrences[0]['start_time'] == '11:00' and occurrences[0]['end_time'] == '12:00'
+    assert occurrences[0]['id'] == occurrence_id(3, MONDAY, time(11, 0)) < 0
+    assert len({o['id'] for o in occurrences}) == 3
+    assert template['id'] == 7  # templates are copied, not modified
+
+    # Open windows expand from today up to the horizon
+    assert len(expand_occurrences([template], {3: rule}, None, None, MONDAY)) == 13
+
+
+def test_split_series_collapses_repeated_instances():
+    events = [_tour(MONDAY + timedelta(days=offset), start)
+              for offset in range(5) for start in ('11:00', '14:00')]
+    events.append(_tour(MONDAY + timedelta(days=5), '15:00'))  # odd time on its own date
+    events.append({'title': 'Lecture', 'event_type': 'talk', 'start_date': MONDAY, 'end_date': MONDAY,
+                   'start_time': '18:00'})
+
+    singles, series = split_series(events)
+    assert series == [] and len(singles) == len(events)
+
+    singles, series = split_series(events, collapse=True)
+    assert [event['title'] for event in singles] == ['Docent-Led Walk-In Tour', 'Lecture']
+    assert singles[0]['start_time'] == '15:00'
+    (template, rule), = series
+    assert rule.times == (time(11, 0), time(14, 0))
+    assert (rule.start_date, rule.end_date) == (MONDAY, MONDAY + timedelta(days=4))
+    assert template['start_date'] == MONDAY and template['start_time'] == '11:00'
+    assert template['url'] == 'https://www.nga.gov/calendar/walk-in-tour'
+
+
+def test_same_titled_series_get_distinct_match_keys():
+    events = [_tour(MONDAY + timedelta(days=offset), '11:00', location='East Building')
+              for offset in range(3)]
+    events += [_tour(MONDAY + timedelta(days=offset), '14:00', location='West Building')
+               for offset in range(3)]
+    _, series = split_series(events, collapse=True)
+    keys = [series_match_key(template) for template, _ in series]
+    assert len(series) == 2 and len(set(keys)) == 2
+    # The template keeps the key of its instances, so re-scrapes find the stored row
+    assert series_match_key(events[0]) in keys and series_match_key(events[3]) in keys
+
+
+def test_split_series_keeps_explicit_recurrence_and_expand_recurring():
+    recurring = {'title': 'Walk-In Tour', 'event_type': 'tour', 'recurrence': {
+        'days_of_week': [5, 6], 'times': ['12:00'], 'start_date': MONDAY, 'end_date': MONDAY + timedelta(days=13)}}
+    singles, series = split_series([recurring])
+    assert singles == []
+    (template, rule), = series
+    assert 'recurrence' not in template and rule.days_of_week == (5, 6)
+
+    instances = expand_recurring([recurring, {'title': 'Other'}])
+    assert [event['start_date'] for event in instances[:-1]] == [
+        date(2026, 3, 7), date(2026, 3, 8), date(2026, 3, 14), date(2026, 3, 15)]
+    assert instances[0]['start_time'] == '12:00' and 'recurrence' not in instances[0]
+    assert instances[-1] == {'title': 'Other'}
+
+
+def test_merged_rule_keeps_earlier_window_and_exceptions():
+    previous = RecurrenceRule(tuple(range(7)), (time(12, 0),), MONDAY, MONDAY + timedelta(days=29),
+                              frozenset({MONDAY + timedelta(days=2), MONDAY + timedelta(days=20)}))
+    scraped = RecurrenceRule(tuple(range(7)), (time(12, 0),), MONDAY + timedelta(days=7),
+                             MONDAY + timedelta(days=36))
+    merged = scraped.merged_with(previous)
+
+    assert (merged.start_date, merged.end_date) == (MONDAY, MONDAY + timedelta(days=36))
+    assert merged.exceptions == {MONDAY + timedelta(days=2)}
+    assert RecurrenceRule.from_row(type('Row', (), merged.to_columns())) == merged
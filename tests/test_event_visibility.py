@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for event_visibility: indexed source matching and the maintained effective_visibility column.
+"""
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.event_visibility import SourceMatcher, refresh_effective_visibility, register_visibility_hooks
+
+
+def _linear_match(event_dict, sources):
+    """The per-request scan SourceMatcher replaces."""
+    by_id = {source.id: source for source in sources}
+    if event_dict.get('source_id') in by_id:
+        return by_id[event_dict['source_id']]
+    handle = (event_dict.get('social_media_handle') or '').lstrip('@').lower()
+    if handle:
+        for source in sources:
+            if (source.handle or '').lstrip('@').lower() == handle:
+                return source
+    event_url = (event_dict.get('source_url') or event_dict.get('url') or '').rstrip('/').lower()
+    if event_url:
+        for source in sources:
+            if source.url and source.url.rstrip('/').lower() in event_url:
+                return source
+    return None
+
+
+def test_matcher_agrees_with_linear_scan():
+    rng = random.Random(7)
+    hosts = ['nga.gov', 'si.edu', 'npg.si.edu', 'instagram.com/dcphoto', 'example.org/events']
+    sources = [
+        SimpleNamespace(id=i, handle=rng.choice(['', '@dcphoto', 'NGA', 'walks']),
+                        url=rng.choice([None, '', f"https://{rng.choice(hosts)}/", f"https://www.{rng.choice(hosts)}"]),
+                        visibility=None)
+        for i in range(1, 40)
+    ]
+    matcher = SourceMatcher(sources)
+    for _ in range(500):
+        event = {
+            'source_id': rng.choice([None, 3, 99]),
+            'social_media_handle': rng.choice([None, '@DCPhoto', 'walks', 'other']),
+            'url': f"https://{rng.choice(['www.', ''])}{rng.choice(hosts)}/{rng.choice(['', 'calendar/1', 'p/x'])}",
+            'source_url': rng.choice([None, 'https://npg.si.edu/event']),
+        }
+        assert matcher.match(event) is _linear_match(event, sources)
+
+
+Base = declarative_base()
+
+
+class Source(Base):
+    __tablename__ = 'sources'
+    id = Column(Integer, primary_key=True)
+    handle = Column(String)
+    url = Column(String)
+    visibility = Column(String)
+    city_id = Column(Integer)
+
+
+class Venue(Base):
+    __tablename__ = 'venues'
+    id = Column(Integer, primary_key=True)
+    visibility = Column(String)
+    city_id = Column(Integer)
+
+
+class Event(Base):
+    __tablename__ = 'events'
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    city_id = Column(Integer)
+    venue_id = Column(Integer, ForeignKey('venues.id'))
+    visibility = Column(String)
+    is_admin_only = Column(Boolean, default=False)
+    source_id = Column(Integer, ForeignKey('sources.id'))
+    social_media_handle = Column(String)
+    source_url = Column(String)
+    url = Column(String)
+    effective_visibility = Column(String)
+
+
+def _effective(event):
+    return (event.get('visibility') or ('admin_only' if event.get('is_admin_only') else None)
+            or event.get('source_visibility') or event.get('venue_visibility') or 'public')
+
+
+def test_hooks_refresh_stored_visibility_on_writes():
+    register_visibility_hooks(Event, Venue, Source, _effective)
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        venue = Venue(visibility='public')
+        source = Source(handle='club', url='https://club.example.org', visibility=None, city_id=1)
+        session.add_all([venue, source])
+        session.commit()
+        event = Event(title='Walk', city_id=1, venue_id=venue.id, url='https://club.example.org/walk')
+        other_city = Event(title='Walk', city_id=2, venue_id=venue.id, url='https://club.example.org/walk')
+        session.add_all([event, other_city])
+        session.commit()
+        session.expire_all()
+        assert event.effective_visibility == 'public'
+
+        source.visibility = 'admin_only'  # heuristic URL match, same city only
+        session.commit()
+        session.expire_all()
+        assert (event.effective_visibility, other_city.effective_visibility) == ('admin_only', 'public')
+
+        venue.visibility = 'admin_only'
+        event.visibility = 'public'
+        session.commit()
+        session.expire_all()
+        assert (event.effective_visibility, other_city.effective_visibility) == ('public', 'admin_only')
+
+        # Bulk statements refresh the rows they touch, not every event
+        with engine.begin() as conn:  # Core write: no hook sees it
+            conn.execute(Event.__table__.insert().values(id=99, title='Stale', city_id=3, effective_visibility='stale'))
+        session.query(Venue).filter(Venue.id == venue.id).update({'visibility': 'public'})
+        session.commit()
+        session.expire_all()
+        assert (event.effective_visibility, other_city.effective_visibility) == ('public', 'public')
+
+        session.query(Source).filter(Source.id == source.id).update({'city_id': 2})  # new city matches now
+        session.query(Event).filter(Event.id == event.id).update({'visibility': 'admin_only'})
+        session.commit()
+        session.expire_all()
+        assert (event.effective_visibility, other_city.effective_visibility) == ('admin_only', 'admin_only')
+        assert session.get(Event, 99).effective_visibility == 'stale'
+
+
+def test_events_without_city_match_sources_of_their_venue_city():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Venue.__table__.insert().values(id=1, visibility='public', city_id=1))
+        conn.execute(Source.__table__.insert().values(id=1, url='https://club.example.org', visibility='admin_only',
+                                                      city_id=1))
+        conn.execute(Event.__table__.insert(), [
+            {'id': 1, 'title': 'Listed via venue', 'venue_id': 1, 'url': 'https://club.example.org/walk'},
+            {'id': 2, 'title': 'No venue', 'venue_id': None, 'url': 'https://club.example.org/walk'},
+        ])
+        assert refresh_effective_visibility(conn, Event, Venue, Source, _effective, city_ids=[2]) == 0
+        assert refresh_effective_visibility(conn, Event, Venue, Source, _effective, city_ids=[1]) == 1
+        assert refresh_effective_visibility(conn, Event, Venue, Source, _effective) == 1
+        stored = dict(conn.execute(select(Event.id, Event.effective_visibility)).all())
+    assert stored == {1: 'admin_only', 2: 'public'}
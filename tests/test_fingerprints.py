@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for scraper fingerprints: page replay, event-set skips, staleness and full rescans.
+"""
+import os
+import sys
+import time
+from datetime import date, time as time_class
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.cron import cron_run_scheduled_scrapers
+from scripts.event_database_handler import record_save_errors
+from scripts.scraper_utils.fingerprints import FingerprintStore, events_fingerprint, page_fingerprint
+
+EVENTS = [{'title': 'Gallery Talk', 'start_date': date(2026, 11, 2), 'start_time': time_class(14, 0)}]
+
+
+def test_page_fingerprint_ignores_volatile_markup():
+    first = b'<html><script nonce="a1">var t=1;</script><h2>Talk</h2>\n\n<!-- 10:01 --></html>'
+    second = b'<html><script nonce="b2">var t=2;</script><h2>Talk</h2> <!-- 10:02 --></html>'
+    assert page_fingerprint(first) == page_fingerprint(second)
+    assert page_fingerprint(first) != page_fingerprint(b'<html><h2>Tour</h2></html>')
+
+
+def test_unchanged_page_replays_stored_events(tmp_path):
+    store = FingerprintStore(str(tmp_path / 'fp.sqlite3'))
+    check = store.check_page('https://example.org/events', b'<h2>Gallery Talk</h2>')
+    assert not check.unchanged
+    store.record_page(check, EVENTS)
+
+    again = store.check_page('https://example.org/events', b'<h2>Gallery Talk</h2>')
+    assert again.unchanged
+    assert again.events == EVENTS
+    assert not store.check_page('https://example.org/events', b'<h2>New Tour</h2>').unchanged
+    assert store.format_stats().startswith('pages 1/3 unchanged (33%)')
+
+
+def test_event_sets_skip_until_changed_stale_or_forced(tmp_path):
+    path = str(tmp_path / 'fp.sqlite3')
+    store = FingerprintStore(path, max_age_days=1)
+    events_hash = events_fingerprint(EVENTS)
+    assert events_hash == events_fingerprint(list(reversed(EVENTS)))
+    assert not store.events_unchanged('museum:nga', events_hash)
+    store.mark_reconciled('museum:nga', events_hash)
+    assert store.events_unchanged('museum:nga', events_hash)
+    assert not store.events_unchanged('museum:nga', events_fingerprint(EVENTS + [{'title': 'Tour'}]))
+
+    assert not FingerprintStore(path, force_full=True).events_unchanged('museum:nga', events_hash)
+    store._connect().execute('UPDATE event_fingerprints SET reconciled_at = ?', (time.time() - 2 * 86400,))
+    assert not store.events_unchanged('museum:nga', events_hash)
+
+
+def test_reconcile_marks_only_fully_saved_sets(tmp_path, monkeypatch):
+    store = FingerprintStore(str(tmp_path / 'fp.sqlite3'))
+    monkeypatch.setattr(cron_run_scheduled_scrapers, 'get_fingerprint_store', lambda: store)
+    reconcile = cron_run_scheduled_scrapers._reconcile
+
+    def failing_save():
+        record_save_errors()  # what the handler does for an event it logs and skips
+        return (0, 0, 0)
+
+    assert reconcile('venue:1', EVENTS, failing_save) == (0, 0, 0)
+    assert reconcile('venue:1', EVENTS, lambda: (1, 0, 0)) == (1, 0, 0)  # retried, not "unchanged"
+    assert reconcile('venue:1', EVENTS, lambda: (1, 0, 0)) is None
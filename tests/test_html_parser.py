@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared HTML parser: lxml by default, host fallback, memoized trees, charset handling.
+"""
+import os
+import sys
+
+import requests
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.scraper_utils import html_parser
+from scripts.scraper_utils.html_parser import parse_cache, parse_html, select_parser
+
+PAGE = b'<html><body><h1>Gallery Talk</h1><a href="/events/1">Details</a></body></html>'
+
+
+def _response(body=PAGE, headers=None, url='https://example.org/events'):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers.update(headers or {'Content-Type': 'text/html; charset=utf-8'})
+    response.url = url
+    return response
+
+
+def test_parser_selection_uses_lxml_except_for_fallback_hosts(monkeypatch):
+    if not html_parser.LXML_AVAILABLE:
+        assert select_parser('https://example.org/') == 'html.parser'
+        return
+    monkeypatch.setenv('SCRAPER_HTML_PARSER_FALLBACK_HOSTS', 'quirky.example.com')
+    assert select_parser('https://example.org/') == 'lxml'
+    assert select_parser('https://www.quirky.example.com/calendar') == 'html.parser'
+    monkeypatch.setenv('SCRAPER_HTML_PARSER', 'html.parser')
+    assert select_parser('https://example.org/') == 'html.parser'
+
+
+def test_tree_is_memoized_on_the_response_and_by_body():
+    parse_cache.clear()
+    response = _response()
+    soup = parse_html(response)
+    assert soup.h1.get_text() == 'Gallery Talk'
+    assert parse_html(response) is soup
+
+    # Same body through a different response object (e.g. replayed from the HTTP cache)
+    assert parse_html(_response()) is soup
+    assert parse_cache.hits == 1 and parse_cache.misses == 1
+    assert parse_html(response, cache=False) is not soup
+
+
+def test_charset_from_headers_is_used_for_bytes():
+    body = '<html><body><p>Café Concert</p></body></html>'.encode('cp1252')
+    soup = parse_html(_response(body, {'content-type': 'text/html; charset=windows-1252'}), cache=False)
+    assert soup.p.get_text() == 'Café Concert'
+
+
+def test_lru_evicts_oldest_tree(monkeypatch):
+    monkeypatch.setattr(html_parser, 'parse_cache', html_parser._ParseCache(2))
+    first = parse_html('<p>one</p>')
+    parse_html('<p>two</p>')
+    parse_html('<p>three</p>')
+    assert parse_html('<p>one</p>') is not first
+    assert parse_html('<p>three</p>') is parse_html('<p>three</p>')
+
+
+def test_empty_lxml_tree_falls_back_to_html_parser(monkeypatch):
+    real_soup = html_parser.BeautifulSoup
+
+    def soup_factory(markup, parser, **kwargs):
+        if parser == 'lxml':
+            return real_soup('', 'html.parser')
+        return real_soup(markup, parser, **kwargs)
+
+    monkeypatch.setattr(html_parser, 'BeautifulSoup', soup_factory)
+    soup = html_parser._build(PAGE, 'lxml', None)
+    assert soup.a['href'] == '/events/1'
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the scraper HTTP cache: validators sent, 304 replayed from cache, unchanged 200s.
+"""
+import os
+import sys
+
+import requests
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.scraper_utils.http_cache import HttpCache, cached_get
+
+
+def _response(status, body=b'', headers=None, url='https://example.org/page'):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs.get('headers') or {})
+        return self.responses.pop(0)
+
+
+def test_304_returns_cached_body_and_sends_validators(tmp_path):
+    cache = HttpCache(str(tmp_path / 'http.sqlite3'))
+    headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 01 Oct 2025 10:00:00 GMT', 'Content-Type': 'text/html'}
+    session = FakeSession([_response(200, b'<html>events</html>', headers), _response(304)])
+
+    first = cached_get(session, 'https://example.org/page', cache=cache, timeout=5)
+    assert first.text == '<html>events</html>'
+    assert not first.from_cache and not first.content_unchanged
+
+    second = cached_get(session, 'https://example.org/page', cache=cache, timeout=5)
+    assert session.calls[1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 01 Oct 2025 10:00:00 GMT'}
+    assert second.status_code == 200
+    assert second.text == '<html>events</html>'
+    assert second.headers['Content-Type'] == 'text/html'
+    assert second.from_cache and second.content_unchanged
+
+
+def test_identical_200_without_validators_is_marked_unchanged(tmp_path):
+    cache = HttpCache(str(tmp_path / 'http.sqlite3'))
+    session = FakeSession([_response(200, b'same'), _response(200, b'same'), _response(200, b'new')])
+    assert not cached_get(session, 'https://example.org/page', cache=cache).content_unchanged
+    assert cached_get(session, 'https://example.org/page', cache=cache).content_unchanged
+    assert not cached_get(session, 'https://example.org/page', cache=cache).content_unchanged
+    # No validators, so no body stored and no conditional headers sent
+    assert session.calls == [{}, {}, {}]
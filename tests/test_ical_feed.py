@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for ical_feed: escaping and folding, VTIMEZONE transitions, VEVENT rendering, UIDs.
+"""
+import os
+import sys
+from datetime import datetime, timezone
+
+from werkzeug.http import parse_etags
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.ical_feed import (
+    CHUNK_EVENTS,
+    escape_text,
+    event_uid,
+    feed_etag,
+    fold_line,
+    iter_calendar,
+    not_modified,
+    render_vevent,
+    vtimezone,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+TZID = 'America/New_York'
+
+
+def _lines(text):
+    """Unfolded content lines."""
+    return text.replace('\r\n ', '').split('\r\n')
+
+
+def test_escape_and_fold():
+    assert escape_text('a,b;c\\d\ne') == 'a\\,b\\;c\\\\d\\ne'
+    assert escape_text(None) == ''
+
+    line = 'DESCRIPTION:' + 'é' * 100
+    folded = fold_line(line)
+    segments = folded[:-2].split('\r\n')
+    assert all(len(segment.encode('utf-8')) <= 75 for segment in segments)
+    assert all(segment.startswith(' ') for segment in segments[1:])
+    assert _lines(folded)[0] == line
+    assert fold_line('SUMMARY:Short') == 'SUMMARY:Short\r\n'
+
+
+def test_vtimezone_has_real_dst_transitions():
+    lines = _lines(vtimezone(TZID, 2026, 2026))
+    assert lines[:2] == ['BEGIN:VTIMEZONE', f'TZID:{TZID}']
+    daylight = lines[lines.index('BEGIN:DAYLIGHT'):lines.index('END:DAYLIGHT')]
+    assert 'DTSTART:20260308T020000' in daylight
+    assert 'TZOFFSETFROM:-0500' in daylight and 'TZOFFSETTO:-0400' in daylight
+    assert 'DTSTART:20261101T020000' in lines
+    assert lines.count('BEGIN:STANDARD') == 2  # initial observance and November change
+
+    # Unknown zones fall back to UTC
+    assert 'TZID:UTC' in _lines(vtimezone('Nowhere/Special', 2026, 2026))
+
+
+def test_render_vevent_all_day_and_timed():
+    all_day = _lines(render_vevent({'id': 5, 'title': 'Exhibit, Opening', 'start_date': '2026-03-02',
+                                    'end_date': '2026-03-04', 'event_type': 'exhibition'}, TZID, NOW))
+    assert 'DTSTART;VALUE=DATE:20260302' in all_day
+    assert 'DTEND;VALUE=DATE:20260305' in all_day  # exclusive end date
+    assert 'SUMMARY:Exhibit\\, Opening' in all_day
+    assert 'DTSTAMP:20260301T120000Z' in all_day
+
+    timed = _lines(render_vevent({'id': 6, 'title': 'Talk', 'start_date': '2026-03-02', 'start_time': '18:30',
+                                  'venue_name': 'Museum', 'venue_address': '1 Main St',
+                                  'url': 'https://example.org/talk',
+                                  'updated_at': '2026-02-20T08:15:00'}, TZID, NOW))
+    assert f'DTSTART;TZID={TZID}:20260302T183000' in timed
+    assert f'DTEND;TZID={TZID}:20260302T193000' in timed  # default duration
+    assert 'LOCATION:Museum\\, 1 Main St' in timed
+    assert 'LAST-MODIFIED:20260220T081500Z' in timed
+    assert 'URL:https://example.org/talk' in timed
+
+    # Multi-day with an opening hour but no end time: all-day span, not one hour on the first day
+    exhibition = _lines(render_vevent({'id': 8, 'title': 'Exhibition', 'start_date': '2026-09-16',
+                                       'end_date': '2026-11-15', 'start_time': '11:00'}, TZID, NOW))
+    assert 'DTSTART;VALUE=DATE:20260916' in exhibition
+    assert 'DTEND;VALUE=DATE:20261116' in exhibition
+
+    # Multi-day with both times: timed span ending on end_date
+    festival = _lines(render_vevent({'id': 9, 'title': 'Festival', 'start_date': '2026-09-16',
+                                     'end_date': '2026-09-18', 'start_time': '11:00', 'end_time': '17:00'},
+                                    TZID, NOW))
+    assert f'DTEND;TZID={TZID}:20260918T170000' in festival
+
+    assert render_vevent({'id': 7, 'title': 'No date'}, TZID, NOW) == ''
+
+
+def test_uids_are_stable_for_events_and_series_occurrences():
+    assert event_uid({'id': 42}) == 'event-42@eventplanner.com'
+    occurrence = {'id': -123456, 'series_id': 3, 'start_date': '2026-03-02', 'start_time': '14:00'}
+    assert event_uid(occurrence) == 'series-3-20260302T1400@eventplanner.com'
+    assert event_uid(dict(occurrence, id=-999)) == event_uid(occurrence)
+
+
+def test_iter_calendar_structure_and_chunks():
+    events = [{'id': i, 'title': f'Event {i}', 'start_date': '2026-03-02'} for i in range(1, CHUNK_EVENTS + 6)]
+    chunks = list(iter_calendar(iter(events), TZID, 'Washington; this week', (2026, 2026), now=NOW))
+    assert len(chunks) == 3  # header + VTIMEZONE, one full batch, the rest + END
+
+    lines = _lines(''.join(chunks))
+    assert lines[0] == 'BEGIN:VCALENDAR' and lines[-2:] == ['END:VCALENDAR', '']
+    assert 'X-WR-CALNAME:Washington\\; this week' in lines
+    assert 'REFRESH-INTERVAL;VALUE=DURATION:PT60M' in lines
+    assert lines.index('END:VTIMEZONE') < lines.index('BEGIN:VEVENT')
+    assert lines.count('BEGIN:VEVENT') == len(events)
+
+
+def test_not_modified_prefers_if_none_match():
+    polled = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    updated = datetime(2026, 2, 28, 9, 0, tzinfo=timezone.utc)
+    assert not_modified(parse_etags('"abc"'), 'abc', polled, updated)
+    assert not_modified(parse_etags(None), 'abc', polled, updated)  # If-Modified-Since alone
+    assert not not_modified(parse_etags(None), 'abc', None, updated)
+    assert not not_modified(parse_etags(None), 'abc', polled, None)
+
+    # An event was deleted: max(updated_at) did not move but the ETag did
+    assert not not_modified(parse_etags('"abc"'), 'def', polled, updated)
+
+
+def test_feed_etag_follows_the_data():
+    updated = datetime(2026, 2, 28, 9, 0)
+    etag = feed_etag('7:abc', 'Washington', TZID, 12, 1, updated)
+    assert etag == feed_etag('7:abc', 'Washington', TZID, 12, 1, updated)
+    assert len(etag) == 32 and '"' not in etag
+    # Same cache key (generation not bumped by another container): a delete or an edit still shows
+    assert etag != feed_etag('7:abc', 'Washington', TZID, 11, 1, updated)
+    assert etag != feed_etag('7:abc', 'Washington', TZID, 12, 1, datetime(2026, 3, 1, 8, 0))
+    assert etag != feed_etag('8:abc', 'Washington', TZID, 12, 1, updated)
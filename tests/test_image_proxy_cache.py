@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for image_proxy_cache: stored variants, LRU eviction, negative entries.
+"""
+import os
+import sys
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.image_proxy_cache import ImageProxyCache
+
+
+def test_put_then_get_returns_same_bytes_and_etag(tmp_path):
+    cache = ImageProxyCache(str(tmp_path), max_bytes=1024 * 1024)
+    key = cache.key('https://example.org/a.jpg', 400)
+    assert cache.get(key) is None
+    stored = cache.put(key, b'jpeg-bytes', 'image/jpeg', 'https://example.org/a.jpg', 400)
+    hit = cache.get(key)
+    assert hit.read() == b'jpeg-bytes'
+    assert hit.content_type == 'image/jpeg'
+    assert hit.etag == stored.etag and hit.etag.startswith('"')
+
+
+def test_width_is_part_of_key():
+    assert ImageProxyCache.key('https://example.org/a.jpg', 400) != ImageProxyCache.key('https://example.org/a.jpg', 600)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ImageProxyCache(str(tmp_path), max_bytes=250)
+    keys = [cache.key(f'https://example.org/{i}.jpg', 400) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, b'x' * 100, 'image/jpeg')
+        os.utime(cache._paths(key)[0], (time.time() - 100 + i, time.time() - 100 + i))
+    cache.get(keys[0])  # touch: keys[1] is now least recently used
+    cache.put(keys[2], b'x' * 100, 'image/jpeg')
+    cache.evict()
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_negative_entries(tmp_path):
+    cache = ImageProxyCache(str(tmp_path), max_bytes=1024, negative_ttl=60)
+    cache.mark_negative('https://blocked.example/a.jpg', 403)
+    cache.mark_negative('https://ok.example/missing.jpg', 404)
+    assert cache.is_negative('https://blocked.example/other.jpg') == 403
+    assert cache.is_negative('https://ok.example/missing.jpg') == 404
+    assert cache.is_negative('https://ok.example/present.jpg') is None
+
+
+def test_disabled_cache_serves_from_memory(tmp_path):
+    cache = ImageProxyCache(str(tmp_path / 'cache'), max_bytes=0)
+    key = cache.key('https://example.org/a.jpg', 400)
+    assert cache.put(key, b'abc', 'image/png').read() == b'abc'
+    assert cache.get(key) is None
+    assert not os.path.exists(tmp_path / 'cache')
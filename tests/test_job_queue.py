@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for job_queue: claiming, lease expiry after a lost worker, retries, cancel, event tailing.
+"""
+import os
+import sys
+import time
+
+from sqlalchemy import create_engine, update
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts import job_queue
+from scripts.job_queue import JobCancelled, JobQueue, JobWorker, scrape_jobs
+
+
+def _queue(tmp_path, **kwargs):
+    return JobQueue(create_engine(f"sqlite:///{tmp_path / 'jobs.db'}"), **kwargs)
+
+
+def _statuses(queue, job_id):
+    return [data.get('status') for _, data in queue.events_since(job_id) if data.get('type') == 'job']
+
+
+def test_worker_runs_job_and_records_result_and_events(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue('scrape_nga', {'json': {'city_id': 1}})
+
+    def handler(job, context):
+        context.emit({'type': 'progress', 'percentage': 50})
+        return {'status_code': 200, 'body': {'events_found': job.payload['json']['city_id']}}
+
+    worker = JobWorker(queue, handler, worker_id='w1', isolate=False)
+    assert worker.run_once()
+    assert not worker.run_once()
+
+    job = queue.get(job_id)
+    assert job.status == 'succeeded'
+    assert job.attempts == 1
+    assert job.result == {'status_code': 200, 'body': {'events_found': 1}}
+    events = [data for _, data in queue.events_since(job_id)]
+    assert {'type': 'progress', 'percentage': 50} in events
+    assert _statuses(queue, job_id) == ['queued', 'running', 'succeeded']
+
+
+def test_isolated_worker_runs_job_in_child_process(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue('scrape_saam')
+    worker = JobWorker(queue, lambda job, context: {'pid': os.getpid()}, worker_id='w1')
+    assert worker.run_once()
+    job = queue.get(job_id)
+    assert job.status == 'succeeded'
+    if worker.isolate:
+        assert job.result['pid'] != os.getpid()
+
+
+def test_expired_lease_requeues_then_fails_when_attempts_used(tmp_path):
+    queue = _queue(tmp_path, max_attempts=2)
+    job_id = queue.enqueue('scrape_npg')
+    for attempt in (1, 2):
+        job = queue.claim('dead-worker', lease_seconds=0.01)
+        assert job.id == job_id and job.attempts == attempt
+        time.sleep(0.02)
+    assert queue.claim('w2') is None
+    job = queue.get(job_id)
+    assert job.status == 'failed'
+    assert 'lease expired' in job.error
+    # The dead worker can no longer write results
+    assert not queue.complete(job_id, 'dead-worker', {})
+
+
+def test_handler_exception_is_retried_with_backoff(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue, 'RETRY_BACKOFF_SECONDS', 0)
+    queue = _queue(tmp_path, max_attempts=2)
+    job_id = queue.enqueue('scrape_hammer')
+    calls = []
+
+    def handler(job, context):
+        calls.append(job.attempts)
+        if len(calls) == 1:
+            raise RuntimeError('proxy down')
+        return {'status_code': 200}
+
+    worker = JobWorker(queue, handler, worker_id='w1', isolate=False)
+    assert worker.run_once()
+    assert queue.get(job_id).status == 'queued'
+    assert worker.run_once()
+    assert calls == [1, 2]
+    assert queue.get(job_id).status == 'succeeded'
+
+
+def test_cancel_queued_job_and_retry_it(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue('scrape_ocma_endpoint')
+    assert queue.cancel(job_id).status == 'cancelled'
+    assert queue.claim('w1') is None
+
+    job = queue.retry(job_id)
+    assert job.status == 'queued' and job.attempts == 0 and not job.cancel_requested
+    assert queue.claim('w1').id == job_id
+
+
+def test_cancel_running_job_stops_at_next_emit(tmp_path, monkeypatch):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue('scrape_websters')
+    job = queue.claim('w1')
+    context = job_queue.JobContext(queue, job)
+    context.emit({'type': 'progress'})
+
+    assert queue.cancel(job_id).status == 'running'
+    monkeypatch.setattr(job_queue.JobContext, 'CANCEL_CHECK_INTERVAL', 0)
+    try:
+        context.emit({'type': 'progress'})
+        raise AssertionError('expected JobCancelled')
+    except JobCancelled:
+        pass
+    assert queue.mark_cancelled(job_id, 'w1')
+    assert queue.get(job_id).status == 'cancelled'
+
+
+def test_tail_drains_events_and_stops_when_job_finishes(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue('trigger_scraping_stream')
+    job = queue.claim('w1')
+    queue.append_event(job_id, {'type': 'event', 'event': {'title': 'Tour'}})
+    queue.complete(job.id, 'w1', {'status_code': 200})
+
+    first_id, _ = queue.events_since(job_id)[0]
+    tailed = [data for _, data in filter(None, queue.tail(job_id, after_id=first_id, poll_interval=0))]
+    assert tailed == [
+        {'type': 'job', 'status': 'running'},
+        {'type': 'event', 'event': {'title': 'Tour'}},
+        {'type': 'job', 'status': 'succeeded'},
+    ]
+
+
+def test_prune_removes_old_finished_jobs(tmp_path):
+    queue = _queue(tmp_path)
+    old_id = queue.enqueue('scrape_smithsonian')
+    queue.cancel(old_id)
+    live_id = queue.enqueue('scrape_museums')
+    with queue.engine.begin() as conn:
+        conn.execute(update(scrape_jobs).where(scrape_jobs.c.id == old_id).values(finished_at=time.time() - 30 * 86400))
+    assert queue.prune(older_than_days=14) == 1
+    assert queue.get(old_id) is None
+    assert queue.events_since(old_id) == []
+    assert queue.get(live_id).status == 'queued'
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for batched LLM extraction: page compaction, token-budget chunking, per-item retry.
+"""
+import json
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.llm_batch import chunk_items, compact_page_text, extract_batch, parse_json_answer
+from scripts.scraper_utils import parse_html
+
+
+class FakeLLM:
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.prompts = []
+
+    def query_with_fallback(self, prompt):
+        self.prompts.append(prompt)
+        return {'success': True, 'provider': 'groq', 'content': self.answers.pop(0)}
+
+
+def test_compact_page_text_drops_boilerplate_and_keeps_structured_data():
+    html = """<html><head><title>Exhibitions</title>
+    <script type="application/ld+json">{"@type": "Event", "name": "Monet"}</script>
+    <script>window.app = {};</script><style>body {}</style></head>
+    <body><nav>Home Visit Shop</nav><main><h2>Monet</h2><p>Through May 3</p><p>Monet</p></main>
+    <footer>© Museum</footer></body></html>"""
+    soup = parse_html(html)
+    text = compact_page_text(soup)
+    assert text.splitlines() == [
+        'Title: Exhibitions',
+        'JSON-LD: {"@type": "Event", "name": "Monet"}',
+        'Exhibitions',
+        'Monet',
+        'Through May 3',
+    ]
+    assert soup.nav is not None  # the shared tree is left alone
+
+
+def test_chunk_items_respects_token_budget_and_item_limit():
+    items = [{'id': str(i), 'content': 'x' * 400} for i in range(7)]  # ~100 tokens each
+    assert [len(batch) for batch in chunk_items(items, token_budget=350, max_items=5)] == [3, 3, 1]
+    assert [len(batch) for batch in chunk_items(items, token_budget=10000, max_items=5)] == [5, 2]
+    assert len(chunk_items([{'id': 'big', 'content': 'y' * 10000}], token_budget=100)[0][0]['content']) == 400
+
+
+def test_parse_json_answer_tolerates_fences_and_prose():
+    assert parse_json_answer('```json\n{"a": [1]}\n```') == {'a': [1]}
+    assert parse_json_answer('Here you go: [{"title": "Tour"}] Enjoy!') == [{'title': 'Tour'}]
+    assert parse_json_answer('no json') is None
+
+
+def test_extract_batch_sends_one_prompt_and_retries_only_missing_items():
+    items = [{'id': f'https://museum.org/p{i}', 'content': f'page {i}'} for i in range(3)]
+    llm = FakeLLM([
+        json.dumps({'https://museum.org/p0': [{'title': 'A'}], 'https://museum.org/p1': []}),
+        '[{"title": "C"}]',
+    ])
+    results = extract_batch(llm, 'Extract events.', items, max_items=5)
+    assert results == {
+        'https://museum.org/p0': [{'title': 'A'}],
+        'https://museum.org/p1': [],
+        'https://museum.org/p2': [{'title': 'C'}],
+    }
+    assert len(llm.prompts) == 2
+    assert '=== ITEM https://museum.org/p1 ===' in llm.prompts[0]
+    assert llm.prompts[1].endswith('page 2')
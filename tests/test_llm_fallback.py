@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for EnhancedLLMFallback: prompt cache, coalesced identical prompts, provider circuit breaker.
+"""
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts import enhanced_llm_fallback, llm_cache
+from scripts.enhanced_llm_fallback import EnhancedLLMFallback, ModelConfig, ModelProvider
+
+
+def _model(provider, name, priority):
+    return ModelConfig(provider=provider, api_key='key', base_url='', model_name=name,
+                       max_tokens=100, temperature=0, priority=priority, cost_tier='free')
+
+
+@pytest.fixture
+def llm(tmp_path, monkeypatch):
+    monkeypatch.setenv('LLM_CACHE_PATH', str(tmp_path / 'llm_cache.sqlite3'))
+    monkeypatch.delenv('LLM_CACHE', raising=False)
+    monkeypatch.setattr(llm_cache, '_cache', None)
+    enhanced_llm_fallback.provider_breaker.reset()
+    instance = EnhancedLLMFallback(silent=True)
+    instance.models = [
+        _model(ModelProvider.GOOGLE, 'gemini', 1),
+        _model(ModelProvider.GROQ, 'llama', 2),
+        _model(ModelProvider.MOCK, 'mock', 999),
+    ]
+    instance.calls = []
+    yield instance
+    enhanced_llm_fallback.provider_breaker.reset()
+
+
+def _answer(provider):
+    return {'success': True, 'content': '{"events": []}', 'provider': provider, 'tokens_used': 10}
+
+
+def test_identical_prompt_is_served_from_cache(llm, monkeypatch):
+    def query_model(model, prompt, context):
+        llm.calls.append(model.model_name)
+        return _answer(model.provider.value)
+
+    monkeypatch.setattr(llm, '_query_model', query_model)
+    first = llm.query_with_fallback('Extract events from: Tuesday meditation')
+    second = EnhancedLLMFallback(silent=True).query_with_fallback('Extract events from: Tuesday meditation')
+    assert first['content'] == second['content']
+    assert second['cached'] and 'cached' not in first
+    assert llm.calls == ['gemini']
+
+    llm.query_with_fallback('Extract events from: Tuesday meditation', use_cache=False)
+    assert llm.calls == ['gemini', 'gemini']
+
+
+def test_mock_answers_are_not_cached(llm, monkeypatch):
+    monkeypatch.setattr(llm, '_query_model', lambda model, prompt, context: {'success': False, 'error': 'HTTP 500'})
+    assert llm.query_with_fallback('prompt')['provider'] == 'mock'
+    assert llm_cache.get_llm_cache().get(llm_cache.prompt_key('prompt')) is None
+
+
+def test_concurrent_identical_prompts_share_one_call(llm, monkeypatch):
+    release = threading.Event()
+
+    def query_model(model, prompt, context):
+        llm.calls.append(model.model_name)
+        release.wait(5)
+        return _answer(model.provider.value)
+
+    monkeypatch.setattr(llm, '_query_model', query_model)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(llm.query_with_fallback('same page text')))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert llm.calls == ['gemini']
+    assert len(results) == 3 and sum(1 for result in results if result.get('coalesced')) == 2
+
+
+def test_rate_limited_provider_is_skipped_during_cooldown(llm, monkeypatch):
+    def query_model(model, prompt, context):
+        llm.calls.append(model.model_name)
+        if model.provider == ModelProvider.GOOGLE:
+            return {'success': False, 'error': 'Resource exhausted (429)', 'status_code': 429}
+        return _answer(model.provider.value)
+
+    monkeypatch.setattr(llm, '_query_model', query_model)
+    assert llm.query_with_fallback('first page', use_cache=False)['provider'] == 'groq'
+    assert llm.query_with_fallback('second page', use_cache=False)['provider'] == 'groq'
+    assert llm.calls == ['gemini', 'llama', 'llama']
+
+    enhanced_llm_fallback.provider_breaker.reset()
+    llm.query_with_fallback('third page', use_cache=False)
+    assert llm.calls[-2:] == ['gemini', 'llama']
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for progress_bus: per-channel snapshots, atomic counters, background flush, long-poll reads.
+"""
+import contextvars
+import os
+import sys
+import threading
+
+from sqlalchemy import create_engine
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.progress_bus import DEFAULT_CHANNEL, ProgressBus
+
+
+def _bus(tmp_path, **kwargs):
+    return ProgressBus(create_engine(f"sqlite:///{tmp_path / 'progress.db'}"), **kwargs)
+
+
+def test_channels_do_not_clobber_each_other(tmp_path):
+    bus = _bus(tmp_path)
+    with bus.use_channel('job:1'):
+        bus.replace({'message': 'NGA', 'percentage': 10})
+    with bus.use_channel('job:2'):
+        bus.replace({'message': 'SAAM', 'percentage': 40})
+    bus.update(message='inline scrape')
+    bus.flush()
+
+    assert bus.read('job:1')[1]['message'] == 'NGA'
+    assert bus.read('job:2')[1]['message'] == 'SAAM'
+    assert bus.read(DEFAULT_CHANNEL)[1]['message'] == 'inline scrape'
+
+
+def test_counters_are_atomic_across_threads(tmp_path):
+    bus = _bus(tmp_path)
+
+    def save_events():
+        for _ in range(500):
+            bus.increment(events_saved=1, events_found=2)
+
+    threads = [threading.Thread(target=save_events) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    snapshot = bus.snapshot()
+    assert snapshot['events_saved'] == 2000
+    assert snapshot['events_found'] == 4000
+
+
+def test_writes_are_coalesced_and_versions_increase(tmp_path):
+    bus = _bus(tmp_path, flush_interval=60)
+    for step in range(100):
+        bus.update(message=f'step {step}')
+    assert bus.read(DEFAULT_CHANNEL) == (0, None)  # nothing written on the hot path
+
+    bus.flush()
+    version, snapshot = bus.read(DEFAULT_CHANNEL)
+    assert (version, snapshot['message']) == (1, 'step 99')
+    bus.update(percentage=50)
+    bus.flush()
+    assert bus.read()[0] == 2
+
+
+def test_wait_returns_when_version_moves(tmp_path):
+    bus = _bus(tmp_path, flush_interval=0.05)
+    bus.update(channel='job:7', message='start')
+    bus.flush()
+    version, _ = bus.read('job:7')
+
+    timer = threading.Timer(0.1, lambda: bus.update(channel='job:7', message='done', percentage=100))
+    timer.start()
+    new_version, snapshot = bus.wait('job:7', version, timeout=5, poll_interval=0.02)
+    timer.join()
+    assert new_version > version
+    assert snapshot['message'] == 'done'
+
+
+def test_without_engine_snapshots_stay_in_memory():
+    bus = ProgressBus()
+    bus.replace({'message': 'standalone'})
+    bus.flush()
+    assert bus.read()[1]['message'] == 'standalone'
+
+
+def test_job_channel_stays_in_its_own_context(tmp_path):
+    bus = _bus(tmp_path)
+    inside = threading.Event()
+    release = threading.Event()
+    seen = {}
+
+    def job():
+        with bus.use_channel('job:7'):
+            inside.set()
+            release.wait(5)
+            context = contextvars.copy_context()
+            helper = threading.Thread(target=context.run, args=(lambda: seen.update(helper=bus.channel()),))
+            helper.start()
+            helper.join()
+
+    worker = threading.Thread(target=job)
+    worker.start()
+    inside.wait(5)
+    seen['request'] = bus.channel()  # another thread while the job is running
+    release.set()
+    worker.join()
+
+    assert seen == {'request': DEFAULT_CHANNEL, 'helper': 'job:7'}
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for response_cache: key normalization, shared invalidation, Redis backend, commit hooks.
+"""
+import os
+import sys
+
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.response_cache import MemoryBackend, RedisBackend, ResponseCache, register_invalidation_hooks
+
+
+class FakeRedis:
+    """Local stand-in for the redis client calls the backend uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1).encode('ascii')
+
+
+def _memory_cache(tmp_path, **kwargs):
+    return ResponseCache(MemoryBackend(generation_path=str(tmp_path / 'generation')), **kwargs)
+
+
+def test_key_normalizes_args_and_separates_roles(tmp_path):
+    cache = _memory_cache(tmp_path)
+    key = cache.key('/api/events', [('time_range', 'today'), ('city_id', '1'), ('event_type', '')], 'public')
+    assert key == cache.key('/api/events', [('city_id', '1'), ('time_range', 'today')], 'public')
+    assert key != cache.key('/api/events', [('city_id', '1'), ('time_range', 'today')], 'admin')
+    assert key != cache.key('/api/venues', [('city_id', '1'), ('time_range', 'today')], 'public')
+
+
+def test_invalidation_is_seen_by_other_workers(tmp_path):
+    worker_a, worker_b = _memory_cache(tmp_path), _memory_cache(tmp_path)
+    key = worker_b.key('/api/cities', [], 'public')
+    stored = worker_b.put(key, b'[{"id": 1}]', 'application/json')
+    assert worker_b.get(key).etag == stored.etag and stored.etag.startswith('"')
+
+    worker_a.invalidate()
+    assert worker_b.get(worker_b.key('/api/cities', [], 'public')) is None
+
+
+def test_database_generation_is_shared_across_containers(tmp_path):
+    # Separate disks (no shared generation file), one database
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    web = ResponseCache(MemoryBackend(generation_path=str(tmp_path / 'web' / 'generation'), engine=engine))
+    worker = ResponseCache(MemoryBackend(generation_path=str(tmp_path / 'worker' / 'generation'), engine=engine))
+    key = web.key('/api/events', [('city_id', '1')], 'public')
+    web.put(key, b'[]', 'application/json')
+    assert web.get(web.key('/api/events', [('city_id', '1')], 'public')) is not None
+
+    worker.invalidate()
+    worker.invalidate()
+    assert web.get(web.key('/api/events', [('city_id', '1')], 'public')) is None
+    assert web.backend.generation() == worker.backend.generation() == '2'
+    assert not (tmp_path / 'worker').exists()
+
+
+def test_lru_evicts_and_ttl_zero_disables_storage(tmp_path):
+    cache = ResponseCache(MemoryBackend(max_entries=2, generation_path=str(tmp_path / 'generation')))
+    keys = [cache.key('/api/venues', [('city_id', str(i))], 'public') for i in range(3)]
+    for key in keys:
+        cache.put(key, b'[]', 'application/json')
+    assert cache.get(keys[0]) is None and cache.get(keys[2]) is not None
+
+    disabled = _memory_cache(tmp_path, ttl=0)
+    key = disabled.key('/api/stats', [], 'public')
+    assert disabled.put(key, b'{}', 'application/json').etag
+    assert disabled.get(key) is None
+
+
+def test_redis_backend_round_trip_and_invalidation():
+    client = FakeRedis()
+    cache = ResponseCache(RedisBackend(client))
+    key = cache.key('/api/events', [('city_id', '1')], 'public')
+    cache.put(key, b'[]', 'application/json')
+    assert cache.get(key).body == b'[]'
+    assert ResponseCache(RedisBackend(client)).get(key).mimetype == 'application/json'
+    cache.invalidate()
+    assert cache.get(cache.key('/api/events', [('city_id', '1')], 'public')) is None
+
+
+Base = declarative_base()
+
+
+class Watched(Base):
+    __tablename__ = 'watched'
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class Unwatched(Base):
+    __tablename__ = 'unwatched'
+    id = Column(Integer, primary_key=True)
+
+
+def test_commit_hooks_invalidate_only_for_watched_writes():
+    class CountingCache:
+        invalidations = 0
+
+        def invalidate(self):
+            self.invalidations += 1
+
+    cache = CountingCache()
+    register_invalidation_hooks(cache, (Watched,))
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Unwatched())
+        session.commit()
+        assert cache.invalidations == 0
+        session.add(Watched(name='a'))
+        session.commit()
+        assert cache.invalidations == 1
+        session.query(Watched).filter(Watched.name == 'a').update({'name': 'b'})
+        session.commit()
+        assert cache.invalidations == 2
+        session.add(Watched(name='c'))
+        session.flush()
+        session.rollback()
+        session.commit()
+        assert cache.invalidations == 2
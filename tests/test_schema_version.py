@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for schema_version: boot migrations run only while the stored version is behind.
+"""
+import os
+import sys
+
+from sqlalchemy import create_engine
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.schema_version import (
+    SCHEMA_VERSION,
+    read_schema_version,
+    record_schema_version,
+    schema_is_current_at,
+    should_migrate_on_boot,
+)
+
+
+def _engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+
+def test_fresh_database_migrates_once(tmp_path, monkeypatch):
+    monkeypatch.delenv('SCHEMA_MIGRATIONS', raising=False)
+    engine = _engine(tmp_path)
+    assert read_schema_version(engine) == 0
+    assert should_migrate_on_boot(engine)
+
+    record_schema_version(engine)
+    assert read_schema_version(engine) == SCHEMA_VERSION
+    assert not should_migrate_on_boot(engine)
+    assert schema_is_current_at(f"sqlite:///{tmp_path / 'app.db'}")
+
+
+def test_older_version_migrates_again(tmp_path, monkeypatch):
+    monkeypatch.delenv('SCHEMA_MIGRATIONS', raising=False)
+    engine = _engine(tmp_path)
+    record_schema_version(engine, SCHEMA_VERSION - 1)
+    assert should_migrate_on_boot(engine)
+    record_schema_version(engine)
+    assert not should_migrate_on_boot(engine)
+
+
+def test_mode_overrides(tmp_path, monkeypatch):
+    engine = _engine(tmp_path)
+    monkeypatch.setenv('SCHEMA_MIGRATIONS', 'skip')
+    assert not should_migrate_on_boot(engine)  # behind, but the release step owns migrations
+
+    record_schema_version(engine)
+    monkeypatch.setenv('SCHEMA_MIGRATIONS', 'always')
+    assert should_migrate_on_boot(engine)
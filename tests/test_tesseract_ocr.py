@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the Tesseract OCR pipeline: preprocessing, text rebuilt from image_to_data, early exit.
+"""
+import os
+import sys
+import threading
+
+from PIL import Image, ImageDraw
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts import tesseract_ocr
+from scripts.tesseract_ocr import OCRResult, preprocess_image, recognize, text_from_data
+
+
+def _striped_image(size, background, ink, angle=0):
+    image = Image.new('RGB', size, background)
+    draw = ImageDraw.Draw(image)
+    for y in range(size[1] // 10, size[1] - size[1] // 10, size[1] // 12):
+        draw.rectangle([size[0] // 10, y, size[0] * 9 // 10, y + size[1] // 40], fill=ink)
+    return image.rotate(angle, expand=True, fillcolor=background) if angle else image
+
+
+def test_preprocess_downscales_and_inverts_light_on_dark():
+    prepared = preprocess_image(_striped_image((4000, 3000), background=(20, 20, 60), ink=(250, 250, 250)))
+    assert prepared.mode == '1'
+    assert max(prepared.size) <= tesseract_ocr.DEFAULT_MAX_DIMENSION + 200  # deskew may expand slightly
+    pixels = list(prepared.convert('L').getdata())
+    assert sum(1 for value in pixels if value) > len(pixels) / 2  # white page, dark text
+
+
+def test_deskew_detects_small_rotation():
+    tilted = preprocess_image(_striped_image((1200, 900), background='white', ink='black', angle=3))
+    straight = tesseract_ocr._skew_angle(tilted.convert('L'))
+    assert abs(straight) <= 1
+
+
+def test_text_from_data_groups_words_into_lines_and_blocks():
+    data = {
+        'text': ['', 'Gallery', 'Talk', 'Nov', '14', '', 'Free'],
+        'conf': ['-1', '95', '91.5', '88', '90', '-1', '70'],
+        'block_num': [1, 1, 1, 1, 1, 2, 2],
+        'par_num': [1, 1, 1, 1, 1, 1, 1],
+        'line_num': [0, 1, 1, 2, 2, 0, 1],
+    }
+    result = text_from_data(data)
+    assert result.text == 'Gallery Talk\nNov 14\n\nFree'
+    assert result.word_count == 5
+    assert round(result.confidence, 1) == 86.9
+
+
+def test_recognize_returns_first_confident_mode_without_waiting_for_slow_ones(monkeypatch):
+    release = threading.Event()
+    started = []
+
+    def fake_run_psm(path, psm, extra_config=''):
+        started.append(psm)
+        if psm != 6:
+            release.wait(5)
+        return OCRResult(psm=psm, text='Walking tour Saturday', confidence=92.0 if psm == 6 else 99.0, word_count=3)
+
+    monkeypatch.setattr(tesseract_ocr, 'run_psm', fake_run_psm)
+    try:
+        result = recognize('unused.png', psm_modes=[6, 3], threshold=80)
+    finally:
+        release.set()
+    assert result.psm == 6 and result.confidence == 92.0
+
+
+def test_recognize_keeps_most_confident_usable_result(monkeypatch):
+    results = {6: OCRResult(6, 'x', 95.0), 3: OCRResult(3, 'Photowalk at noon', 60.0), 8: OCRResult(8, 'Photowalk at 12', 70.0)}
+    monkeypatch.setattr(tesseract_ocr, 'run_psm', lambda path, psm, extra_config='': results[psm])
+    assert recognize('unused.png', psm_modes=[6, 3, 8], threshold=90).psm == 8
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for title_rules: compiled keyword matching and the flags the scrapers filter on.
+"""
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts import title_rules
+from scripts.title_rules import KeywordMatcher, classify
+
+
+def test_keyword_matcher_finds_overlapping_keywords():
+    matcher = KeywordMatcher(['visit', 'visits', 'group visits', 'about', 'about us', 'events', 'current events'])
+    assert matcher.present('group visits and current events') == {
+        'visit', 'visits', 'group visits', 'events', 'current events',
+    }
+    assert matcher.present('about us') == {'about', 'about us'}
+    assert matcher.search('plan a visit')
+    assert not matcher.search('artist talk')
+
+
+def test_navigation_text():
+    assert title_rules.is_navigation('Exhibits Events Press About Us Contact')
+    assert title_rules.is_navigation('x' * 201)
+    assert not title_rules.is_navigation('Art Happy Hour & Pop-Up Talk')
+    assert not title_rules.is_navigation('')
+
+
+def test_category_headings():
+    assert title_rules.is_heading('Past Exhibitions')
+    assert title_rules.is_heading('  view all   exhibitions ')
+    assert title_rules.is_heading('Exhibition')
+    assert not title_rules.is_heading('Past Exhibitions of Modern Art')
+
+
+def test_language():
+    assert title_rules.is_spanish_language('Spanish-Language Walk-In Tours')
+    assert not title_rules.is_english('Conversación en las galerías: la vida y el trabajo')
+    assert not title_rules.is_english('Galerías abiertas')  # starts with a non-English word
+    # "disponibles" is listed for Spanish and French, so it counts twice
+    assert not title_rules.is_english('disponibles disponibles')
+    assert title_rules.is_english('Public Tour: American Art')
+    assert title_rules.is_english(None)
+
+
+def test_listing_titles_and_page_elements():
+    assert title_rules.is_listing_title('Upcoming Events')
+    assert title_rules.is_listing_title('past events → see more')
+    assert title_rules.is_listing_title('Book a Tour')
+    assert not title_rules.is_listing_title('Upcoming Eventsful Evening')
+
+    assert title_rules.is_page_element('0 events,3')
+    assert title_rules.is_page_element('December 5 @ 10:00')
+    assert title_rules.is_page_element('Search results')
+    assert title_rules.is_page_element('Permanent Collection: Asian Art')
+    assert not title_rules.is_page_element('Searching for Sugar Man screening')
+
+
+def test_classify_returns_all_flags_and_is_memoized():
+    title_rules.clear_cache()
+    flags = classify('Bring Your Own Baby Tour', 'Strollers welcome at the pop-up market.', '/events/byob')
+    assert flags.baby_friendly and flags.shopping
+    assert not (flags.heading or flags.navigation or flags.non_english or flags.listing_title)
+    assert classify('Bring Your Own Baby Tour', 'Strollers welcome at the pop-up market.', '/events/byob') is flags
+
+    assert classify(None).page_element is False
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for visit_recorder: buffered batch inserts, visit_daily_stats rollup, rebuild, bad rows.
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, DateTime, ForeignKey, Integer, MetaData, String, Table, create_engine, event, func, select,
+)
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scripts.visit_recorder import NO_CITY, VisitRecorder, visit_daily_stats
+
+
+def _setup(tmp_path, **kwargs):
+    engine = create_engine(f"sqlite:///{tmp_path / 'visits.db'}")
+
+    @event.listens_for(engine, 'connect')
+    def _enable_foreign_keys(dbapi_connection, _record):
+        dbapi_connection.execute('PRAGMA foreign_keys=ON')
+
+    metadata = MetaData()
+    cities = Table('cities', metadata, Column('id', Integer, primary_key=True))
+    visits = Table(
+        'visits', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('city_id', Integer, ForeignKey('cities.id')),
+        Column('ip_address', String(100)),
+        Column('page_path', String(200)),
+        Column('timestamp', DateTime, nullable=False, index=True),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(cities.insert(), [{'id': 1}, {'id': 2}])
+    kwargs.setdefault('flush_interval', 60)
+    return engine, visits, VisitRecorder(engine, visits, **kwargs)
+
+
+def _count(engine, table):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(table)).scalar()
+
+
+def _totals(engine, recorder):
+    with engine.connect() as conn:
+        return recorder.totals_by_city(conn)
+
+
+def test_visits_are_buffered_until_flush(tmp_path):
+    engine, visits, recorder = _setup(tmp_path, flush_size=1000)
+    for _ in range(10):
+        recorder.record(city_id=1, page_path='/')
+    assert recorder.pending() == 10
+    assert _count(engine, visits) == 0  # nothing written on the request path
+
+    assert recorder.flush() == 10
+    assert recorder.pending() == 0
+    assert _count(engine, visits) == 10
+
+
+def test_rollup_tracks_batches_per_day_and_city(tmp_path):
+    engine, visits, recorder = _setup(tmp_path)
+    for city_id in (1, 1, 2, None):
+        recorder.record(city_id=city_id, timestamp=datetime(2026, 10, 15, 12))
+    recorder.record(city_id=1, timestamp=datetime(2026, 10, 16, 9))
+    recorder.flush()
+    recorder.record(city_id=1, timestamp=datetime(2026, 10, 16, 10))
+    recorder.flush()
+
+    assert _totals(engine, recorder) == {1: 4, 2: 1, NO_CITY: 1}
+    with engine.connect() as conn:
+        rows = conn.execute(select(visit_daily_stats).order_by('day', 'city_id')).all()
+    assert [(row.day.isoformat(), row.city_id, row.count) for row in rows] == [
+        ('2026-10-15', NO_CITY, 1), ('2026-10-15', 1, 2), ('2026-10-15', 2, 1), ('2026-10-16', 1, 2),
+    ]
+
+
+def test_rebuild_matches_incremental_rollup(tmp_path):
+    engine, visits, recorder = _setup(tmp_path)
+    for day in (14, 15, 15, 16):
+        recorder.record(city_id=2 if day == 15 else None, timestamp=datetime(2026, 10, day, 8))
+    recorder.flush()
+    incremental = _totals(engine, recorder)
+
+    with engine.begin() as conn:
+        conn.execute(visit_daily_stats.delete())
+    assert recorder.ensure_rollup() == 3
+    assert _totals(engine, recorder) == incremental
+    assert recorder.ensure_rollup() == 0  # already built
+
+
+def test_bad_rows_are_dropped_without_losing_the_batch(tmp_path):
+    engine, visits, recorder = _setup(tmp_path)
+    recorder.record(city_id=1)
+    recorder.record(city_id=999)  # city that does not exist
+    recorder.record(city_id=2)
+
+    assert recorder.flush() == 2
+    assert _count(engine, visits) == 2
+    assert _totals(engine, recorder) == {1: 1, 2: 1}
+
+
+def test_size_threshold_wakes_background_flush(tmp_path):
+    engine, visits, recorder = _setup(tmp_path, flush_size=5)
+    for _ in range(5):
+        recorder.record(city_id=1)
+    deadline = time.monotonic() + 5
+    while _count(engine, visits) < 5 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _count(engine, visits) == 5
+
+
+def test_clear_discards_buffer_and_rollup(tmp_path):
+    engine, visits, recorder = _setup(tmp_path)
+    recorder.record(city_id=1)
+    recorder.flush()
+    recorder.record(city_id=1)
+    recorder.clear()
+    assert recorder.pending() == 0
+    assert _totals(engine, recorder) == {}